@@ -38,12 +38,15 @@ import sys
 import argparse
 import signal
 
+from PyQt4.QtCore import QTimer
 from PyQt4.QtGui import QApplication
 
 import src.GlobalState as GlobalState
 import src.Config as Config
+import src.Debug as Debug
 from src.MainWindow import MainWindow
-#import src.Debug as Debug
+from src.Draw.BatchExport import BatchExport, collect_files
+from src.Draw.ExportFarm import ExportFarm
 
 
 
@@ -54,7 +57,7 @@ from src.MainWindow import MainWindow
 
 
 
-def main( argv, file=None, pdf=None, verbose=None, debug=0, develop=None, fallback=None ):
+def main( argv, file=None, pdf=None, verbose=None, debug=0, develop=None, fallback=None, rebuild_cache=None, template_workers=0, stream_templates=None, batch_pdf=None, batch_pool=Config.BATCH_EXPORT_POOL_SIZE, batch_workers=0, sheet_backend=Config.SHEET_BACKENDS[0], profile_export=None ):
 	"""
 	Entry Point.
 	"""
@@ -62,6 +65,10 @@ def main( argv, file=None, pdf=None, verbose=None, debug=0, develop=None, fallba
 	GlobalState.is_verbose = verbose
 	GlobalState.is_develop = develop
 	GlobalState.is_fallback = fallback
+	GlobalState.rebuild_template_cache = rebuild_cache
+	GlobalState.template_workers = template_workers
+	GlobalState.template_streaming = stream_templates
+	GlobalState.sheet_backend = sheet_backend
 	# Debug-Level soll immer als Zahl gespeichert werden. Der Zugehörige Name kann über das Tupel Config.DEBUG_LEVELS herausgefunden werden.
 	if debug in Config.DEBUG_LEVELS:
 		GlobalState.debug_level = Config.DEBUG_LEVELS.index( debug )
@@ -83,11 +90,32 @@ def main( argv, file=None, pdf=None, verbose=None, debug=0, develop=None, fallba
 		))
 		print( "WARNING! You may encounter unexpected behaviour. Data loss is possible. Proceed only, if you know, what you are doing." )
 
+	if profile_export:
+		Debug.profile_begin()
+
+	## Die Arbeitsprozesse erzeugen jeweils ihre eigene Anwendung.
+	if batch_pdf and batch_workers > 1:
+		farm = ExportFarm( collect_files(file), batch_pdf[0], workers=batch_workers )
+		farm.run()
+		if profile_export:
+			Debug.profile_write( profile_export[0], Debug.profile_end() )
+		return
+
 	app = QApplication( argv )
-	w = MainWindow( file, exportPath=pdf )
-	w.show()
+
+	## Bei der Stapelverarbeitung wird das Hauptfenster nicht benötigt.
+	if batch_pdf:
+		exporter = BatchExport( collect_files(file), batch_pdf[0], poolSize=batch_pool )
+		exporter.finished.connect(app.quit)
+		QTimer.singleShot(0, exporter.start)
+	else:
+		w = MainWindow( file, exportPath=pdf )
+		w.show()
 	retcode = app.exec_()
 
+	if profile_export:
+		Debug.profile_write( profile_export[0], Debug.profile_end() )
+
 
 
 
@@ -109,6 +137,11 @@ if __name__ == "__main__":
 
 	#parser.add_argument("-o", "--onepage", action="store_true", help="Charactersheets will consist of one page only. (Momentan noch ohne Funktion.)")
 	parser.add_argument("-p", "--pdf", metavar="Name", nargs=1, help="Directly creates a pdf file of the specified name out of the loaded character and closes immediatly. If no character file is passed as an argument to this program, an empty character sheet will be created.")
+	parser.add_argument("--batch-pdf", metavar="Directory", nargs=1, help="Creates a pdf file in the specified directory for every character file and closes without opening the main window. The character files are taken from the directory passed as File/Species or, if no such argument is given or it is \"-\", read line by line from stdin. At the end the time per sheet and the overall throughput are printed.")
+	parser.add_argument("--batch-pool", metavar="N", type=int, default=Config.BATCH_EXPORT_POOL_SIZE, help="Number of character sheets that are rendered at the same time by --batch-pdf.")
+	parser.add_argument("--batch-workers", metavar="N", type=int, default=0, help="Spread the character sheets of --batch-pdf over N processes, each of which loads the template files once and renders its sheets on its own. Instead of a file, a species name may be given to export an empty sheet of this species. A file that cannot be exported does not stop the others. With 0 or 1, all sheets are rendered in this process as configured by --batch-pool.")
+	parser.add_argument("--profile-export", metavar="File", nargs=1, help="Measures how long every phase of creating the character sheets takes (html generation of every section, loading by WebKit, drawing and finishing the pdf file) and writes the times per page and phase together with the totals as JSON into the specified file, when the program closes.")
+	parser.add_argument("--sheet-backend", choices=Config.SHEET_BACKENDS, default=Config.SHEET_BACKENDS[0], help="Selects how character sheets are drawn when exporting and printing. \"webkit\" lays out the pages with QtWebKit, \"document\" draws them synchronously with QTextDocument and does not need QtWebKit, but supports less of the page layout.")
 	# Als Argument kann der Name oder die Nummer des Debug-levels eingegeben werden. Bei der Liste der erlaubten Möglichkeiten wird der Name immer nach der zugehörigen Nummer eingefügt.
 	__choices_debug_level = []
 	for item in range( len( Config.DEBUG_LEVELS ) ):
@@ -125,6 +158,9 @@ if __name__ == "__main__":
 	## Development. Some tasks are automatic, that normally the user would have to undertake, like choosing a file name for saving characters and other stuff. Very dangerous for normal work.
 	parser.add_argument("--develop", action="store_true", help=argparse.SUPPRESS)
 	parser.add_argument("--fallback", action="store_true", help=argparse.SUPPRESS)
+	parser.add_argument("--rebuild-cache", action="store_true", help="Ignore the cache of the template files and rebuild it from the XML files.")
+	parser.add_argument("--template-workers", metavar="N", type=int, default=0, help="Parse the template files in N processes at the same time. Only used, if the template cache has to be rebuilt.")
+	parser.add_argument("--stream-templates", action="store_true", help="Parse the template files incrementally. This keeps the memory usage low for very large template files. Only used, if the template cache has to be rebuilt.")
 	parser.add_argument("-v", "--verbose", action="store_true", help="Output useful information.")
 	parser.add_argument("-V", "--version", action="version", version="{name}: {version}".format( name=sys.argv[0], version=Config.version()) )
 	parser.add_argument(dest="file", metavar="File/Species", nargs="?", help="Opens the character from this file at start. Instead of a file, the name of a supported species (human, changeling, mage, vampire, werewolf) may be entered, to create an empty character of the specified species, if no file of that specific name exists. This is most useful in combination with the -p option.")
@@ -132,4 +168,4 @@ if __name__ == "__main__":
 	args = parser.parse_args()
 
 	## Hauptprogramm starten
-	main( sys.argv, file=args.file, pdf=args.pdf, verbose=args.verbose, debug=args.debug, develop=args.develop, fallback=args.fallback )
+	main( sys.argv, file=args.file, pdf=args.pdf, verbose=args.verbose, debug=args.debug, develop=args.develop, fallback=args.fallback, rebuild_cache=args.rebuild_cache, template_workers=args.template_workers, stream_templates=args.stream_templates, batch_pdf=args.batch_pdf, batch_pool=args.batch_pool, batch_workers=args.batch_workers, sheet_backend=args.sheet_backend, profile_export=args.profile_export )
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+"""
+Führt die Leistungsmessungen aus.
+
+Ohne Argumente werden alle Messungen durchgeführt, ansonsten nur die angegebenen.
+"""
+
+
+
+
+import sys
+import argparse
+
+from PyQt4.QtGui import QApplication
+
+import src.Benchmarks.BenchTemplateLoading as BenchTemplateLoading
+import src.Benchmarks.BenchTemplateMemory as BenchTemplateMemory
+import src.Benchmarks.BenchTraitLookup as BenchTraitLookup
+import src.Benchmarks.BenchCharacterMemory as BenchCharacterMemory
+import src.Benchmarks.BenchPrerequisites as BenchPrerequisites
+import src.Benchmarks.BenchPrerequisiteGraph as BenchPrerequisiteGraph
+import src.Benchmarks.BenchSheetHtml as BenchSheetHtml
+import src.Benchmarks.BenchSheetRendering as BenchSheetRendering
+
+
+
+
+BENCHMARKS = {
+	"templates": BenchTemplateLoading.run,
+	"templates-memory": BenchTemplateMemory.run,
+	"trait-lookup": BenchTraitLookup.run,
+	"character-memory": BenchCharacterMemory.run,
+	"prerequisites": BenchPrerequisites.run,
+	"prerequisite-graph": BenchPrerequisiteGraph.run,
+	"sheet-html": BenchSheetHtml.run,
+	"sheet-rendering": BenchSheetRendering.run,
+}
+
+
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Runs the benchmarks of SoulCreator.")
+	parser.add_argument("-r", "--repeat", type=int, default=5, help="How often every measurement is repeated.")
+	parser.add_argument(dest="benchmarks", metavar="Benchmark", nargs="*", help="The benchmarks to run ({}). All benchmarks are run, if none is given.".format(", ".join(sorted(BENCHMARKS.keys()))))
+
+	args = parser.parse_args()
+
+	for name in args.benchmarks:
+		if name not in BENCHMARKS:
+			parser.error( "unknown benchmark \"{}\"".format(name) )
+
+	## Manche Messungen benötigen eine laufende Anwendung, beispielsweise für das Darstellen der Charakterbögen.
+	app = QApplication( sys.argv )
+
+	for name in ( args.benchmarks or sorted(BENCHMARKS.keys()) ):
+		BENCHMARKS[name]( repeat=args.repeat )
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+"""
+Misst Zeit und Speicherbedarf für das Anlegen von Charakteren.
+"""
+
+
+
+
+import multiprocessing
+import resource
+import tracemalloc
+
+from src.Storage.StorageTemplate import StorageTemplate
+from src.IO.ReadXmlTemplate import ReadXmlTemplate
+import src.Work.ConnectPrerequisites as ConnectPrerequisites
+import src.Benchmarks.Timing as Timing
+
+
+
+
+def _memory( count ):
+	"""
+	Legt count Charaktere an und gibt zurück, wieviele KiB sie im Python-Speicher belegen und um wieviele KiB der höchste Speicherbedarf des Prozesses dabei angestiegen ist.
+
+	Nur der zweite Wert enthält auch den Speicher der QObjects und Signalverbindungen von Qt. Diese Funktion wird in einem eigenen Prozess ausgeführt, damit die Messungen sich nicht gegenseitig beeinflussen.
+	"""
+
+	from src.Storage.StorageCharacter import StorageCharacter
+
+	storage = StorageTemplate()
+	ReadXmlTemplate(storage).read()
+
+	characters = []
+	before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	tracemalloc.start()
+	for i in range(count):
+		characters.append( StorageCharacter(storage) )
+	python = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+	return ( python / 1024, after - before, )
+
+
+def run( repeat=5, count=20 ):
+	"""
+	Misst, wie lange das Anlegen eines Charakters mit allen Eigenschaften der Template-Daten dauert, wie lange er bis zur Verwendung braucht (Verknüpfen der Voraussetzungen und Zurücksetzen) und wieviel Speicher count Charaktere belegen.
+
+	\\note Verwendet das Modul resource und ist daher nur auf Unix-artigen Systemen lauffähig.
+	"""
+
+	from src.Storage.StorageCharacter import StorageCharacter
+
+	storage = StorageTemplate()
+	ReadXmlTemplate(storage).read()
+
+	construction = Timing.median( Timing.measure( lambda: StorageCharacter(storage), repeat ) )
+
+	def newCharacter():
+		character = StorageCharacter(storage)
+		ConnectPrerequisites.build_connection(storage, character)
+		character.resetCharacter()
+
+	ready = Timing.median( Timing.measure( newCharacter, repeat ) )
+
+	context = multiprocessing.get_context("spawn")
+	with context.Pool(1, maxtasksperchild=1) as pool:
+		python, process = pool.apply( _memory, ( count, ) )
+
+	Timing.report( "Creating characters", (
+		( "Construction of one character", construction * 1000, "ms" ),
+		( "Construction, connection and reset", ready * 1000, "ms" ),
+		( "Python heap per character", python / count, "KiB" ),
+		( "Peak memory per character", process / count, "KiB" ),
+	) )
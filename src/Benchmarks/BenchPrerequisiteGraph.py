@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+"""
+Misst die Zeit, welche das Verknüpfen der Voraussetzungen benötigt.
+"""
+
+
+
+
+import os
+import tempfile
+
+from src.Storage.StorageTemplate import StorageTemplate
+from src.Storage.StorageCharacter import StorageCharacter
+from src.IO.ReadXmlTemplate import ReadXmlTemplate
+import src.Config as Config
+import src.Work.ConnectPrerequisites as ConnectPrerequisites
+import src.Benchmarks.SyntheticTemplate as SyntheticTemplate
+import src.Benchmarks.Timing as Timing
+
+
+
+
+def _measure( storage, repeat ):
+	"""
+	Misst das Erstellen des Abhängigkeitsgraphen und das Verknüpfen der Signale jeweils an einem neuen Charakter.
+	"""
+
+	state = {}
+	def newCharacter():
+		state["character"] = StorageCharacter(storage)
+	def build():
+		state["graph"] = ConnectPrerequisites.build_graph(storage, state["character"])
+	def newGraph():
+		newCharacter()
+		build()
+	def connect():
+		ConnectPrerequisites.connect_graph(state["graph"], state["character"])
+
+	timesBuild = Timing.measure( build, repeat, setup=newCharacter )
+	timesConnect = Timing.measure( connect, repeat, setup=newGraph )
+
+	dependents = sum( len(traits) for traits in state["graph"].values() )
+	return ( Timing.median(timesBuild), Timing.median(timesConnect), len(state["graph"]), dependents, )
+
+
+def run( repeat=5 ):
+	"""
+	Verknüpft die Voraussetzungen für die mitgelieferten Template-Dateien und zusätzlich für eine künstliche Template-Datei mit 10000 Merits.
+	"""
+
+	storage = StorageTemplate()
+	reader = ReadXmlTemplate(storage)
+	reader.read()
+
+	rows = []
+	with tempfile.TemporaryDirectory() as directory:
+		for merits in ( 0, 10000, ):
+			if merits:
+				fileName = os.path.join( directory, "synthetic-{}.{}".format(merits, Config.FILE_SUFFIX_COMPRESSED) )
+				SyntheticTemplate.write( fileName, merits=merits )
+				reader.readFile(fileName)
+			description = "shipped templates"
+			if merits:
+				description = "shipped templates + {} merits".format(merits)
+			timeBuild, timeConnect, sources, dependents = _measure( storage, repeat )
+			rows.append( ( "Build graph, {}".format(description), timeBuild * 1000, "ms" ) )
+			rows.append( ( "Connect {} sources, {} edges".format(sources, dependents), timeConnect * 1000, "ms" ) )
+
+	## Die künstlichen Eigenschaften sollen nicht in anderen Messungen auftauchen.
+	storage.clear()
+
+	Timing.report( "Prerequisite graph (median of {} runs)".format(repeat), rows )
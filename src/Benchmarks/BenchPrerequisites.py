@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+"""
+Misst, wie schnell die Voraussetzungen der Eigenschaften neu überprüft werden.
+"""
+
+
+
+
+from src.Storage.StorageTemplate import StorageTemplate
+from src.Storage.StorageCharacter import StorageCharacter
+from src.IO.ReadXmlTemplate import ReadXmlTemplate
+import src.Work.ConnectPrerequisites as ConnectPrerequisites
+import src.Benchmarks.Timing as Timing
+
+
+
+
+def run( repeat=5 ):
+	"""
+	Ändert wiederholt sämtliche Attribute eines Magiers und zählt, wie viele Überprüfungen von Voraussetzungen dabei pro Sekunde ausgeführt werden.
+	"""
+
+	storage = StorageTemplate()
+	ReadXmlTemplate(storage).read()
+
+	character = StorageCharacter(storage)
+	character.species = "Mage"
+	ConnectPrerequisites.build_connection(storage, character)
+
+	attributes = [ trait for category in character.traits["Attribute"].values() for trait in category.values() ]
+	rounds = 20
+
+	def bulkChange():
+		for i in range(rounds):
+			for trait in attributes:
+				trait.value = i % 5 + 1
+
+	## Einmal mitzählen, wie viele Überprüfungen eine solche Änderung auslöst.
+	checkPrerequisites = ConnectPrerequisites.checkPrerequisites
+	count = [ 0 ]
+	def countingCheck( trait, storage, character ):
+		count[0] += 1
+		checkPrerequisites( trait, storage, character )
+	ConnectPrerequisites.checkPrerequisites = countingCheck
+	try:
+		bulkChange()
+	finally:
+		ConnectPrerequisites.checkPrerequisites = checkPrerequisites
+	checks = count[0]
+
+	timeBulk = Timing.median( Timing.measure( bulkChange, repeat ) )
+
+	traits = [ trait for typ in character.traits.values() for category in typ.values() for trait in category.values() if trait.hasPrerequisites and trait.prerequisitesCheck is not None ]
+	def checkAll():
+		for trait in traits:
+			trait.prerequisitesCheck()
+	timeCheck = Timing.median( Timing.measure( checkAll, repeat ) )
+
+	Timing.report( "Prerequisite checks, Mage (median of {} runs)".format(repeat), (
+		( "Attribute changes", rounds * len(attributes), "" ),
+		( "Triggered checks", checks, "" ),
+		( "Checks per second, via traitChanged", checks / timeBulk, "1/s" ),
+		( "Checks per second, direct ({} traits)".format(len(traits)), len(traits) / timeCheck, "1/s" ),
+	) )
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+"""
+Misst die Zeit, welche das Erzeugen des Html-Textes der Charakterbögen benötigt, ohne die Darstellung durch WebKit.
+"""
+
+
+
+
+import random
+
+from src.Storage.StorageTemplate import StorageTemplate
+from src.Storage.StorageCharacter import StorageCharacter
+from src.IO.ReadXmlTemplate import ReadXmlTemplate
+from src.Draw.RenderSheet import RenderSheet
+from src.Draw.SheetResources import SheetResources
+import src.Benchmarks.Timing as Timing
+
+from res import rc_resource
+
+
+
+
+def run( repeat=5 ):
+	"""
+	Erzeugt für jede Spezies einen Charakter mit zufälligen, aber stets gleichen Werten und mißt, wie lange das Erzeugen sämtlicher Seiten seines Charakterbogens dauert.
+	"""
+
+	storage = StorageTemplate()
+	ReadXmlTemplate(storage).read()
+
+	resources = SheetResources()
+	rounds = 20
+
+	rows = []
+	for species in resources.species:
+		character = StorageCharacter(storage)
+		character.species = species
+		randomizer = random.Random(species)
+		for typ in ( "Attribute", "Skill", "Merit", "Power", ):
+			for category in character.traits[typ].values():
+				for trait in category.values():
+					trait.value = randomizer.randint(0, 5)
+
+		sheet = RenderSheet( storage, character, None )
+		pages = range( len( resources.pages(species) ) )
+
+		def createHtml():
+			for i in range(rounds):
+				for page in pages:
+					sheet.createHtml(page)
+
+		## Die Vorlagen werden beim ersten Aufruf zerlegt, was nicht mitgemessen werden soll.
+		createHtml()
+		rows.append( ( "{} ({} pages)".format(species, len(pages)), Timing.median( Timing.measure( createHtml, repeat ) ) / rounds * 1000, "ms/sheet" ) )
+
+	Timing.report( "Html generation of character sheets (median of {} runs)".format(repeat), rows )
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+"""
+Vergleicht die Zeit, welche das Zeichnen der Charakterbögen in eine PDF-Datei mit den verschiedenen Verfahren aus Config.SHEET_BACKENDS benötigt.
+"""
+
+
+
+
+import os
+import random
+import tempfile
+
+from PyQt4.QtCore import QEventLoop
+
+import src.Config as Config
+from src.Storage.StorageTemplate import StorageTemplate
+from src.Storage.StorageCharacter import StorageCharacter
+from src.IO.ReadXmlTemplate import ReadXmlTemplate
+import src.Draw.RenderSheet as RenderSheet
+from src.Draw.SheetResources import SheetResources
+from src.Draw.BatchExport import pdf_printer
+import src.Benchmarks.Timing as Timing
+
+from res import rc_resource
+
+
+
+
+def run( repeat=5 ):
+	"""
+	Zeichnet für jede Spezies einen Charakter mit zufälligen, aber stets gleichen Werten mit jedem verfügbaren Verfahren in eine PDF-Datei.
+
+	\note Ist QtWebKit nicht vorhanden, wird nur das Verfahren "document" gemessen.
+	"""
+
+	storage = StorageTemplate()
+	ReadXmlTemplate(storage).read()
+
+	backends = [ backend for backend in Config.SHEET_BACKENDS if backend != "webkit" or RenderSheet.QWebPage is not None ]
+	exportDir = tempfile.mkdtemp()
+
+	rows = []
+	for species in SheetResources().species:
+		character = StorageCharacter(storage)
+		character.species = species
+		randomizer = random.Random(species)
+		for typ in ( "Attribute", "Skill", "Merit", "Power", ):
+			for category in character.traits[typ].values():
+				for trait in category.values():
+					trait.value = randomizer.randint(0, 5)
+
+		for backend in backends:
+			fileName = os.path.join( exportDir, "{}-{}.pdf".format(species, backend) )
+			sheet = RenderSheet.RenderSheet( storage, character, pdf_printer(fileName), backend=backend )
+			loop = QEventLoop()
+			finished = []
+			sheet.sheetFinished.connect( lambda: finished.append(True) )
+			sheet.sheetFinished.connect( loop.quit )
+
+			def render():
+				del finished[:]
+				sheet.setPrinter( pdf_printer(fileName) )
+				sheet.createSheets()
+				## Das Verfahren "document" ist bereits fertig, wenn createSheets() zurückkehrt.
+				if not finished:
+					loop.exec_()
+
+			## Beim ersten Durchlauf werden Vorlagen und Bilder vorbereitet, was nicht mitgemessen werden soll.
+			render()
+			rows.append( ( "{} ({})".format(species, backend), Timing.median( Timing.measure( render, repeat ) ) * 1000, "ms/sheet" ) )
+
+	for item in os.listdir(exportDir):
+		os.remove( os.path.join(exportDir, item) )
+	os.rmdir(exportDir)
+
+	Timing.report( "Rendering of character sheets into pdf files (median of {} runs)".format(repeat), rows )
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+"""
+Misst die Zeit, welche das Einlesen der Template-Dateien benötigt.
+"""
+
+
+
+
+import os
+
+from src.Storage.StorageTemplate import StorageTemplate
+from src.IO.ReadXmlTemplate import ReadXmlTemplate
+import src.GlobalState as GlobalState
+import src.Benchmarks.Timing as Timing
+
+
+
+
+def run( repeat=5 ):
+	"""
+	Vergleicht das Einlesen der Template-Dateien aus den XML-Dateien mit dem Einlesen aus dem Zwischenspeicher.
+
+	\note Der vorhandene Zwischenspeicher wird dabei neu geschrieben.
+	"""
+
+	storage = StorageTemplate()
+
+	readerXml = ReadXmlTemplate(storage, useCache=False)
+	timesXml = Timing.measure( readerXml.read, repeat, setup=storage.clear )
+
+	workers = os.cpu_count() or 1
+	GlobalState.template_workers = workers
+	timesParallel = Timing.measure( readerXml.read, repeat, setup=storage.clear )
+	GlobalState.template_workers = 0
+
+	readerCache = ReadXmlTemplate(storage)
+	def invalidate():
+		storage.clear()
+		readerCache.cache.invalidate()
+	timesCold = Timing.measure( readerCache.read, repeat, setup=invalidate )
+	timesWarm = Timing.measure( readerCache.read, repeat, setup=storage.clear )
+
+	Timing.report( "Template loading (median of {} runs)".format(repeat), (
+		( "XML files, no cache", Timing.median(timesXml) * 1000, "ms" ),
+		( "XML files, no cache, worker processes: {}".format(workers), Timing.median(timesParallel) * 1000, "ms" ),
+		( "Cold start (XML files, cache written)", Timing.median(timesCold) * 1000, "ms" ),
+		( "Warm start (cache read)", Timing.median(timesWarm) * 1000, "ms" ),
+	) )
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+"""
+Vergleicht den Speicherbedarf beim Einlesen der Template-Dateien mit und ohne iterparse.
+"""
+
+
+
+
+import os
+import glob
+import tempfile
+import multiprocessing
+import resource
+
+import src.Config as Config
+import src.Tools.PathTools as PathTools
+import src.Benchmarks.SyntheticTemplate as SyntheticTemplate
+import src.Benchmarks.Timing as Timing
+
+
+
+
+def _peakMemory( fileName, streaming ):
+	"""
+	Liest eine einzelne Datei ein und gibt zurück, um wieviele KiB der höchste Speicherbedarf des Prozesses dabei angestiegen ist.
+
+	Diese Funktion wird in einem eigenen Prozess ausgeführt, damit die Messungen sich nicht gegenseitig beeinflussen.
+	"""
+
+	from src.Storage.TemplateFragment import TemplateFragment
+	from src.IO.ReadXmlTemplate import ReadXmlTemplate
+
+	## Die eingelesenen Daten sollen nicht mitgemessen werden, deswegen werden sie nur aufgezeichnet und sofort wieder verworfen.
+	class DiscardingFragment(TemplateFragment):
+		def __getattr__(self, name):
+			return lambda *args, **kwargs: None
+
+	reader = ReadXmlTemplate( DiscardingFragment(), useCache=False, streaming=streaming )
+	before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	reader.readFile(fileName)
+	after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+	return after - before
+
+
+def run( repeat=5 ):
+	"""
+	Misst den Speicherbedarf für die mitgelieferten Template-Dateien und für künstliche Dateien verschiedener Größe.
+
+	\\note Verwendet das Modul resource und ist daher nur auf Unix-artigen Systemen lauffähig.
+	"""
+
+	context = multiprocessing.get_context("spawn")
+
+	with tempfile.TemporaryDirectory() as directory:
+		files = sorted( glob.glob( os.path.join( PathTools.program_path(), Config.PATH_RESOURCE, Config.RESOURCE_DIR_TEMPLATES, "*.{}".format(Config.FILE_SUFFIX_COMPRESSED) ) ) )
+		for merits in ( 1000, 10000, 50000, ):
+			fileName = os.path.join( directory, "synthetic-{}.{}".format(merits, Config.FILE_SUFFIX_COMPRESSED) )
+			SyntheticTemplate.write( fileName, merits=merits, items=merits )
+			files.append(fileName)
+
+		rows = []
+		with context.Pool(1, maxtasksperchild=1) as pool:
+			for fileName in files:
+				for streaming, description in ( ( False, "tree", ), ( True, "iterparse", ), ):
+					peak = max( pool.apply( _peakMemory, ( fileName, streaming, ) ) for i in range(repeat) )
+					rows.append( ( "{} ({})".format( os.path.basename(fileName), description ), peak, "KiB" ) )
+
+	Timing.report( "Peak memory while reading a template file", rows )
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+"""
+Misst die Zeit, welche das Nachschlagen einzelner Eigenschaften in den Template-Daten benötigt.
+"""
+
+
+
+
+from src.Storage.StorageTemplate import StorageTemplate
+from src.IO.ReadXmlTemplate import ReadXmlTemplate
+import src.Benchmarks.Timing as Timing
+
+
+
+
+def _locationLinear( traits, identifier ):
+	"""
+	Sucht Typ und Kategorie so, wie es Creation.calcPoints() ohne Verzeichnis getan hat.
+	"""
+
+	for typ in traits:
+		for category in traits[typ]:
+			if identifier in traits[typ][category]:
+				return ( typ, category, )
+
+
+def _skillLinear( traits, identifier ):
+	"""
+	Sucht eine Fertigkeit so, wie es TemplateWidget.repopulateBonus() ohne Verzeichnis getan hat.
+	"""
+
+	for category in traits["Skill"]:
+		if identifier in traits["Skill"][category]:
+			return traits["Skill"][category][identifier]
+
+
+def _nameLinear( traits, typ, category, name ):
+	"""
+	Sucht eine Eigenschaft anhand ihres Namens so, wie es ReadXmlCharacter.readTraits() tut.
+	"""
+
+	for identifier, data in traits[typ][category].items():
+		if data["name"] == name:
+			return identifier
+
+
+def run( repeat=5 ):
+	"""
+	Vergleicht das Durchsuchen der verschachtelten Eigenschaften mit den Verzeichnissen von StorageTemplate.
+	"""
+
+	storage = StorageTemplate()
+	ReadXmlTemplate(storage).read()
+
+	traits = storage.traits
+	entries = [ ( typ, category, identifier, data["name"], ) for typ in traits for category in traits[typ] for identifier, data in traits[typ][category].items() ]
+	skills = [ identifier for typ, category, identifier, name in entries if typ == "Skill" ]
+
+	def perLookup( function, count ):
+		return Timing.median( Timing.measure( function, repeat ) ) / count * 1e6
+
+	def locationLinear():
+		for typ, category, identifier, name in entries:
+			_locationLinear( traits, identifier )
+	def locationIndex():
+		for typ, category, identifier, name in entries:
+			storage.traitLocation( identifier )
+
+	def skillLinear():
+		for identifier in skills:
+			_skillLinear( traits, identifier )
+	def skillIndex():
+		for identifier in skills:
+			storage.traitSkills()[identifier]
+
+	def nameLinear():
+		for typ, category, identifier, name in entries:
+			_nameLinear( traits, typ, category, name )
+	def nameIndex():
+		for typ, category, identifier, name in entries:
+			storage.traitIdentifiers( typ, category, name )
+
+	Timing.report( "Trait lookup in {} template traits (median of {} runs)".format(len(entries), repeat), (
+		( "Type of a trait, nested search", perLookup( locationLinear, len(entries) ), "µs" ),
+		( "Type of a trait, index", perLookup( locationIndex, len(entries) ), "µs" ),
+		( "Skill by identifier, nested search", perLookup( skillLinear, len(skills) ), "µs" ),
+		( "Skill by identifier, index", perLookup( skillIndex, len(skills) ), "µs" ),
+		( "Trait by name, category scan", perLookup( nameLinear, len(entries) ), "µs" ),
+		( "Trait by name, index", perLookup( nameIndex, len(entries) ), "µs" ),
+	) )
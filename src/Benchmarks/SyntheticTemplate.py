@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+"""
+Erzeugt künstliche Template-Dateien beliebiger Größe für die Leistungsmessungen.
+"""
+
+
+
+
+import gzip
+from xml.sax.saxutils import quoteattr
+
+import src.Config as Config
+
+
+
+
+## Die Attribute, auf welche sich die Voraussetzungen der künstlichen Merits beziehen.
+ATTRIBUTES = [ name for category, names in Config.ATTRIBUTES for name in names ]
+
+
+
+
+def write( fileName, merits=10000, items=0, species="Synthetic" ):
+	"""
+	Schreibt eine komprimierte Template-Datei mit der gewünschten Anzahl an Merits und Ausrüstungsgegenständen.
+
+	Jeder Merit hat Voraussetzungen, welche sich auf Attribute und auf jeweils einen der vorher erzeugten Merits beziehen, damit auch das Verknüpfen der Voraussetzungen gemessen werden kann.
+	"""
+
+	with gzip.open(fileName, mode="wt", encoding="utf-8") as fo:
+		fo.write( "<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n" )
+		fo.write( "<{name} version=\"{version}\">\n".format(name=Config.PROGRAM_NAME, version=Config.version()) )
+		fo.write( "\t<Template species={}>\n".format(quoteattr(species)) )
+		fo.write( "\t\t<Traits morale=\"Morality\" powerstat=\"\" fuel=\"\">\n" )
+		fo.write( "\t\t\t<Merit>\n" )
+		categories = 10
+		for category in range(categories):
+			fo.write( "\t\t\t\t<Category name=\"Synthetic {}\">\n".format(category) )
+			for i in range(category, merits, categories):
+				prerequisites = "Attribute.{} > 1".format( ATTRIBUTES[i % len(ATTRIBUTES)] )
+				if i >= categories:
+					prerequisites += " and Merit.Synthetic Merit {} > 0".format( i - categories )
+				fo.write( "\t\t\t\t\t<trait name=\"Synthetic Merit {index}\">\n\t\t\t\t\t\t<value>1</value>\n\t\t\t\t\t\t<value>2</value>\n\t\t\t\t\t\t<prerequisites>{prerequisites}</prerequisites>\n\t\t\t\t\t</trait>\n".format(
+					index=i,
+					prerequisites=prerequisites,
+				) )
+			fo.write( "\t\t\t\t</Category>\n" )
+		fo.write( "\t\t\t</Merit>\n" )
+		fo.write( "\t\t</Traits>\n" )
+		fo.write( "\t\t<Items>\n" )
+		fo.write( "\t\t\t<Equipment>\n" )
+		for i in range(items):
+			fo.write( "\t\t\t\t<equipment name=\"Synthetic Item {}\" durability=\"1\" size=\"1\" cost=\"1\"/>\n".format(i) )
+		fo.write( "\t\t\t</Equipment>\n" )
+		fo.write( "\t\t</Items>\n" )
+		fo.write( "\t</Template>\n" )
+		fo.write( "</{}>\n".format(Config.PROGRAM_NAME) )
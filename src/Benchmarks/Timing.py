@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+"""
+Hilfsfunktionen für die Leistungsmessungen.
+"""
+
+
+
+
+import gc
+import time
+
+
+
+
+def measure( function, repeat=5, setup=None ):
+	"""
+	Führt function mehrfach aus und gibt die gemessenen Zeiten in Sekunden als sortierte Liste zurück.
+
+	\param setup Wird vor jeder Messung aufgerufen, ohne selbst gemessen zu werden.
+	"""
+
+	results = []
+	for i in range(repeat):
+		if setup is not None:
+			setup()
+		## Wie bei timeit wird die automatische Speicherbereinigung während der Messung abgeschaltet, damit nicht Abfall vorheriger Durchläufe mitgemessen wird.
+		gc.collect()
+		gc.disable()
+		try:
+			start = time.perf_counter()
+			function()
+			results.append( time.perf_counter() - start )
+		finally:
+			gc.enable()
+	results.sort()
+	return results
+
+
+def median( values ):
+	return values[len(values) // 2]
+
+
+def report( title, rows ):
+	"""
+	Gibt die Ergebnisse einer Messung als Tabelle aus.
+
+	\param rows Liste aus Tupeln (Beschreibung, Wert, Einheit).
+	"""
+
+	print( title )
+	print( "-" * len(title) )
+	for description, value, unit in rows:
+		print( "{:<48} {:>12.3f} {}".format(description, value, unit) )
+	print()
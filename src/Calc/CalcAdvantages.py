@@ -42,6 +42,8 @@ class CalcAdvantages(QObject):
 
 	Die hier deklarierten Berechnungsfunktionen werden zwar bei der Änderung jeder Eigenschaft aufgerufen, aber berechnen die Werte nur, wenn eine Eigenschaft verändert wurde, welche Einfluß auf das Ergebnis nimmt. Sie geben allerdings immer das Ergebnis der berechnung aus. Entweder den neuen Wert, oder den alten Wert, der in dieser Klasse gespeichert wird.
 
+	\note Während StorageCharacter.batch() werden die Berechnungen zurückgestellt und erst nach dem Signal StorageCharacter.batchFinished jeweils einmal ausgeführt. Bis dahin geben die Funktionen den alten Wert aus.
+
 	\todo Diese Klasse so umbennenen, um auszudrücken, daß hier die Werte direkt vom gespeicherten Charakter verwendet werden.
 	"""
 
@@ -66,8 +68,32 @@ class CalcAdvantages(QObject):
 		self.__health     = 0
 		self.__willpower  = 0
 
+		## Berechnungen, die bis zum Ende von StorageCharacter.batch() zurückgestellt wurden.
+		self.__postponed = {}
+
 		self.sizeChanged.connect(self.calcHealth)
 		self.sizeChanged.connect(self.calcDefense)
+		self.__character.batchFinished.connect(self.__calcPostponed)
+
+
+	def __postpone(self, function):
+		"""
+		Stellt die Berechnung zurück, solange der Charakter sich in StorageCharacter.batch() befindet.
+
+		\return True, wenn die Berechnung zurückgestellt wurde.
+		"""
+
+		if self.__character.isBatching():
+			self.__postponed[function] = None
+			return True
+		return False
+
+
+	def __calcPostponed(self):
+		postponed = list(self.__postponed)
+		self.__postponed.clear()
+		for function in postponed:
+			function()
 
 
 	def calc_size(self):
@@ -75,6 +101,9 @@ class CalcAdvantages(QObject):
 		Berechnung der Größe des Charakters.
 		"""
 
+		if self.__postpone(self.calc_size):
+			return self.__size
+
 		is_large = self.__character.traits["Merit"]["Physical"]["Giant"].totalvalue > 0
 		is_small = self.__character.traits["Flaw"]["Physical"]["Dwarf"].totalvalue > 0
 		if self.__character.age < Config.AGE_ADULT:
@@ -97,6 +126,9 @@ class CalcAdvantages(QObject):
 		\todo Bislang nur von Dexterity, Composure und Fast Reflexes abhängig. Möglicherweise vorhandene Übernatürliche Eigenschaften werden nicht berücksichtigt.
 		"""
 
+		if self.__postpone(self.calcInitiative):
+			return self.__initiative
+
 		result = Calc.calc_initiative(
 			self.__character.traits["Attribute"]["Physical"]["Dexterity"].totalvalue,
 			self.__character.traits["Attribute"]["Social"]["Composure"].totalvalue,
@@ -117,6 +149,9 @@ class CalcAdvantages(QObject):
 		\todo Bislang nur von Strength und Dexterity abhängig. Möglicherweise vorhandene Übernatürliche Eigenschaften werden nicht berücksichtigt.
 		"""
 
+		if self.__postpone(self.calcSpeed):
+			return self.__speed
+
 		result = Calc.calc_speed(
 			self.__character.traits["Attribute"]["Physical"]["Strength"].totalvalue,
 			self.__character.traits["Attribute"]["Physical"]["Dexterity"].totalvalue,
@@ -139,6 +174,9 @@ class CalcAdvantages(QObject):
 		\todo Bislang nicht von der Spezies abhängig: Tiere sollten stets das größere von Dex und Wits als Defense haben.
 		"""
 
+		if self.__postpone(self.calcDefense):
+			return self.__defense
+
 		result = Calc.calc_defense(
 			self.__character.traits["Attribute"]["Mental"]["Wits"].totalvalue,
 			self.__character.traits["Attribute"]["Physical"]["Dexterity"].totalvalue,
@@ -158,6 +196,9 @@ class CalcAdvantages(QObject):
 		Berechnung der Gesundheit.
 		"""
 
+		if self.__postpone(self.calcHealth):
+			return self.__health
+
 		## Bevor ich die Gesundheit ausrechnen kann, muß erst die Größe feststehen.
 		size = self.calc_size()
 
@@ -178,6 +219,9 @@ class CalcAdvantages(QObject):
 		Berechnung der Willenskraft.
 		"""
 
+		if self.__postpone(self.calcWillpower):
+			return self.__willpower
+
 		result = Calc.calc_willpower(
 			self.__character.traits["Attribute"]["Mental"]["Resolve"].totalvalue,
 			self.__character.traits["Attribute"]["Social"]["Composure"].totalvalue,
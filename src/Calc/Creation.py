@@ -60,8 +60,12 @@ class Creation(QObject):
 		self.__creationPoints = self.__storage.creationPoints
 		self.__availablePoints = copy.deepcopy(self.__creationPoints)
 
+		# Die Typen, deren Punkte am Ende von StorageCharacter.batch() neu berechnet werden müssen.
+		self.__postponedTyps = {}
+
 		self.pointsChanged.connect(self.controlPoints)
 		self.__character.speciesChanged.connect(self.controlPoints)
+		self.__character.batchFinished.connect(self.__calcPostponedPoints)
 
 
 	@property
@@ -83,16 +87,28 @@ class Creation(QObject):
 
 		## Herausfinden, welchem Typ diese Eigenschaft angehört.
 		typ = None
-		stopLoop = False
-		for item in self.__storage.traits:
-			for subitem in self.__storage.traits[item]:
-				if trait.identifier in self.__storage.traits[item][subitem]:
-					typ = item
-					stopLoop = True
-					break
-			if stopLoop:
-				break
+		location = self.__storage.traitLocation(trait.identifier)
+		if location is not None:
+			typ = location[0]
+
+		## Werden viele Eigenschaften auf einmal verändert, genügt eine Berechnung je Typ am Ende.
+		if self.__character.isBatching():
+			self.__postponedTyps[typ] = None
+			return
+
+		self.__calcPointsOfTyp(typ)
+		self.pointsChanged.emit(self.__availablePoints)
+
 
+	def __calcPostponedPoints(self):
+		if self.__postponedTyps:
+			for typ in self.__postponedTyps:
+				self.__calcPointsOfTyp(typ)
+			self.__postponedTyps.clear()
+			self.pointsChanged.emit(self.__availablePoints)
+
+
+	def __calcPointsOfTyp(self, typ):
 		pointList = []
 
 		categories = self.__storage.categories(typ)
@@ -144,8 +160,6 @@ class Creation(QObject):
 			self.__availablePoints[self.__character.species][typ] = [x - y for x, y in zip(self.__creationPoints[self.__character.species][typ], pointList)]
 			#Debug.debug("{} {}: {} ({})".format(self.__character.species, typ, self.__availablePoints[self.__character.species], self.__creationPoints[self.__character.species]))
 
-		self.pointsChanged.emit(self.__availablePoints)
-
 
 	def controlPoints(self):
 		"""
@@ -86,11 +86,38 @@ SAVE_DIR = "save"
 # Verzeichnisname für Ressourcen
 RESOURCE_DIR_TEMPLATES = "templates"
 
+# Verzeichnisname für zwischengespeicherte Daten
+CACHE_DIR = "cache"
+
+# Dateiname des Zwischenspeichers für die bereits ausgewerteten Template-Dateien
+TEMPLATE_CACHE_FILE = "templates.cache"
+
 # Dateiendung komprimierter Dateien.
 FILE_SUFFIX_COMPRESSED = "scd"
 # Dateiendung der gespeicherten Charkatere
 FILE_SUFFIX_SAVE = "chr"
 
+# Anzahl der Charakterbögen, die bei der Stapelverarbeitung (--batch-pdf) gleichzeitig erzeugt werden.
+BATCH_EXPORT_POOL_SIZE = 2
+
+# Verfahren, mit welchen die Charakterbögen gezeichnet werden können. Bei "webkit" werden die Html-Seiten von QtWebKit gesetzt, bei "document" von QTextDocument, was ohne WebKit und ohne Event-Loop auskommt, aber nur eine vereinfachte Fassung des Charakterbogens ohne svg-Bilder und mit eingeschränktem Layout zeichnet (siehe RenderSheet). Der erste Eintrag ist die Voreinstellung.
+SHEET_BACKENDS = ( "webkit", "document", )
+
+# Auflösung in dpi, mit welcher die Html-Seiten beim Zeichnen mit QTextDocument auf den Drucker übertragen werden.
+SHEET_DOCUMENT_DPI = 96
+
+# Der Name, unter welchem das Bild des Charakters in einem QTextDocument abgelegt wird (siehe RenderSheet.addDocumentResources()).
+SHEET_DOCUMENT_PICTURE = "characterPicture"
+
+# Zeit in Millisekunden, welche die Vorschau des Charakterbogens nach der letzten Änderung am Charakter wartet, bevor sie die betroffenen Abschnitte neu erzeugt.
+PREVIEW_UPDATE_DELAY = 300
+
+# Anzahl der Charakterbögen (Html-Text und PDF-Dokument), die nach dem Exportieren oder Drucken zwischengespeichert werden, damit ein unveränderter Charakter nicht erneut gezeichnet werden muß.
+RENDER_CACHE_SIZE = 4
+
+# Anzahl der Schritte, welche rückgängig gemacht werden können. Ältere Schritte werden verworfen.
+UNDO_STEPS_MAX = 200
+
 # Zeichen, um Listeneinträge in den XML-Dateien zu trennen
 XML_SEPARATION_SYMBOL = ";"
 
@@ -220,6 +247,9 @@ TRAIT_POWERSTAT_VALUE_DEFAULT = 1
 ## Bezeichnung der Übernatürlichen Grundeigenschaft für alle Spezies
 POWERSTAT_IDENTIFIER = "Powerstat"
 
+## Bezeichnung des Alters in den Voraussetzungen der Eigenschaften.
+AGE_IDENTIFIER = "Age"
+
 ## Wieviele Vinculi sollen auf dem Vampir-Charakterbogen angezeigt werden.
 VINCULI_COUNT_MAX = 5
 VINCULI_LEVEL_MAX = 3
@@ -229,6 +259,13 @@ VINCULI_LEVEL_MAX = 3
 # Alle Punkte bis einschließelich dieser Zahl kosten nur 1 Punkt pro Punkt, aber alle darüber kosten das Doppelte.
 TRAIT_CREATION_DOUBLE_COST = 4
 
+## Gründe, aus denen eine Eigenschaft für den Charakter nicht sichtbar ist: falsche Spezies, Alterskategorie, Ära oder Brut/Fraktion. Sie werden zu einer Bitmaske zusammengefaßt (siehe BasicTrait.hiddenReasons).
+TRAIT_HIDDEN_SPECIES = 1
+TRAIT_HIDDEN_AGE     = 2
+TRAIT_HIDDEN_ERA     = 4
+TRAIT_HIDDEN_ONLY    = 8
+TRAIT_HIDDEN_ALL     = TRAIT_HIDDEN_SPECIES | TRAIT_HIDDEN_AGE | TRAIT_HIDDEN_ERA | TRAIT_HIDDEN_ONLY
+
 ## Standardspezies eines neuen Charakters
 SPECIES_INITIAL = "Human"
 
@@ -26,43 +26,76 @@ SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
 
 
 
-from PyQt4.QtCore import pyqtSignal as Signal
-from PyQt4.QtCore import QObject
-
 #import src.Config as Config
 #from ReadXml import ReadXml
+from src.Datatypes.TraitStore import TraitStore
+from src.Datatypes.TraitSignal import TraitSignal
 import src.Debug as Debug
 #from src.Error import ErrTraitType
 
 
 
 
-class AbstractTrait(QObject):
+class AbstractTrait(object):
 	"""
 	@brief Grundgerüst eines Datentyps für eine Charaktereigenschaft.
+
+	Die Werte der Eigenschaft liegen in einem TraitStore. Die Eigenschaften eines Charakters teilen sich einen gemeinsamen TraitStore, eine allein stehende Eigenschaft erhält einen eigenen.
+
+	Eine Eigenschaft ist nur ein leichtgewichtiger Stellvertreter, der sich seinen TraitStore und seine Nummer darin merkt. Die Signale (siehe TraitSignal) legen ihre Verbindungen ebenfalls im TraitStore ab. Daher können beliebig viele Stellvertreter derselben Eigenschaft existieren, sie sind untereinander gleich und lassen sich als Schlüssel eines dict verwenden.
 	"""
 
 
-	nameChanged = Signal(str)
-	valueChanged = Signal(int)
-	totalvalueChanged = Signal(int)
-	traitChanged = Signal(object)
+	__slots__ = ( "_store", "_index", )
+
 
+	nameChanged = TraitSignal(str)
+	valueChanged = TraitSignal(int)
+	totalvalueChanged = TraitSignal(int)
+	traitChanged = TraitSignal(object)
 
-	def __init__(self, name="", value=0, parent=None):
+
+	def __init__(self, name="", value=0, parent=None, store=None, index=None):
 		"""
-		Die Referenz auf character benötige ich nur, damit ich bei Eigenschaften mit Voraussetzungen diese auch überprüfen kann.
+		\param store Der TraitStore, in welchem die Werte der Eigenschaft unter der Nummer index bereits angelegt sind. In diesem Fall werden name und value nicht beachtet.
 
-		\ref checkPrerequisites
+		\param parent Wird nicht mehr verwendet, da Eigenschaften keine QObjects sind.
 		"""
-		
-		super(AbstractTrait, self).__init__(parent)
 
-		self.__identifier = name
-		self.__name = name
-		self.__value = value
+		if store is None:
+			store = TraitStore()
+			index = store.add(name, { "name": name, }, value, traitClass=type(self))
+		self._store = store
+		self._index = index
+
+
+	@classmethod
+	def fromStore(cls, store, index):
+		"""
+		Erzeugt einen Stellvertreter für die bereits im TraitStore store unter der Nummer index angelegte Eigenschaft.
+		"""
+
+		trait = cls.__new__(cls)
+		trait._store = store
+		trait._index = index
+		return trait
+
+
+	def __eq__(self, other):
+		if not isinstance(other, AbstractTrait):
+			return NotImplemented
+		return self._store is other._store and self._index == other._index
 
-		self.valueChanged.connect(self.totalvalueChanged)
+
+	def __ne__(self, other):
+		result = self.__eq__(other)
+		if result is NotImplemented:
+			return result
+		return not result
+
+
+	def __hash__(self):
+		return hash( ( id(self._store), self._index, ) )
 
 
 	def __lt__(self, other):
@@ -71,38 +104,58 @@ class AbstractTrait(QObject):
 
 	@property
 	def identifier(self):
-		return self.__identifier
+		return self._store.identifiers[self._index]
 
 	@identifier.setter
 	def identifier(self, identifier):
-		self.__identifier = identifier
+		self._store.identifiers[self._index] = identifier
 
 
 	def __getName(self):
-		return self.__name
+		return self._store.names[self._index]
 
 	def setName(self, name):
-		if self.__name != name:
-			self.__name = name
+		if self._store.names[self._index] != name:
+			self._recordChange("name", self._store.names[self._index], name)
+			self._store.names[self._index] = name
 			self.nameChanged.emit(name)
-			self.traitChanged.emit(self)
+			self._emitTraitChanged()
 
 	name = property(__getName, setName)
 
 
+	def _recordChange(self, name, old, new):
+		"""
+		Vermerkt die Änderung des Attributs name im Undo-Verlauf des Charakters, dem die Eigenschaft gehört (siehe UndoHistory).
+		"""
+
+		if self._store.character is not None:
+			self._store.character.history.recordValue(self, name, old, new)
+
+
+	def _emitTraitChanged(self):
+		"""
+		Sendet traitChanged aus. Abgeleitete Klassen können hier zusätzlich den Besitzer der Eigenschaft benachrichtigen, ohne dafür eine Verbindung je Eigenschaft zu benötigen.
+		"""
+
+		self.traitChanged.emit(self)
+
+
 	def _getValue(self):
-		return self.__value
+		return self._store.values[self._index]
 
 	def setValue(self, value):
 		"""
 		Verändert den Wert der Eigenschaft.
 		"""
 		
-		if self.__value != value:
-			self.__value = value
-			Debug.debug( "Ändere Eigenschaft {} zu {}".format(self.name, self.__value), level=3 )
-			self.valueChanged.emit(self.__value)
-			self.traitChanged.emit(self)
+		if self._store.values[self._index] != value:
+			self._recordChange("value", self._store.values[self._index], value)
+			self._store.values[self._index] = value
+			Debug.debug( "Ändere Eigenschaft {} zu {}".format(self.name, value), level=3 )
+			self.valueChanged.emit(value)
+			self.totalvalueChanged.emit(self.totalvalue)
+			self._emitTraitChanged()
 
 	value = property(_getValue, setValue)
 
@@ -26,10 +26,9 @@ SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
 
 
 
-from PyQt4.QtCore import pyqtSignal as Signal
-
 #import src.Config as Config
 from src.Datatypes.AbstractTrait import AbstractTrait
+from src.Datatypes.TraitSignal import TraitSignal
 #from src.Error import ErrTraitType
 #import src.Debug as Debug
 
@@ -41,62 +40,70 @@ class BasicTrait(AbstractTrait):
 	@brief Speichert alle Eigenschaften einer einzigen Charaktereigenschaft.
 
 	Simple Eigenschaften wie Attribute haben nur Name und Wert. Bei Fertigkeiten kommen bereits die Spezialisierungen hinzu, bei  Vorzügen noch die Einschränkungen etc.
+
+	Spezies, Voraussetzungen, cheap und only stammen aus dem Eintrag der Template-Daten (siehe TraitStore.data) und können nicht verändert werden.
+
+	Jede Änderung der Eigenschaft wird unmittelbar im Journal des Charakters (siehe StorageCharacter.journal) vermerkt, ohne daß dafür für jede Eigenschaft eine eigene Verbindung nötig wäre.
 	"""
 
 
-	availableChanged = Signal(bool)
+	__slots__ = ()
+
 
+	availableChanged = TraitSignal(bool)
+	hiddenReasonsChanged = TraitSignal(int)
 
-	def __init__(self, character, name="", value=0, parent=None):
+
+	def __init__(self, character, name="", value=0, parent=None, store=None, index=None):
 		"""
-		Die Referenz auf character benötige ich nur, damit ich bei Eigenschaften mit Voraussetzungen diese auch überprüfen kann.
+		Die Referenz auf character benötige ich nur, damit ich bei Eigenschaften mit Voraussetzungen diese auch überprüfen kann. Sie wird im TraitStore abgelegt, den sich alle Eigenschaften des Charakters teilen.
 
 		\ref checkPrerequisites
 		"""
 		
-		super(BasicTrait, self).__init__(name, value, parent)
+		super(BasicTrait, self).__init__(name, value, parent, store, index)
 
-		self.__character = character
-		self.__species = ""
-		self.__prerequisites = False
-		self.__prerequisitesText = ""
-		self.__available = True
-		## Die Breeds, Factions für welche diese Unterkraft besonders günstig ist.
-		self.cheap = []
-		## Die Breeds, Factions welche diese Unterkraft überhaupt erwerben dürfen.
-		self.only = []
+		if self._store.character is None:
+			self._store.character = character
 
-		# In dieser Liste werden Verweise auf alle Eigenschaften gespeichert, die in den Voraussetzungen erwähnung finden.
-		self.__prerequisiteTraits = []
 
+	def _emitTraitChanged(self):
+		if self._store.character is not None:
+			self._store.character.journal.record(self)
+		super(BasicTrait, self)._emitTraitChanged()
 
-	def __getSpecies(self):
-		return self.__species
 
-	def __setSpecies(self, species):
-		self.__species = species
+	@property
+	def species(self):
+		return self._store.data[self._index].get("species", "")
 
-	species = property(__getSpecies, __setSpecies)
 
+	@property
+	def hasPrerequisites(self):
+		return bool(self._store.data[self._index].get("prerequisites"))
 
-	def __getPrerequisites(self):
-		return self.__prerequisites
 
-	def __setPrerequisites(self, prerequisites):
-		self.__prerequisites = prerequisites
+	@property
+	def prerequisitesText(self):
+		return self._store.data[self._index].get("prerequisites") or ""
 
-	hasPrerequisites = property(__getPrerequisites, __setPrerequisites)
 
+	@property
+	def cheap(self):
+		"""
+		Die Breeds, Factions für welche diese Unterkraft besonders günstig ist.
+		"""
+
+		return self._store.data[self._index].get("cheap", [])
 
-	def __getPrerequisitesText(self):
-		return self.__prerequisitesText
 
-	def __setPrerequisitesText(self, text):
-		if self.__prerequisitesText != text:
-			self.__prerequisitesText = text
-			#self.prerequisitesTextChanged.emit(text)
+	@property
+	def only(self):
+		"""
+		Die Breeds, Factions welche diese Unterkraft überhaupt erwerben dürfen.
+		"""
 
-	prerequisitesText = property(__getPrerequisitesText, __setPrerequisitesText)
+		return self._store.data[self._index].get("only", [])
 
 
 	def isAvailable(self):
@@ -104,20 +111,37 @@ class BasicTrait(AbstractTrait):
 		Gibt zurück, ob die Voraussetzungen der Eigenschaft erfüllt sind, oder nicht.
 		"""
 
-		return self.__available
+		return bool(self._store.available[self._index])
 
 	def setAvailable( self, sw ):
 		"""
 		Legt fest, ob die Eigenschaft zur Verfügung steht oder nicht.
 		"""
 
-		if ( self.__available != sw ):
-			self.__available = sw
+		if ( bool(self._store.available[self._index]) != sw ):
+			self._store.available[self._index] = bool(sw)
 			self.availableChanged.emit( sw )
 
 
+	@property
+	def hiddenReasons(self):
+		"""
+		Die Gründe, aus denen diese Eigenschaft für den Charakter nicht sichtbar ist, als Bitmaske von Config.TRAIT_HIDDEN_SPECIES etc. Ist sie 0, ist die Eigenschaft sichtbar.
+
+		Die Gründe werden von StorageCharacter festgelegt, sobald sich Spezies, Alterskategorie, Ära, Brut oder Fraktion ändern. Nur bei einer tatsächlichen Veränderung wird hiddenReasonsChanged() ausgesandt.
+		"""
+
+		return self._store.hiddenReasons[self._index]
+
+	@hiddenReasons.setter
+	def hiddenReasons(self, reasons):
+		if self._store.hiddenReasons[self._index] != reasons:
+			self._store.hiddenReasons[self._index] = reasons
+			self.hiddenReasonsChanged.emit(reasons)
+
+
 	def checkPrerequisites(self, trait):
-		self.__character.checkPrerequisites(self)
+		self._store.character.checkPrerequisites(self)
 
 
 	@property
@@ -126,17 +150,29 @@ class BasicTrait(AbstractTrait):
 		Eine Liste mit Verweisen auf alle Eigenschaften, die in den Voraussetzungen dieser Eigenschaft vorkommen.
 		"""
 
-		return self.__prerequisiteTraits
+		return self._store.list(self._store.prerequisiteTraits, self._index)
 
 	@prerequisiteTraits.setter
 	def prerequisiteTraits(self, prerequisites):
-		if self.__prerequisiteTraits != prerequisites:
-			self.__prerequisiteTraits = prerequisites
+		self._store.prerequisiteTraits[self._index] = prerequisites
 
 	def addPrerequisiteTrait(self, prerequisite):
 		"""
 		Fügt den Verweis auf eine Eigenschaft hinzu.
 		"""
 
-		self.__prerequisiteTraits.append(prerequisite)
+		self.prerequisiteTraits.append(prerequisite)
+
+
+	@property
+	def prerequisitesCheck(self):
+		"""
+		Eine Funktion ohne Argumente, welche zurückgibt, ob die Voraussetzungen erfüllt sind. Solange die Voraussetzungen nicht mit den übrigen Eigenschaften verknüpft wurden, ist dies None.
+		"""
+
+		return self._store.prerequisitesChecks[self._index]
+
+	@prerequisitesCheck.setter
+	def prerequisitesCheck(self, check):
+		self._store.prerequisitesChecks[self._index] = check
 
@@ -26,11 +26,10 @@ SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
 
 
 
-from PyQt4.QtCore import pyqtSignal as Signal
-
 #import src.Config as Config
 #from src.Datatypes.AbstractTrait import AbstractTrait
 from src.Datatypes.StandardTrait import StandardTrait
+from src.Datatypes.TraitSignal import TraitSignal
 #import src.Debug as Debug
 #from src.Error import ErrTraitType
 
@@ -43,20 +42,11 @@ class BonusTrait(StandardTrait):
 	"""
 
 
-	bonusSpecialtiesChanged = Signal(object)
-	bonusValueChanged = Signal(object)
-
+	__slots__ = ()
 
-	def __init__(self, character, name="", value=0, parent=None):
-		super(BonusTrait, self).__init__(character, name, value, parent)
 
-		self.__bonusValue = 0
-		self.__bonusSpecialties = []
-
-		self.valueChanged.connect(self.emitTotalvalueChanged)
-		self.bonusValueChanged.connect(self.emitTotalvalueChanged)
-		self.specialtiesChanged.connect(self.emitTotalspecialtiesChanged)
-		self.bonusSpecialtiesChanged.connect(self.emitTotalspecialtiesChanged)
+	bonusSpecialtiesChanged = TraitSignal(object)
+	bonusValueChanged = TraitSignal(object)
 
 
 	@property
@@ -68,16 +58,12 @@ class BonusTrait(StandardTrait):
 		return self.value + self.bonusValue
 
 
-	def emitTotalvalueChanged(self, value):
-		self.totalvalueChanged.emit(self.totalvalue)
-
-
 	def __getBonusValue(self):
-		return self.__bonusValue
+		return self._store.bonusValues[self._index]
 
 	def __setBonusValue(self, bonusValue):
-		if self.__bonusValue != bonusValue:
-			self.__bonusValue = bonusValue
+		if self._store.bonusValues[self._index] != bonusValue:
+			self._store.bonusValues[self._index] = bonusValue
 			self.bonusValueChanged.emit(bonusValue)
 			self.totalvalueChanged.emit(self.totalvalue)
 
@@ -85,13 +71,14 @@ class BonusTrait(StandardTrait):
 
 
 	def __getBonusSpecialties(self):
-		return self.__bonusSpecialties
+		return self._store.list(self._store.bonusSpecialties, self._index)
 
 	def __setBonusSpecialties(self, bonusSpecialties):
-		if self.__bonusSpecialties != bonusSpecialties:
-			self.__bonusSpecialties = bonusSpecialties
+		if self.__getBonusSpecialties() != bonusSpecialties:
+			self._store.bonusSpecialties[self._index] = bonusSpecialties
 			self.bonusSpecialtiesChanged.emit(bonusSpecialties)
-			self.traitChanged.emit(self)
+			self.totalspecialtiesChanged.emit(self.totalspecialties)
+			self._emitTraitChanged()
 
 	bonusSpecialties = property(__getBonusSpecialties, __setBonusSpecialties)
 
@@ -103,10 +90,6 @@ class BonusTrait(StandardTrait):
 		return result
 
 
-	def emitTotalspecialtiesChanged(self, value):
-		self.totalspecialtiesChanged.emit(self.totalspecialties)
-
-
 	def appendBonusSpecialty(self, name):
 		"""
 		Fügt der Liste von Bonusspezialisierungen eine hinzu.
@@ -114,9 +97,10 @@ class BonusTrait(StandardTrait):
 		\note Diese Methode muß verwendet werden, wenn man das Signal \ref bonusSpecialtiesChanged nutzen möchte.
 		"""
 
-		self.__bonusSpecialties.append(name)
+		self.bonusSpecialties.append(name)
 		self.bonusSpecialtiesChanged.emit(self.bonusSpecialties)
-		self.traitChanged.emit(self)
+		self.totalspecialtiesChanged.emit(self.totalspecialties)
+		self._emitTraitChanged()
 
 	def removeBonusSpecialty(self, name):
 		"""
@@ -125,9 +109,10 @@ class BonusTrait(StandardTrait):
 		\note Diese Methode muß verwendet werden, wenn man das Signal \ref bonusSpecialtiesChanged nutzen möchte.
 		"""
 
-		self.__bonusSpecialties.remove(name)
+		self.bonusSpecialties.remove(name)
 		self.bonusSpecialtiesChanged.emit(self.bonusSpecialties)
-		self.traitChanged.emit(self)
+		self.totalspecialtiesChanged.emit(self.totalspecialties)
+		self._emitTraitChanged()
 
 
 	def clearBonus(self):
@@ -135,8 +120,10 @@ class BonusTrait(StandardTrait):
 		Entfernt alle Bonus-Werte dieser Eigenschaft.
 		"""
 
-		self.__bonusValue = 0
-		self.__bonusSpecialties = []
-		self.bonusValueChanged.emit(self.__bonusValue)
-		self.bonusSpecialtiesChanged.emit(self.__bonusSpecialties)
-		self.traitChanged.emit(self)
+		self._store.bonusValues[self._index] = 0
+		self._store.bonusSpecialties[self._index] = []
+		self.bonusValueChanged.emit(0)
+		self.totalvalueChanged.emit(self.totalvalue)
+		self.bonusSpecialtiesChanged.emit(self.bonusSpecialties)
+		self.totalspecialtiesChanged.emit(self.totalspecialties)
+		self._emitTraitChanged()
@@ -26,10 +26,9 @@ SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
 
 
 
-from PyQt4.QtCore import pyqtSignal as Signal
-
 #import src.Config as Config
 from src.Datatypes.BasicTrait import BasicTrait
+from src.Datatypes.TraitSignal import TraitSignal
 #from src.Error import ErrTraitType
 #import src.Debug as Debug
 
@@ -44,35 +43,35 @@ class StandardTrait(BasicTrait):
 	"""
 
 
-	customTextChanged = Signal(str)
-	specialtiesChanged = Signal(object)
-	totalspecialtiesChanged = Signal(object)
+	__slots__ = ()
 
 
-	def __init__(self, character, name="", value=0, parent=None):
-		super(StandardTrait, self).__init__(character, name, value, parent)
+	customTextChanged = TraitSignal(str)
+	specialtiesChanged = TraitSignal(object)
+	totalspecialtiesChanged = TraitSignal(object)
 
-		self.__specialties = []
-		self.__age = ""
-		self.__era = ""
-		self.__custom = False
-		self.__customText = ""
 
-		self.specialtiesChanged.connect(self.totalspecialtiesChanged)
+	def _getSpecialties(self):
+		return self._store.list(self._store.specialties, self._index)
 
+	def __setSpecialties(self, specialties):
+		"""
+		Legt die Spezialisierungen fest.
 
-	def __getSpecialties(self):
-		return self.__specialties
+		\note Es wird eine Kopie von specialties gespeichert, damit spätere Änderungen an der Liste weder den Speicher noch die bereits aufgezeichneten Deltas (siehe StorageCharacter.history) verändern.
+		"""
 
-	def __setSpecialties(self, specialties):
-		if self.__specialties != specialties:
-			self.__specialties = specialties
+		if self._getSpecialties() != specialties:
+			specialties = list(specialties)
+			self._recordChange("specialties", list(self._getSpecialties()), list(specialties))
+			self._store.specialties[self._index] = specialties
 			self.specialtiesChanged.emit(specialties)
-			self.traitChanged.emit(self)
+			self.totalspecialtiesChanged.emit(self.totalspecialties)
+			self._emitTraitChanged()
 
-	specialties = property(__getSpecialties, __setSpecialties)
+	specialties = property(_getSpecialties, __setSpecialties)
 
-	totalspecialties = property(__getSpecialties)
+	totalspecialties = property(_getSpecialties)
 
 	def appendSpecialty(self, name):
 		"""
@@ -81,9 +80,7 @@ class StandardTrait(BasicTrait):
 		\note Diese Methode muß verwendet werden, wenn man das Signal \ref specialtyChanged nutzen möchte.
 		"""
 
-		self.__specialties.append(name)
-		self.specialtiesChanged.emit(self.specialties)
-		self.traitChanged.emit(self)
+		self.specialties = self._getSpecialties() + [ name ]
 
 	def removeSpecialty(self, name):
 		"""
@@ -92,43 +89,41 @@ class StandardTrait(BasicTrait):
 		\note Diese Methode muß verwendet werden, wenn man das Signal \ref specialtyChanged nutzen möchte.
 		"""
 
-		if name in self.__specialties:
-			self.__specialties.remove(name)
-			self.specialtiesChanged.emit(self.specialties)
-			self.traitChanged.emit(self)
+		if name in self._getSpecialties():
+			specialties = list(self._getSpecialties())
+			specialties.remove(name)
+			self.specialties = specialties
 
 
-	def __getEra(self):
-		return self.__era
+	@property
+	def era(self):
+		return self._store.data[self._index].get("era", "")
 
-	def __setEra(self, era):
-		self.__era = era
 
-	era = property(__getEra, __setEra)
+	@property
+	def age(self):
+		return self._store.data[self._index].get("age", "")
 
 
-	def __getAge(self):
-		return self.__age
-
-	def __setAge(self, age):
-		self.__age = age
-
-	age = property(__getAge, __setAge)
+	@property
+	def custom(self):
+		"""
+		Eigenschaften mit Zusatztext (bspw. Language) können mehrfach gewählt werden.
+		"""
 
+		return bool(self._store.data[self._index].get("custom"))
 
 	def isCustom(self):
-		return self.__custom
-
-	def setCustom(self, custom):
-		self.__custom = custom
+		return self.custom
 
 
 	def __getCustomText(self):
-		return self.__customText
+		return self._store.customTexts[self._index]
 
 	def __setCustomText(self, text):
-		if self.__customText != text:
-			self.__customText = text
+		if self._store.customTexts[self._index] != text:
+			self._recordChange("customText", self._store.customTexts[self._index], text)
+			self._store.customTexts[self._index] = text
 			self.customTextChanged.emit(text)
 
 	customText = property(__getCustomText, __setCustomText)
\ No newline at end of file
@@ -45,14 +45,21 @@ class SubPowerTrait(BasicTrait):
 	"""
 
 
+	__slots__ = ()
+
+
 	#specialtiesChanged = Signal(object)
 
 
-	def __init__(self, character, name="", value=0, level=0, parent=None):
-		super(SubPowerTrait, self).__init__(character, name, value, parent)
+	def __init__(self, character, name="", value=0, level=0, parent=None, store=None, index=None):
+		"""
+		Stufe und Kräfte stammen aus dem Eintrag der Template-Daten. Nur bei einer Eigenschaft ohne TraitStore wird level übernommen.
+		"""
 
-		self.__level = level
-		self.__powers = {}
+		super(SubPowerTrait, self).__init__(character, name, value, parent, store, index)
+
+		if store is None:
+			self._store.data[self._index]["level"] = level
 
 
 	def _getValue(self):
@@ -80,19 +87,9 @@ class SubPowerTrait(BasicTrait):
 
 	@property
 	def level(self):
-		return self.__level
-
-	@level.setter
-	def level(self, level):
-		if self.__level != level:
-			self.__level = level
-			self.traitChanged.emit(self)
+		return self._store.data[self._index].get("level", 0)
 
 
 	@property
 	def powers(self):
-		return self.__powers
-
-	@powers.setter
-	def powers(self, powers):
-		self.__powers = powers
\ No newline at end of file
+		return self._store.data[self._index].get("powers", {})
\ No newline at end of file
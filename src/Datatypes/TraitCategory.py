@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+import collections.abc
+
+
+
+
+class TraitCategory(collections.abc.Mapping):
+	"""
+	@brief Die Eigenschaften einer Kategorie eines Charakters.
+
+	Verhält sich wie ein dict, welches jedem Schlüssel (normalerweise dem Identifier, bei Eigenschaften mit Zusatztext mit numerischem Suffix) eine Eigenschaft zuordnet. Gespeichert wird allerdings nur die Nummer der Eigenschaft im TraitStore. Die Eigenschaft selbst wird erst beim Zugriff als Stellvertreter erzeugt (siehe TraitStore.trait()).
+	"""
+
+
+	def __init__(self, store):
+		self.__store = store
+		self.__indexes = {}
+
+
+	def add(self, key, index):
+		"""
+		Fügt die Eigenschaft mit der Nummer index unter dem Schlüssel key hinzu.
+		"""
+
+		self.__indexes[key] = index
+
+
+	def __getitem__(self, key):
+		return self.__store.trait(self.__indexes[key])
+
+
+	def __contains__(self, key):
+		return key in self.__indexes
+
+
+	def __iter__(self):
+		return iter(self.__indexes)
+
+
+	def __len__(self):
+		return len(self.__indexes)
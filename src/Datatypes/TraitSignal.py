@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+import inspect
+import weakref
+
+
+
+
+## Die Anzahl der Argumente, welche die Funktionen der bereits verbundenen Slots annehmen.
+_argumentCounts = weakref.WeakKeyDictionary()
+
+
+
+
+def _argumentCount(slot):
+	"""
+	Gibt zurück, wieviele Argumente slot höchstens annimmt. Kann dies nicht ermittelt werden, oder nimmt slot beliebig viele Argumente an, wird None zurückgegeben.
+
+	Wie bei Qt darf ein Slot weniger Argumente annehmen, als das Signal überträgt. Überzählige Argumente werden dann einfach nicht übergeben.
+	"""
+
+	function = getattr(slot, "__func__", slot)
+	if function in _argumentCounts:
+		count = _argumentCounts[function]
+	else:
+		try:
+			parameters = inspect.signature(function).parameters.values()
+		except ( TypeError, ValueError, ):
+			return None
+		if any( parameter.kind == inspect.Parameter.VAR_POSITIONAL for parameter in parameters ):
+			count = None
+		else:
+			count = len([ parameter for parameter in parameters if parameter.kind in ( inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD, ) ])
+		if inspect.isfunction(function):
+			_argumentCounts[function] = count
+
+	## Bei einer gebundenen Methode wird self nicht übergeben.
+	if count is not None and function is not slot:
+		count -= 1
+	return count
+
+
+
+
+class _StrongReference(object):
+	"""
+	@brief Hält einen Slot fest, der nicht über eine schwache Referenz erreicht werden kann.
+
+	Wie weakref.WeakMethod liefert der Aufruf den Slot.
+	"""
+
+
+	__slots__ = ( "__slot", )
+
+
+	def __init__(self, slot):
+		self.__slot = slot
+
+
+	def __call__(self):
+		return self.__slot
+
+
+
+
+def _removeConnection(connections, key, reference):
+	"""
+	Entfernt die Verbindung mit der Referenz reference aus den Verbindungen des Signals key.
+	"""
+
+	slots = connections.get(key, [])
+	for i in range(len(slots)):
+		if slots[i][0] is reference:
+			del slots[i]
+			break
+	if not slots:
+		connections.pop(key, None)
+
+
+
+
+class TraitSignal(object):
+	"""
+	@brief Signal einer Eigenschaft, dessen Verbindungen im TraitStore der Eigenschaft liegen.
+
+	Die Eigenschaften eines Charakters sind keine QObjects, sondern leichtgewichtige Stellvertreter, die bei Bedarf erzeugt werden (siehe TraitStore.trait()). Damit eine Verbindung länger besteht als der Stellvertreter, über den sie hergestellt wurde, werden die Slots im TraitStore unter der Nummer der Eigenschaft abgelegt. Jeder Stellvertreter derselben Eigenschaft sendet daher an dieselben Slots.
+
+	Die Verwendung entspricht den Signalen von PyQt: connect(), disconnect() und emit(). Die Slots werden unmittelbar in der Reihenfolge aufgerufen, in welcher sie verbunden wurden.
+
+	Wie bei PyQt hält eine Verbindung zu einer gebundenen Methode deren Objekt nicht am Leben. Wird das Objekt zerstört, wird die Verbindung gelöst. Andere Slots, beispielsweise lambda-Funktionen, werden festgehalten. Ist bei der Verbindung ein Empfänger angegeben, wird sie gelöst, sobald dieser zerstört wird (siehe BoundTraitSignal.connect()).
+	"""
+
+
+	def __init__(self, *types):
+		## Die Typen der Argumente dienen nur der Dokumentation.
+		self.types = types
+
+
+	def __get__(self, trait, traitClass=None):
+		if trait is None:
+			return self
+		return BoundTraitSignal(self, trait._store, trait._index)
+
+
+
+
+class BoundTraitSignal(object):
+	"""
+	@brief Das Signal einer bestimmten Eigenschaft.
+	"""
+
+
+	__slots__ = ( "__key", "__store", )
+
+
+	def __init__(self, signal, store, index):
+		self.__key = ( signal, index, )
+		self.__store = store
+
+
+	def connect(self, slot, receiver=None):
+		"""
+		Verbindet das Signal mit slot. Ein anderes Signal kann ebenfalls als Slot dienen.
+
+		\param receiver Ein QObject, bei dessen Zerstörung die Verbindung gelöst wird. Dies ist nötig, wenn slot keine gebundene Methode ist, aber das Objekt verwendet, beispielsweise eine lambda-Funktion, welche eine Methode des Widgets aufruft.
+		"""
+
+		if not callable(slot):
+			slot = slot.emit
+		connections = self.__store.connections
+		key = self.__key
+		## Die Methoden von BoundTraitSignal gehören zu Objekten, die nur kurz bestehen.
+		if inspect.ismethod(slot) and not isinstance(slot.__self__, BoundTraitSignal):
+			reference = weakref.WeakMethod(slot, lambda reference: _removeConnection(connections, key, reference))
+		else:
+			reference = _StrongReference(slot)
+		connections.setdefault(key, []).append( ( reference, _argumentCount(slot), ) )
+		if receiver is not None:
+			receiver.destroyed.connect(lambda: _removeConnection(connections, key, reference))
+
+
+	def disconnect(self, slot=None):
+		"""
+		Löst die Verbindung zu slot. Ohne Angabe werden sämtliche Verbindungen dieses Signals gelöst.
+		"""
+
+		if slot is None:
+			self.__store.connections.pop(self.__key, None)
+			return
+
+		if not callable(slot):
+			slot = slot.emit
+		slots = self.__store.connections.get(self.__key, [])
+		for i in range(len(slots)):
+			if slots[i][0]() == slot:
+				del slots[i]
+				return
+		raise TypeError("disconnect() failed between signal and {}".format(slot))
+
+
+	def emit(self, *args):
+		for reference, count in list(self.__store.connections.get(self.__key, ())):
+			slot = reference()
+			if slot is None:
+				continue
+			if count is None:
+				slot(*args)
+			else:
+				slot(*args[:count])
+
+	__call__ = emit
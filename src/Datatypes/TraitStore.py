@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+from array import array
+
+
+
+
+class TraitStore(object):
+	"""
+	@brief Die veränderlichen Werte aller Eigenschaften eines Charakters in flachen Feldern.
+
+	Jede Eigenschaft erhält beim Anlegen mit add() eine fortlaufende Nummer. Unter dieser Nummer liegen ihre Werte in den Feldern dieser Klasse, die Eigenschaft selbst (siehe AbstractTrait) merkt sich nur den TraitStore und ihre Nummer. Sie wird daher erst bei Bedarf von trait() als Stellvertreter erzeugt und muß nicht aufbewahrt werden; auch die Verbindungen ihrer Signale liegen hier (siehe TraitSignal). Die unveränderlichen Angaben aus den Template-Daten (Spezies, Alter, Ära, Voraussetzungen etc.) werden nicht kopiert, sondern aus dem Eintrag der Template-Daten gelesen, welcher in data abgelegt ist.
+
+	Die Felder sind öffentlich, werden aber nur von den Eigenschaften gelesen und verändert, damit die Signale der Eigenschaften weiterhin ausgesandt werden.
+
+	\note Spezialisierungen, Bonusspezialisierungen und die Verweise auf die Voraussetzungen sind None, bis sie das erste Mal benötigt werden, da die allermeisten Eigenschaften keine haben.
+	"""
+
+
+	def __init__(self, character=None):
+		## Der Charakter, dem die Eigenschaften gehören.
+		self.character = character
+
+		self.identifiers = []
+		self.names = []
+		## Der Eintrag der Template-Daten jeder Eigenschaft.
+		self.data = []
+		self.values = array("i")
+		## Die Anfangswerte, auf welche resetCharacter() die Eigenschaften zurücksetzt.
+		self.defaults = array("i")
+		self.bonusValues = array("i")
+		self.available = bytearray()
+		## Die Gründe, aus denen eine Eigenschaft nicht sichtbar ist, als Bitmaske von Config.TRAIT_HIDDEN_SPECIES etc. Werden von StorageCharacter gepflegt.
+		self.hiddenReasons = bytearray()
+		self.customTexts = []
+		self.specialties = []
+		self.bonusSpecialties = []
+		self.prerequisiteTraits = []
+		self.prerequisitesChecks = []
+		## Die Klasse jeder Eigenschaft, mit welcher trait() ihren Stellvertreter erzeugt.
+		self.traitClasses = []
+		## Die Slots, welche mit den Signalen der Eigenschaften verbunden sind (siehe TraitSignal). Der Aufruf der Referenz liefert den Slot, oder None, wenn dessen Objekt bereits zerstört wurde.
+		#
+		# {
+		# 	(Signal1, Nummer1): [ (Referenz auf Slot1, Anzahl der Argumente1), ... ],
+		# 	...
+		# }
+		self.connections = {}
+
+
+	def __len__(self):
+		return len(self.values)
+
+
+	def add(self, identifier, data, value=0, customText=None, traitClass=None):
+		"""
+		Legt die Werte einer weiteren Eigenschaft an.
+
+		\param data Der Eintrag der Template-Daten, aus welchem die unveränderlichen Angaben der Eigenschaft gelesen werden. Es muß mindestens "name" enthalten sein.
+
+		\param value Der Anfangswert der Eigenschaft.
+
+		\param traitClass Die Klasse der Eigenschaft (bspw. StandardTrait), mit welcher trait() ihre Stellvertreter erzeugt.
+
+		\return Die Nummer der Eigenschaft.
+		"""
+
+		index = len(self.values)
+		self.identifiers.append(identifier)
+		self.names.append(data["name"])
+		self.data.append(data)
+		self.values.append(value)
+		self.defaults.append(value)
+		self.bonusValues.append(0)
+		self.available.append(True)
+		self.hiddenReasons.append(0)
+		self.customTexts.append(customText)
+		self.specialties.append(None)
+		self.bonusSpecialties.append(None)
+		self.prerequisiteTraits.append(None)
+		self.prerequisitesChecks.append(None)
+		self.traitClasses.append(traitClass)
+		return index
+
+
+	def trait(self, index):
+		"""
+		Gibt die Eigenschaft mit der Nummer index zurück.
+
+		\note Jeder Aufruf erzeugt einen neuen Stellvertreter. Alle Stellvertreter derselben Eigenschaft sind gleich (==) und teilen sich Werte und Signalverbindungen.
+		"""
+
+		return self.traitClasses[index].fromStore(self, index)
+
+
+	def list(self, column, index):
+		"""
+		Gibt die Liste an Position index des Feldes column zurück. Ist dort noch keine Liste abgelegt, wird eine leere erzeugt.
+		"""
+
+		result = column[index]
+		if result is None:
+			result = []
+			column[index] = result
+		return result
+
+
+	def modified(self):
+		"""
+		Gibt die Nummern aller Eigenschaften zurück, deren Wert, Zusatztext oder Spezialisierungen vom Anfangszustand abweichen.
+		"""
+
+		return [ index for index in range(len(self.values)) if self.values[index] != self.defaults[index] or self.customTexts[index] or self.specialties[index] ]
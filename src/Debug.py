@@ -35,6 +35,7 @@ Erlaubt einfachen Zugriff auf Debug-Informationen.
 
 import inspect
 import time
+import json
 
 import src.Config as Config
 import src.GlobalState as GlobalState
@@ -96,9 +97,117 @@ def _debug_prefix( level ):
 			#print("{}\t{:<78}\t{}".format(item[0], item[1], item[3]))
 
 
-def timehook( level=Config.DEBUG_LEVEL_STD + 1 ):
-	if GlobalState.debug_level >= level:
-		return time.time()
+## Die Zeiten, welche timesince() für die einzelnen Phasen gemessen hat, solange mittels profile_begin() gemessen wird. Für jede Seite (None, wenn die Phase keiner Seite zugeordnet ist) ein Dictionary, das jeder Phase die Anzahl der Messungen und die Summe der Zeiten in Sekunden zuordnet.
+_profile = None
+
+
+def profile_begin():
+	"""
+	Beginnt, die Zeiten aller Phasen aufzuzeichnen, die timehook() und timesince() messen.
+	"""
+
+	global _profile
+	_profile = {}
+
+
+def profile_end():
+	"""
+	Beendet die Aufzeichnung.
+
+	\return Die aufgezeichneten Zeiten (siehe profile_report()).
+	"""
+
+	global _profile
+	result = _profile
+	_profile = None
+	return result
+
+
+def profiling():
+	"""
+	Gibt an, ob die Zeiten gerade aufgezeichnet werden.
+	"""
+
+	return _profile is not None
+
+
+def profile_add( page, phase, seconds, count=1 ):
+	if _profile is None:
+		return
+
+	entry = _profile.setdefault(page, {}).setdefault(phase, [ 0, 0 ])
+	entry[0] += count
+	entry[1] += seconds
+
+
+def profile_merge( profile ):
+	"""
+	Fügt die Zeiten einer anderen Aufzeichnung, beispielsweise aus einem anderen Prozeß, zur laufenden Aufzeichnung hinzu.
+	"""
+
+	for page, phases in profile.items():
+		for phase, entry in phases.items():
+			profile_add( page, phase, entry[1], count=entry[0] )
+
+
+def profile_report( profile ):
+	"""
+	Bereitet die aufgezeichneten Zeiten so auf, daß sie beispielsweise als JSON ausgegeben werden können.
+
+	Phasen, deren Name einen "/" enthält, sind Teil einer anderen Phase (beispielsweise "html/attributes" als Teil von "html") und werden bei den Summen für eine Seite nicht mitgezählt.
+
+	\return Ein Dictionary mit der Aufschlüsselung nach Seite und Phase ("pages"), den Summen jeder Phase über alle Seiten ("phases") und der Gesamtzeit ("seconds").
+	"""
+
+	pages = []
+	phases = {}
+	seconds = 0
+	for page in sorted( profile.keys(), key=lambda item: -1 if item is None else item ):
+		pagePhases = {}
+		pageSeconds = 0
+		for phase, entry in sorted( profile[page].items() ):
+			pagePhases[phase] = { "count": entry[0], "seconds": entry[1], }
+			total = phases.setdefault(phase, { "count": 0, "seconds": 0, })
+			total["count"] += entry[0]
+			total["seconds"] += entry[1]
+			if "/" not in phase:
+				pageSeconds += entry[1]
+		pages.append( { "page": page, "phases": pagePhases, "seconds": pageSeconds, } )
+		seconds += pageSeconds
+
+	return {
+		"pages": pages,
+		"phases": phases,
+		"seconds": seconds,
+	}
+
+
+def profile_write( fileName, profile ):
+	"""
+	Schreibt die aufgezeichneten Zeiten als JSON in die Datei fileName, zusammen mit der Programmversion und dem Verfahren, mit welchem die Charakterbögen gezeichnet wurden, damit sich verschiedene Versionen vergleichen lassen.
+	"""
+
+	report = {
+		"program": Config.PROGRAM_NAME,
+		"version": Config.version(),
+		"backend": GlobalState.sheet_backend,
+		"created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+	}
+	report.update( profile_report(profile) )
+
+	with open(fileName, mode="w") as fo:
+		json.dump(report, fo, indent=1, sort_keys=True)
+
+
+def timehook( level=Config.DEBUG_LEVEL_STD + 1, phase=None ):
+	"""
+	Gibt den Startzeitpunkt für eine Messung mit timesince() zurück.
+
+	\note Es wird nur gemessen, wenn der Debug-Level mindestens level beträgt oder die Phase phase aufgezeichnet wird (siehe profile_begin()). Ansonsten wird None zurückgegeben.
+	"""
+
+	if GlobalState.debug_level >= level or ( phase is not None and _profile is not None ):
+		return time.perf_counter()
 
 
 def timer( start, end, text=None, level=Config.DEBUG_LEVEL_STD + 1 ):
@@ -112,7 +221,16 @@ def timer( start, end, text=None, level=Config.DEBUG_LEVEL_STD + 1 ):
 	debug( "{time:.3f} seconds{text}".format(text=_text, time=(end - start) ), level=level )
 
 
-def timesince( start, text=None, level=Config.DEBUG_LEVEL_STD + 1 ):
+def timesince( start, text=None, level=Config.DEBUG_LEVEL_STD + 1, phase=None, page=None ):
+	"""
+	Gibt die seit start vergangene Zeit aus und zeichnet sie als Phase phase der Seite page auf, wenn gerade aufgezeichnet wird.
+	"""
+
+	if start is None:
+		return
+
+	end = time.perf_counter()
+	if phase is not None:
+		profile_add( page, phase, end - start )
 	if GlobalState.debug_level >= level:
-		end = time.time()
 		timer(start, end, text, level=level)
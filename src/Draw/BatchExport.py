@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+import os
+import sys
+import glob
+import time
+import collections
+
+from PyQt4.QtCore import pyqtSignal as Signal
+from PyQt4.QtCore import QObject, QTimer
+from PyQt4.QtGui import QPrinter
+
+import src.Config as Config
+from src.Error import ErrXmlVersion, ErrXmlParsing, ErrFileNotOpened, ErrSpeciesNotExisting
+from src.Storage.StorageTemplate import StorageTemplate
+from src.Storage.StorageCharacter import StorageCharacter
+from src.IO.ReadXmlTemplate import ReadXmlTemplate
+from src.IO.ReadXmlCharacter import ReadXmlCharacter
+import src.IO.Shell as Shell
+import src.Work.ConnectPrerequisites as ConnectPrerequisites
+from src.Draw.RenderSheet import RenderSheet
+
+from res import rc_resource
+
+
+
+
+def collect_files( source=None ):
+	"""
+	Gibt die Liste der zu exportierenden Charakter-Dateien zurück.
+
+	\param source Ein Verzeichnis, dessen sämtliche Charakter-Dateien exportiert werden, oder eine einzelne Datei. Bei None oder "-" werden die Dateinamen zeilenweise von der Standardeingabe gelesen.
+	"""
+
+	if source is None or source == "-":
+		return [ line.strip() for line in sys.stdin if line.strip() ]
+	elif os.path.isdir(source):
+		return sorted( glob.glob( os.path.join( source, "*.{}".format(Config.FILE_SUFFIX_SAVE) ) ) )
+	else:
+		return [ source ]
+
+
+def pdf_file_names( files, exportDir ):
+	"""
+	Ordnet jeder Datei aus files den Namen ihrer PDF-Datei im Verzeichnis exportDir zu.
+
+	\note Gleichnamige Dateien aus verschiedenen Verzeichnissen ergäben dieselbe PDF-Datei und würden einander überschreiben. Nur die erste dieser Dateien erhält daher einen Namen, alle weiteren werden als Kollision mit der ersten vermerkt.
+
+	\return Tupel aus einem Dictionary Datei -> Name der PDF-Datei und einem Dictionary Datei -> Datei, welche diese PDF-Datei bereits erzeugt.
+	"""
+
+	names = {}
+	collisions = {}
+	owners = {}
+	for source in files:
+		if source in names or source in collisions:
+			continue
+
+		fileName = os.path.join( exportDir, "{}.pdf".format( os.path.splitext( os.path.basename(source) )[0] ) )
+		key = os.path.normcase( os.path.abspath(fileName) )
+		if key in owners:
+			collisions[source] = owners[key]
+		else:
+			owners[key] = source
+			names[source] = fileName
+
+	return ( names, collisions, )
+
+
+def pdf_printer( fileName ):
+	"""
+	Erzeugt einen Drucker, der in die PDF-Datei fileName schreibt. Die Einstellungen entsprechen denen des Exports aus dem Hauptfenster.
+	"""
+
+	printer = QPrinter(QPrinter.PrinterResolution)
+	printer.setOutputFormat( QPrinter.PdfFormat )
+	printer.setPaperSize( QPrinter.A4 )
+	printer.setFullPage( True )
+	printer.setOutputFileName( fileName )
+	return printer
+
+
+
+
+class _ExportSlot(object):
+	"""
+	Ein Platz im Pool von BatchExport: ein Charakter samt Leser und Charakterbogen, die für alle Dateien dieses Platzes wiederverwendet werden.
+	"""
+
+	def __init__(self, storage):
+		self.character = StorageCharacter(storage)
+		ConnectPrerequisites.build_connection(storage, self.character)
+		self.reader = ReadXmlCharacter(self.character)
+		self.reader.exception_raised.connect(self.__printException)
+		## Der Charakterbogen benötigt bei seiner Erzeugung einen Drucker und wird daher erst beim ersten Export angelegt.
+		self.sheet = None
+		self.fileName = None
+		self.start = None
+
+
+	def __printException(self, text, error_type):
+		if error_type == "warning":
+			Shell.print_warning(self.fileName, text)
+		else:
+			Shell.print_error(self.fileName, text)
+
+
+
+
+class BatchExport(QObject):
+	"""
+	\brief Erzeugt die Charakterbögen vieler gespeicherter Charaktere als PDF-Dateien, ohne das Hauptfenster aufzubauen.
+
+	Die Template-Daten werden nur einmal eingelesen. Jeder der poolSize Plätze besitzt einen eigenen Charakter und eine eigene RenderSheet-Instanz, die für alle Dateien dieses Platzes weiterverwendet werden. Da RenderSheet nach jeder Seite auf QWebPage warten muß, arbeiten mehrere Plätze abwechselnd in derselben Event-Loop.
+
+	Nach der letzten Datei werden die benötigten Zeiten ausgegeben und finished ausgesandt.
+
+	\code
+	exporter = BatchExport( collect_files("save"), "pdf" )
+	exporter.finished.connect(app.quit)
+	QTimer.singleShot(0, exporter.start)
+	\endcode
+	"""
+
+
+	finished = Signal()
+
+
+	def __init__(self, files, exportDir, poolSize=Config.BATCH_EXPORT_POOL_SIZE, parent=None):
+		super(BatchExport, self).__init__(parent)
+
+		self.__exportDir = exportDir
+		## Dateiname -> Name der PDF-Datei
+		self.__fileNames, self.__collisions = pdf_file_names( files, exportDir )
+		self.__queue = collections.deque( self.__fileNames.keys() )
+		self.__poolSize = max( 1, poolSize )
+
+		self.__storage = StorageTemplate(self)
+		self.__slots = []
+
+		## Liste aus Tupeln (Dateiname, benötigte Zeit in Sekunden)
+		self.__times = []
+		self.__failures = []
+		self.__timeTemplates = 0
+		self.__timeStart = None
+		self.__isFinished = False
+
+
+	@property
+	def times(self):
+		return self.__times
+
+
+	@property
+	def failures(self):
+		return self.__failures
+
+
+	def start(self):
+		"""
+		Liest die Template-Daten ein und beginnt mit dem Export.
+		"""
+
+		timeStart = time.perf_counter()
+		try:
+			ReadXmlTemplate(self.__storage).read()
+		except ( ErrXmlVersion, ErrXmlParsing, ErrFileNotOpened ) as e:
+			Shell.print_error( e, critical=True )
+			self.__queue.clear()
+		self.__timeTemplates = time.perf_counter() - timeStart
+
+		if not os.path.isdir(self.__exportDir):
+			os.makedirs(self.__exportDir)
+
+		for fileName, other in self.__collisions.items():
+			Shell.print_error( fileName, "Would overwrite the PDF file of {}.".format(other) )
+			self.__failures.append(fileName)
+
+		self.__timeStart = time.perf_counter()
+		for i in range( min( self.__poolSize, len(self.__queue) ) ):
+			slot = _ExportSlot(self.__storage)
+			self.__slots.append(slot)
+			self.__exportNext(slot)
+		self.__checkFinished()
+
+
+	def __exportNext(self, slot):
+		"""
+		Startet den Export der nächsten Datei auf dem Platz slot. Dateien, die nicht gelesen werden können, werden übersprungen.
+		"""
+
+		slot.fileName = None
+		while self.__queue:
+			fileName = self.__queue.popleft()
+			slot.fileName = fileName
+			slot.start = time.perf_counter()
+			try:
+				with slot.character.batch():
+					slot.character.resetCharacter()
+					slot.character.isLoading = True
+					slot.reader.read(fileName)
+				slot.character.isLoading = False
+
+				printer = pdf_printer( self.__fileNames[fileName] )
+				if slot.sheet is None:
+					slot.sheet = RenderSheet( self.__storage, slot.character, printer, self )
+					slot.sheet.sheetFinished.connect( lambda slot=slot: self.__sheetFinished(slot) )
+				else:
+					slot.sheet.setPrinter(printer)
+				slot.sheet.createSheets()
+				return
+			except ( ErrXmlVersion, ErrXmlParsing, ErrFileNotOpened, ErrSpeciesNotExisting, EnvironmentError ) as e:
+				Shell.print_error( fileName, e )
+				slot.character.isLoading = False
+				self.__failures.append(fileName)
+				slot.fileName = None
+
+
+	def __sheetFinished(self, slot):
+		self.__times.append( ( slot.fileName, time.perf_counter() - slot.start, ) )
+		slot.fileName = None
+		## Erst nach Rückkehr in die Event-Loop weitermachen, damit RenderSheet seinen Druckvorgang vollständig abschließen kann.
+		QTimer.singleShot( 0, lambda: self.__continue(slot) )
+
+
+	def __continue(self, slot):
+		self.__exportNext(slot)
+		self.__checkFinished()
+
+
+	def __checkFinished(self):
+		if self.__isFinished or self.__queue or any( slot.fileName for slot in self.__slots ):
+			return
+
+		self.__isFinished = True
+		self.report()
+		self.finished.emit()
+
+
+	def report(self):
+		"""
+		Gibt die Zeit für jeden Charakterbogen und den Durchsatz insgesamt aus.
+		"""
+
+		timeTotal = 0
+		if self.__timeStart is not None:
+			timeTotal = time.perf_counter() - self.__timeStart
+
+		for fileName, seconds in self.__times:
+			print( "{:<60} {:>8.3f} s".format(fileName, seconds) )
+		print( "Template data loaded in {:.3f} s.".format(self.__timeTemplates) )
+		print( "{count} character sheets exported in {time:.3f} s ({rate:.2f} sheets/s, pool size {pool}).".format(
+			count=len(self.__times),
+			time=timeTotal,
+			rate=len(self.__times) / timeTotal if timeTotal else 0,
+			pool=self.__poolSize,
+		) )
+		if self.__failures:
+			Shell.print_warning( "{} files could not be exported.".format(len(self.__failures)) )
@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+"""
+Verteilt den Export vieler Charakterbögen auf mehrere Prozesse.
+"""
+
+
+
+
+import os
+import sys
+import time
+import multiprocessing
+import concurrent.futures
+import concurrent.futures.process
+
+from PyQt4.QtCore import QEventLoop
+from PyQt4.QtGui import QApplication
+
+import src.GlobalState as GlobalState
+import src.Debug as Debug
+from src.Error import ErrSpeciesNotExisting
+from src.Storage.StorageTemplate import StorageTemplate
+from src.Storage.StorageCharacter import StorageCharacter
+from src.IO.ReadXmlTemplate import ReadXmlTemplate
+from src.IO.ReadXmlCharacter import ReadXmlCharacter
+import src.IO.Shell as Shell
+import src.Work.ConnectPrerequisites as ConnectPrerequisites
+from src.Draw.RenderSheet import RenderSheet
+from src.Draw.BatchExport import pdf_file_names, pdf_printer
+
+from res import rc_resource
+
+
+
+
+## Der Zustand des Arbeitsprozesses. Wird von _initWorker() angelegt.
+_worker = None
+## Konnte der Arbeitsprozeß nicht vorbereitet werden, steht hier der Grund.
+_workerError = None
+
+
+
+
+class _FarmWorker(object):
+	"""
+	Ein Arbeitsprozeß von ExportFarm: eine eigene Anwendung, die einmal eingelesenen Template-Daten und ein Charakter samt Leser und Charakterbogen, die für alle Dateien dieses Prozesses wiederverwendet werden.
+	"""
+
+	def __init__(self):
+		self.app = QApplication( [ sys.argv[0] ] )
+
+		self.storage = StorageTemplate()
+		ReadXmlTemplate(self.storage).read()
+
+		self.character = StorageCharacter(self.storage)
+		ConnectPrerequisites.build_connection(self.storage, self.character)
+		self.reader = ReadXmlCharacter(self.character)
+		self.reader.exception_raised.connect(self.__collectWarning)
+		self.warnings = []
+
+		## Der Charakterbogen benötigt bei seiner Erzeugung einen Drucker und wird daher erst beim ersten Export angelegt.
+		self.sheet = None
+		self.loop = QEventLoop()
+		self.isFinished = False
+
+
+	def __collectWarning(self, text, error_type):
+		self.warnings.append(text)
+
+
+	def __sheetFinished(self):
+		self.isFinished = True
+		self.loop.quit()
+
+
+	def export(self, source, fileName):
+		"""
+		Exportiert den Charakter aus der Datei source in die PDF-Datei fileName. Existiert keine solche Datei, wird source als Name einer Spezies aufgefaßt und ein leerer Charakterbogen dieser Spezies erzeugt.
+
+		\return Der Name der erzeugten PDF-Datei.
+		"""
+
+		del self.warnings[:]
+
+		with self.character.batch():
+			self.character.resetCharacter()
+			if os.path.exists(source):
+				self.character.isLoading = True
+				try:
+					self.reader.read(source)
+				finally:
+					self.character.isLoading = False
+			else:
+				species = [ item for item in self.storage.species.keys() if item.lower() == source.lower() ]
+				if not species:
+					raise ErrSpeciesNotExisting( species=source )
+				self.character.species = species[0]
+
+		printer = pdf_printer(fileName)
+		if self.sheet is None:
+			self.sheet = RenderSheet( self.storage, self.character, printer )
+			self.sheet.sheetFinished.connect(self.__sheetFinished)
+		else:
+			self.sheet.setPrinter(printer)
+
+		self.isFinished = False
+		self.sheet.createSheets()
+		## Mit QtWebKit entstehen die Seiten erst in der Event-Loop, mit QTextDocument sind sie hier bereits fertig.
+		if not self.isFinished:
+			self.loop.exec_()
+
+		return fileName
+
+
+
+
+def _initWorker( isFallback, debugLevel, sheetBackend, profile ):
+	"""
+	Bereitet einen Arbeitsprozeß vor.
+
+	\note Eine Ausnahme an dieser Stelle würde den gesamten Pool unbrauchbar machen. Sie wird daher festgehalten und für jede Datei dieses Prozesses als Fehler gemeldet.
+	"""
+
+	global _worker, _workerError
+
+	GlobalState.is_fallback = isFallback
+	GlobalState.debug_level = debugLevel
+	GlobalState.sheet_backend = sheetBackend
+	if profile:
+		Debug.profile_begin()
+
+	try:
+		_worker = _FarmWorker()
+	except Exception as e:
+		_workerError = "{}: {}".format( type(e).__name__, e )
+
+
+def _exportFile( source, fileName ):
+	"""
+	Exportiert die Datei source im Arbeitsprozeß in die PDF-Datei fileName.
+
+	Jeder Fehler wird hier abgefangen und als Text zurückgegeben, damit eine fehlerhafte Datei weder den Prozeß noch die übrigen Dateien beeinträchtigt.
+
+	\return Tupel aus Prozeßnummer, benötigter Zeit in Sekunden, Name der PDF-Datei (None bei einem Fehler), Fehlermeldung (None bei Erfolg), der Liste der Warnungen und den aufgezeichneten Zeiten der einzelnen Phasen (None, wenn nicht aufgezeichnet wird, siehe Debug.profile_begin()).
+	"""
+
+	if _worker is None:
+		return ( os.getpid(), 0, None, _workerError, [], None, )
+
+	start = time.perf_counter()
+	try:
+		fileName = _worker.export( source, fileName )
+	except Exception as e:
+		return ( os.getpid(), time.perf_counter() - start, None, "{}: {}".format( type(e).__name__, e ), list(_worker.warnings), _takeProfile(), )
+
+	return ( os.getpid(), time.perf_counter() - start, fileName, None, list(_worker.warnings), _takeProfile(), )
+
+
+def _takeProfile():
+	"""
+	Gibt die seit dem letzten Aufruf aufgezeichneten Zeiten zurück.
+	"""
+
+	if not Debug.profiling():
+		return None
+
+	profile = Debug.profile_end()
+	Debug.profile_begin()
+	return profile
+
+
+
+
+class ExportFarm(object):
+	"""
+	\brief Erzeugt die Charakterbögen vieler Charaktere gleichzeitig in mehreren Prozessen.
+
+	Im Gegensatz zu BatchExport, wo sich alle Charakterbögen eine Event-Loop teilen, besitzt jeder Arbeitsprozeß eine eigene QApplication, liest die Template-Daten einmal ein und exportiert anschließend nacheinander die Dateien, die ihm zugeteilt werden. Der aufrufende Prozeß benötigt selbst keine QApplication.
+
+	Eine Datei, die nicht gelesen oder gezeichnet werden kann, wird als fehlerhaft vermerkt, ohne die übrigen Dateien zu beeinträchtigen. Stürzt ein Arbeitsprozeß vollständig ab, werden alle Dateien, die zu diesem Zeitpunkt in Arbeit waren, einzeln wiederholt, damit nur die tatsächlich schuldige Datei als fehlerhaft gilt.
+
+	\code
+	farm = ExportFarm( collect_files("save"), "pdf", workers=4 )
+	farm.run()
+	\endcode
+	"""
+
+
+	def __init__(self, files, exportDir, workers=None):
+		self.__files = list(files)
+		self.__exportDir = exportDir
+		self.__workers = max( 1, workers or os.cpu_count() or 1 )
+
+		## Dateiname -> Name der PDF-Datei
+		self.__fileNames = {}
+
+		## Dateiname -> (Prozeßnummer, benötigte Zeit in Sekunden, Name der PDF-Datei)
+		self.__results = {}
+		## Dateiname -> Fehlermeldung
+		self.__failures = {}
+		self.__timeTotal = 0
+
+
+	@property
+	def results(self):
+		return self.__results
+
+
+	@property
+	def failures(self):
+		return self.__failures
+
+
+	def run(self):
+		"""
+		Exportiert alle Dateien und gibt anschließend die benötigten Zeiten aus.
+
+		\return True, wenn alle Dateien exportiert werden konnten.
+		"""
+
+		timeStart = time.perf_counter()
+
+		if not os.path.isdir(self.__exportDir):
+			os.makedirs(self.__exportDir)
+
+		self.__fileNames, collisions = pdf_file_names( self.__files, self.__exportDir )
+		for source in self.__files:
+			if source in collisions:
+				self.__fail( source, "Would overwrite the PDF file of {}.".format(collisions[source]) )
+
+		for source in self.__runPool( list(self.__fileNames.keys()), self.__workers ):
+			if self.__runPool( [ source ], 1 ):
+				self.__fail( source, "The worker process terminated unexpectedly." )
+
+		self.__timeTotal = time.perf_counter() - timeStart
+		self.report()
+
+		return not self.__failures
+
+
+	def __runPool(self, files, workers):
+		"""
+		Verteilt die Dateien auf workers Prozesse.
+
+		\return Liste der Dateien, deren Prozeß abgestürzt ist, bevor sie fertig wurden.
+		"""
+
+		crashed = []
+		## Qt verträgt es nicht, in einem per fork erzeugten Prozeß weiterverwendet zu werden.
+		context = multiprocessing.get_context("spawn")
+		with concurrent.futures.ProcessPoolExecutor( max_workers=min( workers, len(files) or 1 ), mp_context=context, initializer=_initWorker, initargs=( GlobalState.is_fallback, GlobalState.debug_level, GlobalState.sheet_backend, Debug.profiling(), ) ) as executor:
+			futures = { executor.submit( _exportFile, source, self.__fileNames[source] ): source for source in files }
+			for future in concurrent.futures.as_completed(futures):
+				source = futures[future]
+				try:
+					pid, seconds, fileName, error, warnings, profile = future.result()
+				except concurrent.futures.process.BrokenProcessPool:
+					crashed.append(source)
+					continue
+
+				if profile is not None:
+					Debug.profile_merge(profile)
+
+				for text in warnings:
+					Shell.print_warning( source, text )
+				if error is None:
+					self.__results[source] = ( pid, seconds, fileName, )
+					self.__progress( pid, source, "{:.3f} s".format(seconds) )
+				else:
+					self.__fail( source, error )
+					self.__progress( pid, source, "failed" )
+
+		return [ source for source in files if source in crashed ]
+
+
+	def __fail(self, source, error):
+		self.__failures[source] = error
+		Shell.print_error( source, error )
+
+
+	def __progress(self, pid, source, state):
+		done = len(self.__results) + len(self.__failures)
+		workerDone = len([ item for item in self.__results.values() if item[0] == pid ])
+		print( "[{done}/{total}] worker {pid} ({workerDone} sheets): {source} {state}".format(
+			done=done,
+			total=len(self.__files),
+			pid=pid,
+			workerDone=workerDone,
+			source=source,
+			state=state,
+		) )
+
+
+	def report(self):
+		"""
+		Gibt die Zeit für jeden Charakterbogen, die Leistung jedes Arbeitsprozesses und den Durchsatz insgesamt aus.
+		"""
+
+		workers = {}
+		for source in self.__files:
+			if source in self.__results:
+				pid, seconds, fileName = self.__results[source]
+				print( "{:<60} {:>8.3f} s".format(source, seconds) )
+				count, timeWorker = workers.get( pid, ( 0, 0, ) )
+				workers[pid] = ( count + 1, timeWorker + seconds, )
+
+		for pid in sorted(workers.keys()):
+			count, timeWorker = workers[pid]
+			print( "Worker {pid}: {count} sheets in {time:.3f} s.".format( pid=pid, count=count, time=timeWorker ) )
+		print( "{count} character sheets exported in {time:.3f} s ({rate:.2f} sheets/s, {workers} worker processes).".format(
+			count=len(self.__results),
+			time=self.__timeTotal,
+			rate=len(self.__results) / self.__timeTotal if self.__timeTotal else 0,
+			workers=self.__workers,
+		) )
+		if self.__failures:
+			Shell.print_warning( "{} files could not be exported.".format(len(self.__failures)) )
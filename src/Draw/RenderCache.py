@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+from collections import OrderedDict
+
+import src.Config as Config
+import src.GlobalState as GlobalState
+import src.Debug as Debug
+
+
+
+
+class RenderCache(object):
+	"""
+	@brief Zwischenspeicher für bereits erzeugte Charakterbögen.
+
+	Ein Charakterbogen hängt nur vom Inhalt des Charakters ab, wie er auch gespeichert wird. Als Schlüssel dient daher eine Prüfsumme des gespeicherten Charakters (siehe WriteXmlCharacter.checksum()).
+
+	Es werden zwei Dinge zwischengespeichert:
+
+	- Der Html-Text aller Seiten. Er hängt nicht vom Drucker ab und kann daher auch für andere Papierformate und Auflösungen verwendet werden, wohl aber vom Zeichenverfahren, da QTextDocument eigenes Markup erhält.
+	- Das fertige PDF-Dokument. Es kann nur wiederverwendet werden, wenn auch Papierformat, Ausrichtung, Auflösung und Zeichenverfahren übereinstimmen.
+
+	Bei beiden fließt außerdem ein, ob die Ränder der Tabellenzellen für Config.DEBUG_LEVEL_MODIFIES_EXPORTS eingezeichnet werden.
+
+	Es werden höchstens Config.RENDER_CACHE_SIZE Einträge jeder Art gehalten. Ist der Zwischenspeicher voll, wird der am längsten nicht mehr verwendete Eintrag verworfen.
+	"""
+
+
+	def __init__(self, size=Config.RENDER_CACHE_SIZE):
+		self.__size = size
+
+		## Der Html-Text aller Seiten.
+		# {
+		# 	( Prüfsumme, Debug, Zeichenverfahren ): [ Seite1, Seite2, ... ],
+		# 	...
+		# }
+		self.__pages = OrderedDict()
+
+		## Der Inhalt der PDF-Dateien.
+		# {
+		# 	( Prüfsumme, Debug, Zeichenverfahren, Papierformat, Ausrichtung, Breite, Höhe, Auflösung ): Bytes1,
+		# 	...
+		# }
+		self.__documents = OrderedDict()
+
+
+	@staticmethod
+	def __debugKey():
+		return GlobalState.debug_level >= Config.DEBUG_LEVEL_MODIFIES_EXPORTS
+
+
+	def __documentKey(self, checksum, printer):
+		return (
+			checksum,
+			self.__debugKey(),
+			GlobalState.sheet_backend,
+			printer.paperSize(),
+			printer.orientation(),
+			printer.width(),
+			printer.height(),
+			printer.resolution(),
+		)
+
+
+	def __lookup(self, cache, key):
+		if key not in cache:
+			return None
+		cache.move_to_end(key)
+		return cache[key]
+
+
+	def __store(self, cache, key, value):
+		cache[key] = value
+		cache.move_to_end(key)
+		while len(cache) > self.__size:
+			cache.popitem(last=False)
+
+
+	def pages(self, checksum):
+		"""
+		Gibt den Html-Text aller Seiten des Charakters mit der Prüfsumme checksum zurück.
+
+		\return Wurden die Seiten noch nicht erzeugt, wird None zurückgegeben.
+		"""
+
+		return self.__lookup(self.__pages, ( checksum, self.__debugKey(), GlobalState.sheet_backend, ))
+
+
+	def setPages(self, checksum, pages):
+		"""
+		Speichert den Html-Text aller Seiten des Charakters mit der Prüfsumme checksum.
+		"""
+
+		self.__store(self.__pages, ( checksum, self.__debugKey(), GlobalState.sheet_backend, ), tuple(pages))
+
+
+	def document(self, checksum, printer):
+		"""
+		Gibt den Inhalt der PDF-Datei zurück, welche für den Charakter mit der Prüfsumme checksum auf einem gleich eingestellten Drucker erzeugt wurde.
+
+		\return Existiert keine passende Datei, wird None zurückgegeben.
+		"""
+
+		document = self.__lookup(self.__documents, self.__documentKey(checksum, printer))
+		if document is not None:
+			Debug.debug( "Reusing the previously rendered character sheet.", level=2 )
+		return document
+
+
+	def setDocument(self, checksum, printer, document):
+		"""
+		Speichert den Inhalt der PDF-Datei, welche für den Charakter mit der Prüfsumme checksum auf printer erzeugt wurde.
+		"""
+
+		self.__store(self.__documents, self.__documentKey(checksum, printer), document)
+
+
+	def clear(self):
+		"""
+		Verwirft alle zwischengespeicherten Charakterbögen.
+		"""
+
+		self.__pages.clear()
+		self.__documents.clear()
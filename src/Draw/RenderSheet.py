@@ -32,10 +32,14 @@ import math
 import re
 
 from PyQt4.QtCore import pyqtSignal as Signal
-from PyQt4.QtCore import Qt, QObject, QFile, QIODevice, QTextStream, QBuffer, QByteArray, QUrl, QRect
-from PyQt4.QtGui import QPainter, QImage, QPalette, QPicture#, QColor, QPen, QFont, QFontMetrics, QTextDocument
-from PyQt4 import QtNetwork# Ist notwendig, wenn ich cx_freeze nutzen möchte. Sonst wird das entsprechende modul nicht eingeschlossen udn QtWebKit funktioniert nicht.
-from PyQt4.QtWebKit import QWebPage
+from PyQt4.QtCore import Qt, QObject, QFile, QIODevice, QTextStream, QByteArray, QUrl, QRect, QRectF
+from PyQt4.QtGui import QPainter, QImage, QPalette, QPicture, QTextDocument#, QColor, QPen, QFont, QFontMetrics
+## Ohne QtWebKit können die Charakterbögen nur mit QTextDocument gezeichnet werden.
+try:
+	from PyQt4 import QtNetwork# Ist notwendig, wenn ich cx_freeze nutzen möchte. Sonst wird das entsprechende modul nicht eingeschlossen udn QtWebKit funktioniert nicht.
+	from PyQt4.QtWebKit import QWebPage
+except ImportError:
+	QWebPage = None
 
 import src.GlobalState as GlobalState
 import src.Config as Config
@@ -46,6 +50,7 @@ import src.Calc.Calc as Calc
 from src.Calc.CalcAdvantages import CalcAdvantages
 import src.Calc.CalcShapes as CalcShapes
 #from src.Draw.CharacterSheetDocument import CharacterSheetDocument
+from src.Draw.SheetResources import SheetResources
 import src.Tools.ImageTools as ImageTools
 import src.Debug as Debug
 
@@ -62,24 +67,51 @@ class RenderSheet(QObject):
 
 	setHtml -> loadFinisched -> render -> printFinished -> seite+1 -> setHtml -> etc.
 
+	Mit backend="document" (siehe Config.SHEET_BACKENDS) wird statt WebKit ein QTextDocument verwendet. Die Seiten werden dann synchron innerhalb von createSheets() gedruckt, ohne Event-Loop. Die Abschnitte erhalten dabei eigenes Markup: Das Gerüst ist schlichtes Html ohne Glyphen-Atlas, die svg-Bilder der Magier (Arkana und Rahmenecke) entfallen und das Bild des Charakters wird nicht als data-URI eingebettet, sondern mit addDocumentResources() abgelegt.
+
+	\note Der Charakterbogen von QTextDocument ist kein gleichwertiger Ersatz für den von WebKit, sondern eine vereinfachte Fassung. QTextDocument beherrscht nur einen Teil von Html und CSS. Nicht unterstützt werden insbesondere svg, die CSS-Eigenschaften position, overflow, max-width, max-height und table-layout, Höhenangaben von Tabellenzeilen und div-Elementen sowie Rahmen einzelner Tabellenzellen. Die Seiten werden daher nicht auf die Höhe des Papiers gestreckt, Textfelder fester Höhe (Beschreibung, Inventar) nicht abgeschnitten und die Linien der Eingabefelder fehlen.
+
+	Ist die letzte Seite gedruckt, wird sheetFinished ausgesandt. Danach kann dieselbe Instanz mit setPrinter() und createSheets() für einen weiteren Charakter verwendet werden, ohne die Html-Vorlagen und die QWebPage erneut zu erzeugen.
+
 	◕◑◔
 	"""
 
 
 	loadFinished = Signal(int, bool)
 	printFinished = Signal()
+	sheetFinished = Signal()
 
 
-	def __init__(self, template, character, printer, parent=None):
+	def __init__(self, template, character, printer, parent=None, backend=None):
 		super(RenderSheet, self).__init__(parent)
 
 		self.__storage = template
 		self.__character = character
+
+		if backend is None:
+			backend = GlobalState.sheet_backend
+		if backend == "webkit" and QWebPage is None:
+			Debug.debug("QtWebKit is not available, character sheets are drawn with QTextDocument instead.")
+			backend = "document"
+		self.__backend = backend
 		self.__calc = CalcAdvantages(self.__character)
 
 		self.__painter = QPainter()
 		self.__printer = printer
 
+		## Die QWebPage wird erst beim ersten Aufruf von createSheets() erzeugt und danach weiterverwendet.
+		self.__page = None
+
+		## Der Html-Text der bereits erzeugten Seiten des aktuellen Charakterbogens.
+		self.__htmlPages = []
+		## Der mit setHtmlPages() vorgegebene Html-Text für den nächsten Aufruf von createSheets().
+		self.__presetHtmlPages = None
+
+		## Um diesen Faktor wird die Html-Seite beim Drucken vergrößert (siehe __renderPdf()).
+		self.__scale = 1
+		## Startzeitpunkt für die Messung, wie lange WebKit für das Laden einer Seite benötigt.
+		self.__timingLoad = None
+
 		## Jedesmal, wenn eine HTML-Seite fertig geladen wurde, wird selbige zum Rendern auf PDF geschickt und dieser Zähler um eins erhöht.
 		self.__pageToPrint = 0
 
@@ -104,55 +136,49 @@ class RenderSheet(QObject):
 			#fileLike.close()
 			#self.__persistentResourceFiles[resFile] = fileLike
 
-		htmlTemplates = {
-			0: ( ":sheet/stylesheets/sheetTemplate.html", ),
-			1: ( ":sheet/stylesheets/sheet.css", ),
-			"Human": ( ":sheet/stylesheets/sheetTemplate-Human-A.html", ),
-			"Changeling": ( ":sheet/stylesheets/sheetTemplate-Changeling-A.html", ":sheet/stylesheets/sheetTemplate-Changeling-B.html", ),
-			"Mage": ( ":sheet/stylesheets/sheetTemplate-Mage-A.html", ":sheet/stylesheets/sheetTemplate-Mage-B.html", ),
-			"Vampire": ( ":sheet/stylesheets/sheetTemplate-Vampire-A.html", ":sheet/stylesheets/sheetTemplate-Vampire-B.html", ),
-			"Werewolf": ( ":sheet/stylesheets/sheetTemplate-Werewolf-A.html", ":sheet/stylesheets/sheetTemplate-Werewolf-B.html", ),
-		}
-		self.__htmlTemplates = {}
-		for species in htmlTemplates.items():
-			self.__htmlTemplates[species[0]] = []
-			for page in species[1]:
-				qrcFile = QFile(page)
-				if not qrcFile.open(QIODevice.ReadOnly):
-					raise ErrFileNotOpened( "While opening file \"{}\" the error \"{}\" occured.".format( page, qrcFile.errorString() ), filename=page )
-				textStream = QTextStream(qrcFile)
-				fileContent = textStream.readAll()
-				qrcFile.close()
-				self.__htmlTemplates[species[0]].append(fileContent)
-
-		## Bilder
-		## Zugreifen kann man auf den Inhalt über self.__resourceFiles[<Name>]
-		resourceFiles =(
-			":sheet/images/species/Mage/Border-Corner.svg",
-			":sheet/images/species/Mage/Power-Death.svg",
-			":sheet/images/species/Mage/Power-Fate.svg",
-			":sheet/images/species/Mage/Power-Forces.svg",
-			":sheet/images/species/Mage/Power-Life.svg",
-			":sheet/images/species/Mage/Power-Matter.svg",
-			":sheet/images/species/Mage/Power-Mind.svg",
-			":sheet/images/species/Mage/Power-Prime.svg",
-			":sheet/images/species/Mage/Power-Space.svg",
-			":sheet/images/species/Mage/Power-Spirit.svg",
-			":sheet/images/species/Mage/Power-Time.svg",
-		)
-		self.__resourceFiles = {}
-		for resFile in resourceFiles:
-			qrcFile = QFile(resFile)
-			if not qrcFile.open(QIODevice.ReadOnly):
-				raise ErrFileNotOpened( "While opening \"{}\" the error \"{}\" occured.".format( resFile, qrcFile.errorString() ), filename=resFile )
-			textStream = QTextStream(qrcFile)
-			fileContent = textStream.readAll()
-			qrcFile.close()
-			self.__resourceFiles[resFile] = fileContent
+		## Die Html-Vorlagen und Bilder werden nur vom ersten Charakterbogen tatsächlich eingelesen.
+		self.__resources = SheetResources()
 
 		self.traitMax = self.__storage.maxTrait(self.__character.species, self.__character.powerstat)
 
 
+	def setPrinter(self, printer):
+		"""
+		Legt fest, auf welchem Drucker der nächste Aufruf von createSheets() den Charakterbogen ausgibt.
+		"""
+
+		self.__printer = printer
+
+
+	def setHtmlPages(self, pages):
+		"""
+		Legt den Html-Text der Seiten für den nächsten Aufruf von createSheets() fest, beispielsweise aus einem RenderCache. Die Seiten werden dann nicht erneut erzeugt.
+
+		\note Der Html-Text muß zum aktuellen Charakter gehören.
+		"""
+
+		self.__presetHtmlPages = pages
+
+
+	@property
+	def htmlPages(self):
+		"""
+		Der Html-Text aller Seiten des zuletzt mit createSheets() erzeugten Charakterbogens.
+		"""
+
+		return tuple(self.__htmlPages)
+
+
+	def __pageHtml(self, page):
+		"""
+		Gibt den Html-Text der Seite page zurück. Jede Seite wird je Aufruf von createSheets() nur einmal erzeugt.
+		"""
+
+		while len(self.__htmlPages) <= page:
+			self.__htmlPages.append(self.createHtml(len(self.__htmlPages)))
+		return self.__htmlPages[page]
+
+
 	def emitLoadFinished(self, status):
 		self.loadFinished.emit(self.__pageToPrint, status)
 
@@ -162,17 +188,34 @@ class RenderSheet(QObject):
 		Erzeugt den Charakterbogen.
 		"""
 
-		self.__page = QWebPage(self)
-		palette = self.__page.palette()
-		palette.setBrush(QPalette.Base, Qt.transparent)
-		self.__page.setPalette(palette)
+		self.__htmlPages = list(self.__presetHtmlPages or ())
+		self.__presetHtmlPages = None
 
-		self.__mainFrame = self.__page.mainFrame()
+		if self.__backend == "document":
+			self.__pageToPrint = 0
+			self.__powerCount = 0
+			self.traitMax = self.__storage.maxTrait(self.__character.species, self.__character.powerstat)
+			self.__pagePreparation()
+			self.__renderDocument()
+			return
 
-		self.loadFinished.connect(self.__renderPdf)
-		self.printFinished.connect(self._createPage)
+		if self.__page is None:
+			self.__page = QWebPage(self)
+			palette = self.__page.palette()
+			palette.setBrush(QPalette.Base, Qt.transparent)
+			self.__page.setPalette(palette)
 
-		self.__mainFrame.loadFinished.connect(self.emitLoadFinished)
+			self.__mainFrame = self.__page.mainFrame()
+
+			self.loadFinished.connect(self.__renderPdf)
+			self.printFinished.connect(self._createPage)
+
+			self.__mainFrame.loadFinished.connect(self.emitLoadFinished)
+
+		## Wird die Instanz für mehrere Charaktere verwendet, müssen die vom Charakter abhängigen Werte jedesmal neu bestimmt werden.
+		self.__pageToPrint = 0
+		self.__powerCount = 0
+		self.traitMax = self.__storage.maxTrait(self.__character.species, self.__character.powerstat)
 
 		## Vorbereiten der Seite
 		self.__pagePreparation()
@@ -183,148 +226,203 @@ class RenderSheet(QObject):
 		self.printFinished.emit()
 
 
-	def _createPage(self):
+	def createHtml(self, page, sections=None, sectionFormat=None):
 		"""
-		Erzeugt die Charakterbogen-Seiten.
+		Erzeugt den Html-Text der Seite page des Charakterbogens.
+
+		\note Es werden nur die Abschnitte erzeugt, welche auf dieser Seite auch vorkommen.
+
+		\param sections Die bereits erzeugten Abschnitte, welche nicht erneut erzeugt werden sollen (siehe SheetTemplate.render()).
+
+		\param sectionFormat Umschließt jeden Abschnitt (siehe SheetTemplate.render()).
 		"""
 
-		if self.__pageToPrint < len(self.__htmlTemplates[self.__character.species]):
-			htmlText = self.__htmlTemplates[0][0]
+		debug_timing_start = Debug.timehook(phase="html")
 
-			## In der css-Datei müssen die geschweiften Klammern geschweifte Klammern bleiben. Also muß ich diese jeweils verdoppeln
-			cssContent = self.__htmlTemplates[1][0]
-			cssContent = cssContent.replace("{", "{{")
-			cssContent = cssContent.replace("}", "}}")
+		slots = self.__slots()
+		if Debug.profiling():
+			slots = { name: self.__profiledSlot(page, name, slot) for name, slot in slots.items() }
+		htmlText = self.__resources.compiledPages(self.__character.species, self.__backend == "document")[page].render(slots, sections, sectionFormat)
 
-			if GlobalState.debug_level >= Config.DEBUG_LEVEL_MODIFIES_EXPORTS:
-				cssContent += "td {{ border: 1px solid #0F0; }}"
-				cssContent += "td.layout {{ border: 1px solid #F00; }}"
+		Debug.timesince( debug_timing_start, "Time neccessary to create the html text of page {}.".format(page + 1), phase="html", page=page )
 
-			htmlText = htmlText.format(
-				stylesheet=cssContent,
-				body=self.__htmlTemplates[self.__character.species][self.__pageToPrint],
-			)
+		return htmlText
 
 
-			blockHeight = {
-				"Human": {
-					"inventory": "350px",
-					"description": "300px",
-				},
-				"Changeling": {
-					"inventory": "457px",
-					"description": "407px",
-				},
-				"Mage": {
-					"inventory": "455px",
-					"description": "405px",
-				},
-				"Vampire": {
-					"inventory": "450px",
-					"description": "360px",
-				},
-				"Werewolf": {
-					"inventory": "450px",
-					"description": "350px",
-				},
-			}
+	@staticmethod
+	def __profiledSlot(page, name, slot):
+		"""
+		Gibt eine Funktion zurück, welche slot aufruft und die benötigte Zeit als Phase "html/<name>" aufzeichnet.
+		"""
 
-			curseText = "Weakness"
-			if self.__character.species == "Changeling":
-				curseText = "Curse"
-
-			htmlText = str(htmlText).format(
-				info=self._createInfo(),
-				attributes=self._createAttributes(),
-				skills=self._createSkills(),
-				powers=self._createPowers(),
-				subpowers=self._createSubPowers(),
-				merits=self._createMerits(),
-				flaws=self._createFlaws(),
-				advantages=self._createAdvantages(),
-				health=self._dotStat(
-					self.tr("Health"),
-					self.__calc.calcHealth(),
-					Config.TRAIT_HEALTH_VALUE_MAX[self.__character.species],
-					hasTemporary=True
-				),
-				willpower=self._dotStat(
-					self.tr("Willpower"),
-					self.__calc.calcWillpower(),
-					Config.TRAIT_WILLPOWER_VALUE_MAX,
-					hasTemporary=True
-				),
-				powerstat=self._dotStat(
-					self.__storage.powerstatName(self.__character.species),
-					self.__character.powerstat,
-					Config.TRAIT_POWERSTAT_VALUE_MAX,
-					hasTemporary=False
-				),
-				fuel=self._createFuel(),
-				morality=self._createMorality(),
-				weapons=self._createWeapons(),
-				goblinContracts=self._createGoblinContracts(),
-				magicalTool=self.simpleTextBox(self.__character.magicalTool, title=self.tr("Magical Tool"), species="Mage"),
-				vinculi=self._createVinculi(),
-				blessing=self.simpleTextBox(
-					self.__storage.breedBlessing(self.__character.species, self.__character.breed),
-					title=self.tr("{} Blessing".format(self.__storage.breedTitle(self.__character.species)))
-				),
-				abilityKith=self.simpleTextBox(
-					self.__storage.kithAbility(self.__character.breed, self.__character.kith),
-					title=self.tr("Kith Ability")
-				),
-				curseBreed=self.simpleTextBox(
-					self.__storage.breedCurse(self.__character.species, self.__character.breed),
-					title="{} {}".format(self.__storage.breedTitle(self.__character.species), curseText)
-				),
-				curseOrganisation=self.simpleTextBox(
-					self.__storage.organisationCurse(self.__character.species, self.__character.organisation),
-					title="{} {}".format(self.__storage.organisationTitle(self.__character.species), curseText)
-				),
-				spellsActive=self.userTextBox(
-					lines=5,
-					title=self.tr("Active Spells"),
-					#description=self.tr("Max: {} +3".format(self.__storage.powerstatName(self.__character.species)))
-					description=self.tr("Max: {} ({} +3)".format((self.__character.powerstat + 3), self.__storage.powerstatName(self.__character.species)))
-				),
-				spellsUponSelf=self.userTextBox(
-					lines=5,
-					title=self.tr("Spells Cast Upon Self"),
-					description=self.tr("Spell Tolerance: {} (Resistance); -1 die per extra spell".format(max(self.__character.traits["Attribute"]["Mental"]["Resolve"].totalvalue, self.__character.traits["Attribute"]["Physical"]["Stamina"].totalvalue, self.__character.traits["Attribute"]["Social"]["Composure"].totalvalue)))
-				),
-				nimbus=self.simpleTextBox(
-					self.__character.nimbus,
-					title=self.tr("Nimbus")
-				),
-				paradoxMarks=self.simpleTextBox(
-					self.__character.paradoxMarks,
-					title=self.tr("Paradox Marks")
-				),
-				shapes=self._createShapeTable(),
-				companion=self._createCompanion(),
-				pledges="",
-				oneiromachy="",
-				influence="",
-				automobiles=self._createAutomobiles(),
-				inventory=self._createInventory(blockHeight[self.__character.species]["inventory"]),
-				description=self._createDescription(blockHeight[self.__character.species]["description"]),
-				allies=self.userTextBox(
-					lines=4,
-					title=self.tr("Allies")
-				),
-				contacts=self.userTextBox(
-					lines=4,
-					title=self.tr("Contacts")
-				),
-				image=self._createImage(),
-				rolls=self._createRolls(),
-				notes=self.userTextBox(
-					lines=3,
-					title=self.tr("Notes")
-				),
-				xp=self._createXp(),
-			)
+		phase = "html/{}".format(name)
+
+		def profiled():
+			debug_timing_start = Debug.timehook(phase=phase)
+			htmlText = slot()
+			Debug.timesince( debug_timing_start, "Time neccessary to create the section \"{}\".".format(name), level=Config.DEBUG_LEVEL_STD + 3, phase=phase, page=page )
+			return htmlText
+
+		return profiled
+
+
+	def createSection(self, name):
+		"""
+		Erzeugt den Html-Text eines einzelnen Abschnitts, also den Inhalt des Platzhalters name der Html-Vorlagen.
+		"""
+
+		return self.__slots()[name]()
+
+
+	def sectionNames(self, page):
+		"""
+		Gibt die Namen aller Abschnitte zurück, die auf der Seite page des Charakterbogens vorkommen.
+		"""
+
+		return self.__resources.compiledPages(self.__character.species, self.__backend == "document")[page].fields
+
+
+	def pageCount(self):
+		"""
+		Gibt die Anzahl der Seiten des Charakterbogens zurück.
+		"""
+
+		return len(self.__resources.pages(self.__character.species))
+
+
+	def __slots(self):
+		"""
+		Gibt für jeden Platzhalter der Html-Vorlagen die Funktion zurück, welche seinen Inhalt erzeugt.
+		"""
+
+		blockHeight = {
+			"Human": {
+				"inventory": "350px",
+				"description": "300px",
+			},
+			"Changeling": {
+				"inventory": "457px",
+				"description": "407px",
+			},
+			"Mage": {
+				"inventory": "455px",
+				"description": "405px",
+			},
+			"Vampire": {
+				"inventory": "450px",
+				"description": "360px",
+			},
+			"Werewolf": {
+				"inventory": "450px",
+				"description": "350px",
+			},
+		}
+
+		curseText = "Weakness"
+		if self.__character.species == "Changeling":
+			curseText = "Curse"
+
+		return {
+			"info": self._createInfo,
+			"attributes": self._createAttributes,
+			"skills": self._createSkills,
+			"powers": self._createPowers,
+			"subpowers": self._createSubPowers,
+			"merits": self._createMerits,
+			"flaws": self._createFlaws,
+			"advantages": self._createAdvantages,
+			"health": lambda: self._dotStat(
+				self.tr("Health"),
+				self.__calc.calcHealth(),
+				Config.TRAIT_HEALTH_VALUE_MAX[self.__character.species],
+				hasTemporary=True
+			),
+			"willpower": lambda: self._dotStat(
+				self.tr("Willpower"),
+				self.__calc.calcWillpower(),
+				Config.TRAIT_WILLPOWER_VALUE_MAX,
+				hasTemporary=True
+			),
+			"powerstat": lambda: self._dotStat(
+				self.__storage.powerstatName(self.__character.species),
+				self.__character.powerstat,
+				Config.TRAIT_POWERSTAT_VALUE_MAX,
+				hasTemporary=False
+			),
+			"fuel": self._createFuel,
+			"morality": self._createMorality,
+			"weapons": self._createWeapons,
+			"goblinContracts": self._createGoblinContracts,
+			"magicalTool": lambda: self.simpleTextBox(self.__character.magicalTool, title=self.tr("Magical Tool"), species="Mage"),
+			"vinculi": self._createVinculi,
+			"blessing": lambda: self.simpleTextBox(
+				self.__storage.breedBlessing(self.__character.species, self.__character.breed),
+				title=self.tr("{} Blessing".format(self.__storage.breedTitle(self.__character.species)))
+			),
+			"abilityKith": lambda: self.simpleTextBox(
+				self.__storage.kithAbility(self.__character.breed, self.__character.kith),
+				title=self.tr("Kith Ability")
+			),
+			"curseBreed": lambda: self.simpleTextBox(
+				self.__storage.breedCurse(self.__character.species, self.__character.breed),
+				title="{} {}".format(self.__storage.breedTitle(self.__character.species), curseText)
+			),
+			"curseOrganisation": lambda: self.simpleTextBox(
+				self.__storage.organisationCurse(self.__character.species, self.__character.organisation),
+				title="{} {}".format(self.__storage.organisationTitle(self.__character.species), curseText)
+			),
+			"spellsActive": lambda: self.userTextBox(
+				lines=5,
+				title=self.tr("Active Spells"),
+				#description=self.tr("Max: {} +3".format(self.__storage.powerstatName(self.__character.species)))
+				description=self.tr("Max: {} ({} +3)".format((self.__character.powerstat + 3), self.__storage.powerstatName(self.__character.species)))
+			),
+			"spellsUponSelf": lambda: self.userTextBox(
+				lines=5,
+				title=self.tr("Spells Cast Upon Self"),
+				description=self.tr("Spell Tolerance: {} (Resistance); -1 die per extra spell".format(max(self.__character.traits["Attribute"]["Mental"]["Resolve"].totalvalue, self.__character.traits["Attribute"]["Physical"]["Stamina"].totalvalue, self.__character.traits["Attribute"]["Social"]["Composure"].totalvalue)))
+			),
+			"nimbus": lambda: self.simpleTextBox(
+				self.__character.nimbus,
+				title=self.tr("Nimbus")
+			),
+			"paradoxMarks": lambda: self.simpleTextBox(
+				self.__character.paradoxMarks,
+				title=self.tr("Paradox Marks")
+			),
+			"shapes": self._createShapeTable,
+			"companion": self._createCompanion,
+			"pledges": lambda: "",
+			"oneiromachy": lambda: "",
+			"influence": lambda: "",
+			"automobiles": self._createAutomobiles,
+			"inventory": lambda: self._createInventory(blockHeight[self.__character.species]["inventory"]),
+			"description": lambda: self._createDescription(blockHeight[self.__character.species]["description"]),
+			"allies": lambda: self.userTextBox(
+				lines=4,
+				title=self.tr("Allies")
+			),
+			"contacts": lambda: self.userTextBox(
+				lines=4,
+				title=self.tr("Contacts")
+			),
+			"image": self._createImage,
+			"rolls": self._createRolls,
+			"notes": lambda: self.userTextBox(
+				lines=3,
+				title=self.tr("Notes")
+			),
+			"xp": self._createXp,
+		}
+
+
+	def _createPage(self):
+		"""
+		Erzeugt die Charakterbogen-Seiten.
+		"""
+
+		if self.__pageToPrint < self.pageCount():
+			htmlText = self.__pageHtml(self.__pageToPrint)
 
 			#Debug.debug(htmlText)
 			#Debug.debug(self._createDescription(blockHeight[self.__character.species]["description"]))
@@ -333,6 +431,8 @@ class RenderSheet(QObject):
 			#self.__mainFrame.setHtml(htmlText)
 			byteArray = QByteArray(htmlText.encode("UTF-8"))
 			#bytes = QByteArray.fromRawData(htmlText)
+			## Gemessen wird bis zum Signal loadFinished, also einschließlich des Layouts durch WebKit.
+			self.__timingLoad = Debug.timehook(phase="webkit")
 			self.__mainFrame.setContent(byteArray, "application/xhtml+xml")
 
 
@@ -405,15 +505,15 @@ class RenderSheet(QObject):
 				tableContents[0][1][2][0] = "Totem:"
 				tableContents[0][1][2][1] = self.__character.companionName
 
-		htmlText = "<table class='fullSpace'><tr>"
+		htmlText = [ "<table class='fullSpace'><tr>" ]
 		for column in tableContents:
-			htmlText += "<td style='width: {}; vertical-align: top;'><table style='width: 100%'>".format(column[0])
+			htmlText.append("<td style='width: {}; vertical-align: top;'><table style='width: 100%'>".format(column[0]))
 			for row in column[1]:
-				htmlText += "<tr><td style='text-align: right; white-space: nowrap;'><span class='{species}' style='font-weight: bold;'>{label}</span></td><td style='width: 100%;'><span class='scriptFont text'>{value}</span></td></tr>".format(label=row[0], value=row[1], species=self.__character.species.lower())
-			htmlText += "</table></td>"
-		htmlText += "</tr></table>"
+				htmlText.append("<tr><td style='text-align: right; white-space: nowrap;'><span class='{species}' style='font-weight: bold;'>{label}</span></td><td style='width: 100%;'><span class='scriptFont text'>{value}</span></td></tr>".format(label=row[0], value=row[1], species=self.__character.species.lower()))
+			htmlText.append("</table></td>")
+		htmlText.append("</tr></table>")
 
-		return htmlText
+		return "".join(htmlText)
 
 
 	def _createAttributes(self):
@@ -428,24 +528,24 @@ class RenderSheet(QObject):
 				column.append(self.__character.traits["Attribute"][category[0]][trait])
 			tableData.append(column)
 
-		htmlText = "<table class='fullWidth'><tr>"
-		htmlText += "<td class='layout' style='width: 1%'><table style='width: 100%'>"
+		htmlText = [ "<table class='fullWidth'><tr>" ]
+		htmlText.append("<td class='layout' style='width: 1%'><table style='width: 100%'>")
 		for label in Config.ATTRIBUTE_ORDER:
-			htmlText += "<tr>"
-			htmlText += "<td><span class='{species}' style='font-weight: bold;'>{}</span></td>".format(label, species=self.__character.species.lower())
-			htmlText += "</tr>"
-		htmlText += "</table></td>"
+			htmlText.append("<tr>")
+			htmlText.append("<td><span class='{species}' style='font-weight: bold;'>{}</span></td>".format(label, species=self.__character.species.lower()))
+			htmlText.append("</tr>")
+		htmlText.append("</table></td>")
 		for column in tableData:
-			htmlText += "<td class='layout' style='padding: 1px;'><!-- variabler horizontaler Raum (Ohne das padding (margin/border) wird diese Spalte ignoriert) --></td>"
-			htmlText += "<td class='layout' style='width: 0.01%;'><table style='table-layout: fixed; width: 0%'><tr><td class='layout'>{border}</td></tr></table></td>".format(border=self.borderCorner())
-			htmlText += "<td class='layout' style='width: 1%'><table style='width: 100%'>"
+			htmlText.append("<td class='layout' style='padding: 1px;'><!-- variabler horizontaler Raum (Ohne das padding (margin/border) wird diese Spalte ignoriert) --></td>")
+			htmlText.append("<td class='layout' style='width: 0.01%;'><table style='table-layout: fixed; width: 0%'><tr><td class='layout'>{border}</td></tr></table></td>".format(border=self.borderCorner()))
+			htmlText.append("<td class='layout' style='width: 1%'><table style='width: 100%'>")
 			for trait in column:
-				htmlText += "<tr>"
-				htmlText += "<td style='width: 100%; text-align: right; font-weight: bold;'>{label}</td>".format(label=trait.name)
-				htmlText += "<td>{value}</td>".format(value=self.valueStyled(trait.totalvalue, self.traitMax))
-				htmlText += "</tr>"
-			htmlText += "</table></td>"
-		htmlText += "</tr></table>"
+				htmlText.append("<tr>")
+				htmlText.append("<td style='width: 100%; text-align: right; font-weight: bold;'>{label}</td>".format(label=trait.name))
+				htmlText.append("<td>{value}</td>".format(value=self.valueStyled(trait.totalvalue, self.traitMax)))
+				htmlText.append("</tr>")
+			htmlText.append("</table></td>")
+		htmlText.append("</tr></table>")
 
 		#tableData = [
 			#[],
@@ -473,7 +573,7 @@ class RenderSheet(QObject):
 			#htmlText += "</tr>"
 		#htmlText += "</table>"
 
-		return htmlText
+		return "".join(htmlText)
 
 
 	def _createSkills(self):
@@ -481,18 +581,18 @@ class RenderSheet(QObject):
 		Erzeugt die Darstellung der Fertigkeiten und Spezialisierungen.
 		"""
 
-		htmlText = "<table class='fullSpace' style='table-layout: fixed;'>"
+		htmlText = [ "<table class='fullSpace' style='table-layout: fixed;'>" ]
 		firstRow = True
 		for item in self.__character.traits["Skill"]:
 			traits = list( self.__character.traits["Skill"][item].keys() )
 			traits.sort()
 			if not firstRow:
 				## Dehnbarer vertikaler Zwischenraum.
-				htmlText += "<tr><td class='layout'></td></tr>"
+				htmlText.append("<tr><td class='layout'></td></tr>")
 			firstRow = False
 			## Dadurch, daß die Zeile einen Höhe von 0%, aber Inhalt hat, wird sie auf die Höhe des Inhalts gestreckt. Die Verbleibende Höhe wird auf die Zeilen ohne Hlhenangabe, die Platzhalterspalten, aufgeteilt.
-			htmlText += "<tr style='height: 0%'><td class='layout'>"
-			htmlText += "<h2 class='{species}'>{category}</h2>".format(species=self.__character.species.lower().lower(), category=item)
+			htmlText.append("<tr style='height: 0%'><td class='layout'>")
+			htmlText.append("<h2 class='{species}'>{category}</h2>".format(species=self.__character.species.lower().lower(), category=item))
 			for subitem in traits:
 				trait = self.__character.traits["Skill"][item][subitem]
 				#Debug.debug(trait.era, self.__character.era, trait.age, Config.getAge(self.__character.age))
@@ -500,11 +600,11 @@ class RenderSheet(QObject):
 					(not trait.era or self.__character.era in trait.era) and
 					(not trait.age or trait.age == Config.getAge(self.__character.age))
 				):
-					htmlText += self.htmlLabelRuleValue(label=trait.name, value=self.valueStyled(trait.totalvalue, self.traitMax), additional=", ".join(trait.totalspecialties))
-			htmlText += "</td></tr>"
-		htmlText += "</table>"
+					htmlText.append(self.htmlLabelRuleValue(label=trait.name, value=self.valueStyled(trait.totalvalue, self.traitMax), additional=", ".join(trait.totalspecialties)))
+			htmlText.append("</td></tr>")
+		htmlText.append("</table>")
 
-		return htmlText
+		return "".join(htmlText)
 
 
 	def _createPowers(self, count=None):
@@ -548,25 +648,24 @@ class RenderSheet(QObject):
 					( int(math.floor(len(traitList) / 2)), len(traitList), ),
 				)
 
-			htmlText = "<h1 class='{species}'>{title}</h1>".format(title=self.__storage.powerName(self.__character.species), species=self.__character.species.lower().lower())
+			htmlText = [ "<h1 class='{species}'>{title}</h1>".format(title=self.__storage.powerName(self.__character.species), species=self.__character.species.lower().lower()) ]
 
 			powerImages = (
 				"Mage",
 			)
 
-			htmlText += "<table style='width: 100%'><tr>"
+			htmlText.append("<table style='width: 100%'><tr>")
 			iterator = 0
 			colIterator = 0
 			for column in iteratorGoal:
-				htmlText += "<td class='layout'>"
+				htmlText.append("<td class='layout'>")
 				for i in range(column[0], column[1]):
 					trait = traitList[i]
-					htmlText += "<table class='fullWidth'>"
-					htmlText += "<tr>"
-					if self.__character.species in powerImages:
-						svgImage = self.__resourceFiles[":sheet/images/species/{species}/Power-{power}.svg".format(species=self.__character.species, power=trait.name)]
-						## In den svg-Dateien muß der <?xml version="1.0" encoding="UTF-8" standalone="no"?> header weg.
-						svgImage = re.sub(r"\<\?[^\>]*\?\>", "", svgImage)
+					htmlText.append("<table class='fullWidth'>")
+					htmlText.append("<tr>")
+					## QTextDocument kann keine svg-Bilder darstellen.
+					if self.__character.species in powerImages and self.__backend != "document":
+						svgImage = self.__resources.glyph(":sheet/images/species/{species}/Power-{power}.svg".format(species=self.__character.species, power=trait.name))
 						imageCol = "<td class='nowrap withHRule layout' style='width: 1em'><div style='width: 1em; height: 1em;'>{}</div></td>".format(svgImage)
 						#imageCol = ""
 					else:
@@ -575,40 +674,40 @@ class RenderSheet(QObject):
 					ruleCol = "<td class='hrulefill'><span class='descText'>{additional}</span></td>".format(additional=trait.customText)
 					valueCol = "<td class='nowrap withHRule' style='text-align: right;'>{value}</td>".format(value=self.valueStyled(trait.totalvalue, self.traitMax))
 					if colIterator > 0:
-						htmlText += "<td class='layout'><table style='width: 100%;'><tr>" + valueCol + ruleCol + labelCol + "</tr></table></td>" + imageCol
+						htmlText.append("<td class='layout'><table style='width: 100%;'><tr>" + valueCol + ruleCol + labelCol + "</tr></table></td>" + imageCol)
 					else:
-						htmlText += imageCol + "<td class='layout'><table style='width: 100%;'><tr>" + labelCol + ruleCol + valueCol + "</tr></table></td>"
-					htmlText += "</tr>"
-					htmlText += "</table>"
+						htmlText.append(imageCol + "<td class='layout'><table style='width: 100%;'><tr>" + labelCol + ruleCol + valueCol + "</tr></table></td>")
+					htmlText.append("</tr>")
+					htmlText.append("</table>")
 					iterator += 1
-				htmlText += "</td>"
+				htmlText.append("</td>")
 				if colIterator < len(iteratorGoal) - 1:
 					# Feste Breite
-					htmlText += "<td class='spacer'></td>"
+					htmlText.append("<td class='spacer'></td>")
 				colIterator += 1
-			htmlText += "</tr></table>"
+			htmlText.append("</tr></table>")
 
 			freeCount = count - iterator
 			if freeCount < 0:
 				freeCount = 0
-			htmlText += "<table style='width: 100%'><tr>"
+			htmlText.append("<table style='width: 100%'><tr>")
 			for column in iteratorGoal:
-				htmlText += "<td class='layout'>"
+				htmlText.append("<td class='layout'>")
 				for i in range(int(math.ceil(freeCount / len(iteratorGoal)))):
-					htmlText += "<table class='fullWidth'>"
-					htmlText += "<tr>"
-					htmlText += "<td class='hrulefill'></td><td class='nowrap withHRule' style='text-align: right;'>{value}</td>".format(value=self.valueStyled(0, self.traitMax))
-					htmlText += "</tr>"
-					htmlText += "</table>"
-				htmlText += "</td>"
-			htmlText += "</tr></table>"
+					htmlText.append("<table class='fullWidth'>")
+					htmlText.append("<tr>")
+					htmlText.append("<td class='hrulefill'></td><td class='nowrap withHRule' style='text-align: right;'>{value}</td>".format(value=self.valueStyled(0, self.traitMax)))
+					htmlText.append("</tr>")
+					htmlText.append("</table>")
+				htmlText.append("</td>")
+			htmlText.append("</tr></table>")
 
 			if self.__character.species in ( "Mage", "Werewolf", ):
 				iterator = int(math.ceil(iterator / 2))
 
 			self.__powerCount = max(iterator, count)
 
-			return htmlText
+			return "".join(htmlText)
 		else:
 			return ""
 
@@ -631,7 +730,7 @@ class RenderSheet(QObject):
 			else:
 				count = countPerSpecies["Human"]
 
-		htmlText = "<h1 class='{species}'>Merits</h1>".format(species=self.__character.species.lower().lower())
+		htmlText = [ "<h1 class='{species}'>Merits</h1>".format(species=self.__character.species.lower().lower()) ]
 		iterator = 0
 		for item in self.__character.traits["Merit"]:
 			traits = list( self.__character.traits["Merit"][item].keys() )
@@ -639,19 +738,19 @@ class RenderSheet(QObject):
 			for subitem in traits:
 				trait = self.__character.traits["Merit"][item][subitem]
 				if trait.isAvailable and trait.value > 0:
-					htmlText += self.htmlLabelRuleValue(label=trait.name, value=self.valueStyled(trait.totalvalue, self.traitMax), additional=trait.customText)
+					htmlText.append(self.htmlLabelRuleValue(label=trait.name, value=self.valueStyled(trait.totalvalue, self.traitMax), additional=trait.customText))
 					iterator += 1
 
 		## Auch die Kräfte nehmen Platz weg, muß also berücksichtigt werden.
 		iterator + self.__powerCount
 
 		while iterator < count:
-			htmlText += "<table class='fullWidth'><tr>"
-			htmlText += "<td class='hrulefill'></td><td class='nowrap' style='text-align: right;'>{value}</td>".format(value=self.valueStyled(0, self.traitMax))
-			htmlText += "</tr></table>"
+			htmlText.append("<table class='fullWidth'><tr>")
+			htmlText.append("<td class='hrulefill'></td><td class='nowrap' style='text-align: right;'>{value}</td>".format(value=self.valueStyled(0, self.traitMax)))
+			htmlText.append("</tr></table>")
 			iterator += 1
 
-		return htmlText
+		return "".join(htmlText)
 
 
 	def _createFlaws(self):
@@ -709,69 +808,69 @@ class RenderSheet(QObject):
 
 
 	def _dotStat(self, title, value, maxValue, hasTemporary=False):
-		htmlText = "<h1 class='{species}'>{title}</h1>".format(title=title, species=self.__character.species.lower().lower())
-		htmlText += "<table style='width: 100%; table-layout: fixed;'>"
-		htmlText += "<tr>"
+		htmlText = [ "<h1 class='{species}'>{title}</h1>".format(title=title, species=self.__character.species.lower().lower()) ]
+		htmlText.append("<table style='width: 100%; table-layout: fixed;'>")
+		htmlText.append("<tr>")
 		for i in range(value):
-			htmlText += "<td class='layout' style='text-align: center; width: {width}%'><span class='bigSymbols'>{}</span></td>".format(self.valueStyled(1), width=100/maxValue)
+			htmlText.append("<td class='layout' style='text-align: center; width: {width}%'><span class='bigSymbols'>{}</span></td>".format(self.valueStyled(1), width=100/maxValue))
 		for i in range(value, maxValue):
-			htmlText += "<td class='layout' style='text-align: center;'><span class='bigSymbols'>{}</span></td>".format(self.valueStyled(0, 1))
-		htmlText += "</tr>"
+			htmlText.append("<td class='layout' style='text-align: center;'><span class='bigSymbols'>{}</span></td>".format(self.valueStyled(0, 1)))
+		htmlText.append("</tr>")
 		if hasTemporary:
-			htmlText += "<tr>"
+			htmlText.append("<tr>")
 			for i in range(maxValue):
-				htmlText += "<td class='layout' style='text-align: center;'><span class='bigSymbols'>{}</span></td>".format(self.valueStyled(0, 1, squares=True))
-			htmlText += "</tr>"
-		htmlText += "</table>"
+				htmlText.append("<td class='layout' style='text-align: center;'><span class='bigSymbols'>{}</span></td>".format(self.valueStyled(0, 1, squares=True)))
+			htmlText.append("</tr>")
+		htmlText.append("</table>")
 
-		return htmlText
+		return "".join(htmlText)
 
 
 	def _createFuel(self, maxPerRow=10):
-		htmlText = "<h1 class='{species}'>{title}</h1>".format(
+		htmlText = [ "<h1 class='{species}'>{title}</h1>".format(
 			title=self.__storage.fuelName(self.__character.species),
 			species=self.__character.species.lower().lower()
-		)
+		) ]
 
-		htmlText += "<table><tr><td>"
+		htmlText.append("<table><tr><td>")
 
-		htmlText += "<table class='fullWidth'>"
-		htmlText += "<tr>"
+		htmlText.append("<table class='fullWidth'>")
+		htmlText.append("<tr>")
 
 		value = self.__storage.fuelMax(species=self.__character.species, powerstat=self.__character.powerstat)
 		while value > maxPerRow:
 			value -= maxPerRow
 			for i in range(maxPerRow):
-				htmlText += "<td class='layout' style='text-align: center;'><span class='bigSymbols'>{}</span></td>".format(self.valueStyled(0, 1, squares=True))
-			htmlText += "</tr><tr>"
+				htmlText.append("<td class='layout' style='text-align: center;'><span class='bigSymbols'>{}</span></td>".format(self.valueStyled(0, 1, squares=True)))
+			htmlText.append("</tr><tr>")
 		for i in range(value):
-			htmlText += "<td class='layout' style='text-align: center;'><span class='bigSymbols'>{}</span></td>".format(self.valueStyled(0, 1, squares=True))
-		htmlText += "</tr>"
-		htmlText += "</table>"
+			htmlText.append("<td class='layout' style='text-align: center;'><span class='bigSymbols'>{}</span></td>".format(self.valueStyled(0, 1, squares=True)))
+		htmlText.append("</tr>")
+		htmlText.append("</table>")
 
-		htmlText += "</td><td class='spacer'></td><td style='width: 0%'>"
+		htmlText.append("</td><td class='spacer'></td><td style='width: 0%'>")
 
-		htmlText += "<span class='small'><table style='width: 100%'><tr><td class='nowrap' style='text-align: center;'>{perTurn}</td></tr><tr><td class='nowrap' style='text-align: center;'>per Turn</td></tr></table></span>".format(perTurn=self.__storage.fuelPerTurn(species=self.__character.species, powerstat=self.__character.powerstat))
+		htmlText.append("<span class='small'><table style='width: 100%'><tr><td class='nowrap' style='text-align: center;'>{perTurn}</td></tr><tr><td class='nowrap' style='text-align: center;'>per Turn</td></tr></table></span>".format(perTurn=self.__storage.fuelPerTurn(species=self.__character.species, powerstat=self.__character.powerstat)))
 
-		htmlText += "</td></tr></table>"
+		htmlText.append("</td></tr></table>")
 
-		return htmlText
+		return "".join(htmlText)
 
 
 	def _createMorality(self):
-		htmlText = "<h1 class='{species}'>{title}</h1>".format(title=self.__storage.moralityName(self.__character.species), species=self.__character.species.lower())
-		htmlText += "<table class='fullWidth'>"
+		htmlText = [ "<h1 class='{species}'>{title}</h1>".format(title=self.__storage.moralityName(self.__character.species), species=self.__character.species.lower()) ]
+		htmlText.append("<table class='fullWidth'>")
 		for row in range(self.__character.morality + 1, Config.TRAIT_MORALITY_VALUE_MAX + 1)[::-1]:
-			htmlText += "<tr>"
-			htmlText += "<td style='text-align: center;'>{level}</td><td {hrule}><span class='scriptFont'>{derangement}</span></td><td  class='narrowLine' style='text-align: center;'><span class='bigSymbols'>{value}</span></td>".format(level=row, derangement=self.derangement(row), value=self.valueStyled(0, 1), hrule=self.__derangementPossible(row))
-			htmlText += "</tr>"
+			htmlText.append("<tr>")
+			htmlText.append("<td style='text-align: center;'>{level}</td><td {hrule}><span class='scriptFont'>{derangement}</span></td><td  class='narrowLine' style='text-align: center;'><span class='bigSymbols'>{value}</span></td>".format(level=row, derangement=self.derangement(row), value=self.valueStyled(0, 1), hrule=self.__derangementPossible(row)))
+			htmlText.append("</tr>")
 		for row in range(1, self.__character.morality + 1)[::-1]:
-			htmlText += "<tr>"
-			htmlText += "<td style='text-align: center;'>{level}</td><td {hrule}></td><td class='narrowLine' style='text-align: center;'><span class='bigSymbols'>{value}</span></td>".format(level=row, value=self.valueStyled(1), hrule=self.__derangementPossible(row))
-			htmlText += "</tr>"
-		htmlText += "</table>"
+			htmlText.append("<tr>")
+			htmlText.append("<td style='text-align: center;'>{level}</td><td {hrule}></td><td class='narrowLine' style='text-align: center;'><span class='bigSymbols'>{value}</span></td>".format(level=row, value=self.valueStyled(1), hrule=self.__derangementPossible(row)))
+			htmlText.append("</tr>")
+		htmlText.append("</table>")
 
-		return htmlText
+		return "".join(htmlText)
 
 
 	def __derangementPossible(self, level):
@@ -816,41 +915,41 @@ class RenderSheet(QObject):
 			"durability",
 		)
 
-		htmlText = "<table class='fullWidth'>"
-		htmlText += "<tr>"
+		htmlText = [ "<table class='fullWidth'>" ]
+		htmlText.append("<tr>")
 		for heading in weaponHeadings:
-			htmlText += "<th style='width: {width}%'><h2 class='{species}'>{title}</h2></th>".format(
+			htmlText.append("<th style='width: {width}%'><h2 class='{species}'>{title}</h2></th>".format(
 					title=heading[0],
 					width=heading[1],
 					species=self.__character.species.lower(),
-				)
-		htmlText += "</tr>"
+				))
+		htmlText.append("</tr>")
 
 		#Debug.debug(htmlText)
 
 		iterator = 0
 		for category in self.__character.weapons:
 			for weapon in self.__character.weapons[category]:
-				htmlText += "<tr>"
-				htmlText += "<td><span class='scriptFont'>{}</span></td>".format(weapon)
+				htmlText.append("<tr>")
+				htmlText.append("<td><span class='scriptFont'>{}</span></td>".format(weapon))
 				for column in weaponInfo:
-					htmlText += "<td style='text-align: center;'><span class='scriptFont'>{}</span></td>".format(self.__storage.weapons[category][weapon][column])
-				htmlText += "</tr>"
+					htmlText.append("<td style='text-align: center;'><span class='scriptFont'>{}</span></td>".format(self.__storage.weapons[category][weapon][column]))
+				htmlText.append("</tr>")
 				iterator += 1
 
 		while iterator < count:
-			htmlText += "<tr class='rowHeight'>"
+			htmlText.append("<tr class='rowHeight'>")
 			## Der Waffenname hat ja auch ein Feld.
 			for i in range(len(weaponHeadings)):
-				htmlText += "<td class='layout' style='vertical-align: bottom;'><table class='underlines fullWidth'><tr style='height: 100%;'>"
-				htmlText += "<td class='hrulefill'></td>"
-				htmlText += "</tr></table></td>"
-			htmlText += "</tr>"
+				htmlText.append("<td class='layout' style='vertical-align: bottom;'><table class='underlines fullWidth'><tr style='height: 100%;'>")
+				htmlText.append("<td class='hrulefill'></td>")
+				htmlText.append("</tr></table></td>")
+			htmlText.append("</tr>")
 			iterator += 1
 
-		htmlText += "</table>"
+		htmlText.append("</table>")
 
-		return htmlText
+		return "".join(htmlText)
 
 
 	def _createGoblinContracts(self):
@@ -993,57 +1092,57 @@ class RenderSheet(QObject):
 			),
 		}
 
-		htmlText = "<table style='width: 100%'><tr>"
+		htmlText = [ "<table style='width: 100%'><tr>" ]
 		iterator = 0
 		for shape in Config.SHAPES_WEREWOLF:
 			if iterator > 0:
-				htmlText += "<td class='layout spacer'><!--Fixed horizontal space--></td>"
-			htmlText += "<td class='layout' style='width: {}%'>".format((100 / len(Config.SHAPES_WEREWOLF)) - 1)
-			htmlText += "<h2 class='{species}'>{title}</h2>".format(title=shape, species=self.__character.species.lower())
-			htmlText += "<table style='width: 100%'>"
+				htmlText.append("<td class='layout spacer'><!--Fixed horizontal space--></td>")
+			htmlText.append("<td class='layout' style='width: {}%'>".format((100 / len(Config.SHAPES_WEREWOLF)) - 1))
+			htmlText.append("<h2 class='{species}'>{title}</h2>".format(title=shape, species=self.__character.species.lower()))
+			htmlText.append("<table style='width: 100%'>")
 			for row in shapesAttributes[shape]:
-				htmlText += "<tr><td class='layout'>"
-				htmlText += self.htmlLabelRuleValue(label=row[0], value="<span class='scriptFont'>{}</span>".format(row[1]))
-				htmlText += "</td></tr>"
-			htmlText += "</table>"
-			htmlText += "</td>"
+				htmlText.append("<tr><td class='layout'>")
+				htmlText.append(self.htmlLabelRuleValue(label=row[0], value="<span class='scriptFont'>{}</span>".format(row[1])))
+				htmlText.append("</td></tr>")
+			htmlText.append("</table>")
+			htmlText.append("</td>")
 			iterator += 1
-		htmlText += "</tr><tr>"
+		htmlText.append("</tr><tr>")
 		for shape in Config.SHAPES_WEREWOLF:
-			htmlText += "<td class='layout'><div class='spacer'></div></td>"
-		htmlText += "</tr><tr>"
+			htmlText.append("<td class='layout'><div class='spacer'></div></td>")
+		htmlText.append("</tr><tr>")
 		iterator = 0
 		for shape in Config.SHAPES_WEREWOLF:
 			if iterator > 0:
-				htmlText += "<td class='layout spacer'><!--Fixed horizontal space--></td>"
-			htmlText += "<td class='layout'>"
-			htmlText += "<table style='width: 100%'>"
+				htmlText.append("<td class='layout spacer'><!--Fixed horizontal space--></td>")
+			htmlText.append("<td class='layout'>")
+			htmlText.append("<table style='width: 100%'>")
 			for row in shapesAdvantages[shape]:
-				htmlText += "<tr><td class='layout'>"
-				htmlText += self.htmlLabelRuleValue(label=row[0], value="<span class='scriptFont'>{}</span>".format(row[1]))
-				htmlText += "</td></tr>"
-			htmlText += "</table>"
-			htmlText += "</td>"
+				htmlText.append("<tr><td class='layout'>")
+				htmlText.append(self.htmlLabelRuleValue(label=row[0], value="<span class='scriptFont'>{}</span>".format(row[1])))
+				htmlText.append("</td></tr>")
+			htmlText.append("</table>")
+			htmlText.append("</td>")
 			iterator += 1
-		htmlText += "</tr><tr>"
+		htmlText.append("</tr><tr>")
 		for shape in Config.SHAPES_WEREWOLF:
-			htmlText += "<td class='layout'><div class='spacer'></div></td>"
-		htmlText += "</tr><tr>"
+			htmlText.append("<td class='layout'><div class='spacer'></div></td>")
+		htmlText.append("</tr><tr>")
 		iterator = 0
 		for shape in Config.SHAPES_WEREWOLF:
 			if iterator > 0:
-				htmlText += "<td class='layout spacer'><!--Fixed horizontal space--></td>"
-			htmlText += "<td class='layout'>"
-			htmlText += "<table style='width: 100%'>"
+				htmlText.append("<td class='layout spacer'><!--Fixed horizontal space--></td>")
+			htmlText.append("<td class='layout'>")
+			htmlText.append("<table style='width: 100%'>")
 			for row in comments[shape]:
-				htmlText += "<tr><td style='text-align: center; font-style: italic;'><span class='small' style='line-height: 1em;'>{}</span></td></tr>".format(row)
-			htmlText += "</table>"
-			htmlText += "</td>"
+				htmlText.append("<tr><td style='text-align: center; font-style: italic;'><span class='small' style='line-height: 1em;'>{}</span></td></tr>".format(row))
+			htmlText.append("</table>")
+			htmlText.append("</td>")
 			iterator += 1
-		htmlText += "</tr></table>"
+		htmlText.append("</tr></table>")
 
 
-		return htmlText
+		return "".join(htmlText)
 
 
 	def _createCompanion(self):
@@ -1135,7 +1234,7 @@ class RenderSheet(QObject):
 		if self.__character.species != "Human":
 			htmlText = "<h1 class='{species}'>{title}</h1>".format(title=self.__storage.subPowerName(self.__character.species), species=self.__character.species.lower())
 
-			htmlText = htmlText.replace("&", "&#38;")
+			htmlText = [ htmlText.replace("&", "&#38;") ]
 
 			powerMax = Config.TRAIT_VALUE_MAX
 			if self.__character.species == "Mage":
@@ -1148,33 +1247,33 @@ class RenderSheet(QObject):
 				"Roll",
 			)
 
-			htmlText += "<table style='width: 100%'><tr>"
+			htmlText.append("<table style='width: 100%'><tr>")
 			for heading in headings:
-				htmlText += "<th><h2 class='{species}'>{title}</h2></th>".format(title=heading, species=self.__character.species.lower())
-			htmlText += "</tr>"
+				htmlText.append("<th><h2 class='{species}'>{title}</h2></th>".format(title=heading, species=self.__character.species.lower()))
+			htmlText.append("</tr>")
 			for item in self.__character.traits["Subpower"]:
 				traits = list( self.__character.traits["Subpower"][item].items() )
 				traits.sort()
 				for subitem in traits:
 					if subitem[1].isAvailable and subitem[1].value > 0 and subitem[1].species == self.__character.species:
-						htmlText += "<tr>"
-						htmlText += "<td><span class='scriptFont'>{}</span></td>".format(subitem[1].name)
-						htmlText += "<td class='layout'>"
+						htmlText.append("<tr>")
+						htmlText.append("<td><span class='scriptFont'>{}</span></td>".format(subitem[1].name))
+						htmlText.append("<td class='layout'>")
 						if self.__storage.traits["Subpower"][item][subitem[0]]["powers"]:
 							for power in self.__storage.traits["Subpower"][item][subitem[0]]["powers"].items():
-								htmlText += "{}".format(self.htmlLabelRuleValue(label=power[0], value=self.valueStyled(power[1], powerMax)))
+								htmlText.append(self.htmlLabelRuleValue(label=power[0], value=self.valueStyled(power[1], powerMax)))
 						elif self.__character.species == "Werewolf":
-							htmlText += self.htmlLabelRuleValue(label=item, value=self.valueStyled(subitem[1].level, powerMax))
-						htmlText += "</td>"
-						htmlText += "<td><span class='scriptFont'>{0[0]}</span><span class='small'> {0[1]}</span>{0[2]}<span class='scriptFont'>{0[3]}</span><span class='small'> {0[4]}</span></td>".format(self.printEnergyCost(
+							htmlText.append(self.htmlLabelRuleValue(label=item, value=self.valueStyled(subitem[1].level, powerMax)))
+						htmlText.append("</td>")
+						htmlText.append("<td><span class='scriptFont'>{0[0]}</span><span class='small'> {0[1]}</span>{0[2]}<span class='scriptFont'>{0[3]}</span><span class='small'> {0[4]}</span></td>".format(self.printEnergyCost(
 							willpower=self.__storage.traits["Subpower"][item][subitem[0]]["costWill"],
 							fuel=self.__storage.traits["Subpower"][item][subitem[0]]["costFuel"]
-						))
-						htmlText += "<td><span class='scriptFont'>{}</span></td>".format(self.__storage.traits["Subpower"][item][subitem[0]]["roll"])
-						htmlText += "</tr>"
-			htmlText += "</table>"
+						)))
+						htmlText.append("<td><span class='scriptFont'>{}</span></td>".format(self.__storage.traits["Subpower"][item][subitem[0]]["roll"]))
+						htmlText.append("</tr>")
+			htmlText.append("</table>")
 
-			return htmlText
+			return "".join(htmlText)
 		else:
 			return ""
 
@@ -1201,18 +1300,18 @@ class RenderSheet(QObject):
 
 	def htmlLabelRuleValue(self, label=None, value=None, additional=None):
 		#Debug.debug(value)
-		htmlText = "<table style='width: 100%'><tr>"
+		htmlText = [ "<table style='width: 100%'><tr>" ]
 		if label:
-			htmlText += "<td class='nowrap withHRule'>{}</td>".format(label)
-		htmlText += "<td class='hrulefill'>"
+			htmlText.append("<td class='nowrap withHRule'>{}</td>".format(label))
+		htmlText.append("<td class='hrulefill'>")
 		if additional:
-			htmlText += "<span class='descText'>{}</span>".format(additional)
-		htmlText += "</td>"
+			htmlText.append("<span class='descText'>{}</span>".format(additional))
+		htmlText.append("</td>")
 		if value:
-			htmlText += "<td class='nowrap withHRule'>{}</td>".format(value)
-		htmlText += "</tr></table>"
+			htmlText.append("<td class='nowrap withHRule'>{}</td>".format(value))
+		htmlText.append("</tr></table>")
 
-		return htmlText
+		return "".join(htmlText)
 
 
 	def _createAutomobiles(self, count=5):
@@ -1240,43 +1339,43 @@ class RenderSheet(QObject):
 			"occupants",
 		)
 
-		htmlText = "<table class='fullWidth'>"
-		htmlText += "<tr>"
+		htmlText = [ "<table class='fullWidth'>" ]
+		htmlText.append("<tr>")
 		for heading in headings:
-			htmlText += "<th style='width: {width}%'><h2 class='{species}'>{title}</h2></th>".format(
+			htmlText.append("<th style='width: {width}%'><h2 class='{species}'>{title}</h2></th>".format(
 					title=heading[0],
 					width=heading[1],
 					species=self.__character.species.lower(),
-				)
-		htmlText += "</tr>"
+				))
+		htmlText.append("</tr>")
 
 		#Debug.debug(htmlText)
 
 		iterator = 0
 		for category in self.__character.automobiles:
 			for automobile in self.__character.automobiles[category]:
-				htmlText += "<tr>"
-				htmlText += "<td><span class='scriptFont'>{}</span></td>".format(automobile)
+				htmlText.append("<tr>")
+				htmlText.append("<td><span class='scriptFont'>{}</span></td>".format(automobile))
 				for column in info:
-					htmlText += "<td style='text-align: center;'><span class='scriptFont'>{}</span></td>".format(self.__storage.automobiles[category][automobile][column])
+					htmlText.append("<td style='text-align: center;'><span class='scriptFont'>{}</span></td>".format(self.__storage.automobiles[category][automobile][column]))
 					## Struktur wird direkt berechneten
 					if column == "size":
-						htmlText += "<td style='text-align: center;'><span class='scriptFont'>{}</span></td>".format(self.__storage.automobiles[category][automobile]["durability"] + self.__storage.automobiles[category][automobile]["size"])
-				htmlText += "</tr>"
+						htmlText.append("<td style='text-align: center;'><span class='scriptFont'>{}</span></td>".format(self.__storage.automobiles[category][automobile]["durability"] + self.__storage.automobiles[category][automobile]["size"]))
+				htmlText.append("</tr>")
 				iterator += 1
 
 		while iterator < count:
-			htmlText += "<tr class='rowHeight'>"
+			htmlText.append("<tr class='rowHeight'>")
 			for i in range(len(headings)):
-				htmlText += "<td class='layout' style='vertical-align: bottom;'><table class='underlines fullWidth'><tr style='height: 100%;'>"
-				htmlText += "<td class='hrulefill'></td>"
-				htmlText += "</tr></table></td>"
-			htmlText += "</tr>"
+				htmlText.append("<td class='layout' style='vertical-align: bottom;'><table class='underlines fullWidth'><tr style='height: 100%;'>")
+				htmlText.append("<td class='hrulefill'></td>")
+				htmlText.append("</tr></table></td>")
+			htmlText.append("</tr>")
 			iterator += 1
 
-		htmlText += "</table>"
+		htmlText.append("</table>")
 
-		return htmlText
+		return "".join(htmlText)
 
 
 	def _createInventory(self, height=293):
@@ -1391,13 +1490,11 @@ class RenderSheet(QObject):
 		htmlText = "<h1 class='{species}'>{title}</h1>".format(title=self.tr("Picture"), species=self.__character.species.lower())
 
 		if self.__character.picture:
-			imageData = QByteArray()
-			imageBuffer = QBuffer(imageData)
-			imageBuffer.open(QIODevice.WriteOnly)
-			self.__character.picture.save(imageBuffer, Config.CHARACTER_PIC_FORMAT)	# Schreibt das Bild in ein QByteArray im angegebenen Bildformat.
-			imageData = imageData.toBase64().data()
-
-			htmlText += "<p style='text-align: center;'><img src='data:image/{form};base64,{image}' style='max-width:100%; max-height:{height}px;'/></p>".format(image=imageData.decode("UTF-8"), form=Config.CHARACTER_PIC_FORMAT, height=height)
+			if self.__backend == "document":
+				## QTextDocument kennt kein max-height, die Breite ergibt sich aus dem Seitenverhältnis des Bildes.
+				htmlText += "<p style='text-align: center;'><img src='{name}' height='{height}'/></p>".format(name=Config.SHEET_DOCUMENT_PICTURE, height=min(height, self.__character.picture.height()))
+			else:
+				htmlText += "<p style='text-align: center;'><img src='data:image/{form};base64,{image}' style='max-width:100%; max-height:{height}px;'/></p>".format(image=self.__character.pictureData, form=Config.CHARACTER_PIC_FORMAT, height=height)
 
 		return htmlText
 
@@ -1511,22 +1608,11 @@ class RenderSheet(QObject):
 		\note Ist maxValue kleiner als value, wird nur maxValue berücksichtigt.
 		"""
 
-		charEmpty = "○"
-		charFull = "●"
-		if squares:
-			charEmpty = "□"
-			charFull = "▣"
-
 		if not maxValue:
 			maxValue = value
-		text = ""
-		for filled in range(min(value, maxValue)):
-			text += charFull
-		for empty in range(min(value, maxValue), maxValue):
-			text += charEmpty
+		filled = min(value, maxValue)
 
-		text = "<span class='dots'>{}</span>".format(text)
-		return text
+		return self.__resources.dots(filled, maxValue - filled, squares)
 
 
 	def borderCorner(self, width=100, height=100):
@@ -1534,12 +1620,12 @@ class RenderSheet(QObject):
 		Fügt ein Bild ein
 
 		\note width und height haben keine Wirkung!
+
+		\note Für QTextDocument wird nichts eingefügt, da es keine svg-Bilder darstellen kann.
 		"""
 
-		if self.__character.species == "Mage":
-			svgImage = self.__resourceFiles[":sheet/images/species/{species}/Border-Corner.svg".format(species=self.__character.species)]
-			## In den svg-Dateien muß der <?xml version="1.0" encoding="UTF-8" standalone="no"?> header weg.
-			svgImage = re.sub(r"\<\?[^\>]*\?\>", "", svgImage)
+		if self.__character.species == "Mage" and self.__backend != "document":
+			svgImage = self.__resources.glyph(":sheet/images/species/{species}/Border-Corner.svg".format(species=self.__character.species))
 
 			border = ""
 			if GlobalState.debug_level >= Config.DEBUG_LEVEL_MODIFIES_EXPORTS:
@@ -1559,35 +1645,31 @@ class RenderSheet(QObject):
 
 		rect = QRect(0, 0, self.__paperSize[0], self.__paperSize[1])
 		if self.__character.species == "Changeling":
-			image = QImage(":sheet/images/sheet/Changeling-Background.jpg")
-			self.__painter.drawImage(rect, image)
+			self.__drawImage(rect, ":sheet/images/sheet/Changeling-Background.jpg")
 		elif self.__character.species == "Mage":
-			image = QImage(":sheet/images/species/Mage/Background.jpg")
-			self.__painter.drawImage(rect, image)
+			self.__drawImage(rect, ":sheet/images/species/Mage/Background.jpg")
 		elif self.__character.species == "Vampire":
-			image = QImage(":sheet/images/sheet/Vampire-Background.jpg")
-			self.__painter.drawImage(rect, image)
+			self.__drawImage(rect, ":sheet/images/sheet/Vampire-Background.jpg")
 		elif self.__character.species == "Werewolf":
-			imageShapes = QImage(":sheet/images/sheet/Werewolf-Shapes.jpg")
+			imageShapes = self.__resources.decodedImage(":sheet/images/sheet/Werewolf-Shapes.jpg")
 			imageHeight = imageShapes.height() * self.__paperSize[0] / imageShapes.width()
 			rect = QRect(0, self.__paperSize[1] - imageHeight, self.__paperSize[0], imageHeight)
-			self.__painter.drawImage(rect, imageShapes)
+			self.__drawImage(rect, ":sheet/images/sheet/Werewolf-Shapes.jpg")
 
 			## Dieses Bild wird später gezeichnet, damit es nicht von den Gestalten abgeschnitten wird.
-			image = QImage(":sheet/images/sheet/Werewolf-Background.png")
+			image = self.__resources.decodedImage(":sheet/images/sheet/Werewolf-Background.png")
 			skullOffset = 100
 			skullHeight = self.__paperSize[1] - imageHeight - skullOffset
 			skullWidth = image.width() * skullHeight / image.height()
 			rect = QRect((self.__paperSize[0] - skullWidth) / 2, skullOffset, skullWidth, skullHeight)
-			self.__painter.drawImage(rect, image)
+			self.__drawImage(rect, ":sheet/images/sheet/Werewolf-Background.png")
 		else:
-			image = QImage(":sheet/images/sheet/WorldOfDarkness-BackgroundL.png")
+			image = self.__resources.decodedImage(":sheet/images/sheet/WorldOfDarkness-BackgroundL.png")
 			rect = QRect(0, 0, image.width() * self.__paperSize[1] / image.height(), self.__paperSize[1])
-			self.__painter.drawImage(rect, image)
+			self.__drawImage(rect, ":sheet/images/sheet/WorldOfDarkness-BackgroundL.png")
 
-			image = QImage(":sheet/images/sheet/WorldOfDarkness-BackgroundR.png")
 			rect = QRect(self.__paperSize[0] - rect.width(), 0, rect.width(), rect.height())
-			self.__painter.drawImage(rect, image)
+			self.__drawImage(rect, ":sheet/images/sheet/WorldOfDarkness-BackgroundR.png")
 
 		self.__painter.restore()
 
@@ -1601,25 +1683,42 @@ class RenderSheet(QObject):
 
 		offsetH = (self.__paperSize[0] - width) / 2
 
-		image = QImage(":sheet/images/sheet/WorldOfDarkness.jpg")
+		imagePath = ":sheet/images/sheet/WorldOfDarkness.jpg"
 		if self.__character.species == "Changeling":
-			image = QImage(":sheet/images/sheet/Changeling.png")
+			imagePath = ":sheet/images/sheet/Changeling.png"
 		elif self.__character.species == "Mage":
-			image = QImage(":sheet/images/sheet/Mage.png")
+			imagePath = ":sheet/images/sheet/Mage.png"
 		if self.__character.species == "Vampire":
-			image = QImage(":sheet/images/sheet/Vampire.png")
+			imagePath = ":sheet/images/sheet/Vampire.png"
 		if self.__character.species == "Werewolf":
-			image = QImage(":sheet/images/sheet/Werewolf.png")
+			imagePath = ":sheet/images/sheet/Werewolf.png"
 		else:
 			pass
 
+		image = self.__resources.decodedImage(imagePath)
 		rect = QRect(offsetH, offsetV, width, image.height() * width / image.width())
 
-		self.__painter.drawImage(rect, image)
+		self.__drawImage(rect, imagePath)
 
 		self.__painter.restore()
 
 
+	def __drawImage(self, rect, imagePath):
+		"""
+		Zeichnet das Bild imagePath in das Rechteck rect.
+
+		Das Bild wird über SheetResources bereits auf die Größe skaliert, die es auf dem Drucker tatsächlich einnimmt. Dadurch muß es weder auf jeder Seite erneut dekodiert noch von drawImage() skaliert werden.
+		"""
+
+		image = self.__resources.scaledImage(
+			imagePath,
+			int(round(rect.width() * self.__scale)),
+			int(round(rect.height() * self.__scale)),
+			self.__printer.resolution()
+		)
+		self.__painter.drawImage(rect, image)
+
+
 	def __pagePreparation(self):
 		"""
 		Vorbereiten der Seite, auf welche die HTML-Zeichnung schließlich gedruckt werden soll.
@@ -1632,11 +1731,16 @@ class RenderSheet(QObject):
 		Abschließen der Seite, auf welche die HTML-Zeichnung schließlich gedruckt werden soll.
 		"""
 
+		## Erst hier wird die PDF-Datei fertiggestellt.
+		debug_timing_start = Debug.timehook(phase="pdf")
 		self.__painter.end()
+		Debug.timesince( debug_timing_start, "Time neccessary to finish the pdf file.", phase="pdf" )
 
 		#for tmp in self.__persistentResourceFiles.values():
 			#os.remove("{}".format(tmp.name))
 
+		self.sheetFinished.emit()
+
 
 
 	def __renderPdf(self, page, status=None):
@@ -1648,6 +1752,9 @@ class RenderSheet(QObject):
 
 		#Debug.debug("Seite: {} (Status ist {})".format(page, status))
 
+		Debug.timesince( self.__timingLoad, "Time neccessary for WebKit to load page {}.".format(page + 1), phase="webkit", page=page )
+		debug_timing_start = Debug.timehook(phase="renderPdf")
+
 		contentsSize = self.__mainFrame.contentsSize()
 		#Debug.debug(contentsSize)
 		self.__page.setViewportSize ( contentsSize )
@@ -1660,6 +1767,91 @@ class RenderSheet(QObject):
 
 		self.__painter.save()
 
+		self.__drawDecoration(scale)
+
+		## HTML-Struktur drucken.
+		debug_timing_frame = Debug.timehook(phase="renderPdf/frame")
+		self.__mainFrame.render ( self.__painter )
+		Debug.timesince( debug_timing_frame, "Time neccessary to draw page {}.".format(page + 1), phase="renderPdf/frame", page=page )
+
+		self.__painter.restore()
+
+		Debug.timesince( debug_timing_start, "Time neccessary to render page {}.".format(page + 1), phase="renderPdf", page=page )
+
+		## Seitenindex erhöhen, nachdem diese Seite abgeschlossen ist.
+		self.__pageToPrint += 1
+
+		if self.__pageToPrint >= self.pageCount():
+			self.__pageClosing()
+		else:
+			self.__printer.newPage()
+			self.printFinished.emit()
+
+
+	def __renderDocument(self):
+		"""
+		Druckt sämtliche Seiten ohne WebKit.
+
+		Der Html-Text jeder Seite wird von einem QTextDocument gesetzt und direkt mit dem QPainter gezeichnet. Die Längenangaben der Html-Vorlagen werden dabei mit Config.SHEET_DOCUMENT_DPI umgerechnet.
+
+		\note Was QTextDocument nicht darstellen kann, ist in der Beschreibung dieser Klasse aufgeführt.
+		"""
+
+		scale = self.__printer.logicalDpiX() / Config.SHEET_DOCUMENT_DPI
+
+		pageCount = self.pageCount()
+		for page in range(pageCount):
+			self.__pageToPrint = page
+			if page > 0:
+				self.__printer.newPage()
+
+			htmlText = self.__pageHtml(page)
+
+			debug_timing_start = Debug.timehook(phase="renderPdf")
+
+			self.__painter.save()
+
+			self.__drawDecoration(scale)
+
+			debug_timing_layout = Debug.timehook(phase="renderPdf/layout")
+			document = QTextDocument()
+			self.addDocumentResources(document)
+			document.setHtml(htmlText)
+			document.setTextWidth(self.__paperSize[0])
+			Debug.timesince( debug_timing_layout, "Time neccessary to lay out page {}.".format(page + 1), phase="renderPdf/layout", page=page )
+
+			debug_timing_frame = Debug.timehook(phase="renderPdf/frame")
+			document.drawContents(self.__painter, QRectF(0, 0, self.__paperSize[0], self.__paperSize[1]))
+			Debug.timesince( debug_timing_frame, "Time neccessary to draw page {}.".format(page + 1), phase="renderPdf/frame", page=page )
+
+			self.__painter.restore()
+
+			Debug.timesince( debug_timing_start, "Time neccessary to render page {}.".format(page + 1), phase="renderPdf", page=page )
+
+		self.__pageToPrint = pageCount
+		self.__pageClosing()
+
+
+	def addDocumentResources(self, document):
+		"""
+		Legt die Bilder, auf welche die Html-Seiten für QTextDocument verweisen, in document ab.
+
+		Statt einer data-URI verweist das Bild des Charakters nur auf den Namen Config.SHEET_DOCUMENT_PICTURE. So muß es weder base64-kodiert noch vom QTextDocument wieder dekodiert werden.
+		"""
+
+		if self.__character.picture:
+			document.addResource(QTextDocument.ImageResource, QUrl(Config.SHEET_DOCUMENT_PICTURE), self.__character.picture)
+
+
+	def __drawDecoration(self, scale):
+		"""
+		Skaliert den Painter für die aktuelle Seite und zeichnet Hintergrund und Logo.
+
+		\param scale Um diesen Faktor ist die Seite auf dem Drucker größer als die Html-Seite.
+		"""
+
+		self.__scale = scale
+
 		self.__painter.scale(scale, scale)
 		self.__painter.setRenderHint ( QPainter.Antialiasing )
 
@@ -1669,7 +1861,9 @@ class RenderSheet(QObject):
 		)
 
 		## Hintergrundbild:
+		debug_timing_start = Debug.timehook(phase="renderPdf/background")
 		self._drawBackground()
+		Debug.timesince( debug_timing_start, "Time neccessary to draw the background.", phase="renderPdf/background", page=self.__pageToPrint )
 
 		## Logo erscheint nur auf erster Seite
 		if self.__pageToPrint < 1:
@@ -1687,21 +1881,9 @@ class RenderSheet(QObject):
 			elif self.__character.species == "Werewolf":
 				posY = 0.01 * self.__paperSize[1]
 				width = 0.33 * self.__paperSize[0]
+			debug_timing_start = Debug.timehook(phase="renderPdf/logo")
 			self._drawLogo(posY, width)
-
-		## HTML-Struktur drucken.
-		self.__mainFrame.render ( self.__painter )
-
-		self.__painter.restore()
-
-		## Seitenindex erhöhen, nachdem diese Seite abgeschlossen ist.
-		self.__pageToPrint += 1
-
-		if self.__pageToPrint >= len(self.__htmlTemplates[self.__character.species]):
-			self.__pageClosing()
-		else:
-			self.__printer.newPage()
-			self.printFinished.emit()
+			Debug.timesince( debug_timing_start, "Time neccessary to draw the logo.", phase="renderPdf/logo", page=self.__pageToPrint )
 
 
 
@@ -0,0 +1,356 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+import re
+import xml.etree.ElementTree as etree
+
+from PyQt4.QtCore import Qt, QFile, QIODevice, QTextStream
+from PyQt4.QtGui import QImage
+
+import src.GlobalState as GlobalState
+import src.Config as Config
+from src.Error import ErrFileNotOpened
+from src.Draw.SheetTemplate import SheetTemplate
+
+
+
+
+class SheetResources(object):
+	"""
+	@brief Die Html-Vorlagen, das Stylesheet und die Bilder der Charakterbögen.
+
+	Die Dateien werden beim Erzeugen der ersten Instanz aus den Qt-Ressourcen gelesen und gleich so aufbereitet, wie RenderSheet sie benötigt. Alle weiteren Instanzen greifen auf dieselben, in der Klasse gespeicherten Daten zu, so daß bei wiederholtem Export keine Datei mehr gelesen werden muß.
+	"""
+
+	# Die Html-Vorlagen der Seiten des Charakterbogens.
+	# {
+	# 	Spezies1: [ Seite1, Seite2, ... ],
+	# 	...
+	# }
+	__pages = {}
+
+	# Das Gerüst, in welches jede Seite zusammen mit dem Stylesheet eingefügt wird.
+	__frame = None
+
+	# Das Gerüst für Seiten, welche von QTextDocument gesetzt werden. Es ist schlichtes Html ohne xml-Deklaration und ohne svg-Namensraum.
+	__documentFrame = None
+
+	# Das Stylesheet. Die geschweiften Klammern sind bereits verdoppelt, damit der Text als Argument für str.format() genutzt werden kann.
+	__stylesheet = None
+
+	# Die svg-Bilder ohne den xml-Header, damit sie direkt in die Html-Seite eingefügt werden können.
+	# {
+	# 	Pfad1: Inhalt1,
+	# 	...
+	# }
+	__images = {}
+
+	# Die svg-Bilder als Symbole für den Glyphen-Atlas, bereinigt um die Metadaten des Zeichenprogramms, sowie die Attribute des äußeren svg-Elements, welche die Größe des Bildes bestimmen.
+	# {
+	# 	Pfad1: ( Symbol1, Attribute1 ),
+	# 	...
+	# }
+	__glyphs = {}
+
+	# Die bereits zusammengesetzten Punktreihen für die Werte der Eigenschaften.
+	# {
+	# 	( Gefüllt, Leer, Quadrate ): Text1,
+	# 	...
+	# }
+	__dots = {}
+
+	# Die Seiten samt Gerüst und Stylesheet als SheetTemplate, getrennt danach, ob das Stylesheet für Config.DEBUG_LEVEL_MODIFIES_EXPORTS verändert ist und ob sie für QTextDocument bestimmt sind.
+	# {
+	# 	( Spezies1, False, False ): [ Seite1, Seite2, ... ],
+	# 	...
+	# }
+	__compiledPages = {}
+
+	# Die bereits dekodierten Hintergrundbilder und Logos.
+	# {
+	# 	Pfad1: QImage1,
+	# 	...
+	# }
+	__decodedImages = {}
+
+	# Die auf die Zielgröße skalierten Bilder.
+	# {
+	# 	( Pfad1, Breite, Höhe, Auflösung ): QImage1,
+	# 	...
+	# }
+	__scaledImages = {}
+
+	__pageFiles = {
+		"Human": ( ":sheet/stylesheets/sheetTemplate-Human-A.html", ),
+		"Changeling": ( ":sheet/stylesheets/sheetTemplate-Changeling-A.html", ":sheet/stylesheets/sheetTemplate-Changeling-B.html", ),
+		"Mage": ( ":sheet/stylesheets/sheetTemplate-Mage-A.html", ":sheet/stylesheets/sheetTemplate-Mage-B.html", ),
+		"Vampire": ( ":sheet/stylesheets/sheetTemplate-Vampire-A.html", ":sheet/stylesheets/sheetTemplate-Vampire-B.html", ),
+		"Werewolf": ( ":sheet/stylesheets/sheetTemplate-Werewolf-A.html", ":sheet/stylesheets/sheetTemplate-Werewolf-B.html", ),
+	}
+
+	## Die svg-Bilder und die Platzhalter, in deren Inhalt sie verwendet werden. Nur Seiten mit einem dieser Platzhalter erhalten das Bild in ihrem Glyphen-Atlas.
+	__imageFiles = {
+		":sheet/images/species/Mage/Border-Corner.svg": "attributes",
+		":sheet/images/species/Mage/Power-Death.svg": "powers",
+		":sheet/images/species/Mage/Power-Fate.svg": "powers",
+		":sheet/images/species/Mage/Power-Forces.svg": "powers",
+		":sheet/images/species/Mage/Power-Life.svg": "powers",
+		":sheet/images/species/Mage/Power-Matter.svg": "powers",
+		":sheet/images/species/Mage/Power-Mind.svg": "powers",
+		":sheet/images/species/Mage/Power-Prime.svg": "powers",
+		":sheet/images/species/Mage/Power-Space.svg": "powers",
+		":sheet/images/species/Mage/Power-Spirit.svg": "powers",
+		":sheet/images/species/Mage/Power-Time.svg": "powers",
+	}
+
+	__svgNamespace = "http://www.w3.org/2000/svg"
+	__xlinkNamespace = "http://www.w3.org/1999/xlink"
+
+
+	def __init__(self):
+		if SheetResources.__frame is None:
+			self.__load()
+
+
+	@classmethod
+	def __load(cls):
+		"""
+		Liest alle Dateien ein.
+
+		\note Erst wenn alle Dateien gelesen werden konnten, gelten die Daten als geladen. Schlägt das Lesen fehl, wird es bei der nächsten Instanz erneut versucht.
+		"""
+
+		for species, files in cls.__pageFiles.items():
+			cls.__pages[species] = [ cls.__readFile(page) for page in files ]
+
+		for image in cls.__imageFiles:
+			## In den svg-Dateien muß der <?xml version="1.0" encoding="UTF-8" standalone="no"?> header weg.
+			cls.__images[image] = re.sub(r"\<\?[^\>]*\?\>", "", cls.__readFile(image))
+			cls.__glyphs[image] = cls.__createGlyph(cls.glyphId(image), cls.__images[image])
+
+		## In der css-Datei müssen die geschweiften Klammern geschweifte Klammern bleiben. Also muß ich diese jeweils verdoppeln
+		cls.__stylesheet = cls.__readFile(":sheet/stylesheets/sheet.css").replace("{", "{{").replace("}", "}}")
+		cls.__frame = cls.__readFile(":sheet/stylesheets/sheetTemplate.html")
+		cls.__documentFrame = cls.__readFile(":sheet/stylesheets/sheetTemplate-Document.html")
+
+
+	@staticmethod
+	def __readFile(fileName):
+		qrcFile = QFile(fileName)
+		if not qrcFile.open(QIODevice.ReadOnly):
+			raise ErrFileNotOpened( "While opening file \"{}\" the error \"{}\" occured.".format( fileName, qrcFile.errorString() ), filename=fileName )
+		textStream = QTextStream(qrcFile)
+		fileContent = textStream.readAll()
+		qrcFile.close()
+		return fileContent
+
+
+	@classmethod
+	def __createGlyph(cls, glyphId, svgText):
+		"""
+		Wandelt das svg-Bild svgText in ein Symbol für den Glyphen-Atlas um.
+
+		Elemente und Attribute fremder Namensräume, wie sie Inkscape hinterläßt, und die Metadaten werden entfernt. Die Attribute des äußeren svg-Elements, welche die Größe und den Koordinatenbereich des Bildes festlegen, werden getrennt zurückgegeben, damit jeder Verweis auf das Symbol genau so groß dargestellt wird wie zuvor das eingebettete Bild.
+		"""
+
+		svgPrefix = "{{{}}}".format(cls.__svgNamespace)
+		root = etree.fromstring(svgText)
+
+		def clean(element):
+			for key in list(element.attrib):
+				if key.startswith("{"):
+					del element.attrib[key]
+			for child in list(element):
+				if not isinstance(child.tag, str) or not child.tag.startswith(svgPrefix) or child.tag == svgPrefix + "metadata":
+					element.remove(child)
+				else:
+					## Der Namensraum wird schon am svg-Element des Atlas angegeben.
+					child.tag = child.tag[len(svgPrefix):]
+					clean(child)
+
+		clean(root)
+
+		sizeAttributes = " ".join( "{}='{}'".format(key, root.get(key)) for key in ( "width", "height", "viewBox", "preserveAspectRatio", ) if root.get(key) is not None )
+
+		symbol = etree.Element("symbol", id=glyphId)
+		symbol.extend(list(root))
+		return ( etree.tostring(symbol, encoding="unicode"), sizeAttributes, )
+
+
+	@property
+	def frame(self):
+		return self.__frame
+
+
+	@property
+	def species(self):
+		"""
+		Die Spezies, für welche es einen Charakterbogen gibt.
+		"""
+
+		return tuple(self.__pages)
+
+
+	def stylesheet(self):
+		"""
+		Gibt das Stylesheet zurück.
+
+		\note Ab Config.DEBUG_LEVEL_MODIFIES_EXPORTS werden zusätzlich die Ränder aller Tabellenzellen eingezeichnet.
+		"""
+
+		if GlobalState.debug_level >= Config.DEBUG_LEVEL_MODIFIES_EXPORTS:
+			return self.__stylesheet + "td {{ border: 1px solid #0F0; }}" + "td.layout {{ border: 1px solid #F00; }}"
+		return self.__stylesheet
+
+
+	def pages(self, species):
+		"""
+		Gibt die Html-Vorlagen aller Seiten des Charakterbogens für die Spezies species zurück.
+		"""
+
+		return self.__pages[species]
+
+
+	def compiledPages(self, species, document=False):
+		"""
+		Gibt die Seiten des Charakterbogens für die Spezies species zurück, bereits in das Gerüst eingefügt und als SheetTemplate zerlegt.
+
+		Jede Seite wird nur beim ersten Aufruf zerlegt.
+
+		\param document Ist document True, werden die Seiten für QTextDocument in das schlichte Html-Gerüst eingefügt und erhalten keinen Glyphen-Atlas, da QTextDocument kein svg darstellen kann.
+		"""
+
+		key = ( species, GlobalState.debug_level >= Config.DEBUG_LEVEL_MODIFIES_EXPORTS, document, )
+		if key not in self.__compiledPages:
+			stylesheet = self.stylesheet()
+			if document:
+				self.__compiledPages[key] = [ SheetTemplate( self.__documentFrame.format( stylesheet=stylesheet, body=page ) ) for page in self.__pages[species] ]
+			else:
+				self.__compiledPages[key] = [ SheetTemplate( self.__frame.format( stylesheet=stylesheet, body=self.__glyphAtlas(species, page) + page ) ) for page in self.__pages[species] ]
+		return self.__compiledPages[key]
+
+
+	def __glyphAtlas(self, species, page):
+		"""
+		Gibt ein unsichtbares svg-Element zurück, welches alle svg-Bilder der Spezies species, die auf der Seite page verwendet werden, genau einmal als Symbol enthält. glyph() verweist dann nur noch auf diese Symbole.
+
+		\note Die geschweiften Klammern sind bereits verdoppelt, damit der Atlas Teil der Vorlage werden kann.
+		"""
+
+		prefix = ":sheet/images/species/{}/".format(species)
+		symbols = [ self.__glyphs[fileName][0] for fileName, slot in sorted(self.__imageFiles.items()) if fileName.startswith(prefix) and "{{{}}}".format(slot) in page ]
+		if not symbols:
+			return ""
+
+		atlas = "<svg xmlns='{svg}' width='0' height='0' style='position: absolute;'><defs>{symbols}</defs></svg>".format(svg=self.__svgNamespace, symbols="".join(symbols))
+		return atlas.replace("{", "{{").replace("}", "}}")
+
+
+	def image(self, fileName):
+		"""
+		Gibt das svg-Bild fileName zurück, bereit zum Einfügen in eine Html-Seite.
+		"""
+
+		return self.__images[fileName]
+
+
+	@staticmethod
+	def glyphId(fileName):
+		"""
+		Gibt die Id zurück, unter welcher das svg-Bild fileName im Glyphen-Atlas der Seite abgelegt ist.
+		"""
+
+		return "glyph-{}".format(fileName.rsplit("/", 1)[-1].rsplit(".", 1)[0])
+
+
+	def glyph(self, fileName):
+		"""
+		Gibt ein svg-Element zurück, welches das Bild fileName aus dem Glyphen-Atlas der Seite darstellt.
+
+		Anstatt das gesamte Bild bei jeder Verwendung erneut einzufügen, wird nur auf das Symbol im Atlas verwiesen. Das Bild bleibt dabei eine Vektorgrafik und muß für keine Auflösung eigens gezeichnet werden.
+		"""
+
+		return "<svg xmlns='{svg}' xmlns:xlink='{xlink}' {size}><use xlink:href='#{id}'/></svg>".format(
+			svg=self.__svgNamespace,
+			xlink=self.__xlinkNamespace,
+			size=self.__glyphs[fileName][1],
+			id=self.glyphId(fileName),
+		)
+
+
+	def dots(self, filled, empty, squares=False):
+		"""
+		Gibt eine Reihe aus filled gefüllten und empty leeren Punkten zurück. Ist squares True, werden statt Punkten Quadrate verwendet.
+
+		Jede Reihe wird nur einmal zusammengesetzt.
+		"""
+
+		key = ( filled, empty, squares, )
+		if key not in self.__dots:
+			charEmpty = "○"
+			charFull = "●"
+			if squares:
+				charEmpty = "□"
+				charFull = "▣"
+			self.__dots[key] = "<span class='dots'>{}</span>".format(charFull * filled + charEmpty * empty)
+		return self.__dots[key]
+
+
+	def decodedImage(self, fileName):
+		"""
+		Gibt das Bild fileName zurück. Es wird nur beim ersten Aufruf aus den Ressourcen gelesen und dekodiert.
+		"""
+
+		if fileName not in self.__decodedImages:
+			self.__decodedImages[fileName] = QImage(fileName)
+		return self.__decodedImages[fileName]
+
+
+	def scaledImage(self, fileName, width, height, resolution):
+		"""
+		Gibt das Bild fileName skaliert auf width mal height Pixel zurück.
+
+		\param resolution Die Auflösung des Druckers. Dasselbe Bild wird für jede Auflösung getrennt zwischengespeichert.
+
+		\note Bilder werden nur verkleinert, niemals vergrößert. Ist das Bild in einer Richtung bereits kleiner, behält es in dieser Richtung seine Größe.
+		"""
+
+		key = ( fileName, width, height, resolution, )
+		if key not in self.__scaledImages:
+			image = self.decodedImage(fileName)
+			## Jede Richtung wird für sich auf die Größe des Bildes begrenzt, damit die andere nicht vergrößert wird.
+			targetWidth = image.width()
+			if 0 < width < targetWidth:
+				targetWidth = width
+			targetHeight = image.height()
+			if 0 < height < targetHeight:
+				targetHeight = height
+			if targetWidth != image.width() or targetHeight != image.height():
+				image = image.scaled(targetWidth, targetHeight, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+			self.__scaledImages[key] = image
+		return self.__scaledImages[key]
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+import string
+
+
+
+
+class SheetTemplate(object):
+	"""
+	@brief Eine bereits zerlegte Html-Vorlage des Charakterbogens.
+
+	Die Vorlage wird nur einmal mittels string.Formatter in Textstücke und Platzhalter zerlegt. render() muß dann nur noch die Platzhalter füllen und alle Stücke aneinanderhängen, anstatt jedesmal den gesamten Text mit str.format() zu durchsuchen.
+
+	Jeder Platzhalter wird von einer Funktion ohne Argumente gefüllt. Es werden nur die Funktionen aufgerufen, deren Platzhalter in der Vorlage auch vorkommen, und zwar jede höchstens einmal.
+
+	\note Wie bei str.format() stehen doppelte geschweifte Klammern für eine einfache geschweifte Klammer. Als Platzhalter sind nur einfache Namen erlaubt, keine Attribute oder Indizes.
+	"""
+
+	__formatter = string.Formatter()
+
+
+	def __init__(self, text):
+		## Liste aus Tupeln (Text, Platzhalter, Formatangabe, Umwandlung). Platzhalter ist None, wenn auf den Text kein Platzhalter folgt.
+		self.__chunks = tuple( self.__formatter.parse(text) )
+
+
+	@property
+	def fields(self):
+		"""
+		Die Namen aller Platzhalter in der Reihenfolge ihres ersten Auftretens.
+		"""
+
+		result = {}
+		for chunk in self.__chunks:
+			if chunk[1] is not None:
+				result[chunk[1]] = None
+		return tuple(result)
+
+
+	def render(self, slots, values=None, sectionFormat=None):
+		"""
+		Erzeugt den Text der Vorlage.
+
+		\param slots Ein Dictionary, welches jedem Platzhalter eine Funktion ohne Argumente zuordnet, die den einzufügenden Inhalt zurückgibt.
+
+		\param values Ein Dictionary mit bereits erzeugten Inhalten. Für diese Platzhalter wird die Funktion nicht aufgerufen, alle neu erzeugten Inhalte werden eingetragen. Dadurch muß nach einer Änderung nur der Inhalt der betroffenen Platzhalter neu erzeugt werden.
+
+		\param sectionFormat Wird dieser Text angegeben, wird jeder Inhalt darin eingebettet, wobei {name} durch den Namen des Platzhalters und {content} durch den Inhalt ersetzt wird.
+
+		\exception KeyError Für einen Platzhalter der Vorlage existiert keine Funktion.
+		"""
+
+		if values is None:
+			values = {}
+		parts = []
+		for literal, field, spec, conversion in self.__chunks:
+			parts.append(literal)
+			if field is not None:
+				if field not in values:
+					values[field] = slots[field]()
+				value = values[field]
+				if conversion:
+					value = self.__formatter.convert_field(value, conversion)
+				value = format(value, spec)
+				if sectionFormat is not None:
+					value = sectionFormat.format(name=field, content=value)
+				parts.append(value)
+		return "".join(parts)
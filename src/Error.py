@@ -312,13 +312,18 @@ class ErrTraitType(ErrTrait):
 			self.text = text
 
 
-#class ErrTraitPrerequisite(ErrTrait):
-	#"""
-	#Ungültige Voraussetzung für die Eigenschaft.
-	#"""
+class ErrTraitPrerequisite(ErrTrait):
+	"""
+	@brief Ungültige Voraussetzung für die Eigenschaft.
+	"""
 
-	#def __init__(self, trait):
-		#super().__init__()
+	def __init__(self, text=None, prerequisites=None, critical=False ):
+		super().__init__( text=text, critical=critical )
 
-		#self.message = self.obj.tr( "Prerequisit of a Trait not valid" )
-		#self.description = self.obj.tr( "Some or all prerequisites of the trait \"{}\" is not valid.".format( trait ))
+		if text is None:
+			text = self.obj.tr( "Prerequisites of a character trait are not valid." )
+
+			if prerequisites is not None:
+				text = self.obj.tr( "The prerequisites \"{}\" are not valid.".format( prerequisites ) )
+
+			self.text = text
@@ -42,3 +42,11 @@ debug_level = Config.DEBUG_LEVEL_NONE
 is_develop = False
 is_fallback = False
 is_verbose = False
+## Der Zwischenspeicher der Template-Dateien wird ignoriert und neu geschrieben.
+rebuild_template_cache = False
+## Anzahl der Prozesse, welche die Template-Dateien gleichzeitig einlesen. Bei 0 oder 1 werden die Dateien nacheinander eingelesen.
+template_workers = 0
+## Die Template-Dateien werden mittels iterparse eingelesen, ohne den gesamten Elementbaum aufzubauen.
+template_streaming = False
+## Verfahren, mit welchem die Charakterbögen gezeichnet werden (siehe Config.SHEET_BACKENDS).
+sheet_backend = Config.SHEET_BACKENDS[0]
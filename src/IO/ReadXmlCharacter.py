@@ -106,15 +106,16 @@ class ReadXmlCharacter(QObject, ReadXml):
 			text_description = self.tr( "{} Loading will be continued but errors may occur.".format( str( e ) ) )
 			self.exception_raised.emit( text_description, "warning" )
 
-		## Die Daten müssen zuerst geladen werden, damit schon beim Laden die Unterschiedung zwischen Kindern und Erwachsenen erfolgen kann.
-		self.readDates(xml_content)
-		self.readCharacterInfo(xml_content)
-		self.readCharacterIdentity(xml_content)
-		self.readDerangements(xml_content)
-		self.readTraits(xml_content)
-		self.readItems(xml_content)
-		self.readSpeciesSpecials(xml_content)
-		self.readPicture(xml_content)
+		with self.__character.batch():
+			## Die Daten müssen zuerst geladen werden, damit schon beim Laden die Unterschiedung zwischen Kindern und Erwachsenen erfolgen kann.
+			self.readDates(xml_content)
+			self.readCharacterInfo(xml_content)
+			self.readCharacterIdentity(xml_content)
+			self.readDerangements(xml_content)
+			self.readTraits(xml_content)
+			self.readItems(xml_content)
+			self.readSpeciesSpecials(xml_content)
+			self.readPicture(xml_content)
 
 
 	def readCharacterInfo(self, tree):
@@ -200,37 +201,44 @@ class ReadXmlCharacter(QObject, ReadXml):
 		"""
 		Liest die Eigenschaften des Charakters aus.
 
-		\todo ich marschiere hier durch alle Eigenschaften, um die Eigenschaft des richtigen Namens zu finden, damit ich customText abarbeiten kann. Das geht doch bestimmt auch mit Direktzugriff.
+		Die Eigenschaften werden mittels StorageCharacter.traitsByName() direkt angesprochen. Nur bei Eigenschaften mit Zusatztext (bspw. Language) muß zwischen den wenigen Plätzen gleichen Namens gewählt werden.
 		"""
 
 		traitRootElement = tree.find("Traits")
-		for typeElement in traitRootElement.getiterator("Type"):
-			typName = typeElement.attrib["name"]
-			for categoryElement in typeElement.getiterator("Category"):
-				categoryName = categoryElement.attrib["name"]
-				for traitElement in categoryElement.getiterator("trait"):
-					traitName = traitElement.attrib["name"]
-					traitCustomText = ""
-					if "customText" in traitElement.attrib:
-						traitCustomText = traitElement.attrib["customText"]
-					traitValue = int(traitElement.attrib["value"])
-					## Wenn die Eigenschaft nicht im Charakter-Speicher existiert (also in den Template-Dateien nicht vorkam), wird sie ignoriert.
-					for item in self.__character.traits[typName][categoryName].values():
-						if item.name == traitName:
-							## Wenn eine Eigenschaft mit Zusatztext bereits im Speicher existiert, muß weitergesucht werden, bis eine Eigenschaft gleichen Namens mit identischem oder ohne Zusatztext gefunden wurde.
-							if item.customText and item.customText != traitCustomText:
-								continue
-
-							item.value = traitValue
-							## Zusatztext
-							item.customText = traitCustomText
-
-							## Es gibt nur einen Eintrag für specialties, aber da ich den Iterator verwende, zähle ich halt bis 1.
-							for specialties in traitElement.getiterator("specialties"):
-								if specialties is not None:
-									specialtiesText = specialties.text
-									item.specialties = [n for n in specialtiesText.split(Config.XML_SEPARATION_SYMBOL)]
-							break
+		with self.__character.batch():
+			for typeElement in traitRootElement.getiterator("Type"):
+				typName = typeElement.attrib["name"]
+				for categoryElement in typeElement.getiterator("Category"):
+					categoryName = categoryElement.attrib["name"]
+					for traitElement in categoryElement.getiterator("trait"):
+						traitName = traitElement.attrib["name"]
+						traitCustomText = traitElement.attrib.get("customText", "")
+						## Wenn die Eigenschaft nicht im Charakter-Speicher existiert (also in den Template-Dateien nicht vorkam), wird sie ignoriert.
+						item = self.__traitSlot( self.__character.traitsByName(typName, categoryName, traitName), traitCustomText )
+						if item is None:
+							continue
+
+						item.value = int(traitElement.attrib["value"])
+						## Zusatztext
+						item.customText = traitCustomText
+
+						specialties = traitElement.find("specialties")
+						if specialties is not None and specialties.text is not None:
+							item.specialties = specialties.text.split(Config.XML_SEPARATION_SYMBOL)
+
+
+	@staticmethod
+	def __traitSlot(traits, customText):
+		"""
+		Wählt aus den Eigenschaften gleichen Namens diejenige aus, welche die gespeicherten Werte aufnimmt.
+
+		Wenn eine Eigenschaft mit Zusatztext bereits belegt ist, wird die nächste Eigenschaft gleichen Namens mit identischem oder ohne Zusatztext genommen.
+		"""
+
+		for item in traits:
+			if not item.customText or item.customText == customText:
+				return item
+		return None
 
 
 	def readItems(self, tree):
@@ -369,6 +377,7 @@ class ReadXmlCharacter(QObject, ReadXml):
 			imageData = QByteArray.fromBase64(str(pictureElement.text))
 			image = QPixmap()
 			image.loadFromData(imageData, Config.CHARACTER_PIC_FORMAT)
-			self.__character.picture = image
+			## Der gelesene Text kann beim Speichern und Exportieren weiterverwendet werden, sofern er im richtigen Format vorliegt.
+			self.__character.setPicture(image, str(pictureElement.text))
 
 
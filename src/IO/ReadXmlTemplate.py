@@ -28,8 +28,11 @@ SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
 import ast
+import gzip
 import tempfile
 import zlib
+import concurrent.futures
+import functools
 
 from PyQt4.QtCore import pyqtSignal as Signal
 from PyQt4.QtCore import QObject
@@ -37,8 +40,10 @@ from PyQt4.QtCore import QObject
 import src.Config as Config
 import src.Tools.PathTools as PathTools
 import src.GlobalState as GlobalState
-from src.Error import ErrXmlOldVersion, ErrFileNotOpened
+from src.Error import Err, ErrXmlOldVersion, ErrFileNotOpened
 from src.IO.ReadXml import ReadXml
+from src.IO.TemplateCache import TemplateCache
+from src.Storage.TemplateFragment import TemplateFragment
 import src.Debug as Debug
 
 ## Fallback to normal ElementTree, sollte lxml nicht installiert sein.
@@ -58,6 +63,26 @@ except ImportError:
 
 
 
+## Diese Eigenschaftstypen werden von readTraits() eingelesen und haben für readFileStream() dieselbe Struktur.
+STREAM_TRAIT_TYPES = (
+	"Attribute",
+	"Skill",
+	"Merit",
+	"Flaw",
+	"Power",
+)
+
+## Die Gruppierungen, welche von readGroups() eingelesen werden.
+STREAM_GROUPS = (
+	"Breed",
+	"Faction",
+	"Organisation",
+	"Party",
+)
+
+
+
+
 class ReadXmlTemplate(QObject, ReadXml):
 	"""
 	@brief Liest die Eigenschaften aus den beigefügten xml-Dateien.
@@ -69,15 +94,26 @@ class ReadXmlTemplate(QObject, ReadXml):
 	exception_raised = Signal( str, str )
 
 
-	def __init__(self, template, parent=None):
+	def __init__(self, template, useCache=True, streaming=None, lazy=False, parent=None):
 		"""
 		\warning Aufgrund der multiplen Vererbung wird nicht die super()-Methode beim Aufruf der __init__()-Methoden der Elternkalssen verwendet.
+
+		\param useCache Ist dieser Parameter False, werden die Template-Dateien auf jeden Fall ausgewertet und der Zwischenspeicher weder gelesen noch geschrieben.
+
+		\param streaming Ist dieser Parameter True, werden die Template-Dateien mit readFileStream() anstelle von readFileTree() eingelesen. Wird nichts angegeben, entscheidet GlobalState.template_streaming.
+
+		\param lazy Ist dieser Parameter True, wird zunächst nur die Template-Datei ohne Spezies (base.scd) vollständig eingelesen. Die Dateien der einzelnen Spezies werden erst eingelesen, wenn StorageTemplate zum ersten Mal nach der jeweiligen Spezies gefragt wird (siehe StorageTemplate.loadSpecies()). Der Zwischenspeicher wird dann nicht verwendet.
 		"""
 
 		QObject.__init__(self, parent)
 		ReadXml.__init__(self)
 
 		self.__storage = template
+		self.__useCache = useCache
+		if streaming is None:
+			streaming = GlobalState.template_streaming
+		self.__streaming = streaming
+		self.__lazy = lazy
 
 		## Die Template-Dateien alle für das Laden vorbereiten.
 		self.__templateFiles = []
@@ -85,13 +121,24 @@ class ReadXmlTemplate(QObject, ReadXml):
 		for template_file in os.listdir(path_to_templates):
 			if template_file.endswith(".{}".format(Config.FILE_SUFFIX_COMPRESSED)):
 				self.__templateFiles.append( os.path.join( path_to_templates, template_file ) )
+		## Die Reihenfolge, in welcher die Dateien eingelesen werden, soll nicht vom Dateisystem abhängen.
+		self.__templateFiles.sort()
+
+		self.__cache = TemplateCache(self.__templateFiles)
+
+
+	@property
+	def cache(self):
+		return self.__cache
 
 
 	def read(self):
 		"""
 		Diese Methode startet den Lesevorgang.
 
-		Es wird kontrolliert, ob es sich um eine Zuässige Template-Datei für dieses Programm handelt
+		Ist ein gültiger Zwischenspeicher vorhanden, wird StorageTemplate direkt aus diesem gefüllt, ohne die XML-Dateien auszuwerten. Andernfalls werden alle Template-Dateien eingelesen und das Ergebnis anschließend zwischengespeichert.
+
+		Beim verzögerten Laden (siehe lazy-Parameter des Konstruktors) werden von den Dateien der einzelnen Spezies nur die allgemeinen Angaben zur Spezies und die Erschaffungspunkte eingelesen (siehe readSpeciesHeader()). Der Zwischenspeicher wird in diesem Fall weder gelesen noch geschrieben, da er stets die Daten aller Spezies enthält und das Wiederherstellen aller Daten länger dauert als das Einlesen der wenigen tatsächlich benötigten Dateien.
 
 		\exception ErrXmlTooOldVersion Die XML-Datei hat die falsche Version.
 
@@ -100,40 +147,308 @@ class ReadXmlTemplate(QObject, ReadXml):
 		\exception ErrXmlParsing Beim Parsen der XML-Datei ist ein Fehler aufgetreten.
 		"""
 
-		#dbgStart = Debug.timehook()
-		for item in self.__templateFiles:
-			Debug.debug( "Reading from file \"{}\".".format(item), level=2 )
-			file_content = None
-			with open(item, mode="rb") as fi:
-				file_content = fi.read()
+		dbgStart = Debug.timehook()
+
+		useCache = self.__useCache and not self.__lazy
+
+		cacheKey = None
+		if useCache:
+			cacheKey = self.__cache.key()
+			if not GlobalState.rebuild_template_cache:
+				cacheData = self.__cache.load(cacheKey)
+				if cacheData is not None:
+					self.__storage.importData(cacheData["template"])
+					for text_description in cacheData["warnings"]:
+						self.exception_raised.emit( text_description, "warning" )
+					Debug.timesince(dbgStart, "Template data restored from cache \"{}\".".format(self.__cache.cacheFile))
+					return
+
+		templateFiles = self.__templateFiles
+		if self.__lazy:
+			templateFiles = []
+			for item in self.__templateFiles:
+				species = self.readSpeciesHeader(item)
+				if species:
+					self.__storage.addSpeciesLoader( species, functools.partial( self.readFile, item ) )
+				else:
+					templateFiles.append(item)
+
+		warnings = []
+		if GlobalState.template_workers > 1 and len(templateFiles) > 1:
+			warnings = self.readParallel(GlobalState.template_workers, templateFiles)
+		else:
+			for item in templateFiles:
+				warnings.extend( self.readFile(item) )
+
+		if useCache:
+			self.__cache.save( cacheKey, {
+				"template": self.__storage.exportData(),
+				"warnings": warnings,
+			} )
+		Debug.timesince(dbgStart, "Template data read from XML files.")
+
+
+	def readFile(self, item):
+		"""
+		Liest eine einzelne Template-Datei ein.
+
+		\return Liste der aufgetretenen Warnungen. Diese wurden auch bereits über das Signal exception_raised verschickt.
+		"""
+
+		Debug.debug( "Reading from file \"{}\".".format(item), level=2 )
+
+		if self.__streaming:
+			return self.readFileStream(item)
+		else:
+			return self.readFileTree(item)
+
+
+	def readFileTree(self, item):
+		"""
+		Liest eine einzelne Template-Datei ein, indem zuerst der gesamte Elementbaum aufgebaut und dieser dann ausgewertet wird.
+
+		\return Liste der aufgetretenen Warnungen.
+		"""
+
+		file_content = None
+		with open(item, mode="rb") as fi:
+			file_content = fi.read()
+
+		## Erzeuge eine temporäre Datei, mit der etree umgehen kann und schreibe den Inhalt aus der Qt-Resource in selbige hinein.
+		file_like = tempfile.SpooledTemporaryFile()
+		## Dank dieser Einstellung kann ich zlib verwenden um Dateien zu dekomprimieren, welche mittels des gzip-Moduls komprimiert wurden.
+		decompressed_object = zlib.decompressobj(16 + zlib.MAX_WBITS)
+		file_like.write(decompressed_object.decompress(file_content))
+		file_like.seek(0)
+
+		xml_content = etree.parse(file_like)
+		file_like.close()
+
+		warnings = self.__checkVersion( xml_content.getroot(), item )
+
+		result = self.readSpecies(xml_content)
+		self.readTemplate(xml_content, result[0], result[1])
+
+		return warnings
+
+
+	def readFileStream(self, item):
+		"""
+		Liest eine einzelne Template-Datei mittels iterparse ein.
+
+		Anders als bei readFileTree() wird hier nie der gesamte Elementbaum im Speicher gehalten. Jede Kategorie von Eigenschaften, jeder Gegenstand usw. wird an die passende Methode von StorageTemplate übergeben, sobald das zugehörige Element geschlossen wurde, und anschließend wieder verworfen. Der Speicherbedarf hängt dadurch nur noch von der Größe der einzelnen Kategorien ab, nicht mehr von der Größe der Datei.
+
+		Die Datei wird dabei auch direkt aus dem komprimierten Datenstrom gelesen.
+
+		\return Liste der aufgetretenen Warnungen.
+		"""
+
+		warnings = []
+
+		## Die Namen aller gerade geöffneten Elemente, beginnend mit dem Wurzelelement.
+		path = []
+		## Die gerade geöffneten Elemente selbst.
+		parents = []
+		species = ""
+		playable = True
+		## Informationen aus übergeordneten Elementen, die erst beim Schließen der untergeordneten Elemente benötigt werden.
+		context = {
+			"group": "",
+			"itemsUsed": True,
+			"itemType": "",
+		}
+
+		with gzip.open(item, mode="rb") as file_like:
+			for event, element in etree.iterparse(file_like, events=( "start", "end", )):
+				if event == "start":
+					path.append(element.tag)
+					depth = len(path)
+					if depth == 1:
+						warnings.extend( self.__checkVersion( element, item ) )
+					elif depth == 2 and element.tag == "Template":
+						species, playable = self.__readSpeciesElement(element)
+					elif depth == 3 and element.tag == "Traits":
+						self.readSpeciesData(element, species, playable)
+					elif depth == 4 and path[2] == "Traits" and element.tag == "Power":
+						self.__storage.setPowerName(species, self.getElementAttribute(element, "name"))
+					elif depth == 4 and path[2] == "Traits" and element.tag == "Subpower":
+						self.__storage.setSubPowerName(species, self.getElementAttribute(element, "name"))
+					elif depth == 4 and path[2] == "Group" and element.tag in STREAM_GROUPS:
+						context["group"] = element.attrib["name"]
+						self.__storage.appendTitle( species, element.tag, context["group"] )
+					elif depth == 4 and path[2] == "Items":
+						context["itemsUsed"] = self.__isUsedItemList(element)
+					elif depth == 5 and path[2] == "Items" and element.tag == "Type":
+						context["itemType"] = self.getElementAttribute(element, "name")
+					parents.append(element)
+				else:
+					parents.pop()
+					if self.__readStreamElement( path, element, species, context ):
+						self.__discardElement( element, parents[-1] )
+					path.pop()
+
+		return warnings
+
+
+	def __readStreamElement( self, path, element, species, context ):
+		"""
+		Wertet ein gerade geschlossenes Element für readFileStream() aus.
+
+		\return True, wenn das Element vollständig ausgewertet wurde und verworfen werden kann.
+		"""
+
+		depth = len(path)
+		if depth < 4 or path[1] != "Template":
+			return False
+
+		section = path[2]
+		tag = element.tag
+		if section == "Traits":
+			if depth == 4 and tag in ( "Virtue", "Vice", ):
+				self.readCharacteristics(element)
+			elif depth == 5 and tag == "Category" and path[3] in STREAM_TRAIT_TYPES:
+				self.__readTraitCategory( path[3], element, species )
+			elif depth == 5 and tag == "Category" and path[3] == "Subpower":
+				self.__readSubPowerCategory( path[3], element, species )
+			elif depth == 5 and tag == "powerstat" and path[3] == "Powerstat":
+				self.__readPowerstatElement( element, species )
+			elif depth == 5 and tag == "mild" and path[3] == "Derangement":
+				self.__readDerangement( element, species )
+			else:
+				return False
+		elif section == "Creation" and depth == 4 and tag == "Type":
+			self.__readCreationPointsType( element, species )
+		elif section == "Group" and depth == 5 and tag == "item" and path[3] in STREAM_GROUPS:
+			self.__readGroupItem( element, species, path[3], context["group"] )
+		elif section == "Items":
+			if not context["itemsUsed"]:
+				## Gegenstände aus nicht verwendeten Listen werden ungelesen verworfen.
+				return depth > 4
+			elif depth == 7 and tag == "weapon" and path[3] == "Weapons":
+				self.__readWeapon( context["itemType"], element )
+			elif depth == 5 and tag == "armor" and path[3] == "Armor":
+				self.__readArmorElement( element )
+			elif depth == 5 and tag == "equipment" and path[3] == "Equipment":
+				self.__readEquipmentElement( element )
+			elif depth == 7 and tag == "item" and path[3] == "Automobiles":
+				self.__readAutomobile( context["itemType"], element )
+			elif depth == 6 and tag == "item" and path[3] == "Extraordinary":
+				self.__readExtraordinaryItem( context["itemType"], element )
+			else:
+				return False
+		else:
+			return False
+
+		return True
+
+
+	def __discardElement( self, element, parent ):
+		"""
+		Gibt den Speicher eines bereits ausgewerteten Elements frei.
+		"""
+
+		element.clear()
+		if lxmlLoadad:
+			## lxml erlaubt nur das Löschen bereits vollständig gelesener Geschwister.
+			while element.getprevious() is not None:
+				del parent[0]
+		else:
+			parent.remove(element)
+
+
+	def __checkVersion( self, rootElement, item ):
+		"""
+		Kontrolliert, ob es sich um eine zulässige Template-Datei für dieses Programm handelt.
+
+		\return Liste der aufgetretenen Warnungen.
+		"""
+
+		warnings = []
+
+		version_source = rootElement.attrib["version"]
+		required_source = False
+		if "required" in rootElement.attrib:
+			required_source = rootElement.attrib["required"].lower() == "true"
+		#Debug.debug(versionSource)
+
+		try:
+			self.checkXmlVersion( rootElement.tag, version_source, item, required=required_source )
+		except ErrXmlOldVersion as e:
+			text_description = self.tr( "{} Loading of template will be continued but errors may occur.".format( str( e ) ) )
+			warnings.append(text_description)
+			self.exception_raised.emit( text_description, "warning" )
+
+		return warnings
+
+
+	def readParallel(self, workers, templateFiles):
+		"""
+		Liest alle Template-Dateien gleichzeitig in mehreren Prozessen ein.
+
+		Jeder Prozess wertet eine Datei aus und liefert die Aufrufe zurück, mit denen er StorageTemplate gefüllt hätte (siehe TemplateFragment). Diese werden anschließend in der festen Reihenfolge der Dateien abgespielt, damit das Ergebnis dasselbe ist wie beim Einlesen nacheinander. Das ist vor allem für addTrait() wichtig, welches die Spezialisierungen mehrfach vorkommender Eigenschaften zusammenfaßt.
+
+		\param workers Die Anzahl der Prozesse.
+
+		\param templateFiles Die einzulesenden Dateien in der Reihenfolge, in welcher sie in StorageTemplate übernommen werden.
+
+		\return Liste der aufgetretenen Warnungen.
+		"""
+
+		warnings = []
+		with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+			futures = [ executor.submit( _readFragment, item, self.__streaming, GlobalState.is_fallback, GlobalState.debug_level ) for item in templateFiles ]
+			for item, future in zip(templateFiles, futures):
+				result = future.result()
+				if result is None:
+					## Die Ausnahmen dieses Programms lassen sich nicht zwischen Prozessen austauschen. Die Datei wird deswegen noch einmal in diesem Prozess eingelesen, damit der Fehler hier auftritt.
+					warnings.extend( self.readFile(item) )
+				else:
+					calls, fileWarnings = result
+					TemplateFragment(calls).replay(self.__storage)
+					for text_description in fileWarnings:
+						self.exception_raised.emit( text_description, "warning" )
+					warnings.extend(fileWarnings)
 
-			## Erzeuge eine temporäre Datei, mit der etree umgehen kann und schreibe den Inhalt aus der Qt-Resource in selbige hinein.
-			file_like = tempfile.SpooledTemporaryFile()
-			## Dank dieser Einstellung kann ich zlib verwenden um Dateien zu dekomprimieren, welche mittels des gzip-Moduls komprimiert wurden.
-			decompressed_object = zlib.decompressobj(16 + zlib.MAX_WBITS)
-			file_like.write(decompressed_object.decompress(file_content))
-			file_like.seek(0)
+		return warnings
 
-			xml_content = etree.parse(file_like)
-			file_like.close()
 
-			xml_root_element = xml_content.getroot()
+	def readSpeciesHeader(self, item):
+		"""
+		Liest nur die allgemeinen Angaben zur Spezies einer Template-Datei (siehe readSpeciesData()) und deren Erschaffungspunkte ein, ohne die restliche Datei auszuwerten.
+
+		Damit stehen StorageTemplate.species und StorageTemplate.creationPoints bereits vollständig zur Verfügung, bevor die Spezies geladen wird. Die Angaben stehen in allen Template-Dateien vor den Eigenschaften, das Einlesen wird daher beim Element Traits abgebrochen.
 
-			version_source = xml_root_element.attrib["version"]
-			required_source = False
-			if "required" in xml_root_element.attrib:
-				required_source = xml_root_element.attrib["required"].lower() == "true"
-			#Debug.debug(versionSource)
+		\note Ist die Template-Datei zu alt, wird die Warnung erst beim vollständigen Einlesen der Datei ausgegeben.
 
-			try:
-				self.checkXmlVersion( xml_root_element.tag, version_source, item, required=required_source )
-			except ErrXmlOldVersion as e:
-				text_description = self.tr( "{} Loading of template will be continued but errors may occur.".format( str( e ) ) )
-				self.exception_raised.emit( text_description, "warning" )
+		\return Der Name der Spezies.
+		"""
 
-			result = self.readSpecies(xml_content)
-			self.readTemplate(xml_content, result[0], result[1])
-		#Debug.timesince(dbgStart)
+		species = ""
+		playable = True
+		path = []
+		with gzip.open(item, mode="rb") as file_like:
+			for event, element in etree.iterparse(file_like, events=( "start", "end", )):
+				if event == "start":
+					path.append(element.tag)
+					depth = len(path)
+					if depth == 1:
+						try:
+							self.checkXmlVersion( element.tag, element.attrib["version"], item, required=element.attrib.get("required", "").lower() == "true" )
+						except ErrXmlOldVersion:
+							pass
+					elif depth == 2 and element.tag == "Template":
+						species, playable = self.__readSpeciesElement(element)
+					elif depth == 3 and element.tag == "Traits":
+						self.readSpeciesData(element, species, playable)
+						break
+				else:
+					if len(path) == 4 and path[2] == "Creation" and element.tag == "Type":
+						self.__readCreationPointsType( element, species )
+					elif len(path) == 3:
+						element.clear()
+					path.pop()
+
+		return species
 
 
 	def readSpecies(self, tree):
@@ -143,7 +458,10 @@ class ReadXmlTemplate(QObject, ReadXml):
 		Nicht alle existierenden Spezies sind spielbar, sollen also nicht ausgewählt werden können.
 		"""
 
-		traitsRoot = tree.find("Template")
+		return self.__readSpeciesElement( tree.find("Template") )
+
+
+	def __readSpeciesElement(self, traitsRoot):
 		species = ""
 		if "species" in traitsRoot.attrib:
 			species = traitsRoot.attrib["species"]
@@ -219,12 +537,20 @@ class ReadXmlTemplate(QObject, ReadXml):
 			if root.tag == "Power":
 				self.__storage.setPowerName(species, self.getElementAttribute(root, "name"))
 			for category in root.getiterator("Category"):
-				categoryName = category.attrib["name"]
-				traits = self.__readTraitData(category, species)
-				for trait in traits:
-					traitId = trait["id"]
-					del trait["id"]
-					self.__storage.addTrait( root.tag, categoryName, traitId, trait )
+				self.__readTraitCategory( root.tag, category, species )
+
+
+	def __readTraitCategory( self, typ, category, species ):
+		"""
+		Liest alle Eigenschaften einer Kategorie.
+		"""
+
+		categoryName = category.attrib["name"]
+		traits = self.__readTraitData(category, species)
+		for trait in traits:
+			traitId = trait["id"]
+			del trait["id"]
+			self.__storage.addTrait( typ, categoryName, traitId, trait )
 
 
 	def readSubPowers( self, root, species ):
@@ -239,67 +565,75 @@ class ReadXmlTemplate(QObject, ReadXml):
 			#Debug.debug(list(root))
 			for categoryElement in list(root):
 				if categoryElement.tag == "Category":
-					categoryName = categoryElement.attrib["name"]
-					## In diese Liste werden alle Unterkräfte geschrieben und erst wenn die gesamte Kategorie ausgelesen ist, werden selbige in den Speicher geschrieben.
-					subPowerList = []
-					cheap = []
-					only = []
-					for element in list(categoryElement):
-						if element.tag == "trait":
-							listOfPowers = {}
-							listOfPrerequisites = []
-							listOfOnlys = []
-							for subelement in list(element):
-								if subelement.tag == "power":
-									listOfPowers.setdefault(subelement.text, int(subelement.attrib["value"]))
-								elif subelement.tag == "prerequisites":
-									listOfPrerequisites.append("({})".format(subelement.text))
-								elif subelement.tag == "only":
-									listOfOnlys.append("{}".format(subelement.text))
-							powerPrerequisites = " and ".join(["Power.{} > {}".format(powerName, powerValue - 1) for powerName, powerValue in listOfPowers.items()])
-							if powerPrerequisites:
-								powerPrerequisites = "({})".format(powerPrerequisites)
-								listOfPrerequisites.append(powerPrerequisites)
-							subPowerData = {
-								"name": element.attrib["name"],
-								"level": self.getElementAttribute(element, "level"),
-								"species": species,
-								"costFuel": self.getElementAttribute(element, "costFuel"),
-								"costWill": self.getElementAttribute(element, "costWill"),
-								"roll": self.getElementAttribute(element, "roll"),
-								"powers": listOfPowers,
-								"prerequisites": " and ".join(listOfPrerequisites),
-								"cheap": [],
-								"only": listOfOnlys,
-							}
-							itemsToInt = (
-								"level",
-							)
-							for item in itemsToInt:
-								if subPowerData[item]:
-									subPowerData[item] = int(subPowerData[item])
-								else:
-									subPowerData[item] = 0
-							#Debug.debug(subPowerData["name"], subPowerData["prerequisites"])
-							identifier = self.getElementAttribute(element, "id")
-							if not identifier:
-								identifier = subPowerData["name"]
-							subPowerList.append([
-								categoryName,
-								identifier,
-								subPowerData,
-							])
-						elif element.tag == "cheap":
-							cheap.append(element.text)
-						elif element.tag == "only":
-							only.append(element.text)
-					#Debug.debug(subPowerList)
-					for item in subPowerList:
-						if cheap:
-							item[2]["cheap"] = cheap
-						if only:
-							item[2]["only"] = only
-						self.__storage.addTrait( root.tag, item[0], item[1], item[2] )
+					self.__readSubPowerCategory( root.tag, categoryElement, species )
+
+
+	def __readSubPowerCategory( self, typ, categoryElement, species ):
+		"""
+		Liest alle Unterkräfte einer Kategorie.
+		"""
+
+		categoryName = categoryElement.attrib["name"]
+		## In diese Liste werden alle Unterkräfte geschrieben und erst wenn die gesamte Kategorie ausgelesen ist, werden selbige in den Speicher geschrieben.
+		subPowerList = []
+		cheap = []
+		only = []
+		for element in list(categoryElement):
+			if element.tag == "trait":
+				listOfPowers = {}
+				listOfPrerequisites = []
+				listOfOnlys = []
+				for subelement in list(element):
+					if subelement.tag == "power":
+						listOfPowers.setdefault(subelement.text, int(subelement.attrib["value"]))
+					elif subelement.tag == "prerequisites":
+						listOfPrerequisites.append("({})".format(subelement.text))
+					elif subelement.tag == "only":
+						listOfOnlys.append("{}".format(subelement.text))
+				powerPrerequisites = " and ".join(["Power.{} > {}".format(powerName, powerValue - 1) for powerName, powerValue in listOfPowers.items()])
+				if powerPrerequisites:
+					powerPrerequisites = "({})".format(powerPrerequisites)
+					listOfPrerequisites.append(powerPrerequisites)
+				subPowerData = {
+					"name": element.attrib["name"],
+					"level": self.getElementAttribute(element, "level"),
+					"species": species,
+					"costFuel": self.getElementAttribute(element, "costFuel"),
+					"costWill": self.getElementAttribute(element, "costWill"),
+					"roll": self.getElementAttribute(element, "roll"),
+					"powers": listOfPowers,
+					"prerequisites": " and ".join(listOfPrerequisites),
+					"cheap": [],
+					"only": listOfOnlys,
+				}
+				itemsToInt = (
+					"level",
+				)
+				for item in itemsToInt:
+					if subPowerData[item]:
+						subPowerData[item] = int(subPowerData[item])
+					else:
+						subPowerData[item] = 0
+				#Debug.debug(subPowerData["name"], subPowerData["prerequisites"])
+				identifier = self.getElementAttribute(element, "id")
+				if not identifier:
+					identifier = subPowerData["name"]
+				subPowerList.append([
+					categoryName,
+					identifier,
+					subPowerData,
+				])
+			elif element.tag == "cheap":
+				cheap.append(element.text)
+			elif element.tag == "only":
+				only.append(element.text)
+		#Debug.debug(subPowerList)
+		for item in subPowerList:
+			if cheap:
+				item[2]["cheap"] = cheap
+			if only:
+				item[2]["only"] = only
+			self.__storage.addTrait( typ, item[0], item[1], item[2] )
 
 
 	def readCreationPoints( self, root, species ):
@@ -311,12 +645,16 @@ class ReadXmlTemplate(QObject, ReadXml):
 
 		if root is not None:
 			for typElement in root.getiterator("Type"):
-				typ = typElement.attrib["name"]
-				resultList = []
-				for pointsElement in typElement.getiterator("points"):
-					points = int(pointsElement.attrib["value"])
-					resultList.append(points)
-				self.__storage.appendCreationPoints( species, typ, resultList )
+				self.__readCreationPointsType( typElement, species )
+
+
+	def __readCreationPointsType( self, typElement, species ):
+		typ = typElement.attrib["name"]
+		resultList = []
+		for pointsElement in typElement.getiterator("points"):
+			points = int(pointsElement.attrib["value"])
+			resultList.append(points)
+		self.__storage.appendCreationPoints( species, typ, resultList )
 
 
 	def readGroups( self, root, species ):
@@ -330,31 +668,39 @@ class ReadXmlTemplate(QObject, ReadXml):
 			self.__storage.appendTitle( species, groupCategory, groupCategoryName )
 			for element in list(root):
 				if element.tag == "item":
-					#Debug.debug(element.tag, element.attrib["name"])
-					groupName = element.attrib["name"]
-					infos = {}
-					for subElement in list(element):
-						if subElement.tag == "kith":
-							abilityList = []
-							for subsubElement in list(subElement):
-								if subsubElement.tag == "ability":
-									abilityList.append(subsubElement.text)
-							self.__storage.addKith(groupName, subElement.attrib["name"], " ".join(abilityList))
-						elif subElement.tag == "weakness":
-							infos["weakness"] = subElement.text
-						elif subElement.tag == "blessing":
-							infos["blessing"] = subElement.text
-						elif subElement.tag == "bonus":
-							for subsubElement in list(subElement):
-								for subsubsubElement in list(subsubElement):
-									if subsubsubElement.tag == "item":
-										bonusTraits = {
-											"type": subsubElement.tag,
-											"name": subsubsubElement.attrib["name"]
-										}
-										if bonusTraits:
-											self.__storage.appendBonusTrait( species, groupName, bonusTraits )
-					self.__storage.appendTitle( species, groupCategory, groupCategoryName, element.attrib["name"], infos )
+					self.__readGroupItem( element, species, groupCategory, groupCategoryName )
+
+
+	def __readGroupItem( self, element, species, groupCategory, groupCategoryName ):
+		"""
+		Liest eine einzelne Gruppierung (beispielsweise einen Clan) samt ihrer Bonuseigenschaften ein.
+		"""
+
+		#Debug.debug(element.tag, element.attrib["name"])
+		groupName = element.attrib["name"]
+		infos = {}
+		for subElement in list(element):
+			if subElement.tag == "kith":
+				abilityList = []
+				for subsubElement in list(subElement):
+					if subsubElement.tag == "ability":
+						abilityList.append(subsubElement.text)
+				self.__storage.addKith(groupName, subElement.attrib["name"], " ".join(abilityList))
+			elif subElement.tag == "weakness":
+				infos["weakness"] = subElement.text
+			elif subElement.tag == "blessing":
+				infos["blessing"] = subElement.text
+			elif subElement.tag == "bonus":
+				for subsubElement in list(subElement):
+					for subsubsubElement in list(subsubElement):
+						if subsubsubElement.tag == "item":
+							bonusTraits = {
+								"type": subsubElement.tag,
+								"name": subsubsubElement.attrib["name"]
+							}
+							if bonusTraits:
+								self.__storage.appendBonusTrait( species, groupName, bonusTraits )
+		self.__storage.appendTitle( species, groupCategory, groupCategoryName, element.attrib["name"], infos )
 
 
 	def readPowerstat( self, root, species ):
@@ -367,13 +713,17 @@ class ReadXmlTemplate(QObject, ReadXml):
 		if root is not None:
 			#Debug.debug(root.tag)
 			for element in root.getiterator("powerstat"):
-				powerstatData = {
-					"fuelMax": int(element.attrib["fuelMax"]),
-					"fuelPerTurn": int(element.attrib["fuelPerTurn"]),
-					"traitMax": int(element.attrib["traitMax"]),
-				}
-				powerstatValue = int(element.text)
-				self.__storage.appendPowerstat( species, powerstatValue, powerstatData )
+				self.__readPowerstatElement( element, species )
+
+
+	def __readPowerstatElement( self, element, species ):
+		powerstatData = {
+			"fuelMax": int(element.attrib["fuelMax"]),
+			"fuelPerTurn": int(element.attrib["fuelPerTurn"]),
+			"traitMax": int(element.attrib["traitMax"]),
+		}
+		powerstatValue = int(element.text)
+		self.__storage.appendPowerstat( species, powerstatValue, powerstatData )
 
 
 	def readDerangements( self, root, species ):
@@ -386,19 +736,35 @@ class ReadXmlTemplate(QObject, ReadXml):
 		if root is not None:
 			#Debug.debug(root.tag, level=4)
 			for mildElement in root.getiterator("mild"):
-				mild = mildElement.attrib["name"]
-				descriptionMild = ""
-				for descriptionElement in mildElement.getiterator("description"):
-					descriptionMild = descriptionElement.text
-				severeVersions = []
-				for severeElement in mildElement.getiterator("severe"):
-					severe = severeElement.attrib["name"]
-					descriptionSevere = ""
-					for descriptionElement in severeElement.getiterator("description"):
-						descriptionSevere = descriptionElement.text
-					self.__storage.appendDerangement(species=species, name=severe, dependancy=[], description=descriptionSevere, isSevere=True)
-					severeVersions.append(severe)
-				self.__storage.appendDerangement(species=species, name=mild, dependancy=severeVersions, description=descriptionMild, isSevere=False)
+				self.__readDerangement( mildElement, species )
+
+
+	def __readDerangement( self, mildElement, species ):
+		"""
+		Liest eine milde Geistesstörung samt der daraus erwachsenden schweren Geistesstörungen.
+		"""
+
+		mild = mildElement.attrib["name"]
+		descriptionMild = ""
+		for descriptionElement in mildElement.getiterator("description"):
+			descriptionMild = descriptionElement.text
+		severeVersions = []
+		for severeElement in mildElement.getiterator("severe"):
+			severe = severeElement.attrib["name"]
+			descriptionSevere = ""
+			for descriptionElement in severeElement.getiterator("description"):
+				descriptionSevere = descriptionElement.text
+			self.__storage.appendDerangement(species=species, name=severe, dependancy=[], description=descriptionSevere, isSevere=True)
+			severeVersions.append(severe)
+		self.__storage.appendDerangement(species=species, name=mild, dependancy=severeVersions, description=descriptionMild, isSevere=False)
+
+
+	def __isUsedItemList(self, element):
+		"""
+		Gegenstandslisten, welche als fallback gekennzeichnet sind, werden nur im fallback-Modus eingelesen.
+		"""
+
+		return GlobalState.is_fallback or not self.getElementAttribute(element, "fallback") == "True"
 
 
 	def readWeapons(self, root):
@@ -409,7 +775,7 @@ class ReadXmlTemplate(QObject, ReadXml):
 		"""
 
 		for weapons in root:
-			if GlobalState.is_fallback or not self.getElementAttribute(weapons, "fallback") == "True":
+			if self.__isUsedItemList(weapons):
 				for typElement in list(weapons):
 					if typElement.tag == "Type":
 						typeName = self.getElementAttribute(typElement, "name")
@@ -417,17 +783,21 @@ class ReadXmlTemplate(QObject, ReadXml):
 							if categoryElement.tag == "Category":
 								for weaponElement in list(categoryElement):
 									if weaponElement.tag == "weapon":
-										#Debug.debug(weaponElement.attrib["name"])
-										weaponName = weaponElement.attrib["name"]
-										weaponData = {
-											"damage": self.getElementAttribute(weaponElement, "damage"),
-											"ranges": self.getElementAttribute(weaponElement, "ranges"),
-											"capacity": self.getElementAttribute(weaponElement, "capacity"),
-											"strength": self.getElementAttribute(weaponElement, "strength"),
-											"size": self.getElementAttribute(weaponElement, "size"),
-											"durability": self.getElementAttribute(weaponElement, "durability"),
-										}
-										self.__storage.addWeapon( typeName, weaponName, weaponData )
+										self.__readWeapon( typeName, weaponElement )
+
+
+	def __readWeapon( self, typeName, weaponElement ):
+		#Debug.debug(weaponElement.attrib["name"])
+		weaponName = weaponElement.attrib["name"]
+		weaponData = {
+			"damage": self.getElementAttribute(weaponElement, "damage"),
+			"ranges": self.getElementAttribute(weaponElement, "ranges"),
+			"capacity": self.getElementAttribute(weaponElement, "capacity"),
+			"strength": self.getElementAttribute(weaponElement, "strength"),
+			"size": self.getElementAttribute(weaponElement, "size"),
+			"durability": self.getElementAttribute(weaponElement, "durability"),
+		}
+		self.__storage.addWeapon( typeName, weaponName, weaponData )
 
 
 	def readArmor(self, root):
@@ -436,17 +806,21 @@ class ReadXmlTemplate(QObject, ReadXml):
 		"""
 
 		for armors in root:
-			if GlobalState.is_fallback or not self.getElementAttribute(armors, "fallback") == "True":
+			if self.__isUsedItemList(armors):
 				for armorElement in list(armors):
 					if armorElement.tag == "armor":
-						armorName = armorElement.attrib["name"]
-						armorData = {
-							"general": int(self.getElementAttribute(armorElement, "general")),
-							"firearms": int(self.getElementAttribute(armorElement, "firearms")),
-							"defense": int(self.getElementAttribute(armorElement, "defense")),
-							"speed": int(self.getElementAttribute(armorElement, "speed")),
-						}
-						self.__storage.addArmor( armorName, armorData )
+						self.__readArmorElement( armorElement )
+
+
+	def __readArmorElement( self, armorElement ):
+		armorName = armorElement.attrib["name"]
+		armorData = {
+			"general": int(self.getElementAttribute(armorElement, "general")),
+			"firearms": int(self.getElementAttribute(armorElement, "firearms")),
+			"defense": int(self.getElementAttribute(armorElement, "defense")),
+			"speed": int(self.getElementAttribute(armorElement, "speed")),
+		}
+		self.__storage.addArmor( armorName, armorData )
 
 
 	def readEquipment(self, root):
@@ -455,16 +829,20 @@ class ReadXmlTemplate(QObject, ReadXml):
 		"""
 
 		for equipment in root:
-			if GlobalState.is_fallback or not self.getElementAttribute(equipment, "fallback") == "True":
+			if self.__isUsedItemList(equipment):
 				for equipmentElement in list(equipment):
 					if equipmentElement.tag == "equipment":
-						equipmentName = equipmentElement.attrib["name"]
-						equipmentData = {
-							"durability": int(self.getElementAttribute(equipmentElement, "durability")),
-							"size": int(self.getElementAttribute(equipmentElement, "size")),
-							"cost": int(self.getElementAttribute(equipmentElement, "cost")),
-						}
-						self.__storage.addEquipment( equipmentName, equipmentData )
+						self.__readEquipmentElement( equipmentElement )
+
+
+	def __readEquipmentElement( self, equipmentElement ):
+		equipmentName = equipmentElement.attrib["name"]
+		equipmentData = {
+			"durability": int(self.getElementAttribute(equipmentElement, "durability")),
+			"size": int(self.getElementAttribute(equipmentElement, "size")),
+			"cost": int(self.getElementAttribute(equipmentElement, "cost")),
+		}
+		self.__storage.addEquipment( equipmentName, equipmentData )
 
 
 	def readAutomobiles(self, root):
@@ -475,7 +853,7 @@ class ReadXmlTemplate(QObject, ReadXml):
 		"""
 
 		for automobiles in root:
-			if GlobalState.is_fallback or not self.getElementAttribute(automobiles, "fallback") == "True":
+			if self.__isUsedItemList(automobiles):
 				for element in list(automobiles):
 					if element.tag == "Type":
 						itemTyp = element.attrib["name"]
@@ -483,18 +861,22 @@ class ReadXmlTemplate(QObject, ReadXml):
 							if subElement.tag == "Category":
 								for subsubElement in list(subElement):
 									if subsubElement.tag == "item":
-										itemName = subsubElement.attrib["name"]
-										itemData = {
-											"durability": int(self.getElementAttribute(subsubElement, "durability")),
-											"size": int(self.getElementAttribute(subsubElement, "size")),
-											"acceleration": int(self.getElementAttribute(subsubElement, "acceleration")),
-											"safeSpeed": int(self.getElementAttribute(subsubElement, "safeSpeed")),
-											"maxSpeed": int(self.getElementAttribute(subsubElement, "maxSpeed")),
-											"maxHandling": int(self.getElementAttribute(subsubElement, "maxHandling")),
-											"occupants": self.getElementAttribute(subsubElement, "occupants"),
-											"cost": float(self.getElementAttribute(subsubElement, "cost")),
-										}
-										self.__storage.addAutomobile( itemTyp, itemName, itemData )
+										self.__readAutomobile( itemTyp, subsubElement )
+
+
+	def __readAutomobile( self, itemTyp, element ):
+		itemName = element.attrib["name"]
+		itemData = {
+			"durability": int(self.getElementAttribute(element, "durability")),
+			"size": int(self.getElementAttribute(element, "size")),
+			"acceleration": int(self.getElementAttribute(element, "acceleration")),
+			"safeSpeed": int(self.getElementAttribute(element, "safeSpeed")),
+			"maxSpeed": int(self.getElementAttribute(element, "maxSpeed")),
+			"maxHandling": int(self.getElementAttribute(element, "maxHandling")),
+			"occupants": self.getElementAttribute(element, "occupants"),
+			"cost": float(self.getElementAttribute(element, "cost")),
+		}
+		self.__storage.addAutomobile( itemTyp, itemName, itemData )
 
 
 	def readExtraordinaryItems(self, root):
@@ -503,19 +885,23 @@ class ReadXmlTemplate(QObject, ReadXml):
 		"""
 
 		for extraordinary in root:
-			if GlobalState.is_fallback or not self.getElementAttribute(extraordinary, "fallback") == "True":
+			if self.__isUsedItemList(extraordinary):
 				for element in list(extraordinary):
 					if element.tag == "Type":
 						itemTyp = element.attrib["name"]
 						for subElement in list(element):
 							if subElement.tag == "item":
-								itemName = subElement.attrib["name"]
-								itemData = {
-									#"durability": int(self.getElementAttribute(equipmentElement, "durability")),
-									#"size": int(self.getElementAttribute(equipmentElement, "size")),
-									"cost": float(self.getElementAttribute(subElement, "cost")),
-								}
-								self.__storage.addExtraordinaryItem( itemTyp, itemName, itemData )
+								self.__readExtraordinaryItem( itemTyp, subElement )
+
+
+	def __readExtraordinaryItem( self, itemTyp, element ):
+		itemName = element.attrib["name"]
+		itemData = {
+			#"durability": int(self.getElementAttribute(equipmentElement, "durability")),
+			#"size": int(self.getElementAttribute(equipmentElement, "size")),
+			"cost": float(self.getElementAttribute(element, "cost")),
+		}
+		self.__storage.addExtraordinaryItem( itemTyp, itemName, itemData )
 
 
 	def __readTraitData(self, root, species=None, typ=None, category=None):
@@ -572,3 +958,25 @@ class ReadXmlTemplate(QObject, ReadXml):
 				listOfTraits.append(traitData)
 
 		return listOfTraits
+
+
+
+
+def _readFragment( fileName, streaming, isFallback, debugLevel ):
+	"""
+	Liest eine Template-Datei in einem eigenen Prozess ein.
+
+	\return Die aufgezeichneten Aufrufe zusammen mit den aufgetretenen Warnungen oder None, falls beim Einlesen ein Fehler aufgetreten ist.
+	"""
+
+	GlobalState.is_fallback = isFallback
+	GlobalState.debug_level = debugLevel
+
+	fragment = TemplateFragment()
+	reader = ReadXmlTemplate(fragment, useCache=False, streaming=streaming)
+	try:
+		warnings = reader.readFile(fileName)
+	except Err:
+		return None
+
+	return fragment.calls, warnings
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+import os
+import hashlib
+import pickle
+
+import src.Config as Config
+import src.GlobalState as GlobalState
+import src.Tools.PathTools as PathTools
+import src.Debug as Debug
+
+
+
+
+## Wird das Format der zwischengespeicherten Daten verändert, muß diese Zahl erhöht werden, damit alte Zwischenspeicher verworfen werden.
+CACHE_FORMAT = 1
+
+
+
+
+class TemplateCache(object):
+	"""
+	@brief Zwischenspeicher für die bereits ausgewerteten Template-Dateien.
+
+	Nach dem ersten Einlesen der Template-Dateien werden die Daten aus StorageTemplate in eine einzige Datei geschrieben. Bei späteren Programmstarts kann StorageTemplate direkt aus dieser Datei gefüllt werden, ohne die XML-Dateien erneut auswerten zu müssen.
+
+	Der Zwischenspeicher ist nur gültig, solange sich weder die Template-Dateien (Änderungszeit, Größe und Prüfsumme) noch die Programmversion geändert haben.
+
+	Die Datei besteht aus zwei aufeinanderfolgenden pickle-Objekten: dem Schlüssel und den eigentlichen Daten. Dadurch muß bei einem veralteten Zwischenspeicher nur der Schlüssel gelesen werden.
+	"""
+
+
+	def __init__(self, templateFiles, cacheFile=None):
+		self.__templateFiles = templateFiles
+
+		if cacheFile is None:
+			cacheFile = os.path.join( PathTools.program_path(), Config.CACHE_DIR, Config.TEMPLATE_CACHE_FILE )
+		self.__cacheFile = cacheFile
+
+
+	@property
+	def cacheFile(self):
+		return self.__cacheFile
+
+
+	def key(self):
+		"""
+		Erzeugt den Schlüssel, mit welchem die Gültigkeit des Zwischenspeichers überprüft wird.
+		"""
+
+		files = []
+		for item in self.__templateFiles:
+			file_status = os.stat(item)
+			with open(item, mode="rb") as fi:
+				checksum = hashlib.sha1( fi.read() ).hexdigest()
+			files.append( ( os.path.basename(item), file_status.st_mtime, file_status.st_size, checksum, ) )
+
+		return {
+			"format": CACHE_FORMAT,
+			"version": Config.version(change=True),
+			"fallback": bool(GlobalState.is_fallback),
+			"files": files,
+		}
+
+
+	def load(self, key):
+		"""
+		Gibt die zwischengespeicherten Daten zurück.
+
+		\note Existiert kein Zwischenspeicher oder paßt der gespeicherte Schlüssel nicht zu key, wird None zurückgegeben.
+		"""
+
+		if not os.path.exists(self.__cacheFile):
+			return None
+
+		try:
+			with open(self.__cacheFile, mode="rb") as fi:
+				if pickle.load(fi) != key:
+					Debug.debug( "Template cache \"{}\" is outdated.".format(self.__cacheFile), level=2 )
+					return None
+				return pickle.load(fi)
+		except ( EnvironmentError, EOFError, ValueError, pickle.PickleError ) as e:
+			Debug.debug( "Template cache \"{}\" is not readable: {}".format(self.__cacheFile, e), level=2 )
+			return None
+
+
+	def save(self, key, data):
+		"""
+		Schreibt die Daten zusammen mit ihrem Schlüssel in den Zwischenspeicher.
+
+		Die Datei wird zuerst unter einem temporären Namen geschrieben und erst anschließend umbenannt, damit ein gleichzeitig startendes Programm niemals eine halb geschriebene Datei vorfindet.
+
+		\note Kann der Zwischenspeicher nicht geschrieben werden (beispielsweise bei einer schreibgeschützten Installation), wird dies stillschweigend hingenommen.
+		"""
+
+		temporaryFile = "{}.{}".format(self.__cacheFile, os.getpid())
+		try:
+			cacheDir = os.path.dirname(self.__cacheFile)
+			if not os.path.isdir(cacheDir):
+				os.makedirs(cacheDir)
+			with open(temporaryFile, mode="wb") as fo:
+				pickle.dump(key, fo, pickle.HIGHEST_PROTOCOL)
+				pickle.dump(data, fo, pickle.HIGHEST_PROTOCOL)
+			os.replace(temporaryFile, self.__cacheFile)
+		except EnvironmentError as e:
+			Debug.debug( "Template cache \"{}\" could not be written: {}".format(self.__cacheFile, e), level=2 )
+			if os.path.exists(temporaryFile):
+				os.remove(temporaryFile)
+
+
+	def invalidate(self):
+		"""
+		Löscht den Zwischenspeicher, damit die Template-Dateien beim nächsten Mal wieder vollständig eingelesen werden.
+		"""
+
+		if os.path.exists(self.__cacheFile):
+			os.remove(self.__cacheFile)
@@ -26,9 +26,10 @@ SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
 
 
 
-from PyQt4.QtCore import QObject, QIODevice, QByteArray, QBuffer
+from PyQt4.QtCore import QObject
 
 import gzip
+import hashlib
 
 import src.Config as Config
 #from src.Error import ErrTraitType, ErrTraitCategory
@@ -73,6 +74,16 @@ class WriteXmlCharacter(QObject):
 		self.writeFile(tree, fileName)
 
 
+	def checksum(self):
+		"""
+		Gibt eine Prüfsumme über den Inhalt des Charakters zurück, wie er gespeichert würde.
+
+		Zwei Charaktere mit derselben Prüfsumme ergeben denselben Charakterbogen.
+		"""
+
+		return hashlib.sha1( etree.tostring(self.buildXmlTree()) ).hexdigest()
+
+
 	def buildXmlTree(self):
 		"""
 		Erzeugt den Element-Baum, der später in eine XML-Datei geschrieben werden kann.
@@ -232,12 +243,8 @@ class WriteXmlCharacter(QObject):
 		
 
 		if self.__character.picture:
-			imageData = QByteArray()
-			imageBuffer = QBuffer(imageData)
-			imageBuffer.open(QIODevice.WriteOnly)
-			self.__character.picture.save(imageBuffer, Config.CHARACTER_PIC_FORMAT)	# Schreibt das Bild in ein QByteArray im angegebenen Bildformat.
-			imageData = imageData.toBase64().data()
-			etree.SubElement(root, "picture").text = imageData.decode("UTF-8")
+			## Das Bild wird nur kodiert, wenn es sich seit dem letzten Speichern oder Exportieren geändert hat.
+			etree.SubElement(root, "picture").text = self.__character.pictureData
 
 		return root
 
@@ -29,8 +29,8 @@ SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
 #import sys
 import os
 
-from PyQt4.QtCore import QCoreApplication, QSize, QPoint, QByteArray, QDir, QTimer
-from PyQt4.QtGui import QMainWindow, QIcon, QMessageBox, QFileDialog, QDialog, QPrinter, QFontDatabase, QColor, QPrintDialog
+from PyQt4.QtCore import Qt, QCoreApplication, QSize, QPoint, QByteArray, QDir, QTimer
+from PyQt4.QtGui import QMainWindow, QIcon, QMessageBox, QFileDialog, QDialog, QPrinter, QFontDatabase, QColor, QPrintDialog, QDockWidget, QAction, QKeySequence
 from PyQt4 import QtSvg	# Damit auch unter Windows SVG-Dateien dargestellt werden.
 
 import src.Tools.PathTools as PathTools
@@ -58,10 +58,12 @@ from .Widgets.MoralityWidget import MoralityWidget
 from .Widgets.AdvantagesWidget import AdvantagesWidget
 from .Widgets.ItemWidget import ItemWidget
 from .Widgets.SpecialsWidget import SpecialsWidget
+from .Widgets.SheetPreviewWidget import SheetPreviewWidget
 from .Widgets.Dialogs.SettingsDialog import SettingsDialog
 from .Widgets.Dialogs.MessageBox import MessageBox
 #from .Draw.DrawSheet import DrawSheet
 from .Draw.RenderSheet import RenderSheet
+from .Draw.RenderCache import RenderCache
 import src.Config as Config
 import src.GlobalState as GlobalState
 import src.Debug as Debug
@@ -146,6 +148,8 @@ class MainWindow(QMainWindow):
 		## Später sollte ich mich für einen entscheiden!!
 		self.__readCharacter = ReadXmlCharacter(self.__character)
 		self.__writeCharacter = WriteXmlCharacter(self.__character)
+		## Zuletzt erzeugte Charakterbögen, damit ein unveränderter Charakter sofort erneut exportiert werden kann.
+		self.__renderCache = RenderCache()
 
 		self.ui.pushButton_next.clicked.connect(self.ui.selectWidget_select.selectNext)
 		self.ui.pushButton_previous.clicked.connect(self.ui.selectWidget_select.selectPrevious)
@@ -181,6 +185,20 @@ class MainWindow(QMainWindow):
 		self.ui.actionPrint.triggered.connect(self.printCharacter)
 		self.ui.actionAbout.triggered.connect(self.aboutApp)
 
+		## Änderungen am Charakter rückgängig machen und wiederherstellen.
+		actionUndo = QAction( self.tr( "&Undo" ), self )
+		actionUndo.setShortcut( QKeySequence.Undo )
+		actionUndo.setEnabled( False )
+		actionUndo.triggered.connect(self.__character.undo)
+		self.__character.history.canUndoChanged.connect(actionUndo.setEnabled)
+		actionRedo = QAction( self.tr( "&Redo" ), self )
+		actionRedo.setShortcut( QKeySequence.Redo )
+		actionRedo.setEnabled( False )
+		actionRedo.triggered.connect(self.__character.redo)
+		self.__character.history.canRedoChanged.connect(actionRedo.setEnabled)
+		self.ui.menuFile.insertActions( self.ui.actionExport, [ actionUndo, actionRedo, ] )
+		self.ui.menuFile.insertSeparator( self.ui.actionExport )
+
 		self.reset()
 		Debug.timesince( debug_timing_between_start, "Time neccessary to set all initial values." )
 
@@ -228,7 +246,8 @@ class MainWindow(QMainWindow):
 		In dieser Funktion werden die Template-Daten aus den XML-Dateien ausgelesen und gespeichert, um damit zu einem späteren Zeitpunkt die GUI füllen zu können.
 		"""
 
-		reader = ReadXmlTemplate(self.__storage)
+		## Die Template-Daten der einzelnen Spezies werden erst eingelesen, wenn sie benötigt werden.
+		reader = ReadXmlTemplate(self.__storage, lazy=True)
 
 		reader.exception_raised.connect(self.showExceptionMessage)
 
@@ -286,12 +305,12 @@ class MainWindow(QMainWindow):
 		self.template = TemplateWidget(self.__storage, self.__character, self)
 		self.ui.layout_template.addWidget( self.template )
 
-		if "Power" in self.__storage.traits.keys():
-			powers = PowerWidget( self.__storage, self.__character, self )
-			self.ui.layout_powers.addWidget( powers )
+		## Die Kräfte kommen erst mit dem Laden der ersten übernatürlichen Spezies hinzu.
+		powers = PowerWidget( self.__storage, self.__character, self )
+		self.ui.layout_powers.addWidget( powers )
 
-			subPowers = SubPowerWidget( self.__storage, self.__character, self )
-			self.ui.layout_subPowers.addWidget( subPowers )
+		subPowers = SubPowerWidget( self.__storage, self.__character, self )
+		self.ui.layout_subPowers.addWidget( subPowers )
 
 		flaws = FlawWidget( self.__storage, self.__character, self )
 		self.ui.layout_flaws.addWidget( flaws )
@@ -305,6 +324,16 @@ class MainWindow(QMainWindow):
 		speciesSpecials = SpecialsWidget(self.__storage, self.__character, self)
 		self.ui.layout_specials.addWidget( speciesSpecials )
 
+		## Die Vorschau des Charakterbogens wird erst auf Wunsch angezeigt, außer sie war beim letzten Beenden des Programms sichtbar.
+		preview = SheetPreviewWidget( self.__storage, self.__character, self )
+		dockPreview = QDockWidget( self.tr( "Sheet Preview" ), self )
+		dockPreview.setObjectName( "dockWidget_preview" )
+		dockPreview.setWidget( preview )
+		self.addDockWidget( Qt.RightDockWidgetArea, dockPreview )
+		if not self.restoreDockWidget( dockPreview ):
+			dockPreview.hide()
+		self.ui.menuFile.insertAction( self.ui.actionExport, dockPreview.toggleViewAction() )
+
 		## Wenn sich der Name im InfoWidget ändert, soll sich auch die Titelzeile des Programms ändern
 		self.info.nameChanged.connect(self.setTitle)
 
@@ -332,8 +361,9 @@ class MainWindow(QMainWindow):
 		Diese Funktion "aktiviert" SoulCreator. Hier werden beispielsweise Merits mit allen anderen Eigenschaften verknüpft, die in ihren Voraussetzungen vorkommen. und bei einem ändern dieser Eigenschaft, wird neu geprüft, ob der Merit verfügbar ist, oder nicht.
 		"""
 
-		## Merits und Subpowers müssen mit allen Eigenschaften verknüpft werden, die in ihrer Prerequisits-Eigenschaft vorkommen.
-		ConnectPrerequisites.build_connection(self.__storage, self.__character)
+		## Merits und Subpowers müssen mit allen Eigenschaften verknüpft werden, die in ihrer Prerequisits-Eigenschaft vorkommen. Dazu wird erst der Abhängigkeitsgraph erstellt und dann jede Voraussetzung ein einziges Mal verknüpft.
+		prerequisiteGraph = ConnectPrerequisites.build_graph(self.__storage, self.__character)
+		ConnectPrerequisites.connect_graph(prerequisiteGraph, self.__character)
 
 		# Bei der Änderung gewisser Eigenschaften müssen die Advantages neu berechnet werden. Die Verknüpfung dazu werden hier festgelegt.
 		calc = CalcAdvantages( self.__character, self )
@@ -365,10 +395,11 @@ class MainWindow(QMainWindow):
 		self.info.notificationSent.connect(self.showStatusBarMessage)
 
 		self.__creation = Creation( self.__storage, self.__character, self )
-		for typ in self.__creation.creationPoints[Config.SPECIES_INITIAL]:
-			for category in self.__storage.categories(typ):
-				for trait in self.__character.traits[typ][category].values():
-					trait.traitChanged.connect(self.__creation.calcPoints)
+		## Die Eigenschaften, welche bereits mit Creation.calcPoints() verknüpft sind.
+		self.__creationTraits = set()
+		self.__connectCreationPoints()
+		## Eigenschaften, welche erst durch das nachträgliche Laden einer Spezies hinzukommen, müssen ebenfalls verknüpft werden.
+		self.__character.traitsAdded.connect(self.__connectCreationPoints)
 
 		# Schreibe die übrigen Erschaffungspunkte
 		self.__creation.pointsChanged.connect(self.showCreationPoints)
@@ -377,6 +408,19 @@ class MainWindow(QMainWindow):
 		self.__creation.pointsChangedPositive.connect(self.warnCreationPointsPositive)
 
 
+	def __connectCreationPoints(self, species=None):
+		"""
+		Verknüpft alle Eigenschaften, für welche Erschaffungspunkte vergeben werden und die noch nicht verknüpft sind, mit Creation.calcPoints().
+		"""
+
+		for typ in self.__creation.creationPoints[Config.SPECIES_INITIAL]:
+			for category in self.__storage.categories(typ):
+				for trait in self.__character.traits[typ][category].values():
+					if trait not in self.__creationTraits:
+						self.__creationTraits.add(trait)
+						trait.traitChanged.connect(self.__creation.calcPoints)
+
+
 	def reset(self):
 		self.__character.resetCharacter()
 		# Direkt nach dem Start ist der Charkater natürlich nicht modifiziert.
@@ -602,22 +646,16 @@ class MainWindow(QMainWindow):
 
 			if ( filePath ):
 				# Charakter wird erst gelöscht, wenn auch wirklich ein neuer Charkater geladen werden soll.
-				self.__character.resetCharacter()
-
-				## Verhindern, daß unnötig Warnungen auftauchen, wenn man einen Charakter lädt.
-				self.__character.isLoading = True
-				try:
-					self.__readCharacter.read(filePath)
-				except ErrXmlVersion as e:
-					MessageBox.error( self, e )
-				except ErrXmlParsing as e:
-					MessageBox.error( self, e )
-				except ErrFileNotOpened as e:
-					MessageBox.error( self, e )
-
-				# Unmittelbar nach dem Laden ist der Charkter natürlich nicht mehr 'geändert'.
-				self.__character.setModified( False )
-				self.__character.isLoading = False
+				## Zurücksetzen und Laden in einem Durchgang, damit Voraussetzungen und Punkte nur einmal am Ende überprüft werden. Danach ist der Charakter nicht mehr 'geändert' und der Verlauf ist leer.
+				with self.__character.loading():
+					try:
+						self.__readCharacter.read(filePath)
+					except ErrXmlVersion as e:
+						MessageBox.error( self, e )
+					except ErrXmlParsing as e:
+						MessageBox.error( self, e )
+					except ErrFileNotOpened as e:
+						MessageBox.error( self, e )
 
 
 	def saveCharacter(self):
@@ -674,7 +712,32 @@ class MainWindow(QMainWindow):
 		printer.setFullPage( True )
 		printer.setOutputFileName( savePath )
 
+		self.__renderSheets( printer, savePath )
+
+
+	def __renderSheets(self, printer, savePath=None):
+		"""
+		Druckt den Charakterbogen auf printer.
+
+		Hat sich der Charakter seit einem früheren Export nicht verändert, wird das damals erzeugte PDF-Dokument nach savePath kopiert, sofern Papierformat und Auflösung übereinstimmen. Andernfalls wird zumindest der Html-Text der Seiten wiederverwendet.
+
+		\param savePath Die Datei, in welche printer das PDF-Dokument schreibt. Bei einem echten Drucker ist savePath None.
+		"""
+
+		checksum = self.__writeCharacter.checksum()
+
+		if savePath:
+			document = self.__renderCache.document( checksum, printer )
+			if document is not None:
+				with open(savePath, "wb") as file_object:
+					file_object.write(document)
+				return
+
 		drawSheet = RenderSheet( self.__storage, self.__character, printer, self )
+		pages = self.__renderCache.pages( checksum )
+		if pages is not None:
+			drawSheet.setHtmlPages( pages )
+		drawSheet.sheetFinished.connect( lambda: self.__storeSheets( checksum, printer, drawSheet, savePath ) )
 
 		try:
 			drawSheet.createSheets()
@@ -682,6 +745,17 @@ class MainWindow(QMainWindow):
 			MessageBox.exception( self, e.message, e.description )
 
 
+	def __storeSheets(self, checksum, printer, drawSheet, savePath=None):
+		"""
+		Legt den gerade fertiggestellten Charakterbogen im Zwischenspeicher ab.
+		"""
+
+		self.__renderCache.setPages( checksum, drawSheet.htmlPages )
+		if savePath and os.path.exists(savePath):
+			with open(savePath, "rb") as file_object:
+				self.__renderCache.setDocument( checksum, printer, file_object.read() )
+
+
 	def exportCharacter(self):
 		"""
 		Diese Funktion druckt den Charakter in ein PDF-Dokument.
@@ -720,12 +794,11 @@ class MainWindow(QMainWindow):
 		printDialog = QPrintDialog( printer, self )
 
 		if ( printDialog.exec_() == QDialog.Accepted ):
-			drawSheet = RenderSheet( self.__storage, self.__character, printer, self )
-
-			try:
-				drawSheet.createSheets()
-			except ErrSpeciesNotExisting as e:
-				MessageBox.exception( self, e.message, e.description )
+			## Auch ein Drucker kann in eine PDF-Datei drucken.
+			savePath = None
+			if printer.outputFormat() == QPrinter.PdfFormat:
+				savePath = printer.outputFileName()
+			self.__renderSheets( printer, savePath )
 
 
 	def writeSettings(self):
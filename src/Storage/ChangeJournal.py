@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+from PyQt4.QtCore import pyqtSignal as Signal
+from PyQt4.QtCore import QObject, QTimer
+
+
+
+
+class ChangeJournal(QObject):
+	"""
+	@brief Führt Buch über die Änderungen eines Charakters.
+
+	Jede Änderung wird mit record() vermerkt und erhöht die Generation um eins. Der Charakter gilt als verändert, solange sich die Generation seit dem letzten markClean() geändert hat. Wird bei einer Änderung das veränderte Feld angegeben, merkt sich das Journal außerdem, in welcher Generation sich dieses Feld zuletzt geändert hat (siehe changedSince()).
+
+	Anstatt jede Änderung einzeln zu melden, wird changed nur einmal je Durchlauf der Event-Loop mit allen seitdem veränderten Feldern ausgesandt. Wer über Änderungen am Charakter Bescheid wissen muß (Speichern, Vorschau etc.), braucht sich daher nur mit diesem einen Signal zu verbinden.
+
+	Felder sind entweder Namen wie "virtue" oder "weapons" oder die veränderte Eigenschaft selbst.
+	"""
+
+
+	## Wird höchstens einmal je Durchlauf der Event-Loop ausgesandt und übergibt die Menge der seit dem letzten Aussenden veränderten Felder.
+	changed = Signal(object)
+	## Wird ausgesandt, wenn sich isDirty() ändert.
+	dirtyChanged = Signal(bool)
+
+
+	def __init__(self, parent=None):
+		super(ChangeJournal, self).__init__(parent)
+
+		self.__generation = 0
+		## Die Generation beim letzten Aufruf von markClean().
+		self.__cleanGeneration = 0
+		## In welcher Generation sich jedes Feld zuletzt geändert hat.
+		self.__fields = {}
+		## Die Felder, welche seit dem letzten Aussenden von changed verändert wurden.
+		self.__pending = set()
+		self.__scheduled = False
+
+
+	@property
+	def generation(self):
+		"""
+		Die Anzahl der bislang vermerkten Änderungen.
+		"""
+
+		return self.__generation
+
+
+	def isDirty(self):
+		"""
+		Gibt zurück, ob seit dem letzten Aufruf von markClean() Änderungen vermerkt wurden.
+		"""
+
+		return self.__generation != self.__cleanGeneration
+
+
+	def record(self, field=None):
+		"""
+		Vermerkt eine Änderung.
+
+		\param field Das veränderte Feld. Ohne Angabe wird nur die Generation erhöht.
+		"""
+
+		wasDirty = self.isDirty()
+		self.__generation += 1
+		if field is not None:
+			self.__fields[field] = self.__generation
+			self.__pending.add(field)
+		if not self.__scheduled:
+			self.__scheduled = True
+			QTimer.singleShot(0, self.flush)
+		if not wasDirty:
+			self.dirtyChanged.emit(True)
+
+
+	def markClean(self):
+		"""
+		Legt fest, daß der aktuelle Stand als unverändert gilt, bspw. nach dem Speichern.
+		"""
+
+		if self.isDirty():
+			self.__cleanGeneration = self.__generation
+			self.dirtyChanged.emit(False)
+
+
+	def changedSince(self, generation):
+		"""
+		Gibt alle Felder zurück, welche sich nach der angegebenen Generation geändert haben.
+		"""
+
+		return [ field for field, fieldGeneration in self.__fields.items() if fieldGeneration > generation ]
+
+
+	def flush(self):
+		"""
+		Sendet changed mit allen bislang nicht gemeldeten Feldern sofort aus.
+
+		Normalerweise geschieht dies automatisch im nächsten Durchlauf der Event-Loop.
+		"""
+
+		if self.__scheduled:
+			self.__scheduled = False
+			fields = self.__pending
+			self.__pending = set()
+			self.changed.emit(fields)
@@ -26,6 +26,9 @@ SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
 
 
 
+import collections
+import contextlib
+
 from PyQt4.QtCore import pyqtSignal as Signal
 from PyQt4.QtCore import QObject, QDate
 from PyQt4.QtGui import QPixmap
@@ -35,15 +38,26 @@ from src.Datatypes.AbstractTrait import AbstractTrait
 from src.Datatypes.StandardTrait import StandardTrait
 from src.Datatypes.BonusTrait import BonusTrait
 from src.Datatypes.SubPowerTrait import SubPowerTrait
+from src.Datatypes.TraitStore import TraitStore
+from src.Datatypes.TraitCategory import TraitCategory
 from src.Datatypes.Identity import Identity
+from src.Storage.ChangeJournal import ChangeJournal
+from src.Storage.UndoHistory import UndoHistory
 import src.Calc.Calc as Calc
 import src.Work.ConnectPrerequisites as ConnectPrerequisites
+import src.Tools.ImageTools as ImageTools
 #from src.Error import ErrListLength
 import src.Debug as Debug
 
 
 
 
+## Die Teile der Identität, deren Änderungen einzeln rückgängig gemacht werden können.
+IDENTITY_FIELDS = ( "forenames", "surname", "honorname", "nickname", "supername", "gender", )
+
+
+
+
 class StorageCharacter(QObject):
 	"""
 	@brief In dieser Klasse werden sämtliche Daten des gerade geöffneten Charakters gespeichert.
@@ -109,22 +123,24 @@ class StorageCharacter(QObject):
 	companionNuminaChanged = Signal(object)
 	companionBanChanged = Signal(str)
 
-	## Dieses Signal enthält alle möglichen Gründe, um eine Eigenschaft zu verstecken, oder sie zu zeigen. species, age, era, breed, faction
-	traitVisibleReasonChanged = Signal(str, str, str, str, str)
+	## Wird ausgesandt, nachdem durch das nachträgliche Laden der Template-Daten einer Spezies neue Eigenschaften hinzugekommen sind.
+	traitsAdded = Signal(str)
 
+	## Wird am Ende von batch() ausgesandt, nachdem die aufgeschobenen Überprüfungen der Voraussetzungen durchgeführt wurden.
+	batchFinished = Signal()
 
-	# Eine Liste sämtlicher verfügbaren Eigenschaften.
+
+	# Eine Liste sämtlicher verfügbaren Eigenschaften. Die Eigenschaften jeder Kategorie stehen in einer TraitCategory, welche die Eigenschaften erst beim Zugriff erzeugt.
 	#
 	# {
 	# 	Typ1: {
 	# 		Kategorie1: {
-	# 			Name1: { "bla": blub, ... }
-	# 			Name2: { "bla": blub, ... }
-	# 			Name3: { "bla": blub, ... }
+	# 			Name1: Eigenschaft1,
+	# 			Name2: Eigenschaft2,
 	# 			...
 	# 		},
 	# 		Kategorie2: {
-	# 			Name1: { "bla": blub, ... }
+	# 			Name1: Eigenschaft1,
 	# 			...
 	# 		},
 	# 		...
@@ -171,7 +187,10 @@ class StorageCharacter(QObject):
 		self.__storage = template
 
 		self.isLoading = False
-		self.__modified = False
+		## Vermerkt alle Änderungen am Charakter (siehe isModifed()).
+		self.__journal = ChangeJournal(self)
+		## Die Änderungen, welche rückgängig gemacht werden können.
+		self.__history = UndoHistory(self, self)
 		self.__dateBirth = QDate(1, 1, 1)
 		self.__dateBecoming = QDate(1, 1, 1)
 		self.__dateGame = QDate(1, 1, 1)
@@ -196,6 +215,8 @@ class StorageCharacter(QObject):
 		self.__morality = 0
 		self.__era = ""
 		self.__picture = None
+		## Das Charakterbild als base64-kodierter Text. Wird erst bei Bedarf erzeugt und bei jeder Änderung des Bildes verworfen.
+		self.__pictureData = None
 		self.__armor = {
 			"name": "",
 			"dedicated": False,
@@ -204,17 +225,22 @@ class StorageCharacter(QObject):
 		self.__magicalTool = ""
 
 		self.identity = Identity()
+		## Der Stand der Identität bei ihrer letzten Änderung, damit die Änderungen rückgängig gemacht werden können.
+		self.__identityState = self.__getIdentityState()
 
 		self.__derangements = {}
 
 		self.__nimbus = ""
 		self.__paradoxMarks = ""
 
+		## Die Werte der Vinculi und der Einflüsse des Begleiters. Da dieser TraitStore dem Charakter gehört, können ihre Änderungen rückgängig gemacht werden.
+		self.__extraTraitStore = TraitStore(self)
+
 		self.__vinculi = []
 		for i in range(Config.VINCULI_COUNT_MAX):
-			vinculum = AbstractTrait()
+			vinculum = AbstractTrait(store=self.__extraTraitStore, index=self.__extraTraitStore.add("", { "name": "", }))
 			self.__vinculi.append(vinculum)
-			vinculum.traitChanged.connect(self.setModified)
+			vinculum.traitChanged.connect(lambda trait: self.__journal.record("vinculi"))
 
 		self.__companionName = ""
 		self.__companionPower = 0
@@ -225,9 +251,9 @@ class StorageCharacter(QObject):
 		self.__companionFuel = 0
 		self.__companionInfluences = []
 		for i in range(Config.COMPANION_INFLUENCES_MAX):
-			companionInfluence = AbstractTrait()
+			companionInfluence = AbstractTrait(store=self.__extraTraitStore, index=self.__extraTraitStore.add("", { "name": "", }))
 			self.__companionInfluences.append(companionInfluence)
-			companionInfluence.traitChanged.connect(self.setModified)
+			companionInfluence.traitChanged.connect(lambda trait: self.__journal.record("companionInfluences"))
 		self.__companionNumina = []
 		self.__companionBan = ""
 
@@ -246,112 +272,157 @@ class StorageCharacter(QObject):
 
 		# Die Eigenschaften in den Charakter laden.
 		self.__traits = {}
-		# Eigenschaften setzen.
-		for typ in self.__storage.traits.keys():
-			self.__traits.setdefault(typ, {})
-			for item in template.traits[typ]:
-				self.__traits[typ].setdefault(item, {})
-				for subitem in template.traits[typ][item].items():
-					#Debug.debug(subitem)
-					val = 2	# Dies mache ich, damit beim initialen Charakter-Reset, auch alle Voraussetzungen überprüft werden.
-					# Eigenschaften, die Zusaztext erhalten können (bspw. Language), werden mehrfach in das Dictionary eingefügt. Aber da ein Dictonary immer nur einen Eintrag desselben Namens haben kann, muß selbiger um ein numerisches Suffix erweitert werden.
-					loop = 1
-					custom = False
-					customText = None
-					if typ != "Subpower" and subitem[1]["custom"]:
-						loop = Config.MULTIPLE_TRAITS_MAX
-						custom = True
-
-					for i in range(loop):
-						trait = None
-						if typ == "Subpower":
-							trait = SubPowerTrait(self, subitem[1]["name"], val)
-							trait.level = subitem[1]["level"]
-							trait.powers = subitem[1]["powers"]
-						else:
-							if typ == "Attribute" or typ == "Skill":
-								trait = BonusTrait(self, subitem[1]["name"], val)
-							else:
-								trait = StandardTrait(self, subitem[1]["name"], val)
-							trait.age = subitem[1]["age"]
-							trait.era = subitem[1]["era"]
-							trait.custom = custom
-							trait.customText = customText
-						trait.identifier = subitem[0]
-						trait.species = subitem[1]["species"]
-						trait.cheap = subitem[1]["cheap"]
-						#if typ == "Subpower" and trait.species == "Werewolf":
-							#Debug.debug(subitem[1]["name"], subitem[1]["only"])
-						trait.only = subitem[1]["only"]
-						if "prerequisites" in subitem[1] and subitem[1]["prerequisites"]:
-							trait.hasPrerequisites = True
-							trait.prerequisitesText = subitem[1]["prerequisites"]
-						# In der Eigenschaft steht der richtige Name aber im Dictionary der Name mit einem numerischen Suffix, damit die Eigenschaft häufiger auftauchen kann.
-						dictKey = subitem[0]
-						if custom:
-							dictKey = "{}{}".format(subitem[0], i)
-						self.__traits[typ][item].setdefault(dictKey, trait)
-
-						# Wenn sich eine Eigenschaft ändert, gilt der Charakter als modifiziert.
-						trait.traitChanged.connect(self.setModified)
-				#if typ == "Subpower":
-					#Debug.debug(self.__traits[typ][item])
+		# Die Werte aller Eigenschaften. Die Eigenschaften selbst sind nur Sichten auf diesen Speicher.
+		self.__traitStore = TraitStore(self)
+		# Eigenschaften in einem einzigen Durchlauf nach den Vorlagen aus den Template-Daten erzeugen. Sie stehen damit bereits auf ihren Anfangswerten.
+		for prototype in self.__storage.traitPrototypes():
+			self.__createTrait(*prototype)
+
+		# Welche Eigenschaften von welcher Voraussetzung abhängen (siehe ConnectPrerequisites.build_graph()).
+		self.__prerequisiteGraph = {}
+		# Die Position jeder Eigenschaft in einer topologischen Sortierung des Abhängigkeitsgraphen. Wird erst bei Bedarf berechnet.
+		self.__prerequisiteOrder = None
+
+		# Verschachtelungstiefe von batch() und die Eigenschaften, deren Voraussetzungen bis zu dessen Ende überprüft werden müssen.
+		self.__batchDepth = 0
+		self.__dirtyPrerequisites = {}
+		# Eigenschaften, deren Voraussetzungen auf Eigenschaften noch nicht geladener Spezies verweisen (siehe ConnectPrerequisites.connect_traits()).
+		self.unresolvedPrerequisites = set()
+
+		## Werden die Daten einer Spezies erst nachträglich geladen, müssen auch die zugehörigen Eigenschaften nachträglich erzeugt werden.
+		self.__storage.speciesLoaded.connect(self.__addLoadedTraits)
 
 		self.bonusChanged.connect(self.__changeBonusTrait)
 
-		# Sobald irgendein Aspekt des Charakters verändert wird, muß festgelegt werden, daß sich der Charkater seit dem letzten Speichern verändert hat.
+		# Sobald irgendein Aspekt des Charakters verändert wird, vermerkt dies der jeweilige Setter direkt im Journal, ohne daß dafür jedes Signal verbunden werden muß. Nur die Identität ist ein eigenes Objekt.
 		# Es ist Aufgabe der Speicher-Funktion, dafür zu sorgen, daß beim Speichern diese Inforamtion wieder zurückgesetzt wird.
-		self.identity.identityChanged.connect(self.setModified)
-		self.eraChanged.connect(self.setModified)
-		self.dateBirthChanged.connect(self.setModified)
-		self.dateBecomingChanged.connect(self.setModified)
-		self.dateGameChanged.connect(self.setModified)
+		self.identity.identityChanged.connect(self.__recordIdentityChange)
 		# Unerwünschte Wirkung
 		#self.speciesChanged.connect(self.clearUnusableTraits)
-		self.speciesChanged.connect(self.setModified)
-		self.virtueChanged.connect(self.setModified)
-		self.viceChanged.connect(self.setModified)
-		self.breedChanged.connect(self.setModified)
-		self.kithChanged.connect(self.setModified)
-		self.bonusChanged.connect(self.setModified)
-		self.factionChanged.connect(self.setModified)
-		self.partyChanged.connect(self.setModified)
-		self.descriptionChanged.connect(self.setModified)
-		self.powerstatChanged.connect(self.setModified)
-		self.moralityChanged.connect(self.setModified)
-		self.derangementChanged.connect(self.setModified)
-		self.pictureChanged.connect(self.setModified)
-		self.weaponsChanged.connect(self.setModified)
-		self.armorChanged.connect(self.setModified)
-		self.equipmentChanged.connect(self.setModified)
-		self.automobilesChanged.connect(self.setModified)
-		self.extraordinaryItemsChanged.connect(self.setModified)
-		self.magicalToolChanged.connect(self.setModified)
-		self.nimbusChanged.connect(self.setModified)
-		self.paradoxMarksChanged.connect(self.setModified)
-		self.companionPowerChanged.connect(self.setModified)
-		self.companionFinesseChanged.connect(self.setModified)
-		self.companionResistanceChanged.connect(self.setModified)
-		self.companionSizeChanged.connect(self.setModified)
-		self.companionSpeedFactorChanged.connect(self.setModified)
-		self.companionFuelChanged.connect(self.setModified)
-		self.companionNuminaChanged.connect(self.setModified)
-		self.companionBanChanged.connect(self.setModified)
-
-		self.ageChanged.connect(self.deselctTraitsWithWrongAge)
-
-		self.speciesChanged.connect(self.__emitTraitVisibleReasonChanged)
-		self.ageChanged.connect(self.__emitTraitVisibleReasonChanged)
-		self.eraChanged.connect(self.__emitTraitVisibleReasonChanged)
-		self.breedChanged.connect(self.__emitTraitVisibleReasonChanged)
-		self.factionChanged.connect(self.__emitTraitVisibleReasonChanged)
+
+		# Spezies, Alterskategorie, Ära und Brut/Fraktion, nach denen zuletzt die Sichtbarkeit der Eigenschaften festgelegt wurde. Solange keine davon gewählt ist, ist auch keine Eigenschaft verborgen.
+		self.__visibilityValues = {
+			Config.TRAIT_HIDDEN_SPECIES: ( "", ),
+			Config.TRAIT_HIDDEN_AGE: ( "", ),
+			Config.TRAIT_HIDDEN_ERA: ( "", ),
+			Config.TRAIT_HIDDEN_ONLY: ( "", "", ),
+		}
+		self.__updateTraitVisibility()
+
+		# Jede Eigenschaft erfährt über BasicTrait.hiddenReasonsChanged selbst, wenn sie verborgen oder wieder gezeigt wird.
+		self.speciesChanged.connect(self.__updateTraitVisibility)
+		self.ageChanged.connect(self.__updateTraitVisibility)
+		self.eraChanged.connect(self.__updateTraitVisibility)
+		self.breedChanged.connect(self.__updateTraitVisibility)
+		self.factionChanged.connect(self.__updateTraitVisibility)
 
 	#connect (self, SIGNAL(realIdentityChanged(cv_Identity)), self, SLOT(emitNameChanged(cv_Identity)));
 
 
-	def __emitTraitVisibleReasonChanged(self):
-		ageText = Config.getAge(self.age)
-		self.traitVisibleReasonChanged.emit(self.species, ageText, self.era, self.breed, self.faction)
+	def __createTrait(self, typ, category, identifier, dictKey, data, value):
+		"""
+		Legt die Eigenschaft des Charakters zu einer Vorlage aus StorageTemplate.traitPrototypes() im TraitStore an.
+
+		Dabei wird noch keine Eigenschaft als Objekt erzeugt, dies geschieht erst beim Zugriff (siehe TraitCategory).
+		"""
+
+		traitClass = StandardTrait
+		if typ == "Subpower":
+			traitClass = SubPowerTrait
+		elif typ == "Attribute" or typ == "Skill":
+			traitClass = BonusTrait
+
+		## Die unveränderlichen Angaben (Spezies, Alter, Voraussetzungen etc.) liest die Eigenschaft aus data. Wenn sich eine Eigenschaft ändert, markiert sie den Charakter selbst als modifiziert (siehe BasicTrait).
+		index = self.__traitStore.add(identifier, data, value, "", traitClass)
+		# In der Eigenschaft steht der richtige Name aber im Dictionary der Name mit einem numerischen Suffix, damit die Eigenschaft häufiger auftauchen kann.
+		categories = self.__traits.setdefault(typ, {})
+		if category not in categories:
+			categories[category] = TraitCategory(self.__traitStore)
+		categories[category].add(dictKey, index)
+
+
+	def __addLoadedTraits(self, species):
+		"""
+		Erzeugt die Eigenschaften, welche durch das nachträgliche Laden der Template-Daten von species hinzugekommen sind.
+
+		Die neuen Eigenschaften werden mit ihren Voraussetzungen verknüpft. Anschließend wird traitsAdded ausgesandt, damit beispielsweise die Anzeige sie ebenfalls übernehmen kann.
+		"""
+
+		newTraits = []
+		for prototype in self.__storage.traitPrototypes():
+			typ, category, identifier, dictKey, data = prototype[:5]
+			if dictKey not in self.__traits.get(typ, {}).get(category, {}):
+				self.__createTrait(*prototype)
+				trait = self.__traits[typ][category][dictKey]
+				trait.hiddenReasons = self.__hiddenReasons(data)
+				newTraits.append( trait )
+
+		ConnectPrerequisites.connect_traits(newTraits, self.__storage, self)
+
+		self.traitsAdded.emit(species)
+
+
+	def __updateTraitVisibility(self):
+		"""
+		Legt fest, welche Eigenschaften aufgrund von Spezies, Alterskategorie, Ära oder Brut/Fraktion des Charakters verborgen sind (siehe BasicTrait.hiddenReasons).
+
+		Es werden nur die Eigenschaften überprüft, deren Sichtbarkeit sich durch die Veränderung überhaupt ändern kann, also diejenigen, welche StorageTemplate.visibilityBuckets() dem alten oder dem neuen Wert zuordnet. Eigenschaften, die deswegen verborgen werden, weil sie einer anderen Alterskategorie vorbehalten sind, werden auf 0 gesetzt.
+		"""
+
+		values = {
+			Config.TRAIT_HIDDEN_SPECIES: ( self.species, ),
+			Config.TRAIT_HIDDEN_AGE: ( Config.getAge(self.age), ),
+			Config.TRAIT_HIDDEN_ERA: ( self.era, ),
+			Config.TRAIT_HIDDEN_ONLY: ( self.breed, self.faction, ),
+		}
+		for reason, value in values.items():
+			oldValue = self.__visibilityValues[reason]
+			if value == oldValue:
+				continue
+			self.__visibilityValues[reason] = value
+
+			buckets = self.__storage.visibilityBuckets(reason)
+			if any(oldValue) and any(value):
+				keys = set( oldValue + value )
+			elif any(oldValue) or any(value):
+				# Wird der Wert erst gewählt oder wieder entfernt, betrifft dies alle Eigenschaften mit dieser Einschränkung.
+				keys = buckets.keys()
+			else:
+				continue
+
+			for key in keys:
+				# Unter "" stehen keine eingeschränkten Eigenschaften.
+				if not key:
+					continue
+				for typ, category, identifier in buckets.get(key, ()):
+					hiddenReasons = self.__hiddenReasons(self.__storage.traits[typ][category][identifier])
+					for trait in self.traitsByIdentifier(typ, category, identifier):
+						if hiddenReasons & Config.TRAIT_HIDDEN_AGE and not trait.hiddenReasons & Config.TRAIT_HIDDEN_AGE and type(trait) == StandardTrait and trait.value > 0:
+							trait.value = 0
+						trait.hiddenReasons = hiddenReasons
+
+
+	def __hiddenReasons(self, data):
+		"""
+		Gibt die Gründe zurück, aus denen eine Eigenschaft mit dem Eintrag data der Template-Daten für diesen Charakter nicht sichtbar ist.
+		"""
+
+		species, = self.__visibilityValues[Config.TRAIT_HIDDEN_SPECIES]
+		age, = self.__visibilityValues[Config.TRAIT_HIDDEN_AGE]
+		era, = self.__visibilityValues[Config.TRAIT_HIDDEN_ERA]
+		breed, faction = self.__visibilityValues[Config.TRAIT_HIDDEN_ONLY]
+		only = data.get("only")
+
+		reasons = 0
+		if species and data.get("species") and data["species"] != species:
+			reasons |= Config.TRAIT_HIDDEN_SPECIES
+		if age and data.get("age") and data["age"] != age:
+			reasons |= Config.TRAIT_HIDDEN_AGE
+		if era and data.get("era") and era not in data["era"]:
+			reasons |= Config.TRAIT_HIDDEN_ERA
+		if (breed or faction) and only and breed not in only and faction not in only:
+			reasons |= Config.TRAIT_HIDDEN_ONLY
+		return reasons
 
 
 	def __getEra(self):
@@ -367,6 +438,7 @@ class StorageCharacter(QObject):
 		"""
 
 		if ( self.__era != era ):
+			self.__recordChange("era", self.__era, era)
 			self.__era = era
 			#Debug.debug("Ära verändert zu {}".format(era) )
 			self.eraChanged.emit( era )
@@ -384,6 +456,7 @@ class StorageCharacter(QObject):
 
 	def setDateBirth( self, date ):
 		if ( self.__dateBirth != date ):
+			self.__recordChange("dateBirth", self.__dateBirth, date)
 			self.__dateBirth = date
 			self.dateBirthChanged.emit( date )
 
@@ -399,6 +472,7 @@ class StorageCharacter(QObject):
 
 	def setDateBecoming( self, date ):
 		if ( self.__dateBecoming != date ):
+			self.__recordChange("dateBecoming", self.__dateBecoming, date)
 			self.__dateBecoming = date
 			self.dateBecomingChanged.emit( date )
 
@@ -414,6 +488,7 @@ class StorageCharacter(QObject):
 
 	def setDateGame( self, date ):
 		if ( self.__dateGame != date ):
+			self.__recordChange("dateGame", self.__dateGame, date)
 			self.__dateGame = date
 			self.dateGameChanged.emit( date )
 
@@ -451,6 +526,9 @@ class StorageCharacter(QObject):
 		"""
 
 		if ( self.__species != species ):
+			## Die Eigenschaften der Spezies müssen zur Verfügung stehen, bevor irgendjemand von dem Wechsel erfährt.
+			self.__storage.loadSpecies(species)
+			self.__recordChange("species", self.__species, species)
 			self.__species = species
 			#Debug.debug("Spezies in Speicher verändert zu {}!".format(species))
 			self.speciesChanged.emit( species )
@@ -476,6 +554,7 @@ class StorageCharacter(QObject):
 
 		if derangements and self.__derangements != derangements:
 			self.__derangements = derangements
+			self.__journal.record("derangements")
 			## Jetzt müssen in der richtigen Reihenfolge (hoch nach tief) die Signale gesandt werden.
 			keys = self.__derangements.keys()
 			#Debug.debug(keys, range(min(keys), max(keys)+1)[::-1])
@@ -492,16 +571,20 @@ class StorageCharacter(QObject):
 		#Debug.debug(moralityValue, type(moralityValue))
 		if moralityValue not in self.__derangements:
 			if derangement:
+				self.__history.recordCall(self.setDerangement, ( moralityValue, "", ), self.setDerangement, ( moralityValue, derangement, ))
 				self.__derangements[moralityValue] = derangement
 				#Debug.debug(derangement, moralityValue)
+				self.__journal.record("derangements")
 				self.derangementChanged.emit(moralityValue, derangement)
 		elif self.__derangements[moralityValue] != derangement:
+			self.__history.recordCall(self.setDerangement, ( moralityValue, self.__derangements[moralityValue], ), self.setDerangement, ( moralityValue, derangement, ))
 			# Wird als Geistesstörung ein leerer String übergeben, wird dieser Eintrag aus der Liste gelöscht. Dennoch wird das Signal einer Änderung mit dem leeren String gesandt.
 			if derangement:
 				self.__derangements[moralityValue] = derangement
 				#Debug.debug(derangement, moralityValue)
 			else:
 				del self.__derangements[moralityValue]
+			self.__journal.record("derangements")
 			self.derangementChanged.emit(moralityValue, derangement)
 
 
@@ -516,10 +599,44 @@ class StorageCharacter(QObject):
 	@picture.setter
 	def picture(self, image):
 		if self.__picture != image:
+			self.__recordChange("picture", self.__picture, image)
 			self.__picture = image
+			self.__pictureData = None
 			self.pictureChanged.emit(image)
 
 
+	def setPicture(self, image, pictureData=None):
+		"""
+		Legt das Charakterbild fest.
+
+		\param pictureData Ist das Bild bereits base64-kodiert vorhanden, beispielsweise weil es so aus einer Datei gelesen wurde, muß es für pictureData nicht erneut kodiert werden.
+
+		\note pictureData wird ohne Leerzeichen und Zeilenumbrüche übernommen, damit es unverändert in die data-URI des Charakterbogens paßt. Liegt es nicht im Format Config.CHARACTER_PIC_FORMAT vor, wird es verworfen und das Bild bei Bedarf neu kodiert.
+		"""
+
+		self.picture = image
+		if pictureData:
+			pictureData = "".join(pictureData.split())
+			if ImageTools.has_format_base64(pictureData):
+				self.__pictureData = pictureData
+
+
+	@property
+	def pictureData(self):
+		"""
+		Das Charakterbild als base64-kodierter Text im Format Config.CHARACTER_PIC_FORMAT, wie es gespeichert und in den Charakterbogen eingebettet wird.
+
+		Das Bild wird nur beim ersten Zugriff nach einer Änderung kodiert. Ist kein Bild vorhanden, wird ein leerer Text zurückgegeben.
+		"""
+
+		if self.__pictureData is None:
+			if self.__picture:
+				self.__pictureData = ImageTools.encode_base64(self.__picture)
+			else:
+				self.__pictureData = ""
+		return self.__pictureData
+
+
 	@property
 	def weapons(self):
 		"""
@@ -538,6 +655,8 @@ class StorageCharacter(QObject):
 
 		if weapon not in self.__weapons[category]:
 			self.__weapons[category].append(weapon)
+			self.__journal.record("weapons")
+			self.__history.recordCall(self.deleteWeapon, ( weapon, category, ), self.addWeapon, ( weapon, category, ))
 			self.weaponAdded.emit(weapon, category)
 
 	def deleteWeapon(self, weapon, category):
@@ -547,6 +666,8 @@ class StorageCharacter(QObject):
 
 		if category in self.__weapons:
 			self.__weapons[category].remove(weapon)
+			self.__journal.record("weapons")
+			self.__history.recordCall(self.addWeapon, ( weapon, category, ), self.deleteWeapon, ( weapon, category, ))
 			self.weaponRemoved.emit(weapon, category)
 
 
@@ -560,8 +681,10 @@ class StorageCharacter(QObject):
 
 	def setArmor(self, name, dedicated=False):
 		if self.__armor["name"] != name or self.__armor["dedicated"] != dedicated:
+			self.__history.recordCall(self.setArmor, ( self.__armor["name"], self.__armor["dedicated"], ), self.setArmor, ( name, dedicated, ))
 			self.__armor["name"] = name
 			self.__armor["dedicated"] = dedicated
+			self.__journal.record("armor")
 			self.armorChanged.emit(name, dedicated)
 
 
@@ -577,11 +700,15 @@ class StorageCharacter(QObject):
 		#Debug.debug(item)
 		if item not in self.__equipment:
 			self.__equipment.append(item)
+			self.__journal.record("equipment")
+			self.__history.recordCall(self.deleteEquipment, ( item, ), self.addEquipment, ( item, ))
 			self.equipmentAdded.emit(item)
 
 	def deleteEquipment(self, item):
 		if item in self.__equipment:
 			self.__equipment.remove(item)
+			self.__journal.record("equipment")
+			self.__history.recordCall(self.addEquipment, ( item, ), self.deleteEquipment, ( item, ))
 			self.equipmentRemoved.emit(item)
 
 
@@ -603,6 +730,8 @@ class StorageCharacter(QObject):
 
 		if automobile not in self.__automobiles[category]:
 			self.__automobiles[category].append(automobile)
+			self.__journal.record("automobiles")
+			self.__history.recordCall(self.deleteAutomobile, ( automobile, category, ), self.addAutomobile, ( automobile, category, ))
 			self.automobileAdded.emit(automobile, category)
 
 	def deleteAutomobile(self, automobile, category):
@@ -612,6 +741,8 @@ class StorageCharacter(QObject):
 
 		if category in self.__automobiles:
 			self.__automobiles[category].remove(automobile)
+			self.__journal.record("automobiles")
+			self.__history.recordCall(self.addAutomobile, ( automobile, category, ), self.deleteAutomobile, ( automobile, category, ))
 			self.automobileRemoved.emit(automobile, category)
 
 
@@ -633,6 +764,8 @@ class StorageCharacter(QObject):
 
 		if extraordinaryItem not in self.__extraordinaryItems[typ]:
 			self.__extraordinaryItems[typ].append(extraordinaryItem)
+			self.__journal.record("extraordinaryItems")
+			self.__history.recordCall(self.deleteExtraordinaryItem, ( extraordinaryItem, typ, ), self.addExtraordinaryItem, ( extraordinaryItem, typ, ))
 			self.extraordinaryItemAdded.emit(extraordinaryItem, typ)
 
 	def deleteExtraordinaryItem(self, extraordinaryItem, typ):
@@ -642,6 +775,8 @@ class StorageCharacter(QObject):
 
 		if typ in self.__extraordinaryItems:
 			self.__extraordinaryItems[typ].remove(extraordinaryItem)
+			self.__journal.record("extraordinaryItems")
+			self.__history.recordCall(self.addExtraordinaryItem, ( extraordinaryItem, typ, ), self.deleteExtraordinaryItem, ( extraordinaryItem, typ, ))
 			self.extraordinaryItemRemoved.emit(extraordinaryItem, typ)
 
 
@@ -655,6 +790,7 @@ class StorageCharacter(QObject):
 	def setMagicalTool(self, tool):
 
 		if self.__magicalTool != tool:
+			self.__recordChange("magicalTool", self.__magicalTool, tool)
 			self.__magicalTool = tool
 			self.magicalToolChanged.emit(tool)
 
@@ -671,6 +807,7 @@ class StorageCharacter(QObject):
 	def setNimbus(self, nimbus):
 
 		if self.__nimbus != nimbus:
+			self.__recordChange("nimbus", self.__nimbus, nimbus)
 			self.__nimbus = nimbus
 			self.nimbusChanged.emit(nimbus)
 
@@ -687,6 +824,7 @@ class StorageCharacter(QObject):
 	def setParadoxMarks(self, paradoxMarks):
 
 		if self.__paradoxMarks != paradoxMarks:
+			self.__recordChange("paradoxMarks", self.__paradoxMarks, paradoxMarks)
 			self.__paradoxMarks = paradoxMarks
 			self.paradoxMarksChanged.emit(paradoxMarks)
 
@@ -707,6 +845,7 @@ class StorageCharacter(QObject):
 
 	def setCompanionName(self, name):
 		if self.__companionName != name:
+			self.__recordChange("companionName", self.__companionName, name)
 			self.__companionName = name
 			self.companionNameChanged.emit(name)
 
@@ -718,6 +857,7 @@ class StorageCharacter(QObject):
 
 	def setCompanionPower(self, power):
 		if self.__companionPower != power:
+			self.__recordChange("companionPower", self.__companionPower, power)
 			self.__companionPower = power
 			self.companionPowerChanged.emit(power)
 
@@ -729,6 +869,7 @@ class StorageCharacter(QObject):
 
 	def setCompanionFinesse(self, finesse):
 		if self.__companionFinesse != finesse:
+			self.__recordChange("companionFinesse", self.__companionFinesse, finesse)
 			self.__companionFinesse = finesse
 			self.companionFinesseChanged.emit(finesse)
 
@@ -740,6 +881,7 @@ class StorageCharacter(QObject):
 
 	def setCompanionResistance(self, resistance):
 		if self.__companionResistance != resistance:
+			self.__recordChange("companionResistance", self.__companionResistance, resistance)
 			self.__companionResistance = resistance
 			self.companionResistanceChanged.emit(resistance)
 
@@ -751,6 +893,7 @@ class StorageCharacter(QObject):
 
 	def setCompanionSize(self, size):
 		if self.__companionSize != size:
+			self.__recordChange("companionSize", self.__companionSize, size)
 			self.__companionSize = size
 			self.companionSizeChanged.emit(size)
 
@@ -762,6 +905,7 @@ class StorageCharacter(QObject):
 
 	def setCompanionSpeedFactor(self, speedFactor):
 		if self.__companionSpeedFactor != speedFactor:
+			self.__recordChange("companionSpeedFactor", self.__companionSpeedFactor, speedFactor)
 			self.__companionSpeedFactor = speedFactor
 			self.companionSpeedFactorChanged.emit(speedFactor)
 
@@ -773,6 +917,7 @@ class StorageCharacter(QObject):
 
 	def setCompanionFuel(self, fuel):
 		if self.__companionFuel != fuel:
+			self.__recordChange("companionFuel", self.__companionFuel, fuel)
 			self.__companionFuel = fuel
 			self.companionFuelChanged.emit(fuel)
 
@@ -794,6 +939,7 @@ class StorageCharacter(QObject):
 	@companionNumina.setter
 	def companionNumina(self, numina):
 		if self.__companionNumina != numina:
+			self.__recordChange("companionNumina", self.__companionNumina, numina)
 			self.__companionNumina = numina
 			self.companionNuminaChanged.emit(numina)
 
@@ -809,6 +955,7 @@ class StorageCharacter(QObject):
 
 	def setCompanionBan(self, ban):
 		if self.__companionBan != ban:
+			self.__recordChange("companionBan", self.__companionBan, ban)
 			self.__companionBan = ban
 			self.companionBanChanged.emit(ban)
 
@@ -819,6 +966,38 @@ class StorageCharacter(QObject):
 	def traits(self):
 		return self.__traits
 
+
+	def traitsByIdentifier(self, typ, category, identifier):
+		"""
+		Gibt die Eigenschaften des Charakters zurück, welche zu der Eigenschaft identifier aus den Template-Daten gehören.
+
+		Bei Eigenschaften mit Zusatztext (bspw. Language) sind dies Config.MULTIPLE_TRAITS_MAX Stück, ansonsten höchstens eine.
+		"""
+
+		traits = self.__traits.get(typ, {}).get(category, {})
+		if identifier in traits:
+			return [ traits[identifier] ]
+
+		result = []
+		for i in range(Config.MULTIPLE_TRAITS_MAX):
+			dictKey = "{}{}".format(identifier, i)
+			if dictKey in traits:
+				result.append(traits[dictKey])
+		return result
+
+
+	def traitsByName(self, typ, category, name):
+		"""
+		Gibt die Eigenschaften des Charakters zurück, welche den Namen name tragen.
+
+		Statt alle Eigenschaften der Kategorie zu durchsuchen, werden die passenden Identifier über StorageTemplate.traitIdentifiers() ermittelt.
+		"""
+
+		result = []
+		for identifier in self.__storage.traitIdentifiers(typ, category, name):
+			result.extend(self.traitsByIdentifier(typ, category, identifier))
+		return result
+
 	#def __setTraits(self, traits):
 		#if self.__traits != traits:
 			#self.__traits = traits
@@ -874,6 +1053,7 @@ class StorageCharacter(QObject):
 		"""
 
 		if ( self.__virtue != virtue ):
+			self.__recordChange("virtue", self.__virtue, virtue)
 			self.__virtue = virtue
 			self.virtueChanged.emit( virtue )
 
@@ -895,6 +1075,7 @@ class StorageCharacter(QObject):
 		"""
 
 		if ( self.__vice != vice ):
+			self.__recordChange("vice", self.__vice, vice)
 			self.__vice = vice
 			self.viceChanged.emit( vice )
 
@@ -916,6 +1097,7 @@ class StorageCharacter(QObject):
 		"""
 
 		if self.__breed != breed:
+			self.__recordChange("breed", self.__breed, breed)
 			self.__breed = breed
 			self.breedChanged.emit(breed)
 
@@ -945,6 +1127,7 @@ class StorageCharacter(QObject):
 
 		if ( self.__bonus != bonus ):
 			#Debug.debug(bonus)
+			self.__recordChange("bonus", self.__bonus, bonus)
 			self.__bonus = bonus
 			self.bonusChanged.emit( bonus )
 
@@ -991,6 +1174,7 @@ class StorageCharacter(QObject):
 		"""
 
 		if ( self.__kith != kith ):
+			self.__recordChange("kith", self.__kith, kith)
 			self.__kith = kith
 			self.kithChanged.emit( kith )
 
@@ -1012,6 +1196,7 @@ class StorageCharacter(QObject):
 		"""
 
 		if ( self.__faction != faction ):
+			self.__recordChange("faction", self.__faction, faction)
 			self.__faction = faction
 			self.factionChanged.emit( faction )
 
@@ -1033,6 +1218,7 @@ class StorageCharacter(QObject):
 		"""
 
 		if ( self.__organisation != organisation ):
+			self.__recordChange("organisation", self.__organisation, organisation)
 			self.__organisation = organisation
 			self.organisationChanged.emit( organisation )
 
@@ -1048,6 +1234,7 @@ class StorageCharacter(QObject):
 
 	def setParty( self, party ):
 		if ( self.__party != party ):
+			self.__recordChange("party", self.__party, party)
 			self.__party = party
 			self.partyChanged.emit( party )
 
@@ -1063,6 +1250,7 @@ class StorageCharacter(QObject):
 
 	def setHeight( self, height ):
 		if ( self.__height != height ):
+			self.__recordChange("height", self.__height, height)
 			self.__height = height
 			self.heightChanged.emit( height )
 
@@ -1078,6 +1266,7 @@ class StorageCharacter(QObject):
 
 	def setWeight( self, weight ):
 		if ( self.__weight != weight ):
+			self.__recordChange("weight", self.__weight, weight)
 			self.__weight = weight
 			self.weightChanged.emit( weight )
 
@@ -1093,6 +1282,7 @@ class StorageCharacter(QObject):
 
 	def setEyes( self, eyes ):
 		if ( self.__eyes != eyes ):
+			self.__recordChange("eyes", self.__eyes, eyes)
 			self.__eyes = eyes
 			self.eyesChanged.emit( eyes )
 
@@ -1108,6 +1298,7 @@ class StorageCharacter(QObject):
 
 	def setHair( self, hair ):
 		if ( self.__hair != hair ):
+			self.__recordChange("hair", self.__hair, hair)
 			self.__hair = hair
 			self.hairChanged.emit( hair )
 
@@ -1123,6 +1314,7 @@ class StorageCharacter(QObject):
 
 	def setNationality( self, nationality ):
 		if ( self.__nationality != nationality ):
+			self.__recordChange("nationality", self.__nationality, nationality)
 			self.__nationality = nationality
 			self.nationalityChanged.emit( nationality )
 
@@ -1140,6 +1332,7 @@ class StorageCharacter(QObject):
 	@description.setter
 	def description( self, text ):
 		if ( self.__description != text ):
+			self.__recordChange("description", self.__description, text)
 			self.__description = text
 			self.descriptionChanged.emit( text )
 
@@ -1159,6 +1352,7 @@ class StorageCharacter(QObject):
 		"""
 
 		if ( self.__powerstat != value ):
+			self.__recordChange("powerstat", self.__powerstat, value)
 			self.__powerstat = value
 			self.powerstatChanged.emit( value )
 
@@ -1180,6 +1374,7 @@ class StorageCharacter(QObject):
 		"""
 
 		if ( self.__morality != value ):
+			self.__recordChange("morality", self.__morality, value)
 			self.__morality = value
 			#Debug.debug("Moral verändert auf {}".format(value))
 			self.moralityChanged.emit( value )
@@ -1190,6 +1385,8 @@ class StorageCharacter(QObject):
 	def resetCharacter(self):
 		## Der Charkater wird umorganisiert, ohne daß wir haufenweise Warnhinweise haben wollen.
 		self.isLoading = True
+		## Die Änderungen am bisherigen Charakter können nicht mehr rückgängig gemacht werden.
+		self.__history.clear()
 		# Standardspezies ist der Mensch.
 		self.species = Config.SPECIES_INITIAL
 		# Zeitalter festlegen.
@@ -1225,21 +1422,19 @@ class StorageCharacter(QObject):
 		#// setBreed(storage.breedNames(species()).at(0));
 		#// setFaction(storage.breedNames(species()).at(0));
 
-		# Attribute und andere Eigenschaften auf Anfangswerte setzen.
-		for item in self.__traits:
-			val = 0
-			if item == "Attribute":
-				val = 1
-			for subitem in self.__traits[item]:
-				for subsubitem in self.__traits[item][subitem].values():
-					subsubitem.value = val
-					subsubitem.customText = ""
-					subsubitem.specialties = []
+		# Attribute und andere Eigenschaften auf Anfangswerte setzen. Es werden nur die Eigenschaften angefaßt, welche vom Anfangszustand abweichen, und die Voraussetzungen werden dabei nur einmal am Ende überprüft.
+		with self.batch():
+			for index in self.__traitStore.modified():
+				trait = self.__traitStore.trait(index)
+				trait.value = self.__traitStore.defaults[index]
+				if isinstance(trait, StandardTrait):
+					trait.customText = ""
+					trait.specialties = []
 
-		self.morality = Config.TRAIT_MORALITY_VALUE_DEFAULT
+			self.morality = Config.TRAIT_MORALITY_VALUE_DEFAULT
 
-		# Übernatürliche Eigenschaft festlegen.
-		self.powerstat = Config.TRAIT_POWERSTAT_VALUE_DEFAULT
+			# Übernatürliche Eigenschaft festlegen.
+			self.powerstat = Config.TRAIT_POWERSTAT_VALUE_DEFAULT
 
 		# Beim Löschen ist darauf zu achten, daß ich nicht aus der Liste löschen kann, über die ich iteriere. Sonst wird nicht alles gelöscht.
 		for category in self.__weapons:
@@ -1288,12 +1483,70 @@ class StorageCharacter(QObject):
 		self.isLoading = False
 
 
+	def __recordChange(self, field, old, new):
+		"""
+		Vermerkt die Änderung des Attributs field im Journal und im Undo-Verlauf.
+		"""
+
+		self.__journal.record(field)
+		self.__history.recordValue(self, field, old, new)
+
+
+	def __getIdentityState(self):
+		return dict( ( name, getattr(self.identity, name) ) for name in IDENTITY_FIELDS )
+
+
+	def __recordIdentityChange(self):
+		"""
+		Vermerkt jeden seit der letzten Änderung veränderten Teil der Identität im Journal und im Undo-Verlauf.
+		"""
+
+		self.__journal.record("identity")
+		state = self.__getIdentityState()
+		for name in IDENTITY_FIELDS:
+			if state[name] != self.__identityState[name]:
+				self.__history.recordValue(self.identity, name, self.__identityState[name], state[name])
+		self.__identityState = state
+
+
+	@property
+	def journal(self):
+		"""
+		Das Journal, in welchem alle Änderungen am Charakter vermerkt werden (siehe ChangeJournal).
+		"""
+
+		return self.__journal
+
+
+	@property
+	def history(self):
+		"""
+		Der Verlauf aller Änderungen, welche rückgängig gemacht werden können (siehe UndoHistory).
+		"""
+
+		return self.__history
+
+
+	def undo(self):
+		self.__history.undo()
+
+
+	def redo(self):
+		self.__history.redo()
+
+
 	def isModifed(self):
-		return self.__modified
+		return self.__journal.isDirty()
 
 	def setModified( self, sw=True ):
-		if ( self.__modified != sw ):
-			self.__modified = sw
+		"""
+		Markiert den Charakter als verändert bzw. nach dem Speichern oder Laden als unverändert.
+		"""
+
+		if sw:
+			self.__journal.record()
+		else:
+			self.__journal.markClean()
 
 
 	# Unerwünschte Funktion.
@@ -1321,19 +1574,163 @@ class StorageCharacter(QObject):
 		\todo Den SyntaxError sollte ich nicht verstecken!
 		"""
 
-		ConnectPrerequisites.checkPrerequisites(trait, self.__storage, self)
+		if self.__batchDepth:
+			self.__dirtyPrerequisites[trait] = None
+		else:
+			ConnectPrerequisites.checkPrerequisites(trait, self.__storage, self)
+
+
+	@property
+	def prerequisiteGraph(self):
+		"""
+		Der umgekehrte Abhängigkeitsgraph der Voraussetzungen.
+
+		{
+			Voraussetzung1: { Eigenschaft1: None, Eigenschaft2: None, ... },
+			...
+		}
 
+		Voraussetzungen sind Eigenschaften oder einer der Bezeichner Config.POWERSTAT_IDENTIFIER, Config.MORALITY_IDENTIFIER und Config.AGE_IDENTIFIER.
 
-	def deselctTraitsWithWrongAge(self, age):
+		\sa addPrerequisiteGraph()
 		"""
-		\todo Man sollte nicht bei jedem Alterswechsel über alle Eigenschaften laufen, sondern zu Beginn des Programms alle Eigenschaften mit "Kid" bzw. "Adult" mit ageChanged verknüpfen.
+
+		return self.__prerequisiteGraph
+
+
+	def addPrerequisiteGraph(self, graph):
 		"""
+		Übernimmt die Abhängigkeiten aus graph, wie ihn ConnectPrerequisites.build_graph() erzeugt.
+
+		\return Liste der Voraussetzungen, welche bislang nicht im Graphen vorkamen und daher noch verknüpft werden müssen.
+		"""
+
+		newSources = []
+		for source, dependents in graph.items():
+			if source not in self.__prerequisiteGraph:
+				self.__prerequisiteGraph[source] = {}
+				newSources.append(source)
+			self.__prerequisiteGraph[source].update(dict.fromkeys(dependents))
+		self.__prerequisiteOrder = None
+		return newSources
+
+
+	def checkDependentPrerequisites(self, source):
+		"""
+		Überprüft die Voraussetzungen aller Eigenschaften, welche von source abhängen.
+
+		\note Innerhalb von batch() werden die Eigenschaften nur vorgemerkt.
+		"""
+
+		dependents = self.__prerequisiteGraph.get(source)
+		if not dependents:
+			return
+		elif self.__batchDepth:
+			self.__dirtyPrerequisites.update(dependents)
+		else:
+			for trait in dependents:
+				ConnectPrerequisites.checkPrerequisites(trait, self.__storage, self)
+
+
+	@contextlib.contextmanager
+	def batch(self):
+		"""
+		Faßt viele Änderungen am Charakter zusammen, bspw. beim Zurücksetzen oder Laden.
+
+		Innerhalb des with-Blocks werden Eigenschaften, deren Voraussetzungen sich ändern, nur vorgemerkt. Am Ende wird jede vorgemerkte Eigenschaft genau einmal überprüft, Voraussetzungen vor den von ihnen abhängigen Eigenschaften, und anschließend batchFinished ausgesandt. Dadurch wird auch availableChanged je Eigenschaft höchstens einmal ausgesandt.
+
+		Aufrufe dürfen verschachtelt werden, maßgeblich ist das Ende des äußersten Blocks.
+
+		\code
+		with character.batch():
+			for trait in traits:
+				trait.value = 0
+		\endcode
+		"""
+
+		self.__batchDepth += 1
+		try:
+			yield self
+		finally:
+			self.__batchDepth -= 1
+			if not self.__batchDepth:
+				self.__finishBatch()
+
+
+	def isBatching(self):
+		"""
+		Gibt zurück, ob gerade Änderungen mit batch() zusammengefaßt werden.
+		"""
+
+		return self.__batchDepth > 0
+
+
+	@contextlib.contextmanager
+	def loading(self):
+		"""
+		Setzt den Charakter zurück und faßt das anschließende Laden wie batch() zusammen.
+
+		Bis nach der abschließenden Überprüfung der Voraussetzungen bleibt isLoading gesetzt, so daß weder unnötige Warnungen auftauchen noch die geladenen Werte im Verlauf landen. Danach gilt der Charakter als unverändert und der Verlauf ist leer.
+
+		\code
+		with character.loading():
+			reader.read(fileName)
+		\endcode
+		"""
+
+		try:
+			with self.batch():
+				self.resetCharacter()
+				## resetCharacter() setzt isLoading am Ende zurück.
+				self.isLoading = True
+				yield self
+
+			self.setModified(False)
+			## Das Laden kann nicht rückgängig gemacht werden.
+			self.__history.clear()
+		finally:
+			self.isLoading = False
+
+
+	def __finishBatch(self):
+		dirty = self.__dirtyPrerequisites
+		self.__dirtyPrerequisites = {}
+		if dirty:
+			order = self.__topologicalOrder()
+			for trait in sorted(dirty, key=lambda trait: order.get(trait, -1)):
+				ConnectPrerequisites.checkPrerequisites(trait, self.__storage, self)
+		self.batchFinished.emit()
+
+
+	def __topologicalOrder(self):
+		"""
+		Gibt die Position jeder Eigenschaft in einer topologischen Sortierung des Abhängigkeitsgraphen zurück (Kahn-Algorithmus).
+
+		\note Eigenschaften, die sich gegenseitig voraussetzen, werden ans Ende gestellt.
+		"""
+
+		if self.__prerequisiteOrder is None:
+			incoming = {}
+			for dependents in self.__prerequisiteGraph.values():
+				for trait in dependents:
+					incoming[trait] = incoming.get(trait, 0) + 1
+
+			order = {}
+			ready = collections.deque( source for source in self.__prerequisiteGraph if source not in incoming )
+			while ready:
+				node = ready.popleft()
+				order[node] = len(order)
+				for trait in self.__prerequisiteGraph.get(node, ()):
+					incoming[trait] -= 1
+					if not incoming[trait]:
+						ready.append(trait)
+
+			for trait in incoming:
+				if trait not in order:
+					order[trait] = len(order)
+			self.__prerequisiteOrder = order
 
-		for typ in self.__traits:
-			for category in self.__traits[typ]:
-				for trait in self.__traits[typ][category].values():
-					if type(trait) == StandardTrait and trait.age and trait.age != Config.getAge(self.age) and trait.value > 0:
-						trait.value = 0
+		return self.__prerequisiteOrder
 
 
 
@@ -26,11 +26,13 @@ SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
 
 
 
+from PyQt4.QtCore import pyqtSignal as Signal
 from PyQt4.QtCore import QObject
 
-#import src.Config as Config
+import src.Config as Config
 from src.Error import ErrTraitType
 import src.Debug as Debug
+import src.Work.CompilePrerequisites as CompilePrerequisites
 
 
 
@@ -339,12 +341,265 @@ class StorageTemplate(QObject):
 	# }
 	__automobiles = {}
 
+	# Die Spezies, deren Template-Dateien noch nicht eingelesen wurden, zusammen mit der Funktion, welche dies nachholt.
+	#
+	# {
+	# 	Spezies1: Funktion1,
+	# 	...
+	# }
+	__speciesLoaders = {}
+
+	# Die folgenden Verzeichnisse erlauben den direkten Zugriff auf die Eigenschaften in __traits, ohne sämtliche Typen und Kategorien durchsuchen zu müssen. Sie werden von addTrait() gepflegt und nach importData() neu aufgebaut. Im Zwischenspeicher werden sie nicht abgelegt.
+	#
+	# Typ und Kategorie jeder Eigenschaft:
+	#
+	# {
+	# 	Identifier1: [ (Typ1, Kategorie1), ... ],
+	# 	...
+	# }
+	__identifierIndex = {}
+
+	# Die Identifier aller Eigenschaften eines Namens:
+	#
+	# {
+	# 	(Typ1, Kategorie1, Name1): [ Identifier1, ... ],
+	# 	...
+	# }
+	__nameIndex = {}
+
+	# Die Eigenschaften jeder Spezies. Eigenschaften, die allen Spezies offenstehen, sind unter "" eingetragen.
+	#
+	# {
+	# 	Spezies1: [ (Typ1, Kategorie1, Identifier1), ... ],
+	# 	...
+	# }
+	__speciesIndex = {}
+
+	# Die Eigenschaften, welche nur in einer bestimmten Alterskategorie zur Verfügung stehen.
+	#
+	# {
+	# 	Alter1: [ (Typ1, Kategorie1, Identifier1), ... ],
+	# 	...
+	# }
+	__ageIndex = {}
+
+	# Die Eigenschaften, welche nur in bestimmten Zeitaltern zur Verfügung stehen.
+	#
+	# {
+	# 	Zeitalter1: [ (Typ1, Kategorie1, Identifier1), ... ],
+	# 	...
+	# }
+	__eraIndex = {}
+
+	# Die Eigenschaften, welche nur Charakteren bestimmter Bruten oder Fraktionen zur Verfügung stehen.
+	#
+	# {
+	# 	Brut1: [ (Typ1, Kategorie1, Identifier1), ... ],
+	# 	...
+	# }
+	__onlyIndex = {}
+
+	# Sämtliche Fertigkeiten ohne Unterteilung in Kategorien.
+	#
+	# {
+	# 	Identifier1: { "name": Name1, ... },
+	# 	...
+	# }
+	__skills = {}
+
+	# Die bereits in einen Baum zerlegten Voraussetzungen (siehe CompilePrerequisites.parse()).
+	#
+	# {
+	# 	Text1: Baum1,
+	# 	...
+	# }
+	__prerequisiteTrees = {}
+
+	# Die Vorlagen, nach denen die Eigenschaften eines Charakters erzeugt werden (siehe traitPrototypes()). Wird erst bei Bedarf erstellt.
+	#
+	# [
+	# 	( Typ1, Kategorie1, Identifier1, Schlüssel1, Daten1, Anfangswert1, ),
+	# 	...
+	# ]
+	__traitPrototypes = []
+
+
+	## Wird ausgesandt, nachdem die Template-Daten einer zuvor nicht geladenen Spezies nachträglich eingelesen wurden.
+	speciesLoaded = Signal(str)
 
 
 	def __init__(self, parent=None):
 		super(StorageTemplate, self).__init__(parent)
 
 
+	def __containers(self):
+		"""
+		Gibt alle Listen zurück, in welchen die Template-Daten gespeichert werden, jeweils zusammen mit einem Schlüssel, unter dem sie exportiert werden.
+		"""
+
+		return (
+			( "creationPoints", self.__creationPointsList, ),
+			( "species", self.__species, ),
+			( "speciesGroupNames", self.__speciesGroupNames, ),
+			( "kiths", self.__kiths, ),
+			( "powerNames", self.__powerNames, ),
+			( "traits", self.__traits, ),
+			( "virtues", self.__virtues, ),
+			( "vices", self.__vices, ),
+			( "derangements", self.__derangements, ),
+			( "powerstat", self.__powerstat, ),
+			( "bonusTraits", self.__bonusTraits, ),
+			( "weapons", self.__weapons, ),
+			( "armor", self.__armor, ),
+			( "equipment", self.__equipment, ),
+			( "extraordinaryItems", self.__extraordinaryItems, ),
+			( "automobiles", self.__automobiles, ),
+		)
+
+
+	def exportData(self):
+		"""
+		Gibt sämtliche geladenen Template-Daten als ein einziges dict zurück.
+
+		\note Es werden keine Kopien angelegt.
+
+		\sa importData()
+		"""
+
+		return dict( self.__containers() )
+
+
+	def importData(self, data):
+		"""
+		Ersetzt die gespeicherten Template-Daten durch die in data übergebenen, wie sie von exportData() erzeugt werden.
+
+		Die Listen werden dabei an Ort und Stelle verändert, damit alle Instanzen dieser Klasse weiterhin auf dieselben Daten zugreifen.
+		"""
+
+		self.__speciesLoaders.clear()
+		for name, container in self.__containers():
+			container.clear()
+			if type(container) == list:
+				container.extend( data[name] )
+			else:
+				container.update( data[name] )
+		self.__buildIndexes()
+
+
+	def clear(self):
+		"""
+		Entfernt sämtliche Template-Daten.
+		"""
+
+		for name, container in self.__containers():
+			container.clear()
+		self.__speciesLoaders.clear()
+		for index in self.__indexes():
+			index.clear()
+
+
+	def __indexes(self):
+		return (
+			self.__identifierIndex,
+			self.__nameIndex,
+			self.__speciesIndex,
+			self.__ageIndex,
+			self.__eraIndex,
+			self.__onlyIndex,
+			self.__skills,
+			self.__prerequisiteTrees,
+			self.__traitPrototypes,
+		)
+
+
+	def __buildIndexes(self):
+		"""
+		Baut sämtliche Verzeichnisse der Eigenschaften neu auf.
+		"""
+
+		for index in self.__indexes():
+			index.clear()
+		for typ in self.__traits:
+			for category in self.__traits[typ]:
+				for identifier, data in self.__traits[typ][category].items():
+					self.__indexTrait(typ, category, identifier, data)
+
+
+	def __indexKeys(self, typ, category, identifier, data):
+		"""
+		Gibt die Einträge der Eigenschaft in den Verzeichnissen für Name, Spezies, Alter, Zeitalter und Brut/Fraktion zurück.
+		"""
+
+		return (
+			( self.__nameIndex, ( ( typ, category, data["name"], ), ), identifier, ),
+			( self.__speciesIndex, ( data["species"] or "", ), ( typ, category, identifier, ), ),
+			( self.__ageIndex, ( data["age"], ) if data.get("age") else (), ( typ, category, identifier, ), ),
+			( self.__eraIndex, data.get("era") or (), ( typ, category, identifier, ), ),
+			( self.__onlyIndex, data.get("only") or (), ( typ, category, identifier, ), ),
+		)
+
+
+	def __indexTrait(self, typ, category, identifier, data):
+		self.__identifierIndex.setdefault(identifier, []).append( ( typ, category, ) )
+		for index, keys, entry in self.__indexKeys(typ, category, identifier, data):
+			for key in keys:
+				index.setdefault(key, []).append(entry)
+		if typ == "Skill":
+			self.__skills[identifier] = data
+		if data.get("prerequisites"):
+			self.prerequisiteTree(data["prerequisites"])
+
+
+	def __reindexTrait(self, typ, category, identifier, oldData, data):
+		"""
+		Paßt die Verzeichnisse an, nachdem die Daten einer bereits vorhandenen Eigenschaft ersetzt wurden.
+		"""
+
+		oldKeys = self.__indexKeys(typ, category, identifier, oldData)
+		newKeys = self.__indexKeys(typ, category, identifier, data)
+		if oldKeys != newKeys:
+			for index, keys, entry in oldKeys:
+				for key in keys:
+					index[key].remove(entry)
+			for index, keys, entry in newKeys:
+				for key in keys:
+					index.setdefault(key, []).append(entry)
+		if typ == "Skill":
+			self.__skills[identifier] = data
+		if data.get("prerequisites"):
+			self.prerequisiteTree(data["prerequisites"])
+
+
+	def addSpeciesLoader(self, species, loader):
+		"""
+		Merkt sich eine Spezies, deren Eigenschaften noch nicht eingelesen wurden.
+
+		Erst wenn zum ersten Mal nach dieser Spezies gefragt wird, beispielsweise über breeds() oder powerName(), wird loader aufgerufen, um die Daten nachzuladen.
+
+		\sa loadSpecies()
+		"""
+
+		self.__speciesLoaders[species] = loader
+
+
+	def isSpeciesLoaded(self, species):
+		return species not in self.__speciesLoaders
+
+
+	def loadSpecies(self, species):
+		"""
+		Lädt die Template-Daten der angegebenen Spezies, falls dies noch nicht geschehen ist.
+
+		Nach dem Laden wird das Signal speciesLoaded ausgesandt.
+		"""
+
+		loader = self.__speciesLoaders.pop(species, None)
+		if loader is not None:
+			Debug.debug( "Loading template data of species \"{}\".".format(species), level=2 )
+			loader()
+			self.speciesLoaded.emit(species)
+
+
 	def __getTyps(self):
 		return self.__traits.keys()
 
@@ -352,7 +607,8 @@ class StorageTemplate(QObject):
 
 
 	def categories(self, typ):
-		listOfCategories = list( self.__traits[typ].keys() )
+		## Solange keine Spezies geladen wurde, welche Eigenschaften dieses Typs besitzt, gibt es auch keine Kategorien.
+		listOfCategories = list( self.__traits.get(typ, {}).keys() )
 		listOfCategories.sort()
 		return listOfCategories
 
@@ -372,15 +628,140 @@ class StorageTemplate(QObject):
 
 	def __setTraits(self, traits):
 		self.__traits = traits
+		self.__buildIndexes()
 
 	traits = property(__getTraits, __setTraits)
 
 	def traitSkills(self):
-		result = {}
-		for category in self.__traits["Skill"]:
-			result.update(self.__traits["Skill"][category])
+		"""
+		Gibt sämtliche Fertigkeiten ohne Unterteilung in Kategorien zurück.
 
-		return result
+		\note Das zurückgegebene dict wird von dieser Klasse gepflegt und darf nicht verändert werden.
+		"""
+
+		return self.__skills
+
+
+	def traitLocation(self, identifier):
+		"""
+		Gibt Typ und Kategorie der Eigenschaft identifier als Tupel zurück.
+
+		\note Tragen Eigenschaften unterschiedlicher Typen denselben Identifier, wird die Eigenschaft des zuerst eingelesenen Typs zurückgegeben. Existiert keine Eigenschaft dieses Identifiers, wird None zurückgegeben.
+		"""
+
+		locations = self.__identifierIndex.get(identifier)
+		if not locations:
+			return None
+		elif len(locations) == 1:
+			return locations[0]
+
+		typs = list(self.__traits.keys())
+		return min(locations, key=lambda location: typs.index(location[0]))
+
+
+	def traitCategory(self, typ, identifier):
+		"""
+		Gibt die Kategorie der Eigenschaft identifier des angegebenen Typs zurück oder None, falls es keine solche Eigenschaft gibt.
+		"""
+
+		for location in self.__identifierIndex.get(identifier, ()):
+			if location[0] == typ:
+				return location[1]
+		return None
+
+
+	def traitIdentifiers(self, typ, category, name):
+		"""
+		Gibt die Identifier aller Eigenschaften des angegebenen Typs und der angegebenen Kategorie zurück, welche den Namen name tragen.
+		"""
+
+		return self.__nameIndex.get( ( typ, category, name, ), [] )
+
+
+	def prerequisiteTree(self, text):
+		"""
+		Gibt die Voraussetzungen text als Baum zurück, wie ihn CompilePrerequisites.parse() erzeugt.
+
+		Jeder Text wird nur ein einziges Mal zerlegt, normalerweise schon beim Einlesen der Template-Dateien.
+		"""
+
+		if text not in self.__prerequisiteTrees:
+			self.__prerequisiteTrees[text] = CompilePrerequisites.parse(text)
+		return self.__prerequisiteTrees[text]
+
+
+	def traitsOfSpecies(self, species):
+		"""
+		Gibt alle Eigenschaften der angegebenen Spezies als Liste von Tupeln (Typ, Kategorie, Identifier) zurück.
+
+		\note Eigenschaften, welche allen Spezies offenstehen, erhält man mit species="".
+		"""
+
+		return self.__speciesIndex.get(species, [])
+
+
+	def traitsOfAge(self, age):
+		"""
+		Gibt alle Eigenschaften als Liste von Tupeln (Typ, Kategorie, Identifier) zurück, welche ausschließlich Charakteren der Alterskategorie age zur Verfügung stehen.
+		"""
+
+		return self.__ageIndex.get(age, [])
+
+
+	def traitAges(self):
+		"""
+		Gibt alle Alterskategorien zurück, auf welche wenigstens eine Eigenschaft beschränkt ist.
+		"""
+
+		return self.__ageIndex.keys()
+
+
+	def traitsOfEra(self, era):
+		"""
+		Gibt alle Eigenschaften als Liste von Tupeln (Typ, Kategorie, Identifier) zurück, welche nur in bestimmten Zeitaltern, darunter era, zur Verfügung stehen.
+		"""
+
+		return self.__eraIndex.get(era, [])
+
+
+	def visibilityBuckets(self, reason):
+		"""
+		Gibt das Verzeichnis zurück, in welchem für den Grund reason (siehe Config.TRAIT_HIDDEN_SPECIES etc.) jeder Spezies, Alterskategorie, Ära bzw. Brut/Fraktion die Eigenschaften zugeordnet sind, welche nur für diese sichtbar sind.
+
+		\note Im Verzeichnis der Spezies stehen unter "" auch die Eigenschaften, die allen Spezies offenstehen.
+		"""
+
+		return {
+			Config.TRAIT_HIDDEN_SPECIES: self.__speciesIndex,
+			Config.TRAIT_HIDDEN_AGE: self.__ageIndex,
+			Config.TRAIT_HIDDEN_ERA: self.__eraIndex,
+			Config.TRAIT_HIDDEN_ONLY: self.__onlyIndex,
+		}[reason]
+
+
+	def traitPrototypes(self):
+		"""
+		Gibt die Vorlagen aller Eigenschaften zurück, nach denen StorageCharacter in einem einzigen Durchlauf die Eigenschaften eines Charakters erzeugt.
+
+		Jede Vorlage ist ein Tupel (Typ, Kategorie, Identifier, Schlüssel, Daten, Anfangswert). Eigenschaften, die Zusatztext erhalten können (bspw. Language), erhalten Config.MULTIPLE_TRAITS_MAX Vorlagen, deren Schlüssel um ein numerisches Suffix erweitert ist. Die unveränderlichen Angaben (Spezies, Alter, Zeitalter, Voraussetzungen etc.) werden nicht kopiert, sondern stehen in den Daten, welche sich alle Charaktere teilen.
+
+		\note Die Vorlagen werden beim ersten Aufruf erstellt und verworfen, sobald sich die Eigenschaften ändern.
+		"""
+
+		if not self.__traitPrototypes:
+			for typ in self.__traits:
+				## Attribute beginnen mit einem Punkt, alle übrigen Eigenschaften mit keinem.
+				value = 0
+				if typ == "Attribute":
+					value = 1
+				for category in self.__traits[typ]:
+					for identifier, data in self.__traits[typ][category].items():
+						if typ != "Subpower" and data["custom"]:
+							for i in range(Config.MULTIPLE_TRAITS_MAX):
+								self.__traitPrototypes.append( ( typ, category, identifier, "{}{}".format(identifier, i), data, value, ) )
+						else:
+							self.__traitPrototypes.append( ( typ, category, identifier, identifier, data, value, ) )
+		return self.__traitPrototypes
 
 
 	def addTrait( self, typ, category, identifier, data):
@@ -404,15 +785,20 @@ class StorageTemplate(QObject):
 		if category not in self.__traits[typ]:
 			self.__traits[typ].setdefault(category,{})
 
+		self.__traitPrototypes.clear()
+
 		if identifier not in self.__traits[typ][category]:
 			self.__traits[typ][category][identifier] = data
+			self.__indexTrait(typ, category, identifier, data)
 		elif (typ != "Subpower"):
 			#Debug.debug(data["name"])
-			specialties = self.__traits[typ][category][identifier]["specialties"]
+			oldData = self.__traits[typ][category][identifier]
+			specialties = oldData["specialties"]
 			specialties.extend(data["specialties"])
 			specialties.sort()
 			self.__traits[typ][category][identifier] = data
 			self.__traits[typ][category][identifier]["specialties"] = specialties
+			self.__reindexTrait(typ, category, identifier, oldData, data)
 
 
 	def traitNames( self, typ, category, era=None, age=None ):
@@ -431,6 +817,7 @@ class StorageTemplate(QObject):
 
 
 	def powerName(self, species):
+		self.loadSpecies(species)
 		return self.__powerNames[species]["Power"]
 
 	def setPowerName(self, species, name):
@@ -441,6 +828,7 @@ class StorageTemplate(QObject):
 
 
 	def subPowerName(self, species):
+		self.loadSpecies(species)
 		return self.__powerNames[species]["Subpower"]
 
 	def setSubPowerName(self, species, name):
@@ -474,6 +862,7 @@ class StorageTemplate(QObject):
 
 
 	def derangementList( self, species, parentDerangement=None ):
+		self.loadSpecies(species)
 		result = []
 		if parentDerangement == None:
 			for item in self.__derangements:
@@ -500,16 +889,19 @@ class StorageTemplate(QObject):
 
 
 	def breeds(self, species):
+		self.loadSpecies(species)
 		result = list( self.__speciesGroupNames[species]["Breed"][1].keys() )
 		result.sort()
 		return result
 
 
 	def breedTitle(self, species):
+		self.loadSpecies(species)
 		return self.__speciesGroupNames[species]["Breed"][0]
 
 
 	def breedBlessing(self, species, breed):
+		self.loadSpecies(species)
 		if breed and "blessing" in self.__speciesGroupNames[species]["Breed"][1][breed]:
 			return self.__speciesGroupNames[species]["Breed"][1][breed]["blessing"]
 		else:
@@ -517,6 +909,7 @@ class StorageTemplate(QObject):
 
 
 	def breedCurse(self, species, breed):
+		self.loadSpecies(species)
 		if breed and "weakness" in self.__speciesGroupNames[species]["Breed"][1][breed]:
 			return self.__speciesGroupNames[species]["Breed"][1][breed]["weakness"]
 		else:
@@ -567,26 +960,31 @@ class StorageTemplate(QObject):
 
 
 	def factions(self, species):
+		self.loadSpecies(species)
 		result = list( self.__speciesGroupNames[species]["Faction"][1].keys() )
 		result.sort()
 		return result
 
 
 	def factionTitle(self, species):
+		self.loadSpecies(species)
 		return self.__speciesGroupNames[species]["Faction"][0]
 
 
 	def organisations(self, species):
+		self.loadSpecies(species)
 		result = list( self.__speciesGroupNames[species]["Organisation"][1].keys() )
 		result.sort()
 		return result
 
 
 	def organisationTitle(self, species):
+		self.loadSpecies(species)
 		return self.__speciesGroupNames[species]["Organisation"][0]
 
 
 	def organisationCurse(self, species, organisation):
+		self.loadSpecies(species)
 		if organisation in self.__speciesGroupNames[species]["Organisation"][1] and "weakness" in self.__speciesGroupNames[species]["Organisation"][1][organisation]:
 			return self.__speciesGroupNames[species]["Organisation"][1][organisation]["weakness"]
 		else:
@@ -594,6 +992,7 @@ class StorageTemplate(QObject):
 
 
 	def partyTitle(self, species):
+		self.loadSpecies(species)
 		return self.__speciesGroupNames[species]["Party"][0]
 
 
@@ -610,6 +1009,7 @@ class StorageTemplate(QObject):
 
 
 	def fuelMax(self, species, powerstat):
+		self.loadSpecies(species)
 		if powerstat > 0:
 			#Debug.debug("{} -> {}".format(powerstat, self.__powerstat[species][powerstat]))
 			return self.__powerstat[species][powerstat]["fuelMax"]
@@ -618,6 +1018,7 @@ class StorageTemplate(QObject):
 
 
 	def fuelPerTurn(self, species, powerstat):
+		self.loadSpecies(species)
 		if powerstat > 0:
 			return self.__powerstat[species][powerstat]["fuelPerTurn"]
 		else:
@@ -625,6 +1026,7 @@ class StorageTemplate(QObject):
 
 
 	def maxTrait(self, species, powerstat):
+		self.loadSpecies(species)
 		if powerstat > 0:
 			return self.__powerstat[species][powerstat]["traitMax"]
 		else:
@@ -680,6 +1082,7 @@ class StorageTemplate(QObject):
 
 		if name not in self.__traits[typ][category]:
 			self.__traits[typ][category].setdefault(name, data)
+			self.__indexTrait(typ, category, name, data)
 
 		## Kontrolle zu Debugzwecken:
 		#keys = self.__traits.keys()
@@ -745,6 +1148,7 @@ class StorageTemplate(QObject):
 
 
 	def bonusTraits(self, species, breed):
+		self.loadSpecies(species)
 		if species in self.__bonusTraits and breed in self.__bonusTraits[species]:
 			return self.__bonusTraits[species][breed]
 		else:
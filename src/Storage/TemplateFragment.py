@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+class TemplateFragment(object):
+	"""
+	@brief Zeichnet die Aufrufe auf, mit denen ein StorageTemplate gefüllt werden würde.
+
+	Anstelle eines StorageTemplate-Objekts kann ReadXmlTemplate auch ein Objekt dieser Klasse übergeben werden. Sämtliche Aufrufe von Methoden wie addTrait(), appendSpecies() etc. werden dann nur samt ihrer Argumente aufgezeichnet. Diese Aufzeichnung besteht ausschließlich aus einfachen Python-Datentypen und kann daher auch zwischen Prozessen ausgetauscht werden.
+
+	Mit replay() werden die aufgezeichneten Aufrufe in der ursprünglichen Reihenfolge an einem echten StorageTemplate ausgeführt. Werden mehrere Fragmente in einer festen Reihenfolge abgespielt, ist das Ergebnis identisch mit dem direkten Einlesen in dieser Reihenfolge.
+	"""
+
+
+	def __init__(self, calls=None):
+		if calls is None:
+			calls = []
+		self.__calls = calls
+
+
+	@property
+	def calls(self):
+		"""
+		Liste der aufgezeichneten Aufrufe im Format [ (Methodenname, args, kwargs), ... ].
+		"""
+
+		return self.__calls
+
+
+	def __getattr__(self, name):
+		if name.startswith("_"):
+			raise AttributeError(name)
+
+		def record(*args, **kwargs):
+			self.__calls.append( ( name, args, kwargs, ) )
+
+		return record
+
+
+	def replay(self, storage):
+		"""
+		Führt alle aufgezeichneten Aufrufe an storage aus.
+		"""
+
+		for name, args, kwargs in self.__calls:
+			getattr(storage, name)(*args, **kwargs)
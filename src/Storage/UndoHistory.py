@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+from PyQt4.QtCore import pyqtSignal as Signal
+from PyQt4.QtCore import QObject, QTimer
+
+import src.Config as Config
+
+
+
+
+## Ein Delta, welches ein Attribut verändert: ( VALUE, Objekt, Attribut, alter Wert, neuer Wert, )
+VALUE = 0
+## Ein Delta, welches über Methodenaufrufe rückgängig gemacht wird, bspw. das Hinzufügen einer Waffe: ( CALL, Funktion, Argumente, Funktion, Argumente, ) für Undo bzw. Redo.
+CALL = 1
+
+
+
+
+class UndoHistory(QObject):
+	"""
+	@brief Ermöglicht es, Änderungen am Charakter rückgängig zu machen und wiederherzustellen.
+
+	Anstelle ganzer Abbilder des Charakters werden nur die einzelnen Änderungen (Deltas) gespeichert. Der Speicherbedarf wächst daher mit der Anzahl der Änderungen und nicht mit der Größe des Charakters.
+
+	Alle Deltas, welche innerhalb eines Durchlaufs der Event-Loop anfallen, stammen von derselben Aktion des Benutzers und bilden einen einzigen Schritt. Aufeinanderfolgende Schritte, welche nur denselben Text verändern, werden zusammengefaßt, damit nicht jeder Tastendruck einzeln rückgängig gemacht werden muß.
+
+	Ein Schritt wird innerhalb von StorageCharacter.batch() wiederhergestellt, so daß Voraussetzungen und Erschaffungspunkte nur einmal je Schritt neu berechnet werden. Während des Wiederherstellens, beim Laden und beim Zurücksetzen des Charakters werden keine Deltas aufgezeichnet.
+	"""
+
+
+	canUndoChanged = Signal(bool)
+	canRedoChanged = Signal(bool)
+
+
+	def __init__(self, character, parent=None):
+		super(UndoHistory, self).__init__(parent)
+
+		self.__character = character
+
+		self.__undoSteps = []
+		self.__redoSteps = []
+		## Der Schritt, welcher gerade aufgezeichnet wird. Er liegt bereits ganz oben auf __undoSteps.
+		self.__step = None
+		self.__replaying = False
+
+		self.__canUndo = False
+		self.__canRedo = False
+
+
+	def canUndo(self):
+		return bool(self.__undoSteps)
+
+
+	def canRedo(self):
+		return bool(self.__redoSteps)
+
+
+	def recordValue(self, target, name, old, new):
+		"""
+		Vermerkt, daß das Attribut name von target von old auf new geändert wird.
+		"""
+
+		self.__record( ( VALUE, target, name, old, new, ) )
+
+
+	def recordCall(self, undo, undoArgs, redo, redoArgs):
+		"""
+		Vermerkt eine Änderung, welche durch den Aufruf undo(*undoArgs) rückgängig gemacht und durch redo(*redoArgs) wiederhergestellt wird.
+		"""
+
+		self.__record( ( CALL, undo, undoArgs, redo, redoArgs, ) )
+
+
+	def __record(self, delta):
+		if self.__replaying or self.__character.isLoading:
+			return
+
+		if self.__step is None:
+			self.__step = []
+			self.__undoSteps.append(self.__step)
+			if len(self.__undoSteps) > Config.UNDO_STEPS_MAX:
+				del self.__undoSteps[0]
+			QTimer.singleShot(0, self.endStep)
+		self.__step.append(delta)
+		del self.__redoSteps[:]
+		self.__emitState()
+
+
+	def endStep(self):
+		"""
+		Schließt den gerade aufgezeichneten Schritt ab.
+
+		Normalerweise geschieht dies automatisch im nächsten Durchlauf der Event-Loop.
+		"""
+
+		step = self.__step
+		self.__step = None
+		if step is None or len(self.__undoSteps) < 2:
+			return
+
+		## Tippt der Benutzer einen Text, wird der neue Schritt mit dem vorigen zusammengefaßt.
+		previous = self.__undoSteps[-2]
+		if len(step) == 1 and len(previous) == 1 and step[0][0] == VALUE and previous[0][0] == VALUE:
+			kind, target, name, old, new = step[0]
+			if type(new) == str and previous[0][1] == target and previous[0][2] == name:
+				previous[0] = ( VALUE, target, name, previous[0][3], new, )
+				self.__undoSteps.pop()
+
+
+	def undo(self):
+		"""
+		Macht den letzten Schritt rückgängig.
+		"""
+
+		self.endStep()
+		if self.__undoSteps:
+			step = self.__undoSteps.pop()
+			self.__replay(step, True)
+			self.__redoSteps.append(step)
+			self.__emitState()
+
+
+	def redo(self):
+		"""
+		Stellt den zuletzt rückgängig gemachten Schritt wieder her.
+		"""
+
+		self.endStep()
+		if self.__redoSteps:
+			step = self.__redoSteps.pop()
+			self.__replay(step, False)
+			self.__undoSteps.append(step)
+			self.__emitState()
+
+
+	def clear(self):
+		"""
+		Verwirft alle Schritte, bspw. nachdem ein anderer Charakter geladen wurde.
+		"""
+
+		self.__step = None
+		del self.__undoSteps[:]
+		del self.__redoSteps[:]
+		self.__emitState()
+
+
+	def __replay(self, step, undo):
+		"""
+		Macht die Deltas von step rückgängig (undo=True) oder stellt sie wieder her.
+
+		Da jede Änderung über die Signale des Charakters weitere Änderungen auslösen kann (bspw. setzt ein Wechsel der Spezies die Brut zurück), werden am Ende alle Attribute noch einmal auf den Wert gesetzt, den sie nach diesem Schritt haben müssen.
+		"""
+
+		if undo:
+			deltas = step[::-1]
+		else:
+			deltas = step
+
+		self.__replaying = True
+		try:
+			with self.__character.batch():
+				values = {}
+				for delta in deltas:
+					if delta[0] == VALUE:
+						kind, target, name, old, new = delta
+						value = old if undo else new
+						setattr(target, name, value)
+						values[( target, name, )] = value
+					elif undo:
+						delta[1](*delta[2])
+					else:
+						delta[3](*delta[4])
+
+				for ( target, name, ), value in values.items():
+					setattr(target, name, value)
+		finally:
+			self.__replaying = False
+
+
+	def __emitState(self):
+		canUndo = self.canUndo()
+		if canUndo != self.__canUndo:
+			self.__canUndo = canUndo
+			self.canUndoChanged.emit(canUndo)
+		canRedo = self.canRedo()
+		if canRedo != self.__canRedo:
+			self.__canRedo = canRedo
+			self.canRedoChanged.emit(canRedo)
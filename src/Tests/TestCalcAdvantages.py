@@ -62,7 +62,7 @@ class TestCalcAdvantages(unittest.TestCase):
 		self._storage = StorageTemplate()
 
 		## Templete füllen
-		reader = ReadXmlTemplate( self._storage )
+		reader = ReadXmlTemplate( self._storage, useCache=False )
 		reader.read()
 
 		## Einen Dummy-Charakter anlegen
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+
+
+import unittest
+
+from src.Storage.StorageTemplate import StorageTemplate
+from src.Storage.StorageCharacter import StorageCharacter
+from src.IO.ReadXmlTemplate import ReadXmlTemplate
+import src.Work.ConnectPrerequisites as ConnectPrerequisites
+
+
+
+
+class TestLazyTemplate(unittest.TestCase):
+	"""
+	Testfunktionen für das verzögerte Laden der Template-Daten einzelner Spezies.
+	"""
+
+	def setUp(self):
+		## Die Template-Daten werden von allen Instanzen von StorageTemplate geteilt und könnten bereits vollständig eingelesen worden sein.
+		self._storage = StorageTemplate()
+		self._storage.clear()
+		ReadXmlTemplate( self._storage, useCache=False, lazy=True ).read()
+
+		self._character = StorageCharacter( self._storage )
+		ConnectPrerequisites.build_connection( self._storage, self._character )
+		self._character.resetCharacter()
+
+
+	def tearDown(self):
+		## Die folgenden Tests sollen nicht auf die noch nicht geladenen Spezies stoßen.
+		self._storage.clear()
+		self._character = None
+		self._storage   = None
+
+
+	def test__header(self):
+		"""
+		Spezies und Erschaffungspunkte stehen zur Verfügung, ohne daß die Spezies geladen wird.
+		"""
+
+		self.assertFalse( self._storage.isSpeciesLoaded( "Vampire" ) )
+		self.assertIn( "Vampire", self._storage.species )
+		self.assertIn( "Vampire", self._storage.creationPoints )
+		self.assertFalse( self._storage.isSpeciesLoaded( "Vampire" ) )
+		self.assertNotIn( "Power", self._character.traits )
+
+
+	def test__loadSpecies(self):
+		"""
+		Beim Wechsel zu einer noch nicht geladenen Spezies erhält der Charakter deren Eigenschaften, verknüpft mit ihren Voraussetzungen.
+		"""
+
+		addedSpecies = []
+		self._character.traitsAdded.connect( addedSpecies.append )
+
+		self._character.species = "Vampire"
+		self.assertTrue( self._storage.isSpeciesLoaded( "Vampire" ) )
+		self.assertEqual( addedSpecies, [ "Vampire" ] )
+		self.assertIn( "Disciplines", self._character.traits["Power"] )
+
+		cant_fluency = self._character.traitsByName( "Merit", "Mental", "Cant Fluency" )[0]
+		occult = self._character.traits["Skill"]["Mental"]["Occult"]
+		self.assertFalse( cant_fluency.isAvailable() )
+		occult.value = 1
+		self.assertTrue( cant_fluency.isAvailable() )
+
+		## Die Eigenschaften anderer Spezies sind verborgen, auch wenn sie erst nachträglich hinzukommen.
+		self._character.species = "Mage"
+		self.assertEqual( addedSpecies, [ "Vampire", "Mage" ] )
+		self.assertTrue( cant_fluency.hiddenReasons )
+		self.assertFalse( self._character.traits["Power"]["Arcana"]["Death"].hiddenReasons )
+
+		## Jede Spezies wird nur ein einziges Mal geladen.
+		self._character.species = "Vampire"
+		self.assertEqual( addedSpecies, [ "Vampire", "Mage" ] )
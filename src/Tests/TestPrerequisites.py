@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+import unittest
+
+import src.Config as Config
+
+from src.Storage.StorageTemplate import StorageTemplate
+from src.Storage.StorageCharacter import StorageCharacter
+from src.IO.ReadXmlTemplate import ReadXmlTemplate
+import src.Work.CompilePrerequisites as CompilePrerequisites
+import src.Work.ConnectPrerequisites as ConnectPrerequisites
+from src.Error import ErrTraitPrerequisite
+
+
+
+
+class TestPrerequisites(unittest.TestCase):
+	"""
+	Testfunktionen für das Zerlegen und Überprüfen der Voraussetzungen.
+	"""
+
+	def setUp(self):
+		## Dummy-Template anlegen
+		self._storage = StorageTemplate()
+
+		## Templete füllen
+		reader = ReadXmlTemplate( self._storage, useCache=False )
+		reader.read()
+
+		## Einen Dummy-Charakter anlegen
+		self._character = StorageCharacter( self._storage )
+		ConnectPrerequisites.build_connection( self._storage, self._character )
+
+
+	def tearDown(self):
+		self._character = None
+		self._storage   = None
+
+
+	def test__parse(self):
+		"""
+		Überprüft, daß Verweise mit Leerzeichen, Doppelpunkten und Spezialisierungen erkannt werden und "and" stärker bindet als "or".
+		"""
+
+		tree = CompilePrerequisites.parse( "Merit.Hollow: Doors > 0 or Merit.Fighting Finesse > 1 and Skill.Crafts.Demolitions > 2" )
+		self.assertEqual( tree, ( "or", (
+			( "compare", ">", ( "reference", "Merit.Hollow: Doors" ), ( "number", 0 ) ),
+			( "and", (
+				( "compare", ">", ( "reference", "Merit.Fighting Finesse" ), ( "number", 1 ) ),
+				( "compare", ">", ( "reference", "Skill.Crafts.Demolitions" ), ( "number", 2 ) ),
+			) ),
+		) ) )
+
+		for text in ( "Merit.Fame", "Merit.Fame > ", "(Merit.Fame < 1", "Merit.Fame < 1 and", "Merit.Fame => 1", ):
+			self.assertRaises( ErrTraitPrerequisite, CompilePrerequisites.parse, text )
+
+
+	def test__compile_tree(self):
+		"""
+		Überprüft die aus dem Baum erzeugte Funktion mit frei gewählten Werten.
+		"""
+
+		values = {}
+		function = CompilePrerequisites.compile_tree(
+			CompilePrerequisites.parse( "(A.a > 1 or A.b >= 3) and (B.c == 2 or 4 < B.c)" ),
+			lambda reference: lambda: values[reference]
+		)
+		for a in range(4):
+			for b in range(4):
+				for c in range(6):
+					values.update( { "A.a": a, "A.b": b, "B.c": c, } )
+					self.assertEqual( function(), ( a > 1 or b >= 3 ) and ( c == 2 or 4 < c ) )
+
+
+	def test__prerequisites(self):
+		"""
+		Überprüft, daß die Verfügbarkeit von Merits den Werten der Voraussetzungen folgt.
+		"""
+
+		dexterity = self._character.traits["Attribute"]["Physical"]["Dexterity"]
+		wits = self._character.traits["Attribute"]["Mental"]["Wits"]
+		crafts = self._character.traits["Skill"]["Mental"]["Crafts"]
+		fast_reflexes = self._character.traits["Merit"]["Physical"]["Fast Reflexes"]
+		eod = self._character.traits["Merit"]["Mental"]["EOD"]
+
+		for value in range( 1, 6 ):
+			dexterity.value = value
+			self.assertEqual( fast_reflexes.isAvailable(), value > 2 )
+
+		dexterity.value = 1
+		wits.value = 3
+		crafts.value = 3
+		crafts.specialties = []
+		self.assertFalse( eod.isAvailable() )
+		crafts.specialties = [ "Explosives" ]
+		self.assertTrue( eod.isAvailable() )
+		crafts.value = 2
+		self.assertFalse( eod.isAvailable() )
+
+
+	def test__powerstat(self):
+		"""
+		Auch Voraussetzungen, die nur aus der Supereigenschaft bestehen, werden überprüft.
+		"""
+
+		trait = self._character.traits["Merit"]["Extraordinary"]["Sublime"]
+		for value in range( Config.TRAIT_POWERSTAT_VALUE_MIN, Config.TRAIT_POWERSTAT_VALUE_MAX + 1 ):
+			self._character.powerstat = value
+			self.assertEqual( trait.isAvailable(), value > 8 )
+
+
+	def test__batch(self):
+		"""
+		Innerhalb von StorageCharacter.batch() werden die Voraussetzungen erst am Ende und dann je Eigenschaft nur einmal überprüft.
+		"""
+
+		dexterity = self._character.traits["Attribute"]["Physical"]["Dexterity"]
+		fast_reflexes = self._character.traits["Merit"]["Physical"]["Fast Reflexes"]
+
+		dexterity.value = 1
+
+		changes = []
+		fast_reflexes.availableChanged.connect( changes.append )
+		with self._character.batch():
+			for value in ( 2, 3, 4, 5, 4, ):
+				dexterity.value = value
+			self.assertFalse( fast_reflexes.isAvailable() )
+			self.assertEqual( changes, [] )
+		self.assertTrue( fast_reflexes.isAvailable() )
+		self.assertEqual( changes, [ True ] )
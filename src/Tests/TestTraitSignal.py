@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+
+
+
+
+import gc
+import unittest
+
+from PyQt4.QtCore import QObject
+
+from src.Datatypes.AbstractTrait import AbstractTrait
+
+
+
+
+class Receiver(object):
+	"""
+	Empfängt die Signale einer Eigenschaft.
+	"""
+
+	def __init__(self, values):
+		self.__values = values
+
+
+	def setValue(self, value):
+		self.__values.append(value)
+
+
+
+
+class TestTraitSignal(unittest.TestCase):
+	"""
+	Testfunktionen für die Verbindungen der Signale von Eigenschaften.
+	"""
+
+	def setUp(self):
+		self._trait = AbstractTrait("Strength", 1)
+
+
+	def tearDown(self):
+		self._trait = None
+
+
+	def test__boundMethod(self):
+		"""
+		Die Verbindung zu einer gebundenen Methode hält deren Objekt nicht am Leben und wird mit ihm gelöst.
+		"""
+
+		values = []
+		receiver = Receiver(values)
+		self._trait.valueChanged.connect(receiver.setValue)
+		self._trait.value = 2
+		self.assertEqual( values, [ 2 ] )
+
+		del receiver
+		gc.collect()
+		self._trait.value = 3
+		self.assertEqual( values, [ 2 ] )
+		self.assertEqual( self._trait._store.connections, {} )
+
+
+	def test__receiver(self):
+		"""
+		Die Verbindung zu einer lambda-Funktion wird gelöst, sobald der angegebene Empfänger zerstört wird.
+		"""
+
+		values = []
+		parent = QObject()
+		receiver = QObject(parent)
+		self._trait.valueChanged.connect(lambda value: values.append(value), receiver)
+		self._trait.value = 2
+		self.assertEqual( values, [ 2 ] )
+
+		## Mit dem Elternobjekt wird auch der Empfänger zerstört.
+		del parent
+		gc.collect()
+		self._trait.value = 3
+		self.assertEqual( values, [ 2 ] )
+		self.assertEqual( self._trait._store.connections, {} )
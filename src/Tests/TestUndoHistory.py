@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.Storage.StorageTemplate import StorageTemplate
+from src.Storage.StorageCharacter import StorageCharacter
+from src.IO.ReadXmlTemplate import ReadXmlTemplate
+from src.IO.ReadXmlCharacter import ReadXmlCharacter
+from src.IO.WriteXmlCharacter import WriteXmlCharacter, etree
+import src.Work.ConnectPrerequisites as ConnectPrerequisites
+
+
+
+
+class TestUndoHistory(unittest.TestCase):
+	"""
+	Testfunktionen für das Rückgängigmachen und Wiederherstellen von Änderungen am Charakter.
+	"""
+
+	def setUp(self):
+		self._storage = StorageTemplate()
+		ReadXmlTemplate( self._storage, useCache=False ).read()
+
+		self._character = StorageCharacter( self._storage )
+		ConnectPrerequisites.build_connection( self._storage, self._character )
+		self._character.resetCharacter()
+
+
+	def tearDown(self):
+		self._character = None
+		self._storage   = None
+
+
+	def test__step(self):
+		"""
+		Alle Änderungen eines Schrittes werden gemeinsam rückgängig gemacht und wiederhergestellt, die Voraussetzungen werden dabei neu überprüft.
+		"""
+
+		dexterity = self._character.traits["Attribute"]["Physical"]["Dexterity"]
+		fast_reflexes = self._character.traits["Merit"]["Physical"]["Fast Reflexes"]
+		history = self._character.history
+
+		self.assertFalse( history.canUndo() )
+		dexterity.value = 2
+		dexterity.value = 3
+		self._character.virtue = self._storage.virtues[1]["name"]
+		history.endStep()
+		self.assertTrue( fast_reflexes.isAvailable() )
+
+		self._character.undo()
+		self.assertEqual( dexterity.value, 1 )
+		self.assertEqual( self._character.virtue, self._storage.virtues[0]["name"] )
+		self.assertFalse( fast_reflexes.isAvailable() )
+		self.assertFalse( history.canUndo() )
+		self.assertTrue( history.canRedo() )
+
+		self._character.redo()
+		self.assertEqual( dexterity.value, 3 )
+		self.assertEqual( self._character.virtue, self._storage.virtues[1]["name"] )
+		self.assertTrue( fast_reflexes.isAvailable() )
+
+
+	def test__text(self):
+		"""
+		Aufeinanderfolgende Änderungen desselben Textes werden zu einem Schritt zusammengefaßt, Gegenstände werden wieder entfernt.
+		"""
+
+		for text in ( "A", "Ab", "Abc", ):
+			self._character.description = text
+			self._character.history.endStep()
+		self._character.addEquipment( "Rope" )
+		self._character.history.endStep()
+
+		self._character.undo()
+		self.assertEqual( self._character.equipment, [] )
+		self.assertEqual( self._character.description, "Abc" )
+		self._character.undo()
+		self.assertEqual( self._character.description, "" )
+		self.assertFalse( self._character.history.canUndo() )
+
+
+	def test__specialties(self):
+		"""
+		Auch Spezialisierungen, die einzeln hinzugefügt oder entfernt werden, können rückgängig gemacht werden. Spätere Änderungen verfälschen die aufgezeichneten Schritte nicht.
+		"""
+
+		crafts = self._character.traits["Skill"]["Mental"]["Crafts"]
+		history = self._character.history
+
+		crafts.appendSpecialty( "Explosives" )
+		history.endStep()
+		self.assertTrue( history.canUndo() )
+		self._character.undo()
+		self.assertEqual( crafts.specialties, [] )
+
+		specialties = [ "A" ]
+		crafts.specialties = specialties
+		history.endStep()
+		specialties.append( "C" )
+		crafts.appendSpecialty( "B" )
+		history.endStep()
+		crafts.removeSpecialty( "A" )
+		history.endStep()
+		self.assertEqual( crafts.specialties, [ "B" ] )
+
+		self._character.undo()
+		self._character.undo()
+		self.assertEqual( crafts.specialties, [ "A" ] )
+		self._character.undo()
+		self._character.redo()
+		self.assertEqual( crafts.specialties, [ "A" ] )
+		self._character.redo()
+		self.assertEqual( crafts.specialties, [ "A", "B" ] )
+
+
+	def test__loading(self):
+		"""
+		Nach dem Laden eines Charakters gibt es nichts rückgängig zu machen.
+		"""
+
+		dexterity = self._character.traits["Attribute"]["Physical"]["Dexterity"]
+		dexterity.value = 3
+		self._character.description = "Loaded"
+
+		directory = tempfile.mkdtemp()
+		try:
+			fileName = os.path.join( directory, "character.chr" )
+			etree.ElementTree( WriteXmlCharacter( self._character ).buildXmlTree() ).write( fileName )
+
+			dexterity.value = 1
+			with self._character.loading():
+				ReadXmlCharacter( self._character ).read( fileName )
+		finally:
+			shutil.rmtree( directory )
+
+		self._character.history.endStep()
+		self.assertEqual( dexterity.value, 3 )
+		self.assertEqual( self._character.description, "Loaded" )
+		self.assertFalse( self._character.isLoading )
+		self.assertFalse( self._character.isModifed() )
+		self.assertFalse( self._character.history.canUndo() )
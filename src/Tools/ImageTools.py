@@ -29,6 +29,11 @@ SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
 import sys
 import os
 
+from PyQt4.QtCore import QByteArray, QBuffer, QIODevice
+from PyQt4.QtGui import QImageReader
+
+import src.Config as Config
+
 
 
 
@@ -43,3 +48,32 @@ def gender_symbol(gender):
 		return "♂"
 	else:
 		return "⚥"
+
+
+def encode_base64(image, imageFormat=Config.CHARACTER_PIC_FORMAT):
+	"""
+	Gibt das Bild im Format imageFormat als base64-kodierten Text zurück, wie er in den gespeicherten Charakteren und im Charakterbogen verwendet wird.
+	"""
+
+	imageData = QByteArray()
+	imageBuffer = QBuffer(imageData)
+	imageBuffer.open(QIODevice.WriteOnly)
+	image.save(imageBuffer, imageFormat)	# Schreibt das Bild in ein QByteArray im angegebenen Bildformat.
+	return imageData.toBase64().data().decode("UTF-8")
+
+
+def has_format_base64(data, imageFormat=Config.CHARACTER_PIC_FORMAT):
+	"""
+	Gibt zurück, ob der base64-kodierte Text data ein Bild im Format imageFormat enthält.
+
+	\note Das Format wird am Anfang der Daten erkannt. Der Rest des Bildes wird nicht dekodiert.
+	"""
+
+	imageData = QByteArray.fromBase64( data[:64].encode("UTF-8") )
+	imageBuffer = QBuffer(imageData)
+	imageBuffer.open(QIODevice.ReadOnly)
+	dataFormat = QImageReader.imageFormat(imageBuffer).data().decode("UTF-8").lower()
+
+	## Qt nennt JPEG-Bilder immer "jpeg".
+	aliases = { "jpg": "jpeg", }
+	return dataFormat == aliases.get( imageFormat.lower(), imageFormat.lower() )
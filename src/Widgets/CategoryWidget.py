@@ -27,6 +27,7 @@ SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
 
 
 import os
+import bisect
 
 #from PyQt4.QtCore import pyqtSignal as Signal
 #from PyQt4.QtCore import Qt
@@ -68,33 +69,60 @@ class CategoryWidget(QWidget):
 		self._layout.addWidget( self._toolBox )
 
 		self._typ = typ
-		categories = self.__storage.categories(self._typ)
+		self.__isCheckable = isCheckable
 
 		# Diese Liste speichert den Index der ToolBox-Seite bei den unterschiedlichen Kategorien
 		# {
 		# 	Index: [Widget, Eigenschaft1, Eigenschaft2, ...]
 		# }
 		self._toolBoxPageList = {}
+		# Die Schlüssel der bereits angezeigten Eigenschaften jeder Kategorie in alphabetischer Reihenfolge.
+		self.__traitKeys = {}
 
-		for item in categories:
-			# Für jede Kategorie wird ein eigener Abschnitt erzeugt.
-			widgetCategory = QWidget()
-			## Dank des Namens übernimmt dieses Widget den Stil des Eltern-Widgets.
-			widgetCategory.setObjectName("transparentWidget")
+		self.__addTraits()
+		#Debug.debug(self._toolBoxPageList)
+		self.__character.speciesChanged.connect(self.hideOrShowToolPage)
+		self.__character.breedChanged.connect(self.hideOrShowToolPage)
+		self.__character.factionChanged.connect(self.hideOrShowToolPage)
+		## Eigenschaften, welche erst durch das nachträgliche Laden einer Spezies hinzukommen, müssen ebenfalls angezeigt werden.
+		self.__character.traitsAdded.connect(self.__addLoadedTraits)
+
+
+	def __addTraits(self):
+		"""
+		Erzeugt für jede Eigenschaft, die noch nicht angezeigt wird, ein Widget. Kategorien, die noch nicht angezeigt werden, erhalten einen eigenen Abschnitt.
+
+		Die Eigenschaften einer Kategorie bleiben dabei alphabetisch sortiert, auch wenn sie erst nachträglich hinzukommen.
+		"""
+
+		for item in self.__storage.categories(self._typ):
+			if item not in self._toolBoxPageList:
+				# Für jede Kategorie wird ein eigener Abschnitt erzeugt.
+				widgetCategory = QWidget()
+				## Dank des Namens übernimmt dieses Widget den Stil des Eltern-Widgets.
+				widgetCategory.setObjectName("transparentWidget")
+
+				layoutCategory = QVBoxLayout()
+
+				widgetCategory.setLayout( layoutCategory )
 
-			layoutCategory = QVBoxLayout()
+				## In dieser Liste sammle ich die Widgets, damit sie später bei Bedarf in die ToolBox eingefügt werden können.
+				self._toolBoxPageList[item] = [widgetCategory]
+				self.__traitKeys[item] = []
 
-			widgetCategory.setLayout( layoutCategory )
+				# Stretch einfügen, damit die Eigenschaften besser angeordnet sind.
+				layoutCategory.addStretch()
 
-			## In dieser Liste sammle ich die Widgets, damit sie später bei Bedarf in die ToolBox eingefügt werden können.
-			self._toolBoxPageList[item] = [widgetCategory]
+			layoutCategory = self._toolBoxPageList[item][0].layout()
+			keys = self.__traitKeys[item]
+			shownKeys = set(keys)
 
-			__list = list( self.__character.traits[self._typ][item].items() )
+			__list = [ trait for trait in self.__character.traits[self._typ][item].items() if trait[0] not in shownKeys ]
 			__list.sort()
 			for trait in __list:
 				# Anlegen des Widgets, das diese Eigenschaft repräsentiert.
 				traitWidget = None
-				if isCheckable:
+				if self.__isCheckable:
 					traitWidget = CheckTrait( trait[1], self )
 				else:
 					traitWidget = CharaTrait( trait[1], self )
@@ -104,16 +132,15 @@ class CategoryWidget(QWidget):
 
 				self._toolBoxPageList[item].append(trait[1])
 
-				layoutCategory.addWidget( traitWidget )
+				## Der Stretch bleibt am Ende der Kategorie.
+				position = bisect.bisect(keys, trait[0])
+				keys.insert(position, trait[0])
+				layoutCategory.insertWidget( position, traitWidget )
 
-				self.__character.traitVisibleReasonChanged.connect(traitWidget.hideOrShowTrait)
 
-			# Stretch einfügen, damit die Eigenschaften besser angeordnet sind.
-			layoutCategory.addStretch()
-		#Debug.debug(self._toolBoxPageList)
-		self.__character.speciesChanged.connect(self.hideOrShowToolPage)
-		self.__character.breedChanged.connect(self.hideOrShowToolPage)
-		self.__character.factionChanged.connect(self.hideOrShowToolPage)
+	def __addLoadedTraits(self, species):
+		self.__addTraits()
+		self.hideOrShowToolPage(species)
 
 
 	def hideOrShowToolPage(self, res):
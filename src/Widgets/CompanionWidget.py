@@ -67,6 +67,8 @@ class CompanionWidget(QWidget):
 		self.__character = character
 		self.__storage = template
 
+		## Die Numina stammen aus den Template-Daten der Geister.
+		self.__storage.loadSpecies("Spirit")
 		spiritNumina = [ numen[1]["name"] for numen in self.__storage.traits["Power"]["Numina"].items() if numen[1]["species"] == "Spirit" ]
 		spiritNumina.sort()
 		self.ui.listWidget_numina.setCheckableItems(spiritNumina)
@@ -112,7 +114,8 @@ class CompanionWidget(QWidget):
 
 			self.__influenceWidgets.append([ lineEdit, traitDots ])
 
-			trait.nameChanged.connect(lineEdit.setText)
+			## setText() ist eine Methode von Qt und wird daher festgehalten, bis das Widget zerstört wird.
+			trait.nameChanged.connect(lineEdit.setText, lineEdit)
 			trait.valueChanged.connect(traitDots.setValue)
 
 
@@ -29,7 +29,7 @@ SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
 from PyQt4.QtCore import pyqtSignal as Signal
 #from PyQt4.QtGui import QWidget, QHBoxLayout, QPushButton, QLineEdit, QLabel
 
-#import src.Config as Config
+import src.Config as Config
 from src.Widgets.Components.TraitLine import TraitLine
 from src.Datatypes.BonusTrait import BonusTrait
 #import src.Debug as Debug
@@ -55,6 +55,8 @@ class CharaTrait(TraitLine):
 		super(CharaTrait, self).__init__(trait.name, trait.value, parent)
 
 		self.__trait = trait
+		## Die Gründe (siehe BasicTrait.hiddenReasons), aus denen dieses Widget versteckt wird.
+		self.__hiddenReasonsMask = Config.TRAIT_HIDDEN_ALL
 
 		# Falls ich mit der Maus den Wert ändere, muß er auch entsprechend verändert werden.
 		self.valueChanged.connect(self.setTraitValue)
@@ -75,6 +77,11 @@ class CharaTrait(TraitLine):
 		#connect( traitPtr(), SIGNAL( availabilityChanged(bool)), this, SLOT( setEnabled(bool)) );
 		self.__trait.availableChanged.connect(self.setEnabled)
 
+		# Der Charakter legt fest, wann die Eigenschaft verborgen ist. Dieses Widget erfährt nur davon, wenn sich dies bei seiner Eigenschaft tatsächlich ändert.
+		self.__trait.hiddenReasonsChanged.connect(self.hideOrShowTrait)
+		if self.__trait.hiddenReasons:
+			self.hideOrShowTrait()
+
 
 	def setTraitValue( self, value ):
 		"""
@@ -107,20 +114,26 @@ class CharaTrait(TraitLine):
 		self.specialtiesClicked.emit(sw, self.__trait)
 
 
-	def hideOrShowTrait(self, species=None, age=None, era=None, breed=None, faction=None):
+	def setHiddenReasonsMask(self, mask):
+		"""
+		Legt fest, aus welchen Gründen (siehe Config.TRAIT_HIDDEN_SPECIES etc.) dieses Widget versteckt wird. Normalerweise werden alle Gründe beachtet.
+		"""
+
+		self.__hiddenReasonsMask = mask
+		self.hideOrShowTrait()
+
+
+	def hideOrShowTrait(self, reasons=None):
 		"""
-		Versteckt oder zeigt diese Eigenschaft.
+		Versteckt oder zeigt diese Eigenschaft, je nachdem, ob sie aus einem der Gründe, die dieses Widget beachtet, verborgen ist.
+
+		\param reasons Die Gründe aus BasicTrait.hiddenReasons. Ohne Angabe werden die aktuellen Gründe der Eigenschaft herangezogen.
 		"""
 
-		visible = True
-		# Es können nur Eigenschaften versteckt werden, die einen age- bzw. era-Eintrag besitzen.
-		if (
-			(species and self.__trait.species and self.__trait.species != species) or
-			(age and self.__trait.age and self.__trait.age != age) or
-			(era and self.__trait.era and era not in self.__trait.era) or
-			((breed or faction) and self.__trait.only and breed not in self.__trait.only and faction not in self.__trait.only)
-		):
-			visible = False
+		if reasons is None:
+			reasons = self.__trait.hiddenReasons
+
+		visible = not reasons & self.__hiddenReasonsMask
 
 		self.setVisible(visible)
 		self.visibilityChanged.emit(visible)
@@ -70,7 +70,14 @@ class CheckTrait(QWidget):
 		self.__trait.valueChanged.connect(self.setValue)
 		if type(self.__trait) == StandardTrait:
 			self.__trait.customTextChanged.connect(self.setText)
-		self.__trait.availableChanged.connect(self.setEnabled)
+		## setEnabled() ist eine Methode von Qt und wird daher festgehalten, bis das Widget zerstört wird.
+		self.__trait.availableChanged.connect(self.setEnabled, self)
+
+		## Die Gründe (siehe BasicTrait.hiddenReasons), aus denen dieses Widget versteckt wird. Alter und Ära gibt es bei SubPowerTrait nicht.
+		self.__hiddenReasonsMask = Config.TRAIT_HIDDEN_SPECIES | Config.TRAIT_HIDDEN_ONLY
+		self.__trait.hiddenReasonsChanged.connect(self.hideOrShowTrait)
+		if self.__trait.hiddenReasons:
+			self.hideOrShowTrait()
 
 
 	def __getValue(self):
@@ -126,24 +133,26 @@ class CheckTrait(QWidget):
 			self.__lineEdit.show()
 
 
-	def hideOrShowTrait(self, species=None, age=None, era=None, breed=None, faction=None):
+	def setHiddenReasonsMask(self, mask):
+		"""
+		Legt fest, aus welchen Gründen (siehe Config.TRAIT_HIDDEN_SPECIES etc.) dieses Widget versteckt wird.
 		"""
-		Versteckt oder zeigt diese Eigenschaft.
 
-		\note age und era gibt es zwar nicht bei SubPowerTrait, aber damit diese Funktion mit StorageCharacter.traitVisibleReasonChanged kompatible bleibt, werden sie als Argument übergeben.
+		self.__hiddenReasonsMask = mask
+		self.hideOrShowTrait()
+
+
+	def hideOrShowTrait(self, reasons=None):
 		"""
+		Versteckt oder zeigt diese Eigenschaft, je nachdem, ob sie aus einem der Gründe, die dieses Widget beachtet, verborgen ist.
+
+		\param reasons Die Gründe aus BasicTrait.hiddenReasons. Ohne Angabe werden die aktuellen Gründe der Eigenschaft herangezogen.
+		"""
+
+		if reasons is None:
+			reasons = self.__trait.hiddenReasons
 
-		visible = True
-		# Es können nur Eigenschaften versteckt werden, die einen age- bzw. era-Eintrag besitzen.
-		if (
-			(species and self.__trait.species and self.__trait.species != species) or
-			#(age and self.__trait.age and self.__trait.age != age) or
-			#(era and self.__trait.era and era not in self.__trait.era) or
-			((breed or faction) and self.__trait.only and breed not in self.__trait.only and faction not in self.__trait.only)
-		):
-			visible = False
-
-		self.setVisible(visible)
+		self.setVisible(not reasons & self.__hiddenReasonsMask)
 
 
 	#def hideOrShowTrait(self, species):
@@ -27,6 +27,7 @@ SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
 
 
 import os
+import bisect
 
 #from PyQt4.QtCore import pyqtSignal as Signal
 #from PyQt4.QtCore import Qt
@@ -63,31 +64,59 @@ class FlawWidget(QWidget):
 		self.__layout.addWidget(self.__toolBox)
 
 		self.__typ = "Flaw"
+
+		# Diese Liste speichert den Index der ToolBox-Seite bei den unterschiedlichen Kategorien
+		self.__categoryIndex = {}
+		# Die Schlüssel der bereits angezeigten Nachteile jeder Kategorie in alphabetischer Reihenfolge.
+		self.__flawKeys = {}
+
+		self.__addFlaws()
+
+		self.setMinimumWidth(Config.TRAIT_WIDTH_MIN)
+
+		## Nachteile, welche erst durch das nachträgliche Laden einer Spezies hinzukommen, müssen ebenfalls angezeigt werden.
+		self.__character.traitsAdded.connect(self.__addLoadedFlaws)
+
+
+	def __addFlaws(self):
+		"""
+		Erzeugt für jeden Nachteil, der noch nicht angezeigt wird, ein Widget. Kategorien, die noch nicht angezeigt werden, erhalten eine eigene Seite der ToolBox.
+
+		Die Nachteile einer Kategorie bleiben dabei alphabetisch sortiert, auch wenn sie erst nachträglich hinzukommen.
+		"""
+
 		categories = []
 		categories.extend(Config.CATEGORIES_FLAWS)
 		categories.extend(self.__storage.categories(self.__typ))
 		# Duplikate werden entfernt. Dadurch wird die in der Config-Klasse vorgegebene Reihenfolge eingehalten und zusätzliche, dort nicht erwähnte Kategorien werden hinterher angehängt.
 		categories = ListTools.uniqify_ordered(categories)
 
-		# Diese Liste speichert den Index der ToolBox-Seite bei den unterschiedlichen Kategorien
-		self.__categoryIndex = {}
-
 		# Flaws werden in einer Spalte heruntergeschrieben, aber mit vertikalem Platz dazwischen.
 		for item in categories:
-			# Für jede Kategorie wird ein eigener Abschnitt erzeugt.
-			widgetFlawCategory = QWidget()
-			## Dank des Namens übernimmt dieses Widget den Stil des Eltern-Widgets.
-			widgetFlawCategory.setObjectName("transparentWidget")
+			if item not in self.__categoryIndex:
+				# Für jede Kategorie wird ein eigener Abschnitt erzeugt.
+				widgetFlawCategory = QWidget()
+				## Dank des Namens übernimmt dieses Widget den Stil des Eltern-Widgets.
+				widgetFlawCategory.setObjectName("transparentWidget")
+
+				layoutFlawCategory = QVBoxLayout()
+
+				widgetFlawCategory.setLayout( layoutFlawCategory )
 
-			layoutFlawCategory = QVBoxLayout()
+				self.__toolBox.addItem( widgetFlawCategory, item )
+				self.__categoryIndex[item] = self.__toolBox.count() - 1
+				self.__flawKeys[item] = []
+				#Debug.debug(self.__categoryIndex)
 
-			widgetFlawCategory.setLayout( layoutFlawCategory )
+				# Stretch einfügen, damit die Eigenschaften besser angeordnet sind.
+				layoutFlawCategory.addStretch()
 
-			self.__toolBox.addItem( widgetFlawCategory, item )
-			self.__categoryIndex[item] = self.__toolBox.count() - 1
-			#Debug.debug(self.__categoryIndex)
+			layoutFlawCategory = self.__toolBox.widget(self.__categoryIndex[item]).layout()
+			keys = self.__flawKeys[item]
+			shownKeys = set(keys)
 
-			__list = list( self.__character.traits[self.__typ][item].items() )
+			## Kategorien aus der Config-Klasse können erst mit einer später geladenen Spezies Nachteile erhalten.
+			__list = [ flaw for flaw in self.__character.traits.get(self.__typ, {}).get(item, {}).items() if flaw[0] not in shownKeys ]
 			__list.sort()
 			for flaw in __list:
 				# Anlegen des Widgets, das diese Eigenschaft repräsentiert.
@@ -95,16 +124,18 @@ class FlawWidget(QWidget):
 				if not flaw[1].custom:
 					traitWidget.setDescriptionHidden(True)
 
-				layoutFlawCategory.addWidget( traitWidget )
+				## Der Stretch bleibt am Ende der Kategorie.
+				position = bisect.bisect(keys, flaw[0])
+				keys.insert(position, flaw[0])
+				layoutFlawCategory.insertWidget( position, traitWidget )
 
 				flaw[1].valueChanged.connect(self.countItems)
-				self.__character.speciesChanged.connect(traitWidget.hideOrShowTrait)
+				# Nachteile werden nur nach der Spezies ausgewählt.
+				traitWidget.setHiddenReasonsMask(Config.TRAIT_HIDDEN_SPECIES)
 
 
-			# Stretch einfügen, damit die Eigenschaften besser angeordnet sind.
-			layoutFlawCategory.addStretch()
-
-		self.setMinimumWidth(Config.TRAIT_WIDTH_MIN)
+	def __addLoadedFlaws(self, species):
+		self.__addFlaws()
 
 
 
@@ -27,6 +27,7 @@ SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
 
 
 import os
+import bisect
 
 #from PyQt4.QtCore import pyqtSignal as Signal
 #from PyQt4.QtCore import Qt
@@ -67,30 +68,72 @@ class MeritWidget(TraitWidget):
 		self.__layout.addWidget(self.__toolBox)
 
 		self.__typ = "Merit"
+
+		# Diese Liste speichert den Index der ToolBox-Seite bei den unterschiedlichen Kategorien
+		self.__categoryIndex = {}
+		# Die Schlüssel der bereits angezeigten Merits jeder Kategorie in alphabetischer Reihenfolge.
+		self.__meritKeys = {}
+
+		self.__addMerits()
+
+		self.setMinimumWidth(Config.TRAIT_WIDTH_MIN)
+
+		self._character.speciesChanged.connect(self.countMerits)
+		## Merits, welche erst durch das nachträgliche Laden einer Spezies hinzukommen, müssen ebenfalls angezeigt werden.
+		self._character.traitsAdded.connect(self.__addLoadedMerits)
+
+	#// 	dialog = new SelectMeritsDialog( this );
+	#//
+	#// 	QHBoxLayout* layout_button = new QHBoxLayout();
+	#// 	layoutTop.addLayout( layout_button );
+	#//
+	#// 	button = new QPushButton();
+	#// 	button.setIcon( style().standardIcon( QStyle::SP_FileDialogStart ) );
+	#//
+	#// 	layout_button.addStretch();
+	#// 	layout_button.addWidget( button );
+	#//
+	#// 	connect( button, SIGNAL( clicked( bool ) ), dialog, SLOT( exec() ) );
+
+
+	def __addMerits(self):
+		"""
+		Erzeugt für jeden Merit, der noch nicht angezeigt wird, ein Widget. Kategorien, die noch nicht angezeigt werden, erhalten eine eigene Seite der ToolBox.
+
+		Die Merits einer Kategorie bleiben dabei alphabetisch sortiert, auch wenn sie erst nachträglich hinzukommen.
+		"""
+
 		categories = []
 		categories.extend(Config.CATEGORIES_MERITS)
 		categories.extend(self._storage.categories(self.__typ))
 		# Duplikate werden entfernt. Dadurch wird die in der Config-Klasse vorgegebene Reihenfolge eingehalten und zusätzliche, dort nicht erwähnte Kategorien werden hinterher angehängt.
 		categories = ListTools.uniqify_ordered(categories)
 
-		# Diese Liste speichert den Index der ToolBox-Seite bei den unterschiedlichen Kategorien
-		self.__categoryIndex = {}
-
 		# Merits werden in einer Spalte heruntergeschrieben, aber mit vertikalem Platz dazwischen.
 		for item in categories:
-			# Für jede Kategorie wird ein eigener Abschnitt erzeugt.
-			widgetMeritCategory = QWidget()
-			## Dank des Namens übernimmt dieses Widget den Stil des Eltern-Widgets.
-			widgetMeritCategory.setObjectName("transparentWidget")
+			if item not in self.__categoryIndex:
+				# Für jede Kategorie wird ein eigener Abschnitt erzeugt.
+				widgetMeritCategory = QWidget()
+				## Dank des Namens übernimmt dieses Widget den Stil des Eltern-Widgets.
+				widgetMeritCategory.setObjectName("transparentWidget")
+
+				layoutMeritCategory = QVBoxLayout()
+				widgetMeritCategory.setLayout( layoutMeritCategory )
 
-			layoutMeritCategory = QVBoxLayout()
-			widgetMeritCategory.setLayout( layoutMeritCategory )
+				self.__toolBox.addItem( widgetMeritCategory, item )
+				self.__categoryIndex[item] = self.__toolBox.count() - 1
+				self.__meritKeys[item] = []
+				#Debug.debug(self.__categoryIndex)
 
-			self.__toolBox.addItem( widgetMeritCategory, item )
-			self.__categoryIndex[item] = self.__toolBox.count() - 1
-			#Debug.debug(self.__categoryIndex)
+				# Stretch einfügen, damit die Eigenschaften besser angeordnet sind.
+				layoutMeritCategory.addStretch()
 
-			__list = list( self._character.traits[self.__typ][item].items() )
+			layoutMeritCategory = self.__toolBox.widget(self.__categoryIndex[item]).layout()
+			keys = self.__meritKeys[item]
+			shownKeys = set(keys)
+
+			## Kategorien aus der Config-Klasse können erst mit einer später geladenen Spezies Merits erhalten.
+			__list = [ merit for merit in self._character.traits.get(self.__typ, {}).get(item, {}).items() if merit[0] not in shownKeys ]
 			__list.sort()
 			for merit in __list:
 				#Debug.debug(merit)
@@ -104,34 +147,20 @@ class MeritWidget(TraitWidget):
 				#Debug.debug(self._storage.traits[self.__typ][item][merit[0]])
 				traitWidget.setPossibleValues(self._storage.traits[self.__typ][item][merit[1].identifier]["values"])
 
-				# Es werden nur Eigenschaften der richtigen Alters- und Zeit-Kategorie angezeigt.
-				self.hideReasonChanged.connect(traitWidget.hideOrShowTrait)
+				# Es werden nur Eigenschaften der richtigen Spezies, Alters- und Zeit-Kategorie angezeigt.
+				traitWidget.setHiddenReasonsMask(Config.TRAIT_HIDDEN_SPECIES | Config.TRAIT_HIDDEN_AGE | Config.TRAIT_HIDDEN_ERA)
 
-				layoutMeritCategory.addWidget( traitWidget )
+				## Der Stretch bleibt am Ende der Kategorie.
+				position = bisect.bisect(keys, merit[0])
+				keys.insert(position, merit[0])
+				layoutMeritCategory.insertWidget( position, traitWidget )
 
 				merit[1].valueChanged.connect(self.countMerits)
 				#self._character.speciesChanged.connect(traitWidget.hideOrShowTrait_species)
 
 
-			# Stretch einfügen, damit die Eigenschaften besser angeordnet sind.
-			layoutMeritCategory.addStretch()
-
-		self.setMinimumWidth(Config.TRAIT_WIDTH_MIN)
-
-		self._character.speciesChanged.connect(self.countMerits)
-
-	#// 	dialog = new SelectMeritsDialog( this );
-	#//
-	#// 	QHBoxLayout* layout_button = new QHBoxLayout();
-	#// 	layoutTop.addLayout( layout_button );
-	#//
-	#// 	button = new QPushButton();
-	#// 	button.setIcon( style().standardIcon( QStyle::SP_FileDialogStart ) );
-	#//
-	#// 	layout_button.addStretch();
-	#// 	layout_button.addWidget( button );
-	#//
-	#// 	connect( button, SIGNAL( clicked( bool ) ), dialog, SLOT( exec() ) );
+	def __addLoadedMerits(self, species):
+		self.__addMerits()
 
 
 	def countMerits(self):
@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from PyQt4.QtCore import QTimer
+from PyQt4.QtGui import QTabWidget, QTextBrowser
+## Ohne QtWebKit wird die Vorschau mit einem QTextBrowser angezeigt.
+try:
+	from PyQt4.QtWebKit import QWebView
+except ImportError:
+	QWebView = None
+
+import src.Config as Config
+from src.Draw.RenderSheet import RenderSheet
+import src.Debug as Debug
+
+
+
+
+## Die Abschnitte des Charakterbogens, welche neu erzeugt werden müssen, wenn das jeweilige Feld im Journal des Charakters (siehe ChangeJournal) als verändert gemeldet wird. Die Abschnitte werden mit den Namen ihrer Platzhalter in den Html-Vorlagen angegeben. Die Daten bestimmen auch das Alter des Charakters.
+SECTIONS_BY_FIELD = {
+	"identity": ( "info", "description", ),
+	"era": ( "skills", ),
+	"dateBirth": ( "skills", "description", ),
+	"dateBecoming": ( "description", ),
+	"dateGame": ( "skills", "description", ),
+	"virtue": ( "info", ),
+	"vice": ( "info", ),
+	"breed": ( "info", "blessing", "curseBreed", "abilityKith", "rolls", ),
+	"kith": ( "info", "abilityKith", ),
+	"faction": ( "info", ),
+	"organisation": ( "info", "curseOrganisation", ),
+	"party": ( "info", ),
+	"description": ( "description", ),
+	"morality": ( "morality", ),
+	"derangements": ( "morality", ),
+	"height": ( "description", ),
+	"weight": ( "description", ),
+	"eyes": ( "description", ),
+	"hair": ( "description", ),
+	"nationality": ( "description", ),
+	"picture": ( "image", ),
+	"weapons": ( "weapons", ),
+	"armor": ( "advantages", "shapes", ),
+	"equipment": ( "inventory", ),
+	"automobiles": ( "automobiles", "inventory", ),
+	"extraordinaryItems": ( "inventory", ),
+	"magicalTool": ( "magicalTool", ),
+	"nimbus": ( "nimbus", ),
+	"paradoxMarks": ( "paradoxMarks", ),
+	"vinculi": ( "vinculi", ),
+	"companionName": ( "info", "companion", ),
+	"companionPower": ( "companion", ),
+	"companionFinesse": ( "companion", ),
+	"companionResistance": ( "companion", ),
+	"companionSize": ( "companion", ),
+	"companionSpeedFactor": ( "companion", ),
+	"companionFuel": ( "companion", ),
+	"companionInfluences": ( "companion", ),
+	"companionNumina": ( "companion", ),
+	"companionBan": ( "companion", ),
+}
+
+## Die Abschnitte des Charakterbogens, welche neu erzeugt werden müssen, wenn sich eine Eigenschaft des jeweiligen Typs ändert.
+SECTIONS_BY_TRAIT_TYPE = {
+	"Attribute": ( "attributes", "advantages", "health", "willpower", "shapes", "description", "spellsUponSelf", ),
+	"Skill": ( "skills", ),
+	"Merit": ( "merits", "advantages", "health", "shapes", ),
+	"Flaw": ( "flaws", ),
+	"Power": ( "powers", ),
+	"Subpower": ( "subpowers", "goblinContracts", ),
+}
+
+## Nach einer Änderung dieser Felder wird der gesamte Charakterbogen neu erzeugt. Die Spezies bestimmt die Html-Vorlagen und die Powerstat den höchsten Wert aller Eigenschaften.
+FIELDS_REBUILD = ( "species", "powerstat", )
+
+## Jeder Abschnitt wird in der Vorschau von diesem Element umschlossen, damit er mit QtWebKit einzeln ersetzt werden kann.
+SECTION_FORMAT = "<div class='previewSection-{name}'>{content}</div>"
+
+
+
+
+class SheetPreviewWidget(QTabWidget):
+	"""
+	@brief Zeigt den Charakterbogen während der Bearbeitung an, jede Seite in einem eigenen Reiter.
+
+	Der Charakterbogen wird nur beim ersten Anzeigen und bei einem Wechsel der Spezies vollständig erzeugt. Ansonsten werden nach einer Änderung des Charakters nur die davon betroffenen Abschnitte (siehe SECTIONS_BY_FIELD und SECTIONS_BY_TRAIT_TYPE) neu erzeugt. Welche Felder sich geändert haben, meldet das Journal des Charakters gesammelt mit einem einzigen Signal. Mit QtWebKit wird auch nur deren Html-Struktur ersetzt, mit einem QTextBrowser muß die Seite aus den bereits vorhandenen Abschnitten neu zusammengesetzt werden.
+
+	Alle Änderungen, die innerhalb von Config.PREVIEW_UPDATE_DELAY Millisekunden eintreffen, werden gemeinsam abgearbeitet. Ist die Vorschau nicht sichtbar, wird mit dem Abarbeiten bis zu ihrem nächsten Erscheinen gewartet.
+	"""
+
+
+	def __init__(self, template, character, parent=None):
+		super(SheetPreviewWidget, self).__init__(parent)
+
+		self.__storage = template
+		self.__character = character
+
+		## Das Markup der Abschnitte muß zu der Ansicht passen, in welcher sie dargestellt werden.
+		backend = "webkit"
+		if QWebView is None:
+			backend = "document"
+		self.__sheet = RenderSheet( self.__storage, self.__character, None, self, backend )
+
+		## Für jede Seite die bereits erzeugten Abschnitte.
+		self.__sections = []
+		self.__views = []
+
+		## Die Namen der Abschnitte, welche bei der nächsten Aktualisierung neu erzeugt werden müssen.
+		self.__dirty = set()
+		self.__rebuild = True
+
+		self.__timer = QTimer(self)
+		self.__timer.setSingleShot(True)
+		self.__timer.setInterval(Config.PREVIEW_UPDATE_DELAY)
+		self.__timer.timeout.connect(self.refresh)
+
+		self.__character.journal.changed.connect(self.__invalidateFields)
+		self.__character.traitsAdded.connect(self.__addTraits)
+
+		## Die Abschnitte, welche von den Eigenschaften abhängen, mit denen die Vorschau bereits verbunden ist. Weitere Eigenschaften können hinzukommen (siehe StorageCharacter.traitsAdded).
+		self.__traitSections = {}
+		self.__connectTraits()
+
+
+	def __connectTraits(self):
+		for typ, sections in SECTIONS_BY_TRAIT_TYPE.items():
+			if typ not in self.__character.traits:
+				continue
+			for category in self.__character.traits[typ].values():
+				for trait in category.values():
+					if trait in self.__traitSections:
+						continue
+					## Die Verfügbarkeit ist keine Änderung des Charakters und wird daher nicht im Journal vermerkt.
+					if hasattr(trait, "availableChanged"):
+						trait.availableChanged.connect(lambda available, sections=sections: self.invalidate(sections), self)
+					self.__traitSections[trait] = sections
+
+
+	def __addTraits(self, species):
+		"""
+		Verbindet die Vorschau mit den Eigenschaften, welche durch das nachträgliche Laden einer Spezies hinzugekommen sind.
+		"""
+
+		self.__connectTraits()
+		self.invalidateAll()
+
+
+	def __invalidateFields(self, fields):
+		"""
+		Vermerkt die Abschnitte, welche von den im Journal als verändert gemeldeten Feldern abhängen.
+		"""
+
+		for field in fields:
+			if field in FIELDS_REBUILD:
+				self.invalidateAll()
+			elif field in SECTIONS_BY_FIELD:
+				self.invalidate(SECTIONS_BY_FIELD[field])
+			elif field in self.__traitSections:
+				self.invalidate(self.__traitSections[field])
+
+
+	def invalidate(self, sections):
+		"""
+		Vermerkt, daß die Abschnitte sections bei der nächsten Aktualisierung neu erzeugt werden müssen.
+		"""
+
+		self.__dirty.update(sections)
+		self.__timer.start()
+
+
+	def invalidateAll(self):
+		"""
+		Vermerkt, daß der gesamte Charakterbogen bei der nächsten Aktualisierung neu erzeugt werden muß.
+		"""
+
+		self.__rebuild = True
+		self.__timer.start()
+
+
+	def showEvent(self, event):
+		if self.__rebuild or self.__dirty:
+			self.__timer.start()
+		super(SheetPreviewWidget, self).showEvent(event)
+
+
+	def refresh(self):
+		"""
+		Erzeugt alle seit der letzten Aktualisierung veränderten Abschnitte neu.
+		"""
+
+		if not self.isVisible():
+			return
+
+		if self.__rebuild:
+			self.__build()
+			return
+
+		debug_timing_start = Debug.timehook()
+
+		contents = {}
+		for page, view in enumerate(self.__views):
+			changed = self.__dirty.intersection(self.__sections[page])
+			if not changed:
+				continue
+			for name in changed:
+				if name not in contents:
+					contents[name] = self.__sheet.createSection(name)
+				self.__sections[page][name] = contents[name]
+
+			if QWebView is not None:
+				frame = view.page().mainFrame()
+				for name in changed:
+					for element in frame.findAllElements("div.previewSection-{}".format(name)):
+						element.setInnerXml(contents[name])
+			else:
+				scrollPosition = view.verticalScrollBar().value()
+				self.__sheet.addDocumentResources(view.document())
+				view.setHtml(self.__sheet.createHtml(page, self.__sections[page]))
+				view.verticalScrollBar().setValue(scrollPosition)
+
+		Debug.timesince( debug_timing_start, "Time neccessary to update the sections {} of the preview.".format(", ".join(sorted(contents))) )
+
+		self.__dirty.clear()
+
+
+	def __build(self):
+		"""
+		Erzeugt den gesamten Charakterbogen neu.
+		"""
+
+		debug_timing_start = Debug.timehook()
+
+		self.__sheet.traitMax = self.__storage.maxTrait(self.__character.species, self.__character.powerstat)
+
+		currentPage = self.currentIndex()
+		self.clear()
+		self.__views = []
+		self.__sections = []
+		for page in range(self.__sheet.pageCount()):
+			sections = {}
+			if QWebView is not None:
+				view = QWebView()
+				view.setHtml(self.__sheet.createHtml(page, sections, SECTION_FORMAT))
+			else:
+				view = QTextBrowser()
+				self.__sheet.addDocumentResources(view.document())
+				view.setHtml(self.__sheet.createHtml(page, sections))
+			self.__views.append(view)
+			self.__sections.append(sections)
+			self.addTab(view, self.tr("Page {}").format(page + 1))
+		self.setCurrentIndex(max(0, min(currentPage, self.count() - 1)))
+
+		self.__rebuild = False
+		self.__dirty.clear()
+
+		Debug.timesince( debug_timing_start, "Time neccessary to build the preview." )
@@ -106,8 +106,8 @@ class SkillWidget(TraitWidget):
 				traitListItem = traitWidget
 				self.__traitWidgets.append(traitListItem)
 
-				# Es werden nur Fertigkeiten der richtigen Alters- und Zeit-Kategorie angezeigt.
-				self.hideReasonChanged.connect(traitWidget.hideOrShowTrait)
+				# Es werden nur Fertigkeiten der richtigen Spezies, Alters- und Zeit-Kategorie angezeigt.
+				traitWidget.setHiddenReasonsMask(Config.TRAIT_HIDDEN_SPECIES | Config.TRAIT_HIDDEN_AGE | Config.TRAIT_HIDDEN_ERA)
 				# Fertigkeiten haben Spezialisierungen.
 				traitWidget.specialtiesClicked.connect(self.uncheckOtherButtons)
 				traitWidget.specialtiesClicked.connect(self.specialtiesActivated.emit)
@@ -81,7 +81,8 @@ class SpecialsWidget(QWidget):
 
 			self.__vinculumWidgets.append([ lineEdit, traitDots ])
 
-			trait.nameChanged.connect(lineEdit.setText)
+			## setText() ist eine Methode von Qt und wird daher festgehalten, bis das Widget zerstört wird.
+			trait.nameChanged.connect(lineEdit.setText, lineEdit)
 			trait.valueChanged.connect(traitDots.setValue)
 			traitDots.valueChanged.connect(self.checkMaxVinculum)
 
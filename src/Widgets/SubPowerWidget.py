@@ -65,9 +65,10 @@ class SubPowerWidget(QWidget):
 		self._layout.addWidget(self.__view)
 
 		self._typ = "Subpower"
-		categories = self.__storage.categories(self._typ)
 
 		self.__items = {}
+		# Die Einträge der bereits angezeigten Kategorien.
+		self.__categoryItems = {}
 
 		self.__rootItem = QStandardItem()
 		self.__rootItem = self.__model.invisibleRootItem()
@@ -75,37 +76,63 @@ class SubPowerWidget(QWidget):
 		self.__rootItemUnused = QStandardItem()
 		self.__rootItemUnused = self.__modelUnused.invisibleRootItem()
 
-		for item in categories:
-			categoryItem = QStandardItem(item)
-			self.__rootItem.appendRow(categoryItem)
+		self.__addSubPowers()
 
-			## Ich benötige diese Items auch im ungenutzten Model.
-			categoryItemUnused = QStandardItem(item)
-			self.__rootItemUnused.appendRow(categoryItemUnused)
-			
-			traitList = list( self.__character.traits[self._typ][item].items() )
+		self.__model.itemChanged.connect(self.__getItemValue)
+		self.__character.speciesChanged.connect(self.hideOrShowToolPage)
+		self.__character.breedChanged.connect(self.hideOrShowToolPage)
+		self.__character.factionChanged.connect(self.hideOrShowToolPage)
+		## Unterkräfte, welche erst durch das nachträgliche Laden einer Spezies hinzukommen, müssen ebenfalls angezeigt werden.
+		self.__character.traitsAdded.connect(self.__addLoadedSubPowers)
+
+
+	def __addSubPowers(self):
+		"""
+		Fügt alle Unterkräfte, die noch nicht angezeigt werden, in den Baum ein. Kategorien, die noch nicht angezeigt werden, erhalten eine eigene Zeile.
+		"""
+
+		for item in self.__storage.categories(self._typ):
+			if item not in self.__categoryItems:
+				categoryItem = QStandardItem(item)
+				self.__rootItem.appendRow(categoryItem)
+				self.__categoryItems[item] = categoryItem
+
+				## Ich benötige diese Items auch im ungenutzten Model.
+				categoryItemUnused = QStandardItem(item)
+				self.__rootItemUnused.appendRow(categoryItemUnused)
+			categoryItem = self.__categoryItems[item]
+
+			traitList = [ trait for trait in self.__character.traits[self._typ][item].items() if trait[1] not in self.__items ]
 			traitList.sort()
 			for trait in traitList:
 				traitItem = QStandardItem(trait[1].name)
 				traitItem.setCheckable(True)
 				## Unhashable Type
 				self.__items[trait[1]] = traitItem
-				categoryItem.appendRow(traitItem)
+				## Nachträglich geladene Unterkräfte werden alphabetisch zwischen die bereits angezeigten einsortiert.
+				position = categoryItem.rowCount()
+				for i in range(categoryItem.rowCount()):
+					if categoryItem.child(i).text() > trait[1].name:
+						position = i
+						break
+				categoryItem.insertRow(position, traitItem)
 
 				## Funktioniert mit PySide nicht:
 				#trait[1].availableChanged.connect(traitItem.setEnabled)
 				## Funktioniert auch mit PySide:
 				trait[1].availableChanged.connect(
-					lambda enable, item=traitItem: item.setEnabled(enable)
+					lambda enable, item=traitItem: item.setEnabled(enable),
+					self
 				)
 				trait[1].valueChanged.connect(
-					lambda val, trait=trait[1], item=traitItem: self.__setItemValue(trait, item)
+					lambda val, trait=trait[1], item=traitItem: self.__setItemValue(trait, item),
+					self
 				)
 
-		self.__model.itemChanged.connect(self.__getItemValue)
-		self.__character.speciesChanged.connect(self.hideOrShowToolPage)
-		self.__character.breedChanged.connect(self.hideOrShowToolPage)
-		self.__character.factionChanged.connect(self.hideOrShowToolPage)
+
+	def __addLoadedSubPowers(self, species):
+		self.__addSubPowers()
+		self.hideOrShowToolPage(species)
 
 
 	def __setItemValue(self, trait, item):
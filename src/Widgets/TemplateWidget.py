@@ -218,10 +218,10 @@ class TemplateWidget(QWidget):
 				"Werewolf",
 			)
 			if self.__character.species in speciesWithSpecialties:
+				skills = self.__storage.traitSkills()
 				for item in bonusList:
-					for category in self.__storage.traits["Skill"]:
-						if item in self.__storage.traits["Skill"][category]:
-							self.ui.comboBox_bonus.addItems( self.__storage.traits["Skill"][category][item]["specialties"] )
+					if item in skills:
+						self.ui.comboBox_bonus.addItems( skills[item]["specialties"] )
 			else:
 				self.ui.comboBox_bonus.addItems( bonusList )
 				self.ui.label_bonus2.setText(__list[0]["name"])
@@ -239,13 +239,12 @@ class TemplateWidget(QWidget):
 		if len(__list) > 1:
 			bonusName = self.ui.comboBox_bonus.currentText()
 			## Bei Bonus-Spezialisierungen muß auch die Fertigkeit gespeichert werden.
+			skills = self.__storage.traitSkills()
 			for item in __list:
 				if item["type"] == "Skill":
-					for skill in self.__storage.traitSkills():
-						if item["name"] == skill and bonusName in self.__storage.traitSkills()[skill]["specialties"]:
-							item["specialty"] = bonusName
-							self.__character.bonus = item
-							break
+					if item["name"] in skills and bonusName in skills[item["name"]]["specialties"]:
+						item["specialty"] = bonusName
+						self.__character.bonus = item
 				elif item["name"] == bonusName:
 					self.__character.bonus = item
 					break
@@ -29,7 +29,7 @@ SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
 from PyQt4.QtCore import pyqtSignal as Signal
 from PyQt4.QtGui import QWidget
 
-import src.Config as Config
+#import src.Config as Config
 #from src import Error
 #import src.Debug as Debug
 
@@ -43,7 +43,6 @@ class TraitWidget(QWidget):
 
 
 	maxTraitChanged = Signal(int)
-	hideReasonChanged = Signal(str, str, str)
 
 
 	def __init__(self, template, character, parent=None):
@@ -55,10 +54,6 @@ class TraitWidget(QWidget):
 		# Wenn sich Spezies oder Powerstat ändert, kann sich der erlaubte Maximalwert ändern.
 		self._character.powerstatChanged.connect(self.emitMaxTraitChanged)
 		self._character.speciesChanged.connect(self.emitMaxTraitChanged)
-		# Ändert sich alterskategorie oder die Ära, Wird ein paasendes Signal gesandt.
-		self._character.eraChanged.connect(self.emitHideReasonChanged)
-		self._character.ageChanged[str].connect(self.emitHideReasonChanged)
-		self._character.speciesChanged.connect(self.emitHideReasonChanged)
 
 
 
@@ -70,13 +65,3 @@ class TraitWidget(QWidget):
 		maxTrait = self._storage.maxTrait(self._character.species, self._character.powerstat)
 		self.maxTraitChanged.emit(maxTrait)
 
-
-	def emitHideReasonChanged(self):
-		#Debug.debug(Config.getAge(self._character.age), self._character.era)
-		#ageStr = Config.AGES[0]
-		#if self._character.age < Config.AGE_ADULT:
-			#ageStr = Config.AGES[1]
-		ageStr = Config.getAge(self._character.age)
-		eraStr = self._character.era
-		self.hideReasonChanged.emit(self._character.species, ageStr, eraStr)
-
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+
+"""
+# Copyright
+
+Copyright (C) 2012 by Victor
+victor@caern.de
+
+# License
+
+This file is part of SoulCreator.
+
+SoulCreator is free software: you can redistribute it and/or modify it under
+the terms of the GNU General Public License as published by the Free Software
+Foundation, either version 3 of the License, or (at your option) any later
+version.
+
+SoulCreator is distributed in the hope that it will be useful, but WITHOUT ANY
+WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+
+
+"""
+Übersetzt die Voraussetzungen der Eigenschaften in Funktionen.
+
+Die Voraussetzungen stehen in den Template-Dateien als Text, bspw. "Attribute.Wits > 2 and (Skill.Crafts.Demolitions > 2 or Merit.Haven: Size > 0)". Dieser Text wird beim Einlesen der Template-Dateien ein einziges Mal mit parse() in einen Baum zerlegt. Für jeden Charakter erzeugt compile_tree() daraus eine Funktion, welche direkt auf die Werte der beteiligten Eigenschaften zugreift und nur noch Vergleiche durchführt.
+
+Aufbau des Baumes:
+
+- ( "or", ( Knoten1, Knoten2, ... ) )
+- ( "and", ( Knoten1, Knoten2, ... ) )
+- ( "compare", Operator, Operand1, Operand2 )
+- ( "number", Zahl )
+- ( "reference", Verweis ), wobei Verweis bspw. "Merit.Fast Reflexes", "Skill.Crafts.Demolitions" oder "Powerstat" lautet.
+"""
+
+
+
+
+import re
+import operator
+
+from src.Error import ErrTraitPrerequisite
+
+
+
+
+## Die erlaubten Vergleichsoperatoren.
+OPERATORS = {
+	"<": operator.lt,
+	"<=": operator.le,
+	">": operator.gt,
+	">=": operator.ge,
+	"==": operator.eq,
+	"!=": operator.ne,
+}
+
+_TOKEN_PATTERN = re.compile( r"\s*(\(|\)|<=|>=|==|!=|<|>|[^()<>=!]+)" )
+_KEYWORD_PATTERN = re.compile( r"(?<!\S)(and|or)(?!\S)" )
+
+
+
+
+def _tokenize( text ):
+	"""
+	Zerlegt den Text in Klammern, Operatoren, die Schlüsselwörter "and" und "or", Zahlen und Verweise.
+
+	Verweise dürfen Leerzeichen und Doppelpunkte enthalten ("Merit.Haven: Size"). Sie enden erst vor dem nächsten Operator, der nächsten Klammer oder dem nächsten Schlüsselwort.
+	"""
+
+	tokens = []
+	position = 0
+	text = text.rstrip()
+	while position < len(text):
+		match = _TOKEN_PATTERN.match( text, position )
+		if match is None:
+			raise ErrTraitPrerequisite( prerequisites=text )
+		position = match.end()
+		token = match.group(1)
+		if token in ( "(", ")", ) or token in OPERATORS:
+			tokens.append( ( token, None, ) )
+			continue
+		for part in _KEYWORD_PATTERN.split( token ):
+			part = part.strip()
+			if not part:
+				continue
+			elif part in ( "and", "or", ):
+				tokens.append( ( part, None, ) )
+			elif part.isdigit():
+				tokens.append( ( "number", int(part), ) )
+			else:
+				tokens.append( ( "reference", part, ) )
+	return tokens
+
+
+class _Parser(object):
+	"""
+	Einfacher rekursiver Parser. "and" bindet stärker als "or".
+	"""
+
+	def __init__( self, text ):
+		self.__text = text
+		self.__tokens = _tokenize( text )
+		self.__position = 0
+
+
+	def __peek(self):
+		if self.__position < len(self.__tokens):
+			return self.__tokens[self.__position][0]
+		return None
+
+
+	def __take( self, kind=None ):
+		if self.__position >= len(self.__tokens) or ( kind is not None and self.__peek() != kind ):
+			raise ErrTraitPrerequisite( prerequisites=self.__text )
+		token = self.__tokens[self.__position]
+		self.__position += 1
+		return token
+
+
+	def parse(self):
+		tree = self.__parseOr()
+		if self.__position != len(self.__tokens):
+			raise ErrTraitPrerequisite( prerequisites=self.__text )
+		return tree
+
+
+	def __parseOr(self):
+		nodes = [ self.__parseAnd() ]
+		while self.__peek() == "or":
+			self.__take()
+			nodes.append( self.__parseAnd() )
+		if len(nodes) == 1:
+			return nodes[0]
+		return ( "or", tuple(nodes), )
+
+
+	def __parseAnd(self):
+		nodes = [ self.__parseAtom() ]
+		while self.__peek() == "and":
+			self.__take()
+			nodes.append( self.__parseAtom() )
+		if len(nodes) == 1:
+			return nodes[0]
+		return ( "and", tuple(nodes), )
+
+
+	def __parseAtom(self):
+		if self.__peek() == "(":
+			self.__take()
+			tree = self.__parseOr()
+			self.__take(")")
+			return tree
+
+		left = self.__parseOperand()
+		if self.__peek() not in OPERATORS:
+			raise ErrTraitPrerequisite( prerequisites=self.__text )
+		comparison = self.__take()[0]
+		right = self.__parseOperand()
+		return ( "compare", comparison, left, right, )
+
+
+	def __parseOperand(self):
+		if self.__peek() not in ( "number", "reference", ):
+			raise ErrTraitPrerequisite( prerequisites=self.__text )
+		return self.__take()
+
+
+def parse( text ):
+	"""
+	Zerlegt den Text der Voraussetzungen in einen Baum aus Tupeln.
+
+	\exception ErrTraitPrerequisite Der Text entspricht nicht der erwarteten Form.
+	"""
+
+	return _Parser( text ).parse()
+
+
+def references( tree ):
+	"""
+	Gibt sämtliche Verweise in tree in der Reihenfolge ihres Auftretens zurück.
+	"""
+
+	kind = tree[0]
+	if kind == "reference":
+		return [ tree[1] ]
+	elif kind == "compare":
+		return references( tree[2] ) + references( tree[3] )
+	elif kind in ( "and", "or", ):
+		result = []
+		for node in tree[1]:
+			result.extend( references( node ) )
+		return result
+	return []
+
+
+def _all( functions ):
+	if len(functions) == 2:
+		first, second = functions
+		return lambda: first() and second()
+
+	def evaluate():
+		for function in functions:
+			if not function():
+				return False
+		return True
+	return evaluate
+
+
+def _any( functions ):
+	if len(functions) == 2:
+		first, second = functions
+		return lambda: first() or second()
+
+	def evaluate():
+		for function in functions:
+			if function():
+				return True
+		return False
+	return evaluate
+
+
+def _compare( comparison, left, right, resolve ):
+	"""
+	Erzeugt die Funktion für einen Vergleich. Der häufigste Fall, ein Verweis verglichen mit einer Zahl, wird gesondert behandelt, damit nur eine Funktion aufgerufen werden muß.
+	"""
+
+	function = OPERATORS[comparison]
+	if left[0] == "reference" and right[0] == "number":
+		getter = resolve( left[1] )
+		value = right[1]
+		return lambda: function( getter(), value )
+
+	leftGetter = _operand( left, resolve )
+	rightGetter = _operand( right, resolve )
+	return lambda: function( leftGetter(), rightGetter() )
+
+
+def _operand( node, resolve ):
+	if node[0] == "number":
+		value = node[1]
+		return lambda: value
+	return resolve( node[1] )
+
+
+def compile_tree( tree, resolve ):
+	"""
+	Erzeugt aus dem Baum eine Funktion ohne Argumente, welche zurückgibt, ob die Voraussetzungen erfüllt sind.
+
+	\param resolve Wird für jeden Verweis einmal aufgerufen und muß eine Funktion ohne Argumente zurückgeben, welche den aktuellen Wert liefert.
+	"""
+
+	kind = tree[0]
+	if kind == "or":
+		return _any( tuple( compile_tree( node, resolve ) for node in tree[1] ) )
+	elif kind == "and":
+		return _all( tuple( compile_tree( node, resolve ) for node in tree[1] ) )
+	elif kind == "compare":
+		return _compare( tree[1], tree[2], tree[3], resolve )
+	raise ErrTraitPrerequisite( prerequisites=repr(tree) )
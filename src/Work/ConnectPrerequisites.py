@@ -29,9 +29,16 @@ SoulCreator.  If not, see <http://www.gnu.org/licenses/>.
 import re
 
 import src.Config as Config
+import src.GlobalState as GlobalState
 from src.Datatypes.BasicTrait import BasicTrait
+import src.Work.CompilePrerequisites as CompilePrerequisites
 import src.Debug as Debug
-#from src.Error import ErrTraitPrerequisite
+
+
+
+
+## Die Typen, deren Eigenschaften Voraussetzungen besitzen können.
+PREREQUISITE_TYPS = ( "Merit", "Flaw", "Subpower", )
 
 
 
@@ -40,134 +47,157 @@ def build_connection(storage, character):
 	"""
 	Merits und Subpowers müssen mit allen Eigenschaften verknüpft werden, die in ihrer Prerequisits-Eigenschaft vorkommen.
 
-	\warning Wenn als Voraussetzung einer Eigenschaft zwei Eigenschaften desselben Typs stehen, bei denen die eine Eigenschaft den identischen Namen wie die zweite hat, nur das letztere noch weitere Buchstaben anhängen hat, kommt es zu Ersetzungsproblemen.
+	\sa build_graph(), connect_graph()
+	"""
+
+	connect_graph(build_graph(storage, character), character)
+
+
+def connect_traits(traits, storage, character):
+	"""
+	Verknüpft nur die angegebenen Eigenschaften mit ihren Voraussetzungen.
+
+	Dies wird benötigt, wenn Eigenschaften erst nachträglich erzeugt werden. Eigenschaften, deren Voraussetzungen bislang nicht vollständig aufgelöst werden konnten (siehe StorageCharacter.unresolvedPrerequisites), werden dabei erneut verknüpft, da die fehlenden Eigenschaften nun vielleicht existieren.
+	"""
+
+	traits = list(traits)
+	traits.extend(character.unresolvedPrerequisites)
+	connect_graph(build_graph(storage, character, traits), character)
+
+
+def build_graph(storage, character, traits=None):
+	"""
+	Erzeugt in einem einzigen Durchlauf über alle Eigenschaften mit Voraussetzungen den umgekehrten Abhängigkeitsgraphen.
+
+	Die Voraussetzungen jeder Eigenschaft liegen bereits zerlegt in StorageTemplate vor, die darin genannten Eigenschaften werden über die Verzeichnisse von StorageTemplate direkt gefunden. Nebenbei erhält jede Eigenschaft die Funktion, welche ihre Voraussetzungen überprüft (prerequisitesCheck).
+
+	\param traits Die zu verknüpfenden Eigenschaften. Ohne Angabe werden alle Eigenschaften der Typen PREREQUISITE_TYPS verwendet.
+
+	\return dict, welches jeder Voraussetzung die Liste der von ihr abhängigen Eigenschaften zuordnet. Voraussetzungen sind Eigenschaften oder einer der Bezeichner Config.POWERSTAT_IDENTIFIER, Config.MORALITY_IDENTIFIER und Config.AGE_IDENTIFIER.
+	"""
+
+	if traits is None:
+		traits = []
+		for typ in PREREQUISITE_TYPS:
+			## Sind die Template-Daten nicht vollständig geladen, kann ein Typ auch ganz fehlen.
+			if typ not in character.traits:
+				continue
+			for category in storage.categories(typ):
+				traits.extend(character.traits[typ][category].values())
+
+	graph = {}
+	for trait in traits:
+		if trait.hasPrerequisites:
+			_add_to_graph(trait, storage, character, graph)
+	return graph
+
+
+def connect_graph(graph, character):
+	"""
+	Verbindet jede Voraussetzung aus graph ein einziges Mal mit StorageCharacter.checkDependentPrerequisites(), welches dann alle abhängigen Eigenschaften überprüft.
+
+	Der Graph wird dazu in StorageCharacter.prerequisiteGraph übernommen. Da die Eigenschaften eines Charakters gleich mit ihren Anfangswerten erzeugt werden, ändert sich bis hierher keine Voraussetzung. Deshalb werden alle Eigenschaften aus graph einmal überprüft.
 	"""
 
-	typs = [ "Merit", "Flaw", "Subpower", ]
-	for typ in typs:
-		trait_categories = storage.categories(typ)
-		for category in trait_categories:
-			for trait in character.traits[typ][category].values():
-				#Debug.debug("{trait} hat Voraussetzungen? {truth}".format(trait=trait.name, truth=trait.hasPrerequisites))
-				if trait.hasPrerequisites:
-					_do_connect(trait, storage, character)
+	for source in character.addPrerequisiteGraph(graph):
+		_connect_source(source, character)
 
+	with character.batch():
+		for dependents in graph.values():
+			for trait in dependents:
+				character.checkPrerequisites(trait)
 
-def _do_connect(trait, storage, character):
+
+def _connect_source(source, character):
+	if source == Config.POWERSTAT_IDENTIFIER:
+		character.powerstatChanged.connect(lambda value: character.checkDependentPrerequisites(source))
+	elif source == Config.MORALITY_IDENTIFIER:
+		character.moralityChanged.connect(lambda value: character.checkDependentPrerequisites(source))
+	elif source == Config.AGE_IDENTIFIER:
+		character.ageChanged.connect(lambda value: character.checkDependentPrerequisites(source))
+	else:
+		## traitChanged übergibt die Eigenschaft selbst.
+		source.traitChanged.connect(character.checkDependentPrerequisites)
+
+
+def _add_to_graph(trait, storage, character, graph):
 	"""
-	Durchsucht alle existierenden Eigenschaften und kontrolliert, ob sie als Voraussetzung für <trait> in Frage kommen.
+	Erzeugt aus den Voraussetzungen von <trait> die Funktion, welche sie überprüft, und trägt <trait> bei allen darin vorkommenden Voraussetzungen als abhängig ein.
 	"""
 
-	trait_prerequisites = trait.prerequisitesText
-	Debug.debug(
-		"Voraussetzungen von {trait}: {prerequisite}".format(trait=trait.name, prerequisite=trait_prerequisites),
-		level=4,
-	)
-	stop_loop = False
-	for prerequisite_typ in storage.traits.keys():
-		## Angabe in den Ressourcen: <typ>.<trait>[.<specialty>]
-		typ_resource = "{}.".format(prerequisite_typ)
-		## Ist eine Eigenschaft diesen Typs eine Voraussetzung der Eigenschaft?
-		if typ_resource in trait_prerequisites:
-			#Debug.debug("{trait} hat {typ} als Voraussetzung!".format(trait=trait.name, typ=item))
-			for prerequisite_category in storage.categories(prerequisite_typ):
-				for prerequisite_trait in character.traits[prerequisite_typ][prerequisite_category].values():
-					## Überprüfen ob die Eigenschaft im Anforderungstext des Merits vorkommt.
-					trait_resource = "{}.{}".format(prerequisite_typ, prerequisite_trait.identifier)
-					if trait_resource in trait_prerequisites:
-						# Überprüfen ob diese Eigenschaft tatsächlich in den Voraussetzungen enthalten ist. Bei dieser Überprüfung ist es wichtig, auf den ganuen Namen zu prüfen: "Status" != "Status: Camarilla"
-						# Diese Überprüfung wird aber nur durchgeführt, wenn die Chance besteht, daß dieser String identisch ist.
-						match_list = re.findall(r"(\w+\.[\w]+[:\s]*[\w]+)(?=[\s]*[><=.]+)", trait_prerequisites, re.UNICODE)
-						if trait_resource in match_list:
-							stop_loop = _create_connection( trait, prerequisite_trait, trait_prerequisites, trait_resource )
-							if stop_loop:
-								return
-	if not stop_loop:
-		## Es kann auch die Supereigenschaft als Voraussetzung vorkommen ...
-		if Config.POWERSTAT_IDENTIFIER in trait_prerequisites:
-			character.powerstatChanged.connect(trait.checkPrerequisites)
-		## ... oder die Moral
-		if Config.MORALITY_IDENTIFIER in trait_prerequisites:
-			character.moralityChanged.connect(trait.checkPrerequisites)
-
-
-def _create_connection( trait, prerequisite_trait, trait_prerequisites, trait_resource ):
+	if GlobalState.debug_level and GlobalState.debug_level >= 4:
+		Debug.debug( "Voraussetzungen von {trait}: {prerequisite}".format(trait=trait.name, prerequisite=trait.prerequisitesText), level=4 )
+	tree = storage.prerequisiteTree(trait.prerequisitesText)
+
+	## Die Eigenschaft kann erneut verknüpft werden (siehe connect_traits()).
+	trait.prerequisiteTraits = []
+	character.unresolvedPrerequisites.discard(trait)
+
+	def resolve(reference):
+		getter, source = _resolve_reference(reference, storage, character)
+		if source is None:
+			character.unresolvedPrerequisites.add(trait)
+		else:
+			dependents = graph.setdefault(source, [])
+			## Alle Verweise von <trait> werden nacheinander aufgelöst, daher genügt der Blick auf den letzten Eintrag, um doppelte Einträge zu vermeiden.
+			if not dependents or dependents[-1] != trait:
+				dependents.append(trait)
+				if not isinstance(source, str):
+					trait.addPrerequisiteTrait(source)
+		return getter
+
+	trait.prerequisitesCheck = CompilePrerequisites.compile_tree(tree, resolve)
+
+
+def _resolve_reference(reference, storage, character):
 	"""
-	Erzeugt die connection zwischen <trait> und den in Frage kommenden Voraussetzungen.
+	Sucht die Eigenschaft, auf welche in den Voraussetzungen verwiesen wird.
+
+	Angabe in den Ressourcen: <typ>.<trait>[.<specialty>], "Powerstat", "Morality" oder "Age". Bei Angabe einer Spezialisierung zählt der Wert der Fertigkeit nur, wenn der Charakter diese Spezialisierung besitzt.
+
+	\return Tupel aus einer Funktion, welche den aktuellen Wert liefert, und der Voraussetzung, wie sie im Abhängigkeitsgraphen eingetragen wird.
+
+	\note Existiert die Eigenschaft nicht (bspw. weil die Template-Daten ihrer Spezies nicht geladen sind), wird der Wert 0 angenommen.
 	"""
 
-	## Vor <typ>.<trait> darf kein anderes Wort außer "and", "or" und "(" stehen.
-	idxA = trait_prerequisites.index(trait_resource)
-	strBefore = trait_prerequisites[:idxA]
-	strBefore = strBefore.rstrip()
-	strBeforeList = strBefore.split(" ")
-	if not strBeforeList[-1] or strBeforeList[-1] == "and" or strBeforeList[-1] == "or" or strBeforeList[-1] == "(":
-		## \todo Den Namen der Eigenschaft mit einem Zeiger auf diese Eigenschaft im Speicher ersetzen.
-		## Die Eigenschaft, von welcher diese hier abhängig ist, der entsprechenden Liste hinzufügen.
-		trait.addPrerequisiteTrait(prerequisite_trait)
-		# Ändere den prerequisitesText dahingehend, daß der Verweis dort steht.
-		# Ändert ohne viel Intelligenz. "Attribute.GiantKid > 1 and Attribute.Giant > 1" wird gnadenlos in "ptr00 > 1 and ptr00Kid > 1" verändert.
-		#trait.prerequisitesText = trait.prerequisitesText.replace(traitResource, "ptr{}".format(id(subsubitem)))
-		trait.prerequisitesText = re.sub(r"{}(?=[\s]*[><=.]+)".format(trait_resource), "ptr{}".format(id(prerequisite_trait)), trait.prerequisitesText)
-		#Debug.debug(trait.prerequisiteTraits, trait.prerequisitesText)
-		## Die Eigenschaften in den Voraussetzungen mit dem Merit verbinden.
-		#Debug.debug("Verbinde {} mit {}".format(subsubitem.name, trait.name))
-		prerequisite_trait.traitChanged.connect(trait.checkPrerequisites)
-		## Sind alle Voraussetzungen mit Verweisen ersetzt, ist diese Funktion erfolgreich beendet.
-		traitString = re.search(r"(?<!ptr)\w+\.\w+", trait.prerequisitesText, re.UNICODE)
-		if not traitString:
-			return True
-	## Sind nicht alle Voraussetzungen mit Verweisen ersetzt, ist diese Funktion zwar beendet, aber es wird kein Erfolg ausgegeben.
-	return False
+	if reference == Config.POWERSTAT_IDENTIFIER:
+		return ( lambda: character.powerstat, reference, )
+	elif reference == Config.MORALITY_IDENTIFIER:
+		return ( lambda: character.morality, reference, )
+	elif reference == Config.AGE_IDENTIFIER:
+		return ( lambda: character.age, reference, )
+
+	typ, _, identifier = reference.partition(".")
+	specialty = None
+	category = storage.traitCategory(typ, identifier)
+	if category is None and "." in identifier:
+		identifier, specialty = identifier.rsplit(".", 1)
+		category = storage.traitCategory(typ, identifier)
+	if category is None and ":" in identifier:
+		## In den Template-Dateien steht teilweise "Merit.Haven:Size", der Identifier lautet aber "Haven: Size".
+		identifier = re.sub(r"\s*:\s*", ": ", identifier)
+		category = storage.traitCategory(typ, identifier)
+
+	prerequisite_traits = []
+	if category is not None:
+		prerequisite_traits = character.traitsByIdentifier(typ, category, identifier)
+	if not prerequisite_traits:
+		Debug.debug( "Prerequisite \"{}\" does not exist.".format(reference), level=3 )
+		return ( lambda: 0, None, )
+
+	prerequisite_trait = prerequisite_traits[0]
+	if specialty is None:
+		getter = lambda: prerequisite_trait.value
+	else:
+		getter = lambda: prerequisite_trait.value if specialty in prerequisite_trait.specialties else 0
+	return ( getter, prerequisite_trait, )
 
 
 def checkPrerequisites(trait, storage, character):
 	if not isinstance(trait, BasicTrait):
 		Debug.debug("Error!")
-	else:
-		if trait.hasPrerequisites and trait.prerequisiteTraits:
-			## Angabe in den Ressourcen: <typ>.<trait>[.<specialty>] >|<|== ? and|or ...
-			## Diese werden aufgeteilt in [[ <typ>, <trait>, <specialty> ] >|<|== ? and|or ... ]
-			traitPrerequisites = trait.prerequisitesText
-			#Debug.debug("{trait} hat Voraussetzungen? {truth}".format(trait=trait.name, truth=trait.hasPrerequisites))
-			for item in trait.prerequisiteTraits:
-				# Überprüfen, ob die Eigenschaft im Anforderungstext des Merits vorkommt.
-				literalReference = "ptr{}".format(id(item))
-				if literalReference in traitPrerequisites:
-					## Spezialisierungen
-					literalReferencePlusSpecial = "{}.".format(literalReference)
-					if literalReferencePlusSpecial in traitPrerequisites:
-						idx = traitPrerequisites.index(literalReferencePlusSpecial)
-						#traitWithSpecial = re.search(r"\w+\.{1}(\w+)", traitPrerequisites[idx:])
-						#special = traitWithSpecial.group(1)
-						specialties = re.findall(r"\w+\.{1}(\w+)", traitPrerequisites[idx:])
-						for special in specialties:
-							if special in item.specialties:
-								traitPrerequisites = traitPrerequisites.replace(".{}".format(special), "")
-							else:
-								traitPrerequisites = traitPrerequisites.replace("{}.{}".format(literalReference, special), "0")
-					traitPrerequisites = traitPrerequisites.replace(literalReference, str(item.value))
-			# Es kann auch die Supereigenschaft als Voraussetzung vorkommen ...
-			if Config.POWERSTAT_IDENTIFIER in traitPrerequisites:
-				traitPrerequisites = traitPrerequisites.replace(Config.POWERSTAT_IDENTIFIER, str(character.powerstat))
-			# ... oder die Moral
-			if Config.MORALITY_IDENTIFIER in traitPrerequisites:
-				traitPrerequisites = traitPrerequisites.replace(Config.MORALITY_IDENTIFIER, str(character.morality))
-
-			# Die Voraussetzungen sollten jetzt nurnoch aus Zahlen und logischen Operatoren bestehen.
-			## eval() is dangerous
-			## Aber ast.literal_eval() erlaubt nicht das Auswerten von "a < b" etc.
-			## Es werden ausschließlich Zahlen, Klammern "(" und ")" und die Zeichen "<" "<=" ">" ">=" "==" und "!=" sowie den logischen Verknüpfungen "and" und "or" erlaubt.
-			#traitPrerequisites = "1 < 2 and 2 < 3"
-			if re.match( r"^(\(*\d+\s*[<>=!]+\s*\d+\)*\s*(and|or)?\s*)+$", traitPrerequisites ):
-				try:
-					result = eval(traitPrerequisites)
-					#Debug.debug("Eigenschaft {} ({} = {})".format(trait.name, traitPrerequisites, result))
-				except (NameError, SyntaxError):
-					Debug.debug("Error bei {}: {}".format(trait.name, traitPrerequisites))
-					result = False
-			else:
-				raise ValueError("Only digits, spaces and the symbols \"<\", \">\", \"=\", \"!\", \"(\" and \")\" are allowed at this point.")
-
+	elif trait.hasPrerequisites and trait.prerequisitesCheck is not None:
+		result = trait.prerequisitesCheck()
+		if GlobalState.debug_level and GlobalState.debug_level >= 4:
 			Debug.debug( "Eigenschaft \"{}\" wird verfügbar? {}!".format(trait.name, result), level=4 )
-			trait.setAvailable(result)
+		trait.setAvailable(result)
@@ -32,6 +32,10 @@ import unittest
 from src.Tests.TestCalc import TestCalc
 from src.Tests.TestCalcAdvantages import TestCalcAdvantages
 from src.Tests.TestCalcShapes import TestCalcShapes
+from src.Tests.TestLazyTemplate import TestLazyTemplate
+from src.Tests.TestPrerequisites import TestPrerequisites
+from src.Tests.TestTraitSignal import TestTraitSignal
+from src.Tests.TestUndoHistory import TestUndoHistory
 
 
 